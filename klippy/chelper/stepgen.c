@@ -0,0 +1,145 @@
+// Parallel step generation for several steppers
+//
+// This file may be distributed under the terms of the GNU GPLv3 license.
+
+// The steps of every stepper only depend on its own stepper_kinematics,
+// its stepcompress queue and the (read only) moves on its trapq, so the
+// steppers of one flush window can be generated concurrently. A pool of
+// worker threads takes steppers from the current job, and the calling
+// thread works on the job as well until all steppers are done.
+
+#include <pthread.h> // pthread_mutex_lock
+#include <stdlib.h> // malloc
+#include <string.h> // memset
+#include "compiler.h" // __visible
+#include "itersolve.h" // itersolve_generate_steps
+#include "pyhelper.h" // report_errno
+#include "stepgen.h" // stepgen_pool_alloc
+#include "trapq.h" // trapq_check_sentinels
+
+struct stepgen_pool {
+    pthread_mutex_t lock; // protects variables below
+    pthread_cond_t work_cond, done_cond;
+    int num_threads, exit;
+    pthread_t *threads;
+    // Current job
+    struct stepper_kinematics **sks;
+    int count, next, pending;
+    double flush_time;
+    int32_t ret;
+};
+
+// Generate the steps of the next stepper of the current job. The lock
+// must be held, it is released while the steps are generated.
+static void
+run_next(struct stepgen_pool *sp)
+{
+    struct stepper_kinematics *sk = sp->sks[sp->next++];
+    double flush_time = sp->flush_time;
+    pthread_mutex_unlock(&sp->lock);
+    int32_t ret = itersolve_generate_steps(sk, flush_time);
+    pthread_mutex_lock(&sp->lock);
+    if (ret && !sp->ret)
+        sp->ret = ret;
+    if (!--sp->pending)
+        pthread_cond_signal(&sp->done_cond);
+}
+
+static void *
+worker_thread(void *data)
+{
+    struct stepgen_pool *sp = data;
+    pthread_mutex_lock(&sp->lock);
+    for (;;) {
+        if (sp->exit)
+            break;
+        if (sp->next >= sp->count) {
+            pthread_cond_wait(&sp->work_cond, &sp->lock);
+            continue;
+        }
+        run_next(sp);
+    }
+    pthread_mutex_unlock(&sp->lock);
+    return NULL;
+}
+
+// Create a pool with the given number of worker threads
+struct stepgen_pool * __visible
+stepgen_pool_alloc(int num_threads)
+{
+    struct stepgen_pool *sp = malloc(sizeof(*sp));
+    memset(sp, 0, sizeof(*sp));
+    int ret = pthread_mutex_init(&sp->lock, NULL);
+    if (ret)
+        goto fail;
+    ret = pthread_cond_init(&sp->work_cond, NULL);
+    if (ret)
+        goto fail;
+    ret = pthread_cond_init(&sp->done_cond, NULL);
+    if (ret)
+        goto fail;
+    sp->threads = malloc(sizeof(*sp->threads) * num_threads);
+    for (; sp->num_threads < num_threads; sp->num_threads++) {
+        ret = pthread_create(&sp->threads[sp->num_threads], NULL
+                             , worker_thread, sp);
+        if (ret)
+            goto fail;
+    }
+    return sp;
+
+fail:
+    report_errno("stepgen pool alloc", ret);
+    stepgen_pool_free(sp);
+    return NULL;
+}
+
+// Stop the worker threads and free the pool
+void __visible
+stepgen_pool_free(struct stepgen_pool *sp)
+{
+    if (!sp)
+        return;
+    pthread_mutex_lock(&sp->lock);
+    sp->exit = 1;
+    pthread_cond_broadcast(&sp->work_cond);
+    pthread_mutex_unlock(&sp->lock);
+    int i;
+    for (i = 0; i < sp->num_threads; i++) {
+        int ret = pthread_join(sp->threads[i], NULL);
+        if (ret)
+            report_errno("pthread_join", ret);
+    }
+    free(sp->threads);
+    free(sp);
+}
+
+// Generate the steps of all given steppers up to flush_time
+int32_t __visible
+stepgen_pool_generate_steps(struct stepgen_pool *sp
+                            , struct stepper_kinematics **sks
+                            , int count, double flush_time)
+{
+    // The sentinels of a trapq are updated lazily on first use, so
+    // do that here before the workers share the trapq
+    int i;
+    for (i = 0; i < count; i++)
+        if (sks[i]->tq)
+            trapq_check_sentinels(sks[i]->tq);
+    pthread_mutex_lock(&sp->lock);
+    sp->sks = sks;
+    sp->count = count;
+    sp->next = 0;
+    sp->pending = count;
+    sp->flush_time = flush_time;
+    sp->ret = 0;
+    pthread_cond_broadcast(&sp->work_cond);
+    while (sp->next < sp->count)
+        run_next(sp);
+    while (sp->pending)
+        pthread_cond_wait(&sp->done_cond, &sp->lock);
+    sp->count = sp->next = 0;
+    sp->sks = NULL;
+    int32_t ret = sp->ret;
+    pthread_mutex_unlock(&sp->lock);
+    return ret;
+}
@@ -0,0 +1,13 @@
+#ifndef STEPGEN_H
+#define STEPGEN_H
+
+#include <stdint.h> // int32_t
+
+struct stepper_kinematics;
+struct stepgen_pool *stepgen_pool_alloc(int num_threads);
+void stepgen_pool_free(struct stepgen_pool *sp);
+int32_t stepgen_pool_generate_steps(struct stepgen_pool *sp
+                                    , struct stepper_kinematics **sks
+                                    , int count, double flush_time);
+
+#endif // stepgen.h
@@ -4,6 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, time, collections, threading, multiprocessing, os
+import importlib
 from . import bus, motion_report
 
 # ADXL345 registers
@@ -30,6 +31,9 @@ SCALE_Z  = 0.003906 * FREEFALL_ACCEL # 1 / 256 (at 3.3V) mg/LSB
 Accel_Measurement = collections.namedtuple(
     'Accel_Measurement', ('time', 'accel_x', 'accel_y', 'accel_z'))
 
+# Supported raw data file formats (csv text or numpy binary files)
+OUTPUT_FORMATS = ['csv', 'npy', 'npz']
+
 # Helper class to obtain measurements
 class AccelQueryHelper:
     def __init__(self, printer, cconn):
@@ -74,7 +78,11 @@ class AccelQueryHelper:
         count = 0
         self.samples = samples = [None] * total
         for msg in raw_samples:
-            for samp_time, x, y, z in msg['params']['data']:
+            data = msg['params']['data']
+            if hasattr(data, 'tolist'):
+                # Sample array of internal clients
+                data = data.tolist()
+            for samp_time, x, y, z in data:
                 if samp_time < self.request_start_time:
                     continue
                 if samp_time > self.request_end_time:
@@ -83,6 +91,24 @@ class AccelQueryHelper:
                 count += 1
         del samples[count:]
         return self.samples
+    def get_samples_array(self):
+        # Copy the sample blocks (numpy arrays, or lists if numpy wasn't
+        # available while measuring) into a preallocated numpy array with
+        # (time, accel_x, accel_y, accel_z) columns
+        np = importlib.import_module('numpy')
+        raw_samples = self._get_raw_samples()
+        total = sum([len(m['params']['data']) for m in raw_samples])
+        data = np.empty((total, 4))
+        count = 0
+        for msg in raw_samples:
+            block = msg['params']['data']
+            if len(block):
+                data[count:count+len(block)] = block
+                count += len(block)
+        times = data[:count, 0]
+        start = np.searchsorted(times, self.request_start_time, side='left')
+        end = np.searchsorted(times, self.request_end_time, side='right')
+        return data[start:end]
     def write_to_file(self, filename):
         def write_impl():
             try:
@@ -90,6 +116,16 @@ class AccelQueryHelper:
                 os.nice(20)
             except:
                 pass
+            if filename.endswith('.npy'):
+                np = importlib.import_module('numpy')
+                np.save(filename, self.get_samples_array())
+                return
+            if filename.endswith('.npz'):
+                np = importlib.import_module('numpy')
+                data = self.get_samples_array()
+                np.savez(filename, time=data[:,0], accel_x=data[:,1],
+                         accel_y=data[:,2], accel_z=data[:,3])
+                return
             f = open(filename, "w")
             f.write("#time,accel_x,accel_y,accel_z\n")
             samples = self.samples or self.get_samples()
@@ -140,14 +176,18 @@ class AccelCommandHelper:
         name = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
         if not name.replace('-', '').replace('_', '').isalnum():
             raise gcmd.error("Invalid NAME parameter")
+        ext = gcmd.get("FORMAT", "csv").lower()
+        if ext not in OUTPUT_FORMATS:
+            raise gcmd.error("Invalid FORMAT parameter")
         bg_client = self.bg_client
         self.bg_client = None
         bg_client.finish_measurements()
         # Write data to file
         if self.base_name == self.name:
-            filename = "/tmp/%s-%s.csv" % (self.base_name, name)
+            filename = "/tmp/%s-%s.%s" % (self.base_name, name, ext)
         else:
-            filename = "/tmp/%s-%s-%s.csv" % (self.base_name, self.name, name)
+            filename = "/tmp/%s-%s-%s.%s" % (self.base_name, self.name,
+                                             name, ext)
         bg_client.write_to_file(filename)
         gcmd.respond_info("Writing raw accelerometer data to %s file"
                           % (filename,))
@@ -255,7 +295,8 @@ class ADXL345:
         mcu.add_config_cmd("query_adxl345 oid=%d clock=0 rest_ticks=0"
                            % (oid,), on_restart=True)
         mcu.register_config_callback(self._build_config)
-        mcu.register_response(self._handle_adxl345_data, "adxl345_data", oid)
+        mcu.register_bulk_response(self._handle_adxl345_data,
+                                   "adxl345_data", oid)
         # Clock tracking
         self.last_sequence = self.max_query_duration = 0
         self.last_limit_count = self.last_error_count = 0
@@ -295,10 +336,60 @@ class ADXL345:
     # Measurement collection
     def is_measuring(self):
         return self.query_rate > 0
-    def _handle_adxl345_data(self, params):
+    def _handle_adxl345_data(self, values):
+        # Bulk handler - values is (oid, sequence, data)
         with self.lock:
-            self.raw_samples.append(params)
+            self.raw_samples.append(values)
     def _extract_samples(self, raw_samples):
+        # Returns a (time, x, y, z) sample array, or a list of sample
+        # tuples without numpy. Webhooks clients get the array as lists,
+        # internal clients (AccelQueryHelper) get it as is.
+        try:
+            np = importlib.import_module('numpy')
+        except ImportError:
+            return self._extract_samples_python(raw_samples)
+        return self._extract_samples_array(np, raw_samples)
+    def _extract_samples_array(self, np, raw_samples):
+        # Decode all messages at once into a (time, x, y, z) sample array
+        (x_pos, x_scale), (y_pos, y_scale), (z_pos, z_scale) = self.axes_map
+        last_sequence = self.last_sequence
+        time_base, chip_base, inv_freq = self.clock_sync.get_time_translation()
+        seqs = []
+        counts = []
+        blocks = []
+        for oid, sequence, data in raw_samples:
+            seq_diff = (last_sequence - sequence) & 0xffff
+            seq_diff -= (seq_diff & 0x8000) << 1
+            seqs.append(last_sequence - seq_diff)
+            count = len(data) // BYTES_PER_SAMPLE
+            counts.append(count)
+            blocks.append(bytes(data[:count * BYTES_PER_SAMPLE]))
+        d = np.frombuffer(b"".join(blocks), dtype=np.uint8)
+        d = d.reshape(-1, BYTES_PER_SAMPLE).astype(np.int32)
+        # Chip clock of each sample (message sequence and index in message)
+        counts = np.array(counts, dtype=np.int64)
+        starts = np.cumsum(counts) - counts
+        chip_clock = (np.repeat(np.array(seqs, dtype=np.int64), counts)
+                      * SAMPLES_PER_BLOCK
+                      + np.arange(len(d)) - np.repeat(starts, counts))
+        if len(d):
+            self.clock_sync.set_last_chip_clock(int(chip_clock[-1]))
+        xlow, ylow, zlow, xzhigh, yzhigh = d.T
+        valid = (yzhigh & 0x80) == 0
+        self.last_error_count += int(len(d) - np.count_nonzero(valid))
+        rx = (xlow | ((xzhigh & 0x1f) << 8)) - ((xzhigh & 0x10) << 9)
+        ry = (ylow | ((yzhigh & 0x1f) << 8)) - ((yzhigh & 0x10) << 9)
+        rz = ((zlow | ((xzhigh & 0xe0) << 3) | ((yzhigh & 0xe0) << 6))
+              - ((yzhigh & 0x40) << 7))
+        raw_xyz = (rx[valid], ry[valid], rz[valid])
+        samples = np.empty((len(raw_xyz[0]), 4))
+        samples[:, 0] = np.round(
+            time_base + (chip_clock[valid] - chip_base) * inv_freq, 6)
+        samples[:, 1] = np.round(raw_xyz[x_pos] * x_scale, 6)
+        samples[:, 2] = np.round(raw_xyz[y_pos] * y_scale, 6)
+        samples[:, 3] = np.round(raw_xyz[z_pos] * z_scale, 6)
+        return samples
+    def _extract_samples_python(self, raw_samples):
         # Load variables to optimize inner loop below
         (x_pos, x_scale), (y_pos, y_scale), (z_pos, z_scale) = self.axes_map
         last_sequence = self.last_sequence
@@ -306,11 +397,11 @@ class ADXL345:
         # Process every message in raw_samples
         count = seq = 0
         samples = [None] * (len(raw_samples) * SAMPLES_PER_BLOCK)
-        for params in raw_samples:
-            seq_diff = (last_sequence - params['sequence']) & 0xffff
+        for oid, sequence, data in raw_samples:
+            seq_diff = (last_sequence - sequence) & 0xffff
             seq_diff -= (seq_diff & 0x8000) << 1
             seq = last_sequence - seq_diff
-            d = bytearray(params['data'])
+            d = bytearray(data)
             msg_cdiff = seq * SAMPLES_PER_BLOCK - chip_base
             for i in range(len(d) // BYTES_PER_SAMPLE):
                 d_xyz = d[i*BYTES_PER_SAMPLE:(i+1)*BYTES_PER_SAMPLE]
@@ -421,7 +512,7 @@ class ADXL345:
         if not raw_samples:
             return {}
         samples = self._extract_samples(raw_samples)
-        if not samples:
+        if not len(samples):
             return {}
         return {'data': samples, 'errors': self.last_error_count,
                 'overflows': self.last_limit_count}
@@ -3,7 +3,7 @@
 # Copyright (C) 2021,2022  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, math, threading
+import logging, math, threading, importlib.util
 from . import bus, motion_report
 
 MIN_MSG_TIME = 0.100
@@ -23,9 +23,8 @@ class AngleCalibration:
         if self.stepper_name is None:
             # No calibration
             return
-        try:
-            import numpy
-        except:
+        # Only check for numpy here, it is imported when calibrating
+        if importlib.util.find_spec('numpy') is None:
             raise config.error("Angle calibration requires numpy module")
         sconfig = config.getsection(self.stepper_name)
         sconfig.getint('microsteps', note_valid=False)
@@ -439,8 +438,8 @@ class Angle:
             "query_spi_angle oid=%d clock=0 rest_ticks=0 time_shift=0"
             % (oid,), on_restart=True)
         mcu.register_config_callback(self._build_config)
-        mcu.register_response(self._handle_spi_angle_data,
-                              "spi_angle_data", oid)
+        mcu.register_bulk_response(self._handle_spi_angle_data,
+                                   "spi_angle_data", oid)
         # API server endpoints
         self.api_dump = motion_report.APIDumpHelper(
             self.printer, self._api_update, self._api_startstop, 0.100)
@@ -464,9 +463,10 @@ class Angle:
     # Measurement collection
     def is_measuring(self):
         return self.start_clock != 0
-    def _handle_spi_angle_data(self, params):
+    def _handle_spi_angle_data(self, values):
+        # Bulk handler - values is (oid, sequence, data)
         with self.lock:
-            self.raw_samples.append(params)
+            self.raw_samples.append(values)
     def _extract_samples(self, raw_samples):
         # Load variables to optimize inner loop below
         sample_ticks = self.sample_ticks
@@ -488,12 +488,12 @@ class Angle:
         # Process every message in raw_samples
         count = error_count = 0
         samples = [None] * (len(raw_samples) * 16)
-        for params in raw_samples:
-            seq = (last_sequence & ~0xffff) | params['sequence']
+        for oid, sequence, data in raw_samples:
+            seq = (last_sequence & ~0xffff) | sequence
             if seq < last_sequence:
                 seq += 0x10000
             last_sequence = seq
-            d = bytearray(params['data'])
+            d = bytearray(data)
             msg_mclock = start_clock + seq*16*sample_ticks
             for i in range(len(d) // 3):
                 tcode = d[i*3]
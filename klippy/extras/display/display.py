@@ -7,6 +7,7 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, os, ast
 from . import hd44780, hd44780_spi, st7920, uc1701, menu
+from .. import gcode_macro
 
 # Normal time between each screen redraw
 REDRAW_TIME = 0.500
@@ -51,6 +52,56 @@ class DisplayTemplate:
         context.update(params)
         return self.template.render(context)
 
+# Copy of a status value that isn't affected by later in-place updates
+def _status_snapshot(value):
+    if isinstance(value, dict):
+        return {k: _status_snapshot(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_status_snapshot(v) for v in value]
+    if isinstance(value, tuple):
+        # Plain tuple, also for namedtuples (eg, Coord) - compares equal
+        return tuple([_status_snapshot(v) for v in value])
+    return value
+
+# Status dictionary that records which fields the display templates read
+class TrackedStatusDict(gcode_macro.StatusDict):
+    def __init__(self, status):
+        gcode_macro.StatusDict.__init__(self, status)
+        self.read_keys = set()
+        self.checked_keys = set()
+        self.read_all = False
+    def __getitem__(self, key):
+        self.read_keys.add(key)
+        return gcode_macro.StatusDict.__getitem__(self, key)
+    def __contains__(self, key):
+        self.checked_keys.add(key)
+        return dict.__contains__(self, key)
+    def __iter__(self):
+        self.read_all = True
+        return dict.__iter__(self)
+    def __len__(self):
+        self.read_all = True
+        return dict.__len__(self)
+    def keys(self):
+        self.read_all = True
+        return dict.keys(self)
+    def get_dependencies(self):
+        # Return the fields read so far, with their values at that time
+        if self.read_all:
+            return None, _status_snapshot(dict(self))
+        checked = {key: dict.__contains__(self, key)
+                   for key in self.checked_keys}
+        read = {key: _status_snapshot(dict.get(self, key))
+                for key in self.read_keys if dict.__contains__(self, key)}
+        return checked, read
+
+class TrackingStatusWrapper(gcode_macro.GetStatusWrapper):
+    def wrap_status(self, status):
+        return TrackedStatusDict(status)
+    def get_dependencies(self):
+        return {name: status.get_dependencies()
+                for name, status in self.cache.items()}
+
 # Store [display_data my_group my_item] sections (one instance per group name)
 class DisplayGroup:
     def __init__(self, config, name, data_configs):
@@ -74,8 +125,30 @@ class DisplayGroup:
             if c.get('text'):
                 template = gcode_macro.load_template(c, 'text')
                 self.data_items.append((row, col, template))
+        self.printer = printer
+        # Status fields read during the last rendering of the group
+        self.dependencies = None
+    def check_changed(self, eventtime):
+        if self.dependencies is None:
+            return True
+        for name, (checked, read) in self.dependencies.items():
+            status = self.printer.lookup_object(name).get_status(eventtime)
+            if checked is None:
+                if status != read:
+                    return True
+                continue
+            for key, present in checked.items():
+                if (key in status) != present:
+                    return True
+            for key, value in read.items():
+                if key not in status or status[key] != value:
+                    return True
+        return False
     def show(self, display, templates, eventtime):
+        self.dependencies = None
         context = self.data_items[0][2].create_template_context(eventtime)
+        status_wrapper = TrackingStatusWrapper(self.printer, eventtime)
+        context['printer'] = status_wrapper
         context['draw_progress_bar'] = display.draw_progress_bar
         def render(name, **kwargs):
             return templates[name].render(context, **kwargs)
@@ -84,6 +157,7 @@ class DisplayGroup:
             text = template.render(context)
             display.draw_text(row, col, text.replace('\n', ''), eventtime)
         context.clear() # Remove circular references for better gc
+        self.dependencies = status_wrapper.get_dependencies()
 
 # Global cache of DisplayTemplate, DisplayGroup, and glyphs
 class PrinterDisplayTemplate:
@@ -203,6 +277,8 @@ class PrinterLCD:
             self.screen_update_event)
         self.redraw_request_pending = False
         self.redraw_time = 0.
+        # Data group currently on the screen (None after a menu redraw)
+        self.drawn_data_group = None
         # Register g-code commands
         gcode = self.printer.lookup_object("gcode")
         gcode.register_mux_command('SET_DISPLAY_GROUP', 'DISPLAY', name,
@@ -222,16 +298,27 @@ class PrinterLCD:
         if self.redraw_request_pending:
             self.redraw_request_pending = False
             self.redraw_time = eventtime + REDRAW_MIN_TIME
-        self.lcd_chip.clear()
         # update menu component
-        if self.menu is not None:
+        if self.menu is not None and self.menu.is_running():
+            self.lcd_chip.clear()
             ret = self.menu.screen_update_event(eventtime)
             if ret:
+                self.drawn_data_group = None
                 self.lcd_chip.flush()
                 return eventtime + REDRAW_TIME
-        # Update normal display
+        # Update normal display - the framebuffer still holds the data
+        # group if none of the status fields it depends on changed
+        data_group = self.show_data_group
+        try:
+            if (data_group is self.drawn_data_group
+                and not data_group.check_changed(eventtime)):
+                return eventtime + REDRAW_TIME
+        except:
+            logging.exception("Error during display screen update")
+        self.lcd_chip.clear()
+        self.drawn_data_group = data_group
         try:
-            self.show_data_group.show(self, self.display_templates, eventtime)
+            data_group.show(self, self.display_templates, eventtime)
         except:
             logging.exception("Error during display screen update")
         self.lcd_chip.flush()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+from os.path import dirname, realpath
+import unittest
+
+import site
+_klippo_dir = dirname(dirname(dirname(realpath(__file__))))
+site.addsitedir(_klippo_dir)
+
+import jinja2
+
+from gcode import Coord
+from extras.display.display import (DisplayGroup, TrackedStatusDict,
+                                    TrackingStatusWrapper)
+
+
+class _DummyObject:
+    def __init__(self, status):
+        self.status = status
+    def get_status(self, eventtime):
+        return self.status
+
+class _DummyPrinter:
+    def __init__(self, objects):
+        self.objects = objects
+    def lookup_object(self, name, default=None):
+        return self.objects.get(name, default)
+
+# DisplayGroup without [display_data] config sections
+class _DummyDisplayGroup(DisplayGroup):
+    def __init__(self, printer, dependencies):
+        self.printer = printer
+        self.dependencies = dependencies
+
+
+class TrackedStatusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.env = jinja2.Environment()
+        self.toolhead = _DummyObject({
+            'position': Coord(1., 2., 3., 4.),
+            'homed_axes': "xyz",
+            'extruder': "extruder"})
+        self.fan = _DummyObject({'speed': .5, 'rpm': [1000, 1200]})
+        self.printer = _DummyPrinter({'toolhead': self.toolhead,
+                                      'fan': self.fan})
+
+    def render(self, text):
+        wrapper = TrackingStatusWrapper(self.printer, 0.)
+        self.env.from_string(text).render(printer=wrapper)
+        return _DummyDisplayGroup(self.printer, wrapper.get_dependencies())
+
+    def test_namedtuple(self):
+        status = TrackedStatusDict({'position': Coord(1., 2., 3., 4.)})
+        self.assertEqual(status['position'].x, 1.)
+        checked, read = status.get_dependencies()
+        self.assertEqual(read, {'position': (1., 2., 3., 4.)})
+        self.assertEqual(read['position'], Coord(1., 2., 3., 4.))
+
+    def test_unchanged(self):
+        group = self.render("{{ printer.toolhead.position.z }}"
+                            " {{ printer.fan.rpm[0] }}")
+        self.assertFalse(group.check_changed(0.))
+        # Fields that weren't read don't cause a redraw
+        self.toolhead.status['homed_axes'] = ""
+        self.fan.status['speed'] = 1.
+        self.assertFalse(group.check_changed(0.))
+
+    def test_changed(self):
+        group = self.render("{{ printer.toolhead.position.z }}")
+        self.toolhead.status['position'] = Coord(1., 2., 3.2, 4.)
+        self.assertTrue(group.check_changed(0.))
+
+    def test_changed_in_place(self):
+        group = self.render("{{ printer.fan.rpm[1] }}")
+        self.fan.status['rpm'][1] = 1300
+        self.assertTrue(group.check_changed(0.))
+
+    def test_contains(self):
+        group = self.render("{% if 'target' in printer.toolhead %}x{% endif %}")
+        self.assertFalse(group.check_changed(0.))
+        self.toolhead.status['target'] = 0.
+        self.assertTrue(group.check_changed(0.))
+
+    def test_iterate(self):
+        group = self.render("{% for k in printer.fan %}{{ k }}{% endfor %}")
+        self.assertFalse(group.check_changed(0.))
+        self.fan.status['speed'] = 1.
+        self.assertTrue(group.check_changed(0.))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,7 +28,9 @@ class ArcSupport:
 
     def __init__(self, config):
         self.printer = config.get_printer()
-        self.mm_per_arc_segment = config.getfloat('resolution', 1., above=0.0)
+        self.tolerance = config.getfloat('tolerance', 0.025, above=0.)
+        self.mm_per_arc_segment = config.getfloat('resolution', None,
+                                                  above=0.)
 
         self.gcode_move = self.printer.load_object(config, 'gcode_move')
         self.gcode = self.printer.lookup_object('gcode')
@@ -93,30 +95,26 @@ class ArcSupport:
         # Build list of linear coordinates to move
         coords = self.planArc(currentPos, asTarget, asPlanar,
                               clockwise, *axes)
-        e_per_move = e_base = 0.
         if asE is not None:
-            if gcodestatus['absolute_extrude']:
-                e_base = currentPos[3]
-            e_per_move = (asE - e_base) / len(coords)
-
-        # Convert coords into G1 commands
-        for coord in coords:
-            g1_params = {'X': coord[0], 'Y': coord[1], 'Z': coord[2]}
-            if e_per_move:
-                g1_params['E'] = e_base + e_per_move
-                if gcodestatus['absolute_extrude']:
-                    e_base += e_per_move
-            if asF is not None:
-                g1_params['F'] = asF
-            g1_gcmd = self.gcode.create_gcode_command("G1", "G1", g1_params)
-            self.gcode_move.cmd_G1(g1_gcmd)
+            # Spread the extrusion evenly over the segments
+            e_base = currentPos[3]
+            e_end = asE
+            if not gcodestatus['absolute_extrude']:
+                e_end += e_base
+            e_per_move = (e_end - e_base) / len(coords)
+            coords = [self.Coord(c[0], c[1], c[2], e_base + i * e_per_move)
+                      for i, c in enumerate(coords, 1)]
+
+        # Queue all segments with the toolhead at once
+        self.gcode_move.move_batch(coords, asF)
 
     # function planArc() originates from marlin plan_arc()
     # https://github.com/MarlinFirmware/Marlin
     #
     # The arc is approximated by generating many small linear segments.
-    # The length of each segment is configured in MM_PER_ARC_SEGMENT
-    # Arcs smaller then this value, will be a Line only
+    # The segments are as long as possible while keeping the distance
+    # between each segment and the arc within the configured tolerance,
+    # but no longer than the (optional) resolution.
     #
     # alpha and beta axes are the current plane, helical axis is linear travel
     def planArc(self, currentPos, targetPos, offset, clockwise,
@@ -154,7 +152,12 @@ class ArcSupport:
             mm_of_travel = math.hypot(flat_mm, linear_travel)
         else:
             mm_of_travel = math.fabs(flat_mm)
-        segments = max(1., math.floor(mm_of_travel / self.mm_per_arc_segment))
+        # Chord error of a segment spanning angle theta is r*(1-cos(theta/2))
+        theta_max = 2. * math.acos(1. - min(1., self.tolerance / radius))
+        segments = max(1., math.ceil(math.fabs(angular_travel) / theta_max))
+        if self.mm_per_arc_segment is not None:
+            segments = max(segments,
+                           math.ceil(mm_of_travel / self.mm_per_arc_segment))
 
         # Generate coordinates
         theta_per_segment = angular_travel / segments
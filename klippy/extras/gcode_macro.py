@@ -3,7 +3,7 @@
 # Copyright (C) 2018-2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import traceback, logging, ast, copy
+import traceback, logging, ast, copy, collections.abc
 import jinja2
 
 
@@ -11,6 +11,104 @@ import jinja2
 # Template handling
 ######################################################################
 
+# Status dictionaries and lists are copied lazily, one level at a time as
+# a template accesses them, so that templates can't modify the internal
+# state of printer objects and only pay for the fields they read
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+def _status_copy(value):
+    if isinstance(value, _IMMUTABLE_TYPES + (StatusDict, StatusList)):
+        return value
+    if isinstance(value, collections.abc.Mapping):
+        return StatusDict(value)
+    if isinstance(value, collections.abc.MutableSequence):
+        return StatusList(value)
+    if isinstance(value, frozenset):
+        return frozenset(_status_copy(v) for v in value)
+    if isinstance(value, collections.abc.Set):
+        return set(_status_copy(v) for v in value)
+    if isinstance(value, tuple):
+        items = [_status_copy(v) for v in value]
+        if all(c is v for c, v in zip(items, value)):
+            return value
+        if hasattr(value, '_fields'):
+            return type(value)(*items)
+        return tuple(items)
+    # Other objects are not expected in a status, copy them fully
+    return copy.deepcopy(value)
+
+class StatusDict(dict):
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        res = _status_copy(value)
+        if res is not value:
+            dict.__setitem__(self, key, res)
+        return res
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+    def values(self):
+        return [self[key] for key in self]
+    def items(self):
+        return [(key, self[key]) for key in self]
+    # Other methods that return values must not hand out the originals
+    def __iter__(self):
+        # Also stops dict(status) from taking the raw values directly
+        return dict.__iter__(self)
+    def setdefault(self, key, default=None):
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return self[key]
+    def pop(self, key, *args):
+        if key not in self:
+            return dict.pop(self, key, *args)
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, _status_copy(value)
+    def copy(self):
+        return StatusDict(self)
+    def __or__(self, other):
+        res = StatusDict(self)
+        res.update(other)
+        return res
+    def __ror__(self, other):
+        res = StatusDict(other)
+        res.update(self)
+        return res
+
+class StatusList(list):
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        value = list.__getitem__(self, index)
+        res = _status_copy(value)
+        if res is not value:
+            list.__setitem__(self, index, res)
+        return res
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+    def pop(self, index=-1):
+        value = self[index]
+        list.__delitem__(self, index)
+        return value
+    def copy(self):
+        return StatusList(self)
+    def __add__(self, other):
+        return StatusList(list.__add__(self, list(other)))
+    def __radd__(self, other):
+        return StatusList(list.__add__(list(other), self))
+    def __mul__(self, count):
+        return StatusList(list.__mul__(self, count))
+    __rmul__ = __mul__
+
 # Wrapper for access to printer object get_status() methods
 class GetStatusWrapper:
     def __init__(self, printer, eventtime=None):
@@ -26,8 +124,10 @@ class GetStatusWrapper:
             raise KeyError(val)
         if self.eventtime is None:
             self.eventtime = self.printer.get_reactor().monotonic()
-        self.cache[sval] = res = copy.deepcopy(po.get_status(self.eventtime))
+        self.cache[sval] = res = self.wrap_status(po.get_status(self.eventtime))
         return res
+    def wrap_status(self, status):
+        return _status_copy(status)
     def __contains__(self, val):
         try:
             self.__getitem__(val)
@@ -48,7 +148,7 @@ class TemplateWrapper:
         gcode_macro = self.printer.lookup_object('gcode_macro')
         self.create_template_context = gcode_macro.create_template_context
         try:
-            self.template = env.from_string(script)
+            self.template = gcode_macro.compile_template(script)
         except Exception as e:
             msg = "Error loading template '%s': %s" % (
                  name, traceback.format_exception_only(type(e), e)[-1])
@@ -72,6 +172,13 @@ class PrinterGCodeMacro:
     def __init__(self, config):
         self.printer = config.get_printer()
         self.env = jinja2.Environment('{%', '%}', '{', '}')
+        # Compiled templates by script, shared by identical scripts
+        self.templates = {}
+    def compile_template(self, script):
+        template = self.templates.get(script)
+        if template is None:
+            template = self.templates[script] = self.env.from_string(script)
+        return template
     def load_template(self, config, option, default=None):
         name = "%s:%s" % (config.get_name(), option)
         if default is None:
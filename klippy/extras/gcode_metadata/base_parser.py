@@ -2,6 +2,56 @@ import itertools
 from math import pi
 import os
 import re
+import threading
+
+import location
+
+from .thumbnails import split_thumbnails, write_thumbnails, get_thumbnail
+from .file_index import FileIndexError, request_file_index
+
+_NUMBER_START = frozenset("0123456789+-.")
+
+def _parse_number(value):
+    """Return value as int or float, or None if it isn't a number"""
+    if not value or value[0] not in _NUMBER_START:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def parse_value(value):
+    """
+    Convert the value of a metadata option into a Python object.
+    Supported are numbers, percentages (returned as a fraction, "15%" is
+    0.15), comma separated lists of numbers (returned as a tuple) and
+    strings, which are returned without surrounding quotes.
+    Anything else is returned unchanged as a string.
+    """
+    number = _parse_number(value)
+    if number is not None:
+        return number
+    if not value:
+        return value
+    if value[-1] == "%":
+        number = _parse_number(value[:-1].rstrip())
+        if number is not None:
+            return number / 100
+    elif len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    elif "," in value:
+        parts = value.split(",")
+        if not parts[-1].strip():
+            # Allow a trailing comma, as in "1.75,"
+            parts.pop()
+        numbers = tuple([_parse_number(p.strip()) for p in parts])
+        if numbers and None not in numbers:
+            return numbers
+    return value
 
 class BaseParser:
     """Base class for all parsers
@@ -26,6 +76,10 @@ class BaseParser:
     """Name of the slicer used to generate the G-Code file"""
     SLICER = "Unknown"
 
+    """Option keys used by the getters of this parser. Other options are
+    skipped while parsing. If None, all options are kept."""
+    OPTION_KEYS = None
+
     """If part of the metadata is stored at the end of the file.
     Only used when parsing UFP files because reading the tail requires
     decompressing the entire file."""
@@ -41,14 +95,38 @@ class BaseParser:
     counter _SUBCLASS_VERSION exists. This value should be overwritten to a
     value higher than 1 when only one subclass receives a breaking change to
     avoid all other caches to become invalid."""
-    _VERSION = 1
+    _VERSION = 3
     _SUBCLASS_VERSION = 1
 
+    """File index state, not pickled. _file_index_done is set once the
+    index thread is done with the request, _file_index is None then
+    if building the index failed."""
+    _file_index = None
+    _file_index_done = None
+
     def __init__(self, head, tail, path, module):
         self.config_diameter = module.config_diameter
         self.path = path
+        self._index_path = os.path.join(location.metadata_cache(),
+                                        module._cache_key(path) + '.index')
+        self._thumbnail_path = None
+        head = self._extract_thumbnails(head, module)
         self.options, self.non_option_lines = self._parse_options(head, tail)
 
+    def _extract_thumbnails(self, head, module):
+        """
+        Write thumbnails embedded in the header into the thumbnail cache
+        and return the header without them. Thumbnails are only searched
+        for in the header, not at the end of the file.
+        """
+        head, images = split_thumbnails(head)
+        if images:
+            path_base = os.path.join(location.thumbnails(),
+                                     module._cache_key(self.path))
+            if write_thumbnails(images, path_base):
+                self._thumbnail_path = path_base + ".png"
+        return head
+
     @classmethod
     def _detect(cls, lines):
         """
@@ -64,15 +142,15 @@ class BaseParser:
     def _parse_options(self, head=[], tail=[]):
         options = {}
         non_option_lines = []
+        delimiter = self.DELIMITER
+        keys = self.OPTION_KEYS
         for l in itertools.chain(head, tail):
-            if self.DELIMITER in l:
-                key, value = l.split(self.DELIMITER, maxsplit=1)
-                value = value.strip()
-                try:
-                    value = eval(value, {}, {})
-                except (NameError, SyntaxError):
-                    pass
-                options[key.strip()] = value
+            if delimiter in l:
+                key, value = l.split(delimiter, maxsplit=1)
+                key = key.strip()
+                if keys is not None and key not in keys:
+                    continue
+                options[key] = parse_value(value.strip())
             else:
                 non_option_lines.append(l)
         return options, non_option_lines
@@ -84,6 +162,47 @@ class BaseParser:
         """Return a file object containing the G-Code data"""
         return open(self.path, "rb")
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_file_index', None)
+        state.pop('_file_index_done', None)
+        return state
+
+    def prepare_file_index(self):
+        """Build the file index in the background, so it is ready when
+        a print starts"""
+        self._request_file_index(urgent=False)
+
+    def get_file_index(self, wait=True):
+        """
+        Return the FileIndex with the byte offsets of layers and objects
+        in the stream returned by get_gcode_stream(). The file is scanned
+        once in the index thread, afterwards the index is read from the
+        cache. With wait=False None is returned until the index is ready,
+        so that the reactor doesn't block. FileIndexError is raised if
+        the index can't be built.
+        """
+        self._request_file_index(urgent=True)
+        if not self._file_index_done.is_set():
+            if not wait:
+                return None
+            self._file_index_done.wait()
+        if self._file_index is None:
+            raise FileIndexError("No file index for %s" % (self.path,))
+        return self._file_index
+
+    def _request_file_index(self, urgent):
+        if self._file_index_done is None:
+            self._file_index_done = threading.Event()
+        elif self._file_index_done.is_set() or not urgent:
+            return
+        request_file_index(self, self._index_path, self._set_file_index,
+                           urgent)
+
+    def _set_file_index(self, index):
+        self._file_index = index
+        self._file_index_done.set()
+
     def get_file_size(self):
         """The size of the gcode file in bytes"""
         return os.path.getsize(self.path)
@@ -215,13 +334,9 @@ class BaseParser:
         """The G-Code flavor used"""
         return None
 
-    def get_thumbnail_path(self):
-        """Full path to a thumbnail image of the object"""
-        return None
-
-    def parse_elapsed_time(self, line):
+    def get_thumbnail_path(self, small=False):
         """
-        Return the printing time in seconds up to this line as predicted
-        by the slicer. Requires the comment line describing the estimate.
+        Full path to a thumbnail image of the object. If small is True,
+        a version downscaled for list views is returned if available.
         """
-        return None
+        return get_thumbnail(self._thumbnail_path, small)
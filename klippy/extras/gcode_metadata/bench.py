@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Usage:
+
+./bench.py [-r REPEAT] PATH...
+
+Compare the speed of parsing the metadata options of the given gcode files
+using eval() (the previous implementation), the literal parser keeping all
+options, and the literal parser skipping options no getter uses.
+"""
+
+import configparser
+import itertools
+import optparse
+import site
+import time
+from os.path import basename, dirname, realpath
+
+klippo_dir = dirname(dirname(dirname(realpath(__file__))))
+site.addsitedir(klippo_dir)
+
+import configfile
+from extras.gcode_metadata import load_config
+
+class DummyPrinter:
+    class Reactor:
+        process_name = "printer"
+        def register_event_handler(*args): pass
+    reactor = Reactor()
+    def register_event_handler(*args): pass
+
+def parse_options_eval(parser, head, tail):
+    options = {}
+    for l in itertools.chain(head, tail):
+        if parser.DELIMITER in l:
+            key, value = l.split(parser.DELIMITER, maxsplit=1)
+            value = value.strip()
+            try:
+                value = eval(value, {}, {})
+            except Exception:
+                pass
+            options[key.strip()] = value
+    return options
+
+def parse_options_all(parser, head, tail):
+    keys = parser.OPTION_KEYS
+    parser.OPTION_KEYS = None
+    try:
+        return parser._parse_options(head, tail)[0]
+    finally:
+        parser.OPTION_KEYS = keys
+
+def parse_options_fast(parser, head, tail):
+    return parser._parse_options(head, tail)[0]
+
+def main():
+    opts = optparse.OptionParser("%prog [options] <gcode files>")
+    opts.add_option("-r", "--repeat", type="int", dest="repeat", default=100,
+                    help="number of times each file is parsed")
+    options, args = opts.parse_args()
+    if not args:
+        opts.error("A path to parse must be provided")
+    fileconfig = configparser.ConfigParser()
+    fileconfig.read_dict({"extruder": {"filament_diameter": "1.75"}})
+    config = configfile.ConfigWrapper(
+        DummyPrinter(), fileconfig, {}, "gcode_metadata")
+    mm = load_config(config)
+    for path in args:
+        with open(path, "rb") as fp:
+            head = mm._get_head_md(fp)
+            tail = mm._get_tail_md(fp)
+        ParserClass = mm._find_parser(head + tail)
+        parser = ParserClass(head, tail, path, mm)
+        print("%s: %s, %d comment lines" % (
+            basename(path), parser.get_slicer(), len(head) + len(tail)))
+        for name, func in [("eval", parse_options_eval),
+                           ("literal", parse_options_all),
+                           ("literal used keys", parse_options_fast)]:
+            start = time.process_time()
+            for i in range(options.repeat):
+                res = func(parser, head, tail)
+            duration = (time.process_time() - start) / options.repeat
+            print("  %-18s %8.3f ms %5d options" % (
+                name, duration * 1000, len(res)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+Byte offset index of a G-Code file
+
+The index maps layer changes and EXCLUDE_OBJECT_START/END blocks to byte
+offsets in the G-Code stream (the decompressed stream for UFP files), so
+that a print can be started at any layer or skip objects without reading
+the G-Code in between. Along with every layer the modal state that is
+needed to continue printing from there is recorded. The elapsed time
+comments of the slicer are collected as well, to look up the progress
+for a file position.
+
+The file is scanned once with a regular expression that only matches the
+few lines of interest, and the index is stored in the metadata cache
+directory.
+"""
+
+import bisect
+import collections
+import logging
+import os
+import pickle
+import re
+import threading
+
+"""Increase when the index format changes"""
+INDEX_VERSION = 3
+
+"""Read size of the scan. Kept small so that a scan in a background thread
+doesn't hold the GIL for long."""
+CHUNK_SIZE = 64 * 1024
+
+"""Layer start, with the state at that point of the file"""
+Layer = collections.namedtuple('Layer', (
+    'offset', 'z', 'absolute_coordinates', 'absolute_extrude',
+    'fan_speed', 'extruder_temp', 'bed_temp'))
+
+PATTERN_SCAN = re.compile(
+    rb"^[ \t]*(?:"
+    rb"(?P<layer>;LAYER:|;LAYER_CHANGE)"
+    rb"|(?P<object>EXCLUDE_OBJECT_START|EXCLUDE_OBJECT_END)"
+    rb"|;TIME_ELAPSED:(?P<elapsed>[0-9.]+)"
+    rb"|(?P<modal>G9[01]|M8[23]|M10[4679]|M1[49]0)\b"
+    rb"|G[01][ \t][^;\n]*?Z(?P<z>-?[0-9.]+))",
+    re.MULTILINE)
+PATTERN_NAME = re.compile(rb"NAME=(\S+)", re.IGNORECASE)
+PATTERN_S = re.compile(rb"[ \t]S(-?[0-9.]+)")
+PATTERN_E = re.compile(rb"^[ \t]*G(?:[01]|92)[ \t][^;\n]*?E(-?[0-9.]+)",
+                       re.MULTILINE)
+
+PATTERN_BLOCK = re.compile(
+    rb"^[ \t]*(?![Gg]0?[0-3](?![0-9.])|;|\r?$)(?P<cmd>[^\s;]+)[^;\n]*",
+    re.MULTILINE)
+PATTERN_Z = re.compile(rb"^[ \t]*G[01][ \t][^;\n]*?Z(-?[0-9.]+)",
+                       re.MULTILINE)
+PATTERN_F = re.compile(rb"^[ \t]*G[01][ \t][^;\n]*?F([0-9.]+)",
+                       re.MULTILINE)
+PATTERN_XYZ = re.compile(rb"[ \t][XYZ]")
+PATTERN_TOOL = re.compile(rb"T[0-9]+")
+PATTERN_EXTENDED_PARAM = re.compile(rb"([A-Z_0-9]+)=(\S*)")
+
+"""Commands of a skipped block that are replayed with their last value"""
+SKIP_REPLAY_COMMANDS = {
+    b"G90", b"M82", b"M83", b"M73", b"M104", b"M106", b"M107", b"M109",
+    b"M117", b"M140", b"M190", b"M204", b"M220", b"M221",
+    b"SET_FAN_SPEED", b"SET_HEATER_TEMPERATURE", b"SET_PRESSURE_ADVANCE",
+    b"SET_VELOCITY_LIMIT"}
+"""Commands of a skipped block that don't affect the state after it"""
+SKIP_IGNORE_COMMANDS = {
+    b"EXCLUDE_OBJECT_START", b"EXCLUDE_OBJECT_END", b"G4", b"M400"}
+"""Parameters selecting the heater, fan or tool a command applies to"""
+SKIP_TARGET_PARAMS = {b"T", b"P", b"HEATER", b"EXTRUDER", b"FAN"}
+
+class FileIndex:
+
+    def __init__(self):
+        self.layers = []
+        # Object name -> list of (start offset, end offset) of its blocks
+        self.objects = {}
+        # Slicer elapsed time comments, as sorted offsets and their times
+        self.elapsed_offsets = []
+        self.elapsed_times = []
+        # Size of the G-Code stream in bytes
+        self.size = 0
+
+    def get_layer_count(self):
+        return len(self.layers)
+
+    def get_layer(self, layer):
+        """Return the Layer entry of the given layer index"""
+        return self.layers[layer]
+
+    def get_object_blocks(self, name):
+        return self.objects.get(name.upper(), [])
+
+    def get_slicer_time(self, offset, total_time):
+        """
+        Return the time in seconds the slicer predicts for printing up to
+        offset, interpolated between the elapsed time comments. The start
+        and the end of the file, at total_time, are used as additional
+        points, so files without such comments get an estimate too.
+        """
+        i = bisect.bisect_right(self.elapsed_offsets, offset)
+        if i > 0:
+            start = self.elapsed_offsets[i - 1], self.elapsed_times[i - 1]
+        else:
+            start = 0, 0.
+        if i < len(self.elapsed_offsets):
+            end = self.elapsed_offsets[i], self.elapsed_times[i]
+        else:
+            end = self.size, max(total_time, start[1])
+        if end[0] <= start[0]:
+            return end[1]
+        fraction = min(1., (offset - start[0]) / (end[0] - start[0]))
+        return start[1] + fraction * (end[1] - start[1])
+
+
+def _get_param(pattern, line, default=None):
+    match = pattern.search(line)
+    if match is None:
+        return default
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return default
+
+def build_index(fp):
+    """Scan the given binary G-Code stream and return its FileIndex"""
+    index = FileIndex()
+    state = {'absolute_coordinates': True, 'absolute_extrude': True,
+             'fan_speed': 0., 'extruder_temp': 0., 'bed_temp': 0.}
+    open_objects = {}
+    layer_z_pending = False
+    chunk_offset = 0
+    partial = b""
+    while True:
+        data = fp.read(CHUNK_SIZE)
+        buf = partial + data
+        if data:
+            # Only scan complete lines
+            end = buf.rfind(b"\n") + 1
+            partial = buf[end:]
+            buf = buf[:end]
+        for m in PATTERN_SCAN.finditer(buf):
+            if m.lastgroup == 'z':
+                if layer_z_pending:
+                    try:
+                        z = float(m.group('z'))
+                    except ValueError:
+                        continue
+                    index.layers[-1] = index.layers[-1]._replace(z=z)
+                    layer_z_pending = False
+                continue
+            if m.lastgroup == 'elapsed':
+                try:
+                    elapsed = float(m.group('elapsed'))
+                except ValueError:
+                    continue
+                index.elapsed_offsets.append(chunk_offset + m.start())
+                index.elapsed_times.append(elapsed)
+                continue
+            line_end = buf.find(b"\n", m.start())
+            if line_end < 0:
+                line_end = len(buf)
+            line = buf[m.start():line_end].split(b";", 1)[0] + b" "
+            offset = chunk_offset + m.start()
+            if m.lastgroup == 'layer':
+                index.layers.append(Layer(offset=offset, z=None, **state))
+                layer_z_pending = True
+            elif m.lastgroup == 'object':
+                match = PATTERN_NAME.search(line)
+                if match is not None:
+                    name = match.group(1).decode(errors='replace').upper()
+                elif (m.group('object') == b"EXCLUDE_OBJECT_END"
+                      and open_objects):
+                    # NAME is optional, it ends the last started object
+                    name = next(reversed(open_objects))
+                else:
+                    continue
+                if m.group('object') == b"EXCLUDE_OBJECT_START":
+                    open_objects.pop(name, None)
+                    open_objects[name] = offset
+                elif name in open_objects:
+                    index.objects.setdefault(name, []).append(
+                        (open_objects.pop(name), chunk_offset + line_end + 1))
+            else:
+                cmd = m.group('modal')
+                if cmd == b"G90":
+                    state['absolute_coordinates'] = True
+                elif cmd == b"G91":
+                    state['absolute_coordinates'] = False
+                elif cmd == b"M82":
+                    state['absolute_extrude'] = True
+                elif cmd == b"M83":
+                    state['absolute_extrude'] = False
+                elif cmd == b"M106":
+                    state['fan_speed'] = _get_param(PATTERN_S, line, 255.)
+                elif cmd == b"M107":
+                    state['fan_speed'] = 0.
+                elif cmd in (b"M104", b"M109"):
+                    state['extruder_temp'] = _get_param(
+                        PATTERN_S, line, state['extruder_temp'])
+                else:
+                    state['bed_temp'] = _get_param(
+                        PATTERN_S, line, state['bed_temp'])
+        if not data:
+            break
+        chunk_offset += len(buf)
+    index.size = chunk_offset + len(buf)
+    return index
+
+def find_last_extrude_position(fp, offset, max_distance=1024*1024):
+    """
+    Return the last E value set by G0/G1/G92 before offset in the given
+    binary G-Code stream, or None if there is none within max_distance.
+    """
+    end = offset
+    while end > 0 and offset - end < max_distance:
+        start = max(0, end - CHUNK_SIZE)
+        fp.seek(start)
+        buf = fp.read(end - start)
+        if start > 0:
+            # Skip the partial first line, it is read with the next block
+            skip = buf.find(b"\n") + 1
+            buf = buf[skip:]
+            start += skip
+        matches = list(PATTERN_E.finditer(buf))
+        if matches:
+            return float(matches[-1].group(1))
+        if start == end:
+            break
+        end = start
+    return None
+
+
+class FileIndexError(Exception):
+    pass
+
+def load_file_index(md, index_path):
+    """
+    Return the FileIndex of the G-Code of the metadata object md. It is read
+    from index_path if that is up to date, otherwise the file is scanned
+    and the result is written to index_path.
+    """
+    try:
+        if os.path.getmtime(index_path) >= os.path.getmtime(md.path):
+            with open(index_path, 'rb') as fp:
+                version, index = pickle.load(fp)
+            if version == INDEX_VERSION:
+                return index
+    except OSError:
+        pass
+    except Exception:
+        logging.exception("Could not read file index %s", index_path)
+    with md.get_gcode_stream() as fp:
+        index = build_index(fp)
+    # Other processes may read the index at the same time
+    tmp_path = "%s.%d.tmp" % (index_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as fp:
+            pickle.dump((INDEX_VERSION, index), fp)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        logging.exception("Could not write file index %s", index_path)
+    return index
+
+
+class _IndexBuilder:
+    """
+    Loads and builds file indexes one at a time in a background thread,
+    so that browsing many files doesn't start a scan for each of them.
+    Requests for the same index file are merged.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Index paths in build order
+        self.queue = collections.deque()
+        # Index path -> (metadata object, list of callbacks)
+        self.pending = {}
+        self.thread = None
+
+    def request(self, md, index_path, callback, urgent=False):
+        with self.lock:
+            if index_path in self.pending:
+                callbacks = self.pending[index_path][1]
+                if callback not in callbacks:
+                    callbacks.append(callback)
+                if urgent and index_path in self.queue:
+                    self.queue.remove(index_path)
+                    self.queue.appendleft(index_path)
+                return
+            self.pending[index_path] = (md, [callback])
+            if urgent:
+                self.queue.appendleft(index_path)
+            else:
+                self.queue.append(index_path)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run,
+                                               name="File-Index-Thread",
+                                               daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        os.nice(10)
+        while True:
+            with self.lock:
+                if not self.queue:
+                    self.thread = None
+                    return
+                index_path = self.queue.popleft()
+                md = self.pending[index_path][0]
+            try:
+                index = load_file_index(md, index_path)
+            except Exception:
+                logging.exception("Could not build file index for %s",
+                                  md.get_path())
+                index = None
+            with self.lock:
+                md, callbacks = self.pending.pop(index_path)
+            for callback in callbacks:
+                callback(index)
+
+_builder = _IndexBuilder()
+
+def request_file_index(md, index_path, callback, urgent=False):
+    """
+    Load or build the FileIndex of the metadata object md in the
+    background and call callback with it (or None if that failed) from
+    the index thread. Urgent requests are handled before the others.
+    """
+    _builder.request(md, index_path, callback, urgent)
+
+
+def _get_replay_key(cmd, line):
+    """
+    Return the key of a replayed command line. A later line with the same
+    key overrides all values it sets, so only the last one is replayed.
+    """
+    if cmd in (b"M82", b"M83"):
+        return b"M82", ()
+    if b"=" in line:
+        params = PATTERN_EXTENDED_PARAM.findall(line.upper())
+    else:
+        params = [(p[:1].upper(), p[1:]) for p in line.split()[1:]]
+    return cmd, tuple(sorted(
+        (name, value if name in SKIP_TARGET_PARAMS else None)
+        for name, value in params))
+
+def get_skip_commands(data):
+    """
+    Return the commands that replace skipping the G-Code block data
+    (given as bytes), so that the state after it stays consistent, and
+    the E position at its end. The last Z height and feedrate of the
+    moves are restored, and the last values set by the commands in
+    SKIP_REPLAY_COMMANDS (waiting temperature commands don't wait) and
+    the tool changes are replayed in their original order. None is
+    returned if the block can't be skipped because it switches to
+    relative positioning, sets the position of an axis or contains any
+    other command, which might change the state in a way that isn't
+    known here.
+    """
+    # Replay key -> command line, in the order of their last occurrence.
+    # Tool changes start a new segment, as commands without a tool
+    # parameter apply to the current tool
+    last = {}
+    segment = 0
+    for m in PATTERN_BLOCK.finditer(data):
+        cmd = m.group('cmd').upper()
+        line = m.group(0).strip()
+        if cmd in SKIP_IGNORE_COMMANDS:
+            continue
+        if cmd == b"G92":
+            if PATTERN_XYZ.search(line + b" "):
+                return None, None
+            continue
+        if PATTERN_TOOL.fullmatch(cmd):
+            segment += 1
+            last[(segment, cmd)] = line
+            continue
+        if cmd not in SKIP_REPLAY_COMMANDS:
+            return None, None
+        if cmd in (b"M109", b"M190"):
+            cmd = {b"M109": b"M104", b"M190": b"M140"}[cmd]
+            line = cmd + line[4:]
+        key = (segment, _get_replay_key(cmd, line))
+        last.pop(key, None)
+        last[key] = line
+    commands = [c.decode(errors='replace') for c in last.values()]
+    tail = data
+    if len(data) > 4096:
+        tail = data[-4096:]
+        tail = tail[tail.find(b"\n") + 1:]
+    for block in (tail, data):
+        matches = list(PATTERN_Z.finditer(block))
+        if matches:
+            commands.append("G0 Z" + matches[-1].group(1).decode())
+            break
+    last_e = None
+    for block in (tail, data):
+        matches = list(PATTERN_E.finditer(block))
+        if matches:
+            last_e = float(matches[-1].group(1))
+            break
+    for block in (tail, data):
+        matches = list(PATTERN_F.finditer(block))
+        if matches:
+            commands.append("G1 F" + matches[-1].group(1).decode())
+            break
+    return commands, last_e
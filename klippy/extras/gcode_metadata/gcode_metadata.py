@@ -129,6 +129,7 @@ class GCodeMetadata(MetadataBase):
             raise ValueError(f"File must be either gcode or ufp file, not {ext}")
         self.write_cache(metadata, path)
         self.prune_cache()
+        metadata.prepare_file_index()
         return metadata
 
     def prune_cache(self):
@@ -7,6 +7,9 @@ class PrusaSlicerParser(BaseParser):
     PATTERN_DETECT = re.compile("generated by PrusaSlicer",
                                 flags=re.IGNORECASE)
     SLICER = "PrusaSlicer"
+    OPTION_KEYS = frozenset(["gcode_flavor", "filament_diameter",
+                             "filament_density", "filament used [mm]",
+                             "estimated printing time (normal mode)"])
 
     # Read the tail when in a UFP file
     _needs_tail=True
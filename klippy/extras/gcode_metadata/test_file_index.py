@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import io
+from os.path import dirname, realpath
+import unittest
+
+import site
+_klippo_dir = dirname(dirname(dirname(realpath(__file__))))
+site.addsitedir(_klippo_dir)
+
+from extras.gcode_metadata.file_index import build_index, get_skip_commands
+from extras.virtual_sdcard import PrintJob
+
+
+GCODE = b"""M140 S60
+M104 S200
+G90
+M82
+;LAYER:0
+G1 Z0.2 F600
+EXCLUDE_OBJECT_START NAME=cube_1
+G1 X10 Y10 E1.0 F1200
+M204 S500
+G1 X20 Y10 E2.0
+EXCLUDE_OBJECT_END NAME=cube_1
+EXCLUDE_OBJECT_START NAME=cube_2
+G1 X30 Y10 E3.0
+EXCLUDE_OBJECT_END
+;LAYER:1
+M106 S255
+G1 Z0.4
+EXCLUDE_OBJECT_START NAME=cube_1
+G1 X10 Y10 E4.0
+EXCLUDE_OBJECT_END NAME=cube_1
+"""
+
+
+class _DummyGCode:
+    def __init__(self):
+        self.scripts = []
+    def run_script(self, script):
+        self.scripts.append(script)
+
+class _DummyGCodeMove:
+    absolute_coord = True
+    absolute_extrude = True
+
+
+class BuildIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = build_index(io.BytesIO(GCODE))
+
+    def get_block(self, name, i):
+        start, end = self.index.get_object_blocks(name)[i]
+        return GCODE[start:end]
+
+    def test_layers(self):
+        self.assertEqual(self.index.get_layer_count(), 2)
+        layer = self.index.get_layer(1)
+        self.assertEqual(layer.z, .4)
+        self.assertEqual(layer.bed_temp, 60.)
+        self.assertEqual(layer.extruder_temp, 200.)
+        self.assertEqual(layer.fan_speed, 0.)
+        self.assertTrue(GCODE[layer.offset:].startswith(b";LAYER:1\n"))
+
+    def test_objects(self):
+        self.assertEqual(len(self.index.get_object_blocks("CUBE_1")), 2)
+        block = self.get_block("cube_1", 0)
+        self.assertTrue(block.startswith(b"EXCLUDE_OBJECT_START NAME=cube_1"))
+        self.assertTrue(block.endswith(b"EXCLUDE_OBJECT_END NAME=cube_1\n"))
+
+    def test_object_end_without_name(self):
+        block = self.get_block("cube_2", 0)
+        self.assertTrue(block.startswith(b"EXCLUDE_OBJECT_START NAME=cube_2"))
+        self.assertTrue(block.endswith(b"EXCLUDE_OBJECT_END\n"))
+
+
+class SkipCommandsTest(unittest.TestCase):
+
+    def test_moves(self):
+        commands, last_e = get_skip_commands(
+            b"EXCLUDE_OBJECT_START NAME=a\n"
+            b"G1 Z0.6 F600 ; lift\n"
+            b"\n"
+            b"G1 X1 Y2 E3.5 F1800\n"
+            b"EXCLUDE_OBJECT_END NAME=a\n")
+        self.assertEqual(commands, ["G0 Z0.6", "G1 F1800"])
+        self.assertEqual(last_e, 3.5)
+
+    def test_replay_last_values(self):
+        commands, last_e = get_skip_commands(
+            b"M204 S500\n"
+            b"SET_VELOCITY_LIMIT ACCEL=500 SQUARE_CORNER_VELOCITY=5\n"
+            b"M106 S128\n"
+            b"G1 X1 E1\n"
+            b"M109 S210\n"
+            b"SET_VELOCITY_LIMIT ACCEL=800\n"
+            b"M204 S700\n"
+            b"M221 S95\n")
+        self.assertEqual(commands, [
+            "SET_VELOCITY_LIMIT ACCEL=500 SQUARE_CORNER_VELOCITY=5",
+            "M106 S128", "M104 S210", "SET_VELOCITY_LIMIT ACCEL=800",
+            "M204 S700", "M221 S95"])
+        self.assertEqual(last_e, 1.)
+
+    def test_tool_change(self):
+        commands, last_e = get_skip_commands(
+            b"M104 S200\n"
+            b"T1\n"
+            b"M104 S210\n"
+            b"M104 T0 S190\n"
+            b"G92 E0\n")
+        self.assertEqual(commands, ["M104 S200", "T1", "M104 S210",
+                                    "M104 T0 S190"])
+        self.assertEqual(last_e, 0.)
+
+    def test_not_skippable(self):
+        for data in (b"G91\nG1 X1\n", b"G92 X0\n", b"G10\nG1 X1\nG11\n",
+                     b"PRIME_LINE\n", b"M600\n"):
+            self.assertEqual(get_skip_commands(data), (None, None), data)
+
+
+class SkipBlockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = build_index(io.BytesIO(GCODE))
+        self.job = PrintJob.__new__(PrintJob)
+        self.job.gcode = _DummyGCode()
+        self.job.gcode_move = _DummyGCodeMove()
+        self.job.file_obj = io.BytesIO(GCODE)
+
+    def skip(self, name, buffered_size):
+        start, end = self.index.get_object_blocks(name)[0]
+        self.job.file_position = start
+        self.job.file_obj.seek(start + buffered_size)
+        buffered = GCODE[start:start + buffered_size]
+        return self.job.skip_block(buffered, end - start), end
+
+    def test_skip(self):
+        rest, end = self.skip("cube_1", 16)
+        self.assertEqual(rest, b"")
+        self.assertEqual(self.job.file_obj.tell(), end)
+        self.assertEqual(self.job.gcode.scripts,
+                         ["M204 S500\nG1 F1200", "G92 E2.0"])
+
+    def test_skip_buffered(self):
+        start, end = self.index.get_object_blocks("cube_2")[0]
+        rest, end = self.skip("cube_2", end - start + 8)
+        self.assertEqual(rest, GCODE[end:end + 8])
+        self.assertEqual(self.job.gcode.scripts, ["G92 E3.0"])
+
+    def test_not_skipped(self):
+        self.job.gcode_move.absolute_coord = False
+        rest, end = self.skip("cube_1", 16)
+        self.assertIsNone(rest)
+        self.assertEqual(self.job.gcode.scripts, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Thumbnails embedded in G-Code comments
+
+PrusaSlicer (and Cura with a post processing script) can store base64
+encoded PNG images in the file header, in blocks like this:
+
+; thumbnail begin 220x124 15620
+; iVBORw0KGgoAAAANSUhEUgAAANwAAAB8CAYAAAAhAJ...
+; thumbnail end
+
+The images are decoded once when the metadata is parsed and written into
+the thumbnail cache, together with a version downscaled for list views.
+"""
+
+import base64
+import binascii
+import io
+import logging
+import os
+import re
+import struct
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+"""Size in pixels of the longer side of thumbnails shown in lists"""
+SMALL_SIZE = 128
+
+PATTERN_BEGIN = re.compile(r"\s*thumbnail(_PNG)? begin \d+x\d+ \d+")
+PATTERN_END = re.compile(r"\s*thumbnail(_PNG)? end")
+
+def split_thumbnails(lines):
+    """
+    Separate thumbnail blocks from the given comment lines.
+    Return the remaining lines and a list of the decoded PNG images.
+    """
+    if not any(PATTERN_BEGIN.match(l) for l in lines):
+        return lines, []
+    remaining = []
+    images = []
+    block = None
+    for l in lines:
+        if block is None:
+            if PATTERN_BEGIN.match(l):
+                block = []
+            else:
+                remaining.append(l)
+        elif PATTERN_END.match(l):
+            try:
+                data = base64.b64decode("".join(block))
+            except (binascii.Error, ValueError):
+                logging.info("Ignoring invalid embedded thumbnail")
+            else:
+                if data.startswith(PNG_SIGNATURE):
+                    images.append(data)
+            block = None
+        else:
+            block.append(l.strip())
+    return remaining, images
+
+def png_size(data):
+    """Return (width, height) of a PNG image"""
+    return struct.unpack(">II", data[16:24])
+
+def _downscale(data, size):
+    """Return the image scaled to fit size, or None if that's not possible"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.thumbnail((size, size))
+        out = io.BytesIO()
+        img.save(out, "PNG")
+    except Exception:
+        logging.exception("Could not downscale thumbnail")
+        return None
+    return out.getvalue()
+
+def write_thumbnails(images, path_base):
+    """
+    Write the largest of the given PNG images to path_base + ".png" and
+    a version for list views to path_base + "_small.png". If Pillow is
+    not available, the smallest image that is at least SMALL_SIZE pixels
+    big is used for lists instead of downscaling. Without a separate
+    image for lists, an old path_base + "_small.png" is removed.
+    Return True if any image was written.
+    """
+    images = [(max(png_size(data)), data) for data in images
+              if len(data) >= 24 and data.startswith(PNG_SIGNATURE)]
+    if not images:
+        return False
+    images.sort(key=lambda i: i[0])
+    large_size, large = images[-1]
+    small = None
+    if large_size > SMALL_SIZE:
+        small = next(data for size, data in images if size >= SMALL_SIZE)
+        small = _downscale(small, SMALL_SIZE) or small
+    try:
+        with open(path_base + ".png", "wb") as fp:
+            fp.write(large)
+        if small is not None and small is not large:
+            with open(path_base + "_small.png", "wb") as fp:
+                fp.write(small)
+        elif os.path.exists(path_base + "_small.png"):
+            # Left from an earlier version of the file, lists use the
+            # large image now
+            os.remove(path_base + "_small.png")
+    except OSError:
+        logging.exception("Could not write thumbnail")
+        return False
+    return True
+
+def get_thumbnail(path, small=False):
+    """
+    Return the path of a thumbnail written by write_thumbnails, preferring
+    the small version if requested. None is returned if it doesn't exist.
+    """
+    if path is None:
+        return None
+    if small:
+        small_path = path[:-4] + "_small.png"
+        if os.path.isfile(small_path):
+            return small_path
+    if os.path.isfile(path):
+        return path
+    return None
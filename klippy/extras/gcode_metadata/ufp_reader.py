@@ -1,10 +1,10 @@
-import copy
 import logging
 import os
 import xml.etree.ElementTree as ET
 from zipfile import ZipFile
 
 from .base_parser import BaseParser
+from .thumbnails import write_thumbnails, get_thumbnail
 import location
 
 _GCODE_PATH = "/3D/model.gcode"
@@ -106,15 +106,10 @@ class _UFPReader(metaclass=_UFPMetaClass):
         if virtual_path is None:
             return False
 
-        try:
-            with open(self._thumbnail_path, "wb") as thumbnail_target:
-                logging.debug("Extracting thumbnail for %s into %s",
-                        self.path, self._thumbnail_path)
-                thumbnail_target.write(zip_obj.read(virtual_path))
-            return True
-        except OSError:
-            logging.exception("Could not write thumbnail")
-        return False
+        logging.debug("Extracting thumbnail for %s into %s",
+                self.path, self._thumbnail_path)
+        return write_thumbnails([zip_obj.read(virtual_path)],
+                                self._thumbnail_path[:-4])
 
     def _extract_materials(self, zip_obj):
         """
@@ -187,16 +182,16 @@ class _UFPReader(metaclass=_UFPMetaClass):
             return super(self.__class__, self).get_diameter(extruder)
         return diameter
 
-    def get_thumbnail_path(self):
+    def get_thumbnail_path(self, small=False):
         if not (self._thumbnail_path and os.path.isfile(self._thumbnail_path)):
             # Thumbnail not found, try extracting it
             with ZipFile(self.path) as zip_obj:
                 if not self._extract_thumbnail(zip_obj):
                     return None
-        return self._thumbnail_path
+        return get_thumbnail(self._thumbnail_path, small)
 
     def __reduce__(self):
-        state = copy.copy(self.__dict__)
+        state = self.__getstate__()
         del state["_module"]
         return (self._restore_pickled,
                 (self._baseclass,),
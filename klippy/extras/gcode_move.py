@@ -50,6 +50,7 @@ class GCodeMove:
         self.saved_states = {}
         self.move_transform = self.move_with_transform = None
         self.position_with_transform = (lambda: [0., 0., 0., 0.])
+        self.move_batch_with_transform = None
         self.collision_avoidance_moves = 0
     def _handle_ready(self):
         self.is_printer_ready = True
@@ -57,6 +58,7 @@ class GCodeMove:
             toolhead = self.printer.lookup_object('toolhead')
             self.move_with_transform = toolhead.move
             self.position_with_transform = toolhead.get_position
+            self.move_batch_with_transform = toolhead.move_batch
         self.reset_last_position()
     def _handle_shutdown(self):
         if not self.is_printer_ready:
@@ -87,6 +89,9 @@ class GCodeMove:
         self.move_transform = transform
         self.move_with_transform = transform.move
         self.position_with_transform = transform.get_position
+        # Transforms without batch support get the moves one at a time
+        self.move_batch_with_transform = getattr(transform, 'move_batch',
+                                                 None)
         return old_transform
     def _get_gcode_position(self):
         p = [lp - bp for lp, bp in zip(self.last_position, self.base_position)]
@@ -145,6 +150,8 @@ class GCodeMove:
                              % (gcmd.get_commandline(),))
         if 'C' in params:
             self.collision_avoidance_moves = max(int(params['C']), self.collision_avoidance_moves)
+        self._move_to(end_pos, params)
+    def _move_to(self, end_pos, params):
         if self.collision_avoidance_moves > 0:
             collision = self.printer.lookup_object('collision')
             moves = collision.pathfinder.find_path(tuple(self.last_position[:3]), tuple(end_pos[:3]))
@@ -159,6 +166,33 @@ class GCodeMove:
         else:
             self.last_position = end_pos
             self.move_with_transform(self.last_position, self.speed, bool('FORCE' in params))
+    def move_batch(self, positions, gcode_speed=None):
+        # Move through a series of absolute g-code positions (eg, the
+        # segments of an arc).  An axis that is None keeps its position.
+        if gcode_speed is not None:
+            if gcode_speed <= 0.:
+                raise self.printer.command_error("Invalid speed %.3f"
+                                                 % (gcode_speed,))
+            self.speed = gcode_speed * self.speed_factor
+        base_position = self.base_position
+        extrude_factor = self.extrude_factor
+        last_position = self.last_position
+        end_positions = []
+        for pos in positions:
+            last_position = list(last_position)
+            for i in (0, 1, 2):
+                if pos[i] is not None:
+                    last_position[i] = pos[i] + base_position[i]
+            if pos[3] is not None:
+                last_position[3] = pos[3] * extrude_factor + base_position[3]
+            end_positions.append(last_position)
+        if (self.move_batch_with_transform is None
+            or self.collision_avoidance_moves > 0):
+            for end_pos in end_positions:
+                self._move_to(end_pos, {})
+            return
+        self.last_position = last_position
+        self.move_batch_with_transform(end_positions, self.speed)
     # G-Code coordinate manipulation
     def cmd_G20(self, gcmd):
         # Set units to inches
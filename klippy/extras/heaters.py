@@ -218,6 +218,64 @@ class ControlPID:
             or target_temp == 0)
 
 
+######################################################################
+# Temperature history
+######################################################################
+
+HISTORY_INTERVAL = 1.
+HISTORY_SIZE = 1200
+
+# Fixed size ring of temperature samples.  All sensors are sampled at
+# the same times, so a single list of timestamps describes all series.
+class TemperatureHistory:
+    def __init__(self, names, size=HISTORY_SIZE):
+        self.size = size
+        self.count = 0
+        self.times = [0.] * size
+        self.series = {name: ([0.] * size, [0.] * size, [0.] * size)
+                       for name in names}
+    def add_sample(self, eventtime, values):
+        pos = self.count % self.size
+        self.times[pos] = eventtime
+        for name, (temps, targets, powers) in self.series.items():
+            temps[pos], targets[pos], powers[pos] = values[name]
+        self.count += 1
+    def _get_pos(self, index):
+        # Map an index of the stored samples (oldest first) to the ring
+        return (self.count - min(self.count, self.size) + index) % self.size
+    def _find(self, eventtime):
+        # Index of the first stored sample at or after eventtime
+        low, high = 0, min(self.count, self.size)
+        while low < high:
+            mid = (low + high) // 2
+            if self.times[self._get_pos(mid)] < eventtime:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    def _extract(self, data, start, end):
+        first = self._get_pos(start)
+        if first + end - start <= self.size:
+            return data[first:first + end - start]
+        return data[first:] + data[:self._get_pos(end)]
+    def get_history(self, start_time=0., end_time=None, names=None):
+        start = self._find(start_time)
+        end = min(self.count, self.size)
+        if end_time is not None:
+            end = max(start, self._find(end_time))
+        if names is None:
+            names = self.series.keys()
+        sensors = {}
+        for name in names:
+            temps, targets, powers = self.series[name]
+            sensors[name] = {
+                'temperature': self._extract(temps, start, end),
+                'target': self._extract(targets, start, end),
+                'power': self._extract(powers, start, end)}
+        return {'time': self._extract(self.times, start, end),
+                'sensors': sensors}
+
+
 ######################################################################
 # Sensor and heater lookup
 ######################################################################
@@ -228,9 +286,11 @@ class PrinterHeaters:
         self.sensor_factories = {}
         self.heaters = {}
         self.gcode_id_to_sensor = {}
+        self.sensors = {}
         self.available_heaters = []
         self.available_sensors = []
         self.has_started = self.have_load_sensors = False
+        self.history = None
         self.printer.register_event_handler("klippy:ready", self._handle_ready)
         self.printer.register_event_handler("gcode:request_restart",
                                             self.turn_off_all_heaters)
@@ -241,6 +301,10 @@ class PrinterHeaters:
         gcode.register_command("M105", self.cmd_M105, when_not_ready=True)
         gcode.register_command("TEMPERATURE_WAIT", self.cmd_TEMPERATURE_WAIT,
                                desc=self.cmd_TEMPERATURE_WAIT_help)
+        # Register webhooks
+        webhooks = self.printer.lookup_object('webhooks')
+        webhooks.register_endpoint("heaters/temperature_history",
+                                   self._handle_history_request)
     def load_config(self, config):
         self.have_load_sensors = True
         # Load default temperature sensors
@@ -285,6 +349,7 @@ class PrinterHeaters:
         return self.sensor_factories[sensor_type](config)
     def register_sensor(self, config, psensor, gcode_id=None):
         self.available_sensors.append(config.get_name())
+        self.sensors[config.get_name()] = psensor
         if gcode_id is None:
             gcode_id = config.get('gcode_id', None)
             if gcode_id is None:
@@ -305,6 +370,9 @@ class PrinterHeaters:
     # G-Code M105 temperature reporting
     def _handle_ready(self):
         self.has_started = True
+        self.history = TemperatureHistory(self.available_sensors)
+        reactor = self.printer.get_reactor()
+        reactor.register_timer(self._sample_history, reactor.NOW)
     def _get_temp(self, eventtime):
         # Tn:XXX /YYY B:XXX /YYY
         out = []
@@ -339,6 +407,36 @@ class PrinterHeaters:
         heater.set_temp(temp)
         if wait and temp:
             self._wait_for_temperature(heater)
+    # Temperature history
+    def _sample_history(self, eventtime):
+        values = {}
+        for name, sensor in self.sensors.items():
+            if isinstance(sensor, Heater):
+                status = sensor.get_status(eventtime)
+                values[name] = (status['temperature'], status['target'],
+                                status['power'])
+            else:
+                temp, target = sensor.get_temp(eventtime)
+                values[name] = (round(temp, 2), target, 0.)
+        self.history.add_sample(eventtime, values)
+        return eventtime + HISTORY_INTERVAL
+    def get_temperature_history(self, start_time=0., end_time=None,
+                                names=None):
+        if self.history is None:
+            return {'time': [], 'sensors': {}}
+        return self.history.get_history(start_time, end_time, names)
+    def _handle_history_request(self, web_request):
+        start_time = web_request.get_float('start_time', 0.)
+        end_time = web_request.get('end_time', None, types=(int, float))
+        names = web_request.get('sensors', None, types=(list,))
+        if names is not None:
+            unknown = [n for n in names if n not in self.sensors]
+            if unknown:
+                raise web_request.error("Unknown sensor '%s'" % (unknown[0],))
+        reactor = self.printer.get_reactor()
+        history = self.get_temperature_history(start_time, end_time, names)
+        history['eventtime'] = reactor.monotonic()
+        web_request.send(history)
     cmd_TEMPERATURE_WAIT_help = "Wait for a temperature on a sensor"
     def cmd_TEMPERATURE_WAIT(self, gcmd):
         sensor_name = gcmd.get('SENSOR')
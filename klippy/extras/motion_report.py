@@ -3,11 +3,57 @@
 # Copyright (C) 2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging
+import logging, os, sys, json, struct, time
 import chelper
 
 API_UPDATE_INTERVAL = 0.500
 
+# Binary frames used for bulk streaming and motion captures.  A frame is
+# a FRAME_HEADER (sync byte, frame type, name length, payload length)
+# followed by the utf8 name and the payload.  The sync byte is chosen
+# so that a frame can never be mistaken for a json webhooks message.
+#  - Trapq payloads are a series of TRAPQ_RECORD entries (print_time,
+#    move_t, start_v, accel, start_x, start_y, start_z, x_r, y_r, z_r)
+#  - Stepper payloads are a STEPQ_HEADER (start_position,
+#    start_mcu_position, step_distance, first_clock, first_step_time,
+#    last_clock, last_step_time) followed by STEPQ_RECORD entries
+#    (first_clock, last_clock, start_position, step_count, interval, add)
+#  - Info payloads are a json encoded dictionary
+# All records are in chronological order.
+FRAME_SYNC = 0x00
+FRAME_HEADER = struct.Struct('<BcHI')
+FRAME_TRAPQ, FRAME_STEPQ, FRAME_INFO = b't', b's', b'i'
+TRAPQ_RECORD = struct.Struct('<10d')
+TRAPQ_FIELDS = ('print_time', 'move_t', 'start_v', 'accel',
+                'start_x', 'start_y', 'start_z', 'x_r', 'y_r', 'z_r')
+STEPQ_HEADER = struct.Struct('<dqdQdQd')
+STEPQ_RECORD = struct.Struct('<QQqiii4x')
+STEPQ_FIELDS = ('first_clock', 'last_clock', 'start_position',
+                'step_count', 'interval', 'add')
+
+def encode_frame(ftype, name, payload):
+    bname = name.encode()
+    return b"".join([FRAME_HEADER.pack(FRAME_SYNC, ftype, len(bname),
+                                       len(payload)), bname, payload])
+
+# Copy blocks of C structs (as returned by trapq_extract_old() and
+# stepcompress_extract_old() - newest first) into a packed buffer
+def pack_records(chunks, ctype, record, fields, skip_first=0):
+    ffi_main, ffi_lib = chelper.get_ffi()
+    size = ffi_main.sizeof(ctype)
+    out = []
+    if size == record.size and sys.byteorder == 'little':
+        # Native layout matches - copy the raw memory
+        for data, count in chunks:
+            buf = ffi_main.buffer(data, count * size)
+            out.extend([buf[i*size:(i+1)*size]
+                        for i in range(count-1, -1, -1)])
+    else:
+        for data, count in chunks:
+            out.extend([record.pack(*[getattr(data[i], f) for f in fields])
+                        for i in range(count-1, -1, -1)])
+    return b"".join(out[skip_first:])
+
 # Helper to periodically transmit data to a set of API clients
 class APIDumpHelper:
     def __init__(self, printer, data_cb, startstop_cb=None,
@@ -71,6 +117,7 @@ class APIDumpHelper:
             return self._stop()
         if not msg:
             return eventtime + self.update_interval
+        json_msg = None
         for cconn, template in list(self.clients.items()):
             if cconn.is_closed():
                 del self.clients[cconn]
@@ -78,7 +125,14 @@ class APIDumpHelper:
                     return self._stop()
                 continue
             tmp = dict(template)
-            tmp['params'] = msg
+            if isinstance(cconn, InternalDumpClient):
+                tmp['params'] = msg
+            else:
+                # Numpy arrays are only passed to internal clients
+                if json_msg is None:
+                    json_msg = {k: v.tolist() if hasattr(v, 'tolist') else v
+                                for k, v in msg.items()}
+                tmp['params'] = json_msg
             cconn.send(tmp)
         return eventtime + self.update_interval
 
@@ -99,17 +153,108 @@ class InternalDumpClient:
             # Avoid filling up memory with too many samples
             self.finalize()
 
+# Maximum amount of unsent data on a binary client before backpressure
+MAX_SEND_BACKLOG = 4 * 1024 * 1024
+
+# Helper to periodically transmit binary frames to a set of clients
+class APIBinaryDumpHelper(APIDumpHelper):
+    def __init__(self, printer, data_cb, startstop_cb=None,
+                 update_interval=API_UPDATE_INTERVAL):
+        APIDumpHelper.__init__(self, printer, data_cb, startstop_cb,
+                               update_interval)
+        self.deferred_updates = self.dropped_frames = 0
+    def add_capture_client(self, cconn):
+        self.clients[cconn] = {}
+        self._start()
+    def _update(self, eventtime):
+        for cconn in list(self.clients.keys()):
+            if cconn.is_closed():
+                del self.clients[cconn]
+        if not self.clients:
+            return self._stop()
+        # Leave the data in the motion history while all clients are
+        # still busy sending previous frames
+        backlogs = [cconn.get_send_backlog() for cconn in self.clients]
+        if min(backlogs) > MAX_SEND_BACKLOG:
+            self.deferred_updates += 1
+            return eventtime + self.update_interval
+        try:
+            frame = self.data_cb(eventtime)
+        except self.printer.command_error as e:
+            logging.exception("API Dump Helper data callback error")
+            return self._stop()
+        if not frame:
+            return eventtime + self.update_interval
+        for cconn, backlog in zip(list(self.clients.keys()), backlogs):
+            if backlog > MAX_SEND_BACKLOG:
+                self.dropped_frames += 1
+                continue
+            cconn.send_raw(frame)
+        return eventtime + self.update_interval
+    def get_stats(self):
+        return self.deferred_updates, self.dropped_frames
+
+# Write binary frames to a ring of segment files on disk
+class CaptureClient:
+    def __init__(self, prefix, max_size, segments, info_cb):
+        self.prefix = prefix
+        self.segment_size = max(1, max_size // segments)
+        self.segments = segments
+        self.info_cb = info_cb
+        self.segment_seq = 0
+        self.file = None
+        self.file_size = 0
+        self.is_done = False
+        self._open_segment()
+    def _open_segment(self):
+        if self.file is not None:
+            self.file.close()
+        old_seq = self.segment_seq - self.segments
+        if old_seq >= 0:
+            try:
+                os.remove(self.get_segment_name(old_seq))
+            except OSError:
+                pass
+        self.file = open(self.get_segment_name(self.segment_seq), "wb")
+        self.segment_seq += 1
+        # Every segment starts with an info frame, so that it can be
+        # read even after older segments are removed
+        info = json.dumps(self.info_cb(), separators=(',', ':')).encode()
+        frame = encode_frame(FRAME_INFO, "info", info)
+        self.file.write(frame)
+        self.file_size = len(frame)
+    def get_segment_name(self, seq):
+        return "%s.%06d.kmr" % (self.prefix, seq)
+    def finalize(self):
+        if self.is_done:
+            return
+        self.is_done = True
+        self.file.close()
+        self.file = None
+    def is_closed(self):
+        return self.is_done
+    def get_send_backlog(self):
+        return 0
+    def send_raw(self, frame):
+        if self.is_done:
+            return
+        if self.file_size + len(frame) > self.segment_size:
+            self._open_segment()
+        self.file.write(frame)
+        self.file_size += len(frame)
+
 # Extract stepper queue_step messages
 class DumpStepper:
     def __init__(self, printer, mcu_stepper):
         self.printer = printer
         self.mcu_stepper = mcu_stepper
-        self.last_api_clock = 0
+        self.last_api_clock = self.last_binary_clock = 0
         self.api_dump = APIDumpHelper(printer, self._api_update)
+        self.binary_dump = APIBinaryDumpHelper(printer, self._binary_update)
         wh = self.printer.lookup_object('webhooks')
         wh.register_mux_endpoint("motion_report/dump_stepper", "name",
                                  mcu_stepper.get_name(), self._add_api_client)
-    def get_step_queue(self, start_clock, end_clock):
+    def _get_step_chunks(self, start_clock, end_clock):
         mcu_stepper = self.mcu_stepper
         res = []
         while 1:
@@ -121,6 +266,9 @@ class DumpStepper:
                 break
             end_clock = data[count-1].first_clock
         res.reverse()
+        return res
+    def get_step_queue(self, start_clock, end_clock):
+        res = self._get_step_chunks(start_clock, end_clock)
         return ([d[i] for d, cnt in res for i in range(cnt-1, -1, -1)], res)
     def log_steps(self, data):
         if not data:
@@ -154,9 +302,35 @@ class DumpStepper:
                 "start_mcu_position": mcu_pos, "step_distance": step_dist,
                 "first_clock": first_clock, "first_step_time": first_time,
                 "last_clock": last_clock, "last_step_time": last_time}
+    def _binary_update(self, eventtime):
+        res = self._get_step_chunks(self.last_binary_clock, 1<<63)
+        if not res:
+            return b""
+        clock_to_print_time = self.mcu_stepper.get_mcu().clock_to_print_time
+        first = res[0][0][res[0][1]-1]
+        first_clock = first.first_clock
+        first_time = clock_to_print_time(first_clock)
+        self.last_binary_clock = last_clock = res[-1][0][0].last_clock
+        last_time = clock_to_print_time(last_clock)
+        mcu_pos = first.start_position
+        start_position = self.mcu_stepper.mcu_to_commanded_position(mcu_pos)
+        step_dist = self.mcu_stepper.get_step_dist()
+        if self.mcu_stepper.get_dir_inverted()[0]:
+            step_dist = -step_dist
+        header = STEPQ_HEADER.pack(start_position, mcu_pos, step_dist,
+                                   first_clock, first_time,
+                                   last_clock, last_time)
+        records = pack_records(res, 'struct pull_history_steps',
+                               STEPQ_RECORD, STEPQ_FIELDS)
+        return encode_frame(FRAME_STEPQ, self.mcu_stepper.get_name(),
+                            header + records)
     def _add_api_client(self, web_request):
-        self.api_dump.add_client(web_request)
         hdr = ('interval', 'count', 'add')
+        if web_request.get_str('format', 'json') == 'binary':
+            self.binary_dump.add_client(web_request)
+            web_request.send({'header': hdr, 'format': 'binary'})
+            return
+        self.api_dump.add_client(web_request)
         web_request.send({'header': hdr})
 
 NEVER_TIME = 9999999999999999.
@@ -167,12 +341,13 @@ class DumpTrapQ:
         self.printer = printer
         self.name = name
         self.trapq = trapq
-        self.last_api_msg = (0., 0.)
+        self.last_api_msg = self.last_binary_move = (0., 0.)
         self.api_dump = APIDumpHelper(printer, self._api_update)
+        self.binary_dump = APIBinaryDumpHelper(printer, self._binary_update)
         wh = self.printer.lookup_object('webhooks')
         wh.register_mux_endpoint("motion_report/dump_trapq", "name", name,
                                  self._add_api_client)
-    def extract_trapq(self, start_time, end_time):
+    def _extract_chunks(self, start_time, end_time):
         ffi_main, ffi_lib = chelper.get_ffi()
         res = []
         while 1:
@@ -186,6 +361,9 @@ class DumpTrapQ:
                 break
             end_time = data[count-1].print_time
         res.reverse()
+        return res
+    def extract_trapq(self, start_time, end_time):
+        res = self._extract_chunks(start_time, end_time)
         return ([d[i] for d, cnt in res for i in range(cnt-1, -1, -1)], res)
     def log_trapq(self, data):
         if not data:
@@ -222,10 +400,30 @@ class DumpTrapQ:
             return {}
         self.last_api_msg = d[-1]
         return {"data": d}
+    def _binary_update(self, eventtime):
+        last_time, last_duration = self.last_binary_move
+        qtime = last_time + min(last_duration, 0.100)
+        res = self._extract_chunks(qtime, NEVER_TIME)
+        if not res:
+            return b""
+        # Don't resend the last move of the previous frame
+        first = res[0][0][res[0][1]-1]
+        skip_first = (first.print_time, first.move_t) == self.last_binary_move
+        last = res[-1][0][0]
+        if skip_first and len(res) == 1 and res[0][1] == 1:
+            return b""
+        self.last_binary_move = (last.print_time, last.move_t)
+        records = pack_records(res, 'struct pull_move', TRAPQ_RECORD,
+                               TRAPQ_FIELDS, skip_first)
+        return encode_frame(FRAME_TRAPQ, self.name, records)
     def _add_api_client(self, web_request):
-        self.api_dump.add_client(web_request)
         hdr = ('time', 'duration', 'start_velocity', 'acceleration',
                'start_position', 'direction')
+        if web_request.get_str('format', 'json') == 'binary':
+            self.binary_dump.add_client(web_request)
+            web_request.send({'header': hdr, 'format': 'binary'})
+            return
+        self.api_dump.add_client(web_request)
         web_request.send({'header': hdr})
 
 STATUS_REFRESH_TIME = 0.250
@@ -243,9 +441,14 @@ class PrinterMotionReport:
             'live_velocity': 0., 'live_extruder_velocity': 0.,
             'steppers': [], 'trapq': [],
         }
+        # Binary captures
+        self.capture = None
         # Register handlers
         self.printer.register_event_handler("klippy:connect", self._connect)
         self.printer.register_event_handler("klippy:shutdown", self._shutdown)
+        gcode.register_command("MOTION_REPORT_CAPTURE",
+                               self.cmd_MOTION_REPORT_CAPTURE,
+                               desc=self.cmd_MOTION_REPORT_CAPTURE_help)
     def register_stepper(self, config, mcu_stepper):
         ds = DumpStepper(self.printer, mcu_stepper)
         self.steppers[mcu_stepper.get_name()] = ds
@@ -267,6 +470,56 @@ class PrinterMotionReport:
         # Populate 'trapq' and 'steppers' in get_status result
         self.last_status['steppers'] = list(sorted(self.steppers.keys()))
         self.last_status['trapq'] = list(sorted(self.trapqs.keys()))
+    # Binary capture to disk
+    def _get_capture_info(self):
+        mcu = self.printer.lookup_object('mcu')
+        eventtime = self.printer.get_reactor().monotonic()
+        print_time = mcu.estimated_print_time(eventtime)
+        # Same initial status as an objects/subscribe of all objects, the
+        # motan handlers need eg, the configfile settings
+        status = {name: obj.get_status(eventtime)
+                  for name, obj in self.printer.lookup_objects()
+                  if hasattr(obj, 'get_status')}
+        status['toolhead'] = dict(status.get('toolhead', {}),
+                                  estimated_print_time=print_time)
+        subscriptions = {}
+        for name in self.trapqs:
+            subscriptions["trapq:" + name] = {}
+        for name in self.steppers:
+            subscriptions["stepq:" + name] = {}
+        return {'status': status, 'subscriptions': subscriptions}
+    cmd_MOTION_REPORT_CAPTURE_help = "Start/stop capturing motion to disk"
+    def cmd_MOTION_REPORT_CAPTURE(self, gcmd):
+        if self.capture is not None:
+            # End capture
+            capture = self.capture
+            self.capture = None
+            capture.finalize()
+            gcmd.respond_info("Motion capture written to %s.*.kmr"
+                              % (capture.prefix,))
+            return
+        name = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
+        if not name.replace('-', '').replace('_', '').isalnum():
+            raise gcmd.error("Invalid NAME parameter")
+        max_size = gcmd.get_int("MAX_SIZE", 64, minval=1)
+        segments = gcmd.get_int("SEGMENTS", 8, minval=2)
+        prefix = "/tmp/motion-%s" % (name,)
+        self.capture = CaptureClient(prefix, max_size * 1024 * 1024,
+                                     segments, self._get_capture_info)
+        for dump in list(self.trapqs.values()) + list(self.steppers.values()):
+            dump.binary_dump.add_capture_client(self.capture)
+        gcmd.respond_info("Motion capture started (%s.*.kmr)" % (prefix,))
+    def stats(self, eventtime):
+        dumps = list(self.trapqs.values()) + list(self.steppers.values())
+        deferred = dropped = 0
+        for dump in dumps:
+            d_deferred, d_dropped = dump.binary_dump.get_stats()
+            deferred += d_deferred
+            dropped += d_dropped
+        if not deferred and not dropped:
+            return False, ""
+        return False, "motion_report: deferred=%d dropped=%d" % (deferred,
+                                                                 dropped)
     # Shutdown handling
     def _dump_shutdown(self, eventtime):
         # Log stepper queue_steps on mcu that started shutdown (if any)
@@ -6,38 +6,50 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 
+import logging
+
 class PrintStats:
 
     def __init__(self, config):
         self.printer = config.get_printer()
         self.initialize_print()
-        self.printer.register_event_handler("gcode:read_metadata", self.handle_gcode_metadata)
         self.printer.register_event_handler("virtual_sdcard:print_end", self.initialize_print)
-        # this relies on no gcode being processed before the start event which is given.
-        self.printer.register_event_handler("virtual_sdcard:print_start", self.initialize_print)
+        self.printer.register_event_handler("virtual_sdcard:print_start", self.handle_print_start)
         self.printer.register_event_handler("klippy:connect", self.handle_connect)
 
-        # List of time estimations by the slicer inside the gcode
-        # [[time actually printed, elapsed time put by slicer], ...]
-        self.slicer_elapsed_times = []
-
     def handle_connect(self):
         self.virtual_sdcard = self.printer.lookup_object('virtual_sdcard')
 
     def initialize_print(self, *args):
-        self.slicer_elapsed_times = []
+        # File index of the current job, mapping file positions
+        # to the elapsed time estimated by the slicer
+        self.file_index = None
+        self.file_index_failed = False
+        # Offset from which on the elapsed times are compared with the
+        # actual print time, so heatup isn't part of the correction
+        self.reference_offset = 0
+        # (time actually printed, slicer time) at reference_offset
+        self.reference = None
 
-    def handle_gcode_metadata(self, print_time, line):
-        """
-        Recieves all gcode-comment-lines as they are printed,
-        and searches for print-time estimations
-        """
-        if self.virtual_sdcard.jobs:
-            job = self.virtual_sdcard.jobs[0]
-            slicer_elapsed_time = job.md.parse_elapsed_time(line)
-            if slicer_elapsed_time is not None:
-                self.slicer_elapsed_times.append(
-                        (job.get_printed_time(), slicer_elapsed_time))
+    def handle_print_start(self, jobs, job):
+        self.initialize_print()
+        self.lookup_file_index(job)
+
+    def lookup_file_index(self, job):
+        # The index is built in a background thread, until it is ready
+        # the estimate is based on the total slicer time only
+        try:
+            self.file_index = job.md.get_file_index(wait=False)
+        except Exception:
+            logging.exception("Could not get file index for print progress")
+            self.file_index_failed = True
+            return
+        if self.file_index is None:
+            return
+        if self.file_index.elapsed_offsets:
+            self.reference_offset = self.file_index.elapsed_offsets[0]
+        elif self.file_index.layers:
+            self.reference_offset = self.file_index.layers[0].offset
 
     def get_print_time_prediction(self):
         """ we try to consider everything 'printed' that ran through gcode processing,
@@ -45,6 +57,7 @@ class PrintStats:
             time estimations in gcode: |....|....|....|........................|
             actual print time      |......|.....|.....|.............................|
                                    ^ start of print   ^ current point in time       ^ prediction
+            The slicer time at the current file position is looked up in the file index.
             after the print job is done the output is undefined, normally None """
         if self.virtual_sdcard.jobs:
             job = self.virtual_sdcard.jobs[0]
@@ -54,23 +67,20 @@ class PrintStats:
         if slicer_estimated_time is None:  # No time prediction
             return None, None
 
-        est_remaining = None
-        progress = None
-
         printed_time = job.get_printed_time()
-        if self.slicer_elapsed_times:
-            time_since_slicer_est = (printed_time
-                                     - self.slicer_elapsed_times[-1][0])
-            est_remaining = max(0, slicer_estimated_time
-                                 - self.slicer_elapsed_times[-1][1]
-                                 - time_since_slicer_est)
-            # now apply factor based on how wrong previous estimations were
-            # we ignore the first estimation block since it contains heatup
-            # where high variance is expected
-            if len(self.slicer_elapsed_times) > 1:
-                est_remaining *= \
-                    (self.slicer_elapsed_times[-1][0] - self.slicer_elapsed_times[0][0]) \
-                   /(self.slicer_elapsed_times[-1][1] - self.slicer_elapsed_times[0][1])
+        if self.file_index is None and not self.file_index_failed:
+            self.lookup_file_index(job)
+        if self.file_index is not None:
+            slicer_time = self.file_index.get_slicer_time(
+                job.file_position, slicer_estimated_time)
+            est_remaining = max(0, slicer_estimated_time - slicer_time)
+            if self.reference is None:
+                if job.file_position >= self.reference_offset:
+                    self.reference = (printed_time, slicer_time)
+            elif slicer_time > self.reference[1]:
+                # now apply factor based on how wrong previous estimations were
+                est_remaining *= (printed_time - self.reference[0]) \
+                               / (slicer_time - self.reference[1])
         else: # We dont have elapsed times
             est_remaining = max(slicer_estimated_time - printed_time, 0)
 
@@ -68,42 +68,68 @@ class ShaperCalibrate:
                     "Failed to import `numpy` module, make sure it was "
                     "installed via `~/klippy-env/bin/pip install` (refer to "
                     "docs/Measuring_Resonances.md for more details).")
+        self._response_cache = {}
 
     def background_process_exec(self, method, args):
+        return self.background_process_exec_multi([(method, args)])[0]
+
+    def background_process_exec_multi(self, calls):
+        # Run each (method, args) call in its own process and wait for
+        # all of them to complete
         if self.printer is None:
-            return method(*args)
+            return [method(*args) for method, args in calls]
         import queuelogger
-        parent_conn, child_conn = multiprocessing.Pipe()
-        def wrapper():
-            queuelogger.clear_bg_logging()
-            try:
-                res = method(*args)
-            except:
-                child_conn.send((True, traceback.format_exc()))
+        def start_process(method, args):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            def wrapper():
+                queuelogger.clear_bg_logging()
+                try:
+                    res = method(*args)
+                except:
+                    child_conn.send((True, traceback.format_exc()))
+                    child_conn.close()
+                    return
+                child_conn.send((False, res))
                 child_conn.close()
-                return
-            child_conn.send((False, res))
-            child_conn.close()
-        # Start a process to perform the calculation
-        calc_proc = multiprocessing.Process(target=wrapper)
-        calc_proc.daemon = True
-        calc_proc.start()
-        # Wait for the process to finish
+            calc_proc = multiprocessing.Process(target=wrapper)
+            calc_proc.daemon = True
+            calc_proc.start()
+            return calc_proc, parent_conn
+        # Start a process per calculation
+        procs = [start_process(method, args) for method, args in calls]
+        results = [None] * len(procs)
+        pending = list(range(len(procs)))
+        # Wait for the processes to finish
         reactor = self.printer.get_reactor()
         gcode = self.printer.lookup_object("gcode")
         eventtime = last_report_time = reactor.monotonic()
-        while calc_proc.is_alive():
+        while pending:
+            for i in list(pending):
+                calc_proc, parent_conn = procs[i]
+                # Results must be read before the process exits, as
+                # large results do not fit into the pipe buffer
+                if parent_conn.poll():
+                    results[i] = parent_conn.recv()
+                elif calc_proc.is_alive():
+                    continue
+                elif parent_conn.poll():
+                    results[i] = parent_conn.recv()
+                else:
+                    results[i] = (True, "Process exited without result")
+                calc_proc.join()
+                parent_conn.close()
+                pending.remove(i)
+            if not pending:
+                break
             if eventtime > last_report_time + 5.:
                 last_report_time = eventtime
                 gcode.respond_info("Wait for calculations..", log=False)
             eventtime = reactor.pause(eventtime + .1)
         # Return results
-        is_err, res = parent_conn.recv()
-        if is_err:
-            raise self.error("Error in remote calculation: %s" % (res,))
-        calc_proc.join()
-        parent_conn.close()
-        return res
+        for is_err, res in results:
+            if is_err:
+                raise self.error("Error in remote calculation: %s" % (res,))
+        return [res for is_err, res in results]
 
     def _split_into_windows(self, x, window_size, overlap):
         # Memory-efficient algorithm to split an input 'x' into a series
@@ -152,10 +178,9 @@ class ShaperCalibrate:
         if isinstance(raw_values, np.ndarray):
             data = raw_values
         else:
-            samples = raw_values.get_samples()
-            if not samples:
+            data = raw_values.get_samples_array()
+            if not data.shape[0]:
                 return None
-            data = np.array(samples)
 
         N = data.shape[0]
         T = data[-1,0] - data[0,0]
@@ -181,31 +206,24 @@ class ShaperCalibrate:
         calibration_data.set_numpy(self.numpy)
         return calibration_data
 
-    def _estimate_shaper(self, shaper, test_damping_ratio, test_freqs):
+    def _estimate_shaper_responses(self, shaper, test_damping_ratios,
+                                   test_freqs):
+        # Estimate the remaining vibrations of the shaper for all tested
+        # damping ratios at once; returns a (damping ratios x frequencies)
+        # matrix of the shaper response
         np = self.numpy
 
         A, T = np.array(shaper[0]), np.array(shaper[1])
         inv_D = 1. / A.sum()
 
-        omega = 2. * math.pi * test_freqs
-        damping = test_damping_ratio * omega
-        omega_d = omega * math.sqrt(1. - test_damping_ratio**2)
-        W = A * np.exp(np.outer(-damping, (T[-1] - T)))
-        S = W * np.sin(np.outer(omega_d, T))
-        C = W * np.cos(np.outer(omega_d, T))
-        return np.sqrt(S.sum(axis=1)**2 + C.sum(axis=1)**2) * inv_D
-
-    def _estimate_remaining_vibrations(self, shaper, test_damping_ratio,
-                                       freq_bins, psd):
-        vals = self._estimate_shaper(shaper, test_damping_ratio, freq_bins)
-        # The input shaper can only reduce the amplitude of vibrations by
-        # SHAPER_VIBRATION_REDUCTION times, so all vibrations below that
-        # threshold can be igonred
-        vibr_threshold = psd.max() / shaper_defs.SHAPER_VIBRATION_REDUCTION
-        remaining_vibrations = self.numpy.maximum(
-                vals * psd - vibr_threshold, 0).sum()
-        all_vibrations = self.numpy.maximum(psd - vibr_threshold, 0).sum()
-        return (remaining_vibrations / all_vibrations, vals)
+        drs = np.array(test_damping_ratios)[:, None, None]
+        omega = 2. * math.pi * test_freqs[None, :, None]
+        damping = drs * omega
+        omega_d = omega * np.sqrt(1. - drs**2)
+        W = A * np.exp(-damping * (T[-1] - T))
+        S = (W * np.sin(omega_d * T)).sum(axis=2)
+        C = (W * np.cos(omega_d * T)).sum(axis=2)
+        return np.sqrt(S**2 + C**2) * inv_D
 
     def _get_shaper_smoothing(self, shaper, accel=5000, scv=5.):
         half_accel = accel * .5
@@ -227,6 +245,12 @@ class ShaperCalibrate:
         offset_180 *= inv_D
         return max(offset_90, offset_180)
 
+    def _get_response_cache(self, shaper_cfg, freq_bins):
+        # Shaper responses only depend on the shaper and the frequency
+        # bins, which are normally the same for all tested axes
+        key = (shaper_cfg.name, freq_bins.tobytes())
+        return self._response_cache.setdefault(key, {})
+
     def fit_shaper(self, shaper_cfg, calibration_data, max_smoothing):
         np = self.numpy
 
@@ -235,26 +259,38 @@ class ShaperCalibrate:
         freq_bins = calibration_data.freq_bins
         psd = calibration_data.psd_sum[freq_bins <= MAX_FREQ]
         freq_bins = freq_bins[freq_bins <= MAX_FREQ]
+        response_cache = self._get_response_cache(shaper_cfg, freq_bins)
+
+        # The input shaper can only reduce the amplitude of vibrations by
+        # SHAPER_VIBRATION_REDUCTION times, so all vibrations below that
+        # threshold can be igonred
+        vibr_threshold = psd.max() / shaper_defs.SHAPER_VIBRATION_REDUCTION
+        all_vibrations = np.maximum(psd - vibr_threshold, 0).sum()
 
         best_res = None
         results = []
         for test_freq in test_freqs[::-1]:
-            shaper_vibrations = 0.
-            shaper_vals = np.zeros(shape=freq_bins.shape)
-            shaper = shaper_cfg.init_func(
-                    test_freq, shaper_defs.DEFAULT_DAMPING_RATIO)
-            shaper_smoothing = self._get_shaper_smoothing(shaper)
+            cached = response_cache.get(test_freq)
+            if cached is None:
+                shaper = shaper_cfg.init_func(
+                        test_freq, shaper_defs.DEFAULT_DAMPING_RATIO)
+                shaper_smoothing = self._get_shaper_smoothing(shaper)
+            else:
+                shaper_smoothing, vals, max_accel = cached
             if max_smoothing and shaper_smoothing > max_smoothing and best_res:
                 return best_res
-            # Exact damping ratio of the printer is unknown, pessimizing
-            # remaining vibrations over possible damping values
-            for dr in TEST_DAMPING_RATIOS:
-                vibrations, vals = self._estimate_remaining_vibrations(
-                        shaper, dr, freq_bins, psd)
-                shaper_vals = np.maximum(shaper_vals, vals)
-                if vibrations > shaper_vibrations:
-                    shaper_vibrations = vibrations
-            max_accel = self.find_shaper_max_accel(shaper)
+            if cached is None:
+                # Exact damping ratio of the printer is unknown, pessimizing
+                # remaining vibrations over possible damping values
+                vals = self._estimate_shaper_responses(
+                        shaper, TEST_DAMPING_RATIOS, freq_bins)
+                max_accel = self.find_shaper_max_accel(shaper)
+                response_cache[test_freq] = (shaper_smoothing, vals, max_accel)
+            remaining_vibrations = np.maximum(
+                    vals * psd - vibr_threshold, 0).sum(axis=1)
+            shaper_vibrations = max(
+                    0., (remaining_vibrations / all_vibrations).max())
+            shaper_vals = vals.max(axis=0)
             # The score trying to minimize vibrations, but also accounting
             # the growth of smoothing. The formula itself does not have any
             # special meaning, it simply shows good results on real user data
@@ -276,6 +312,21 @@ class ShaperCalibrate:
                 selected = res
         return selected
 
+    def _fit_shaper_job(self, shaper_cfg, calibration_data, max_smoothing):
+        # Also return the newly computed responses, so that the response
+        # cache can be updated in the main process when the fit runs in
+        # a background process; the entries already present in the cache
+        # were inherited from the main process and need not be sent back
+        freq_bins = calibration_data.freq_bins
+        freq_bins = freq_bins[freq_bins <= MAX_FREQ]
+        response_cache = self._get_response_cache(shaper_cfg, freq_bins)
+        cached_freqs = set(response_cache)
+        shaper = self.fit_shaper(shaper_cfg, calibration_data, max_smoothing)
+        new_responses = {test_freq: res
+                         for test_freq, res in response_cache.items()
+                         if test_freq not in cached_freqs}
+        return shaper, new_responses
+
     def _bisect(self, func):
         left = right = 1.
         while not func(left):
@@ -303,11 +354,19 @@ class ShaperCalibrate:
     def find_best_shaper(self, calibration_data, max_smoothing, logger=None):
         best_shaper = None
         all_shapers = []
-        for shaper_cfg in shaper_defs.INPUT_SHAPERS:
-            if shaper_cfg.name not in AUTOTUNE_SHAPERS:
-                continue
-            shaper = self.background_process_exec(self.fit_shaper, (
-                shaper_cfg, calibration_data, max_smoothing))
+        shaper_cfgs = [shaper_cfg for shaper_cfg in shaper_defs.INPUT_SHAPERS
+                       if shaper_cfg.name in AUTOTUNE_SHAPERS]
+        # Fit all shapers in parallel
+        fit_results = self.background_process_exec_multi([
+            (self._fit_shaper_job, (shaper_cfg, calibration_data,
+                                    max_smoothing))
+            for shaper_cfg in shaper_cfgs])
+        freq_bins = calibration_data.freq_bins
+        freq_bins = freq_bins[freq_bins <= MAX_FREQ]
+        for shaper_cfg, (shaper, new_responses) in zip(shaper_cfgs,
+                                                       fit_results):
+            self._get_response_cache(shaper_cfg, freq_bins).update(
+                    new_responses)
             if logger is not None:
                 logger("Fitted shaper '%s' frequency = %.1f Hz "
                        "(vibrations = %.1f%%, smoothing ~= %.3f)" % (
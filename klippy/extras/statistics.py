@@ -11,6 +11,9 @@ class PrinterSysStats:
         self.last_process_time = self.total_process_time = 0.
         self.last_load_avg = 0.
         self.last_mem_avail = 0
+        self.reactor = printer.get_reactor()
+        self.last_gc_counts = (0, 0, 0)
+        self.last_gc_time = 0.
         self.mem_file = None
         try:
             self.mem_file = open("/proc/meminfo", "r")
@@ -43,11 +46,19 @@ class PrinterSysStats:
                         break
             except:
                 pass
+        # Get garbage collection pauses
+        counts, pause_time, max_pause = self.reactor.get_gc_pause_stats()
+        self.last_gc_counts = counts
+        self.last_gc_time = pause_time
+        msg = "%s gc=%d/%d/%d gctime=%.3f gcmax=%.3f" % (
+            msg, counts[0], counts[1], counts[2], pause_time, max_pause)
         return (False, msg)
     def get_status(self, eventtime):
         return {'sysload': self.last_load_avg,
                 'cputime': self.total_process_time,
-                'memavail': self.last_mem_avail}
+                'memavail': self.last_mem_avail,
+                'gc_counts': self.last_gc_counts,
+                'gc_time': self.last_gc_time}
 
 class PrinterStats:
     def __init__(self, config):
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import collections
+from os.path import dirname, realpath
+import unittest
+
+import site
+_klippo_dir = dirname(dirname(realpath(__file__)))
+site.addsitedir(_klippo_dir)
+
+import jinja2
+
+from gcode import Coord
+from extras.gcode_macro import GetStatusWrapper
+
+
+class _DummyObject:
+    def __init__(self, status):
+        self.status = status
+    def get_status(self, eventtime):
+        return self.status
+
+class _DummyPrinter:
+    def __init__(self, objects):
+        self.objects = objects
+    def lookup_object(self, name, default=None):
+        return self.objects.get(name, default)
+    def lookup_objects(self):
+        return list(self.objects.items())
+
+
+class StatusCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.env = jinja2.Environment('{%', '%}', '{', '}')
+        mesh_params = collections.OrderedDict([('x', 1), ('y', 2)])
+        self.bed_mesh = _DummyObject({
+            'profiles': {'default': {'points': [[0., .1], [.2, .3]],
+                                     'mesh_params': mesh_params}}})
+        self.toolhead = _DummyObject({
+            'position': Coord(1., 2., 3., 4.),
+            'limits': ([0., 100.], [0., 200.]),
+            'homed': {'x', 'y'}})
+        self.printer = _DummyPrinter({'bed_mesh': self.bed_mesh,
+                                      'toolhead': self.toolhead})
+
+    def render(self, text):
+        wrapper = GetStatusWrapper(self.printer, 0.)
+        return self.env.from_string(text).render(printer=wrapper)
+
+    def test_read(self):
+        res = self.render(
+            "{printer.bed_mesh.profiles.default.mesh_params.y}"
+            " {printer.bed_mesh.profiles.default.points[1][0]}"
+            " {printer.toolhead.position.z}"
+            " {printer.toolhead.limits[1][1]}"
+            " {'x' in printer.toolhead.homed}")
+        self.assertEqual(res, "2 0.2 3.0 200.0 True")
+
+    def test_mutate_dict_subclass(self):
+        self.render("{% set params = printer.bed_mesh.profiles.default"
+                    ".mesh_params %}{% set _ = params.update(x=99) %}"
+                    "{% set _ = params.pop('y') %}")
+        profile = self.bed_mesh.status['profiles']['default']
+        self.assertEqual(profile['mesh_params'],
+                         collections.OrderedDict([('x', 1), ('y', 2)]))
+
+    def test_mutate_nested_list(self):
+        self.render("{% set pts = printer.bed_mesh.profiles.default.points %}"
+                    "{% set _ = pts[0].append(5.0) %}"
+                    "{% set _ = pts.reverse() %}")
+        profile = self.bed_mesh.status['profiles']['default']
+        self.assertEqual(profile['points'], [[0., .1], [.2, .3]])
+
+    def test_mutate_in_tuple(self):
+        self.render("{% set _ = printer.toolhead.limits[0].append(1.0) %}"
+                    "{% set _ = printer.toolhead.homed.add('z') %}")
+        self.assertEqual(self.toolhead.status['limits'],
+                         ([0., 100.], [0., 200.]))
+        self.assertEqual(self.toolhead.status['homed'], {'x', 'y'})
+
+    def test_namedtuple(self):
+        wrapper = GetStatusWrapper(self.printer, 0.)
+        position = wrapper['toolhead']['position']
+        self.assertIs(position, self.toolhead.status['position'])
+        self.toolhead.status['position'] = Coord([1.], 2., 3., 4.)
+        wrapper = GetStatusWrapper(self.printer, 0.)
+        position = wrapper['toolhead']['position']
+        self.assertIsInstance(position, Coord)
+        position.x.append(2.)
+        self.assertEqual(self.toolhead.status['position'].x, [1.])
+
+
+if __name__ == '__main__':
+    unittest.main()
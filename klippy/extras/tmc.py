@@ -85,6 +85,113 @@ class FieldHelper:
 # Periodic error checking
 ######################################################################
 
+# Poll the status of all drivers that share a bus from a single timer.
+# Transports that support it read the registers of all drivers as one
+# batch: the reads of drivers with separate transports are started at
+# once, so that their round trips overlap.
+class TMCBusPoller:
+    def __init__(self, printer, name):
+        self.printer = printer
+        self.name = name
+        self.checks = []
+        self.poll_timer = None
+        self.poll_count = 0
+        self.total_latency = self.max_latency = 0.
+    def add_check(self, check):
+        if check not in self.checks:
+            self.checks.append(check)
+        if self.poll_timer is None:
+            reactor = self.printer.get_reactor()
+            self.poll_timer = reactor.register_timer(
+                self._do_poll, reactor.monotonic() + 1.)
+    def remove_check(self, check):
+        if check in self.checks:
+            self.checks.remove(check)
+        if not self.checks and self.poll_timer is not None:
+            self.printer.get_reactor().unregister_timer(self.poll_timer)
+            self.poll_timer = None
+    def _read_group(self, eventtime, checks):
+        # Read the drivers sharing a transport one after the other - the
+        # transport mutex is only held for the reads of one driver
+        try:
+            return [check.mcu_tmc.read_registers(check.get_poll_registers())
+                    for check in checks]
+        except self.printer.command_error:
+            return None
+    def _read_batch(self, checks):
+        # Read all registers, or return None
+        groups = {}
+        for check in checks:
+            if not hasattr(check.mcu_tmc, 'read_registers'):
+                return None
+            groups.setdefault(check.mcu_tmc.mutex, []).append(check)
+        reactor = self.printer.get_reactor()
+        completions = [
+            (group, reactor.register_callback(
+                lambda e, group=group: self._read_group(e, group)))
+            for group in groups.values()]
+        values = {}
+        for group, completion in completions:
+            group_values = completion.wait()
+            if group_values is None:
+                # Fall back to individual queries (with retries)
+                return None
+            values.update(zip(group, group_values))
+        return [values[check] for check in checks]
+    def _do_poll(self, eventtime):
+        reactor = self.printer.get_reactor()
+        start_time = reactor.monotonic()
+        checks = list(self.checks)
+        values = self._read_batch(checks)
+        if values is None:
+            values = [None] * len(checks)
+        try:
+            for check, vals in zip(checks, values):
+                if check in self.checks:
+                    check.check_registers(vals)
+        except self.printer.command_error as e:
+            self.printer.invoke_shutdown(str(e))
+            return reactor.NEVER
+        latency = reactor.monotonic() - start_time
+        self.poll_count += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        return eventtime + 1.
+    def stats(self, eventtime):
+        if not self.poll_count:
+            return ""
+        avg_latency = self.total_latency / self.poll_count
+        msg = "tmc_bus %s: drivers=%d latency=%.6f max_latency=%.6f" % (
+            self.name, len(self.checks), avg_latency, self.max_latency)
+        self.poll_count = 0
+        self.total_latency = self.max_latency = 0.
+        return msg
+
+class PrinterTMCBusPollers:
+    def __init__(self, printer):
+        self.printer = printer
+        self.pollers = {}
+    def lookup_poller(self, bus_key, name):
+        poller = self.pollers.get(bus_key)
+        if poller is None:
+            poller = TMCBusPoller(self.printer, name)
+            self.pollers[bus_key] = poller
+        return poller
+    def stats(self, eventtime):
+        msgs = [p.stats(eventtime) for p in self.pollers.values()]
+        return False, ' '.join([m for m in msgs if m])
+
+def lookup_tmc_bus_poller(printer, mcu_tmc, name):
+    pollers = printer.lookup_object('tmc_bus_poll', None)
+    if pollers is None:
+        pollers = PrinterTMCBusPollers(printer)
+        printer.add_object('tmc_bus_poll', pollers)
+    # Transports without a bus key are identified by their mutex
+    get_bus_key = getattr(mcu_tmc, 'get_bus_key', None)
+    if get_bus_key is None:
+        return pollers.lookup_poller(mcu_tmc.mutex, name)
+    return pollers.lookup_poller(get_bus_key(), name)
+
 class TMCErrorCheck:
     def __init__(self, config, mcu_tmc):
         self.printer = config.get_printer()
@@ -92,7 +199,9 @@ class TMCErrorCheck:
         self.stepper_name = ' '.join(name_parts[1:])
         self.mcu_tmc = mcu_tmc
         self.fields = mcu_tmc.get_fields()
-        self.check_timer = None
+        self.poller = lookup_tmc_bus_poller(self.printer, mcu_tmc,
+                                            self.stepper_name)
+        self.is_checking = False
         self.last_drv_status = self.last_status = None
         # Setup for GSTAT query
         reg_name = self.fields.lookup_register("drv_err")
@@ -122,13 +231,14 @@ class TMCErrorCheck:
                 if f in err_fields:
                     err_mask |= self.fields.all_fields[reg_name][f]
         self.drv_status_reg_info = [0, reg_name, mask, err_mask, cs_actual_mask]
-    def _query_register(self, reg_info, try_clear=False):
+    def _query_register(self, reg_info, try_clear=False, val=None):
         last_value, reg_name, mask, err_mask, cs_actual_mask = reg_info
         cleared_flags = 0
         count = 0
         while 1:
             try:
-                val = self.mcu_tmc.get_register(reg_name)
+                if val is None:
+                    val = self.mcu_tmc.get_register(reg_name)
             except self.printer.command_error as e:
                 count += 1
                 if count < 3 and str(e).startswith("Unable to read tmc uart"):
@@ -145,7 +255,7 @@ class TMCErrorCheck:
                 if not cs_actual_mask or val & cs_actual_mask:
                     break
                 irun = self.fields.get_field(self.irun_field)
-                if self.check_timer is None or irun < 4:
+                if not self.is_checking or irun < 4:
                     break
                 if (self.irun_field == "irun"
                     and not self.fields.get_field("ihold")):
@@ -160,40 +270,44 @@ class TMCErrorCheck:
                 try_clear = False
                 cleared_flags |= val & err_mask
                 self.mcu_tmc.set_register(reg_name, val & err_mask)
+            val = None
         return cleared_flags
-    def _do_periodic_check(self, eventtime):
-        try:
-            self._query_register(self.drv_status_reg_info)
-            if self.gstat_reg_info is not None:
-                self._query_register(self.gstat_reg_info)
-        except self.printer.command_error as e:
-            self.printer.invoke_shutdown(str(e))
-            return self.printer.get_reactor().NEVER
-        return eventtime + 1.
+    def _get_poll_reg_infos(self):
+        if self.gstat_reg_info is None:
+            return [self.drv_status_reg_info]
+        return [self.drv_status_reg_info, self.gstat_reg_info]
+    def get_poll_registers(self):
+        return [reg_info[1] for reg_info in self._get_poll_reg_infos()]
+    def check_registers(self, values=None):
+        # Check the registers of get_poll_registers() - values are the
+        # results of a batch read (None to query them here)
+        reg_infos = self._get_poll_reg_infos()
+        if values is None:
+            values = [None] * len(reg_infos)
+        for reg_info, val in zip(reg_infos, values):
+            self._query_register(reg_info, val=val)
     def stop_checks(self):
-        if self.check_timer is None:
+        if not self.is_checking:
             return
-        self.printer.get_reactor().unregister_timer(self.check_timer)
-        self.check_timer = None
+        self.poller.remove_check(self)
+        self.is_checking = False
     def start_checks(self):
-        if self.check_timer is not None:
+        if self.is_checking:
             self.stop_checks()
         cleared_flags = 0
         self._query_register(self.drv_status_reg_info)
         if self.gstat_reg_info is not None:
             cleared_flags = self._query_register(self.gstat_reg_info,
                                                  try_clear=self.clear_gstat)
-        reactor = self.printer.get_reactor()
-        curtime = reactor.monotonic()
-        self.check_timer = reactor.register_timer(self._do_periodic_check,
-                                                  curtime + 1.)
+        self.is_checking = True
+        self.poller.add_check(self)
         if cleared_flags:
             reset_mask = self.fields.all_fields["GSTAT"]["reset"]
             if cleared_flags & reset_mask:
                 return True
         return False
     def get_status(self, eventtime=None):
-        if self.check_timer is None:
+        if not self.is_checking:
             return {'drv_status': None}
         last_value, reg_name = self.drv_status_reg_info[:2]
         if last_value != self.last_drv_status:
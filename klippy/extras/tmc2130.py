@@ -263,6 +263,15 @@ class MCU_TMC_SPI:
         with self.mutex:
             read = self.tmc_spi.reg_read(reg, self.chain_pos)
         return read
+    def read_registers(self, reg_names):
+        regs = [self.name_to_reg[reg_name] for reg_name in reg_names]
+        with self.mutex:
+            return [self.tmc_spi.reg_read(reg, self.chain_pos)
+                    for reg in regs]
+    def get_bus_key(self):
+        # Drivers on the same SPI bus are polled together
+        spi = self.tmc_spi.spi
+        return ('spi', spi.get_mcu().get_name(), spi.bus, spi.sw_pins)
     def set_register(self, reg_name, val, print_time=None):
         reg = self.name_to_reg[reg_name]
         with self.mutex:
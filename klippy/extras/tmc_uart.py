@@ -235,6 +235,9 @@ class MCU_TMC_uart:
     def get_register(self, reg_name):
         with self.mutex:
             return self._do_get_register(reg_name)
+    def read_registers(self, reg_names):
+        with self.mutex:
+            return [self._do_get_register(reg_name) for reg_name in reg_names]
     def set_register(self, reg_name, val, print_time=None):
         reg = self.name_to_reg[reg_name]
         if self.printer.get_start_args().get('debugoutput') is not None:
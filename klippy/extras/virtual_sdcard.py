@@ -8,23 +8,32 @@ import logging
 import os
 from uuid import uuid4
 
+from .gcode_metadata.file_index import (find_last_extrude_position,
+                                        get_skip_commands)
+
 
 
 RESTORE_GCODE_POS_SPEED = 100
 
 
 class PrintJob:
-    def __init__(self, path, manager):
+    def __init__(self, path, manager, start_layer=None):
         self.manager = manager
         self.reactor = manager.reactor
         self.toolhead = manager.toolhead
         self.gcode = manager.gcode
         self.heaters = manager.printer.lookup_object('heaters')
+        self.gcode_move = manager.printer.lookup_object('gcode_move')
+        self.exclude_object = manager.printer.lookup_object('exclude_object', None)
         self.gcode_metadata = manager.gcode_metadata
+        # Start offset -> end offset of excluded object blocks
+        self.excluded_blocks = {}
+        self.excluded_names = []
 
         self.continuous = False
         self.was_queued = len(manager.jobs) and not (len(manager.jobs) == 1 and manager.jobs[0].state in ('finished', 'aborted'))
         self.path = path
+        self.start_layer = start_layer # Layer index to start printing at
         self.state = None
         self.set_state('queued') # queued -> printing -> pausing -> paused -> printing -> finished
         self.file_position = 0 #                      -> aborting -> aborted
@@ -108,6 +117,8 @@ class PrintJob:
     def work_handler(self, eventtime):
         logging.info(f"Print job entering work handler (position {self.file_position})")
         self.reactor.unregister_timer(self.work_timer)
+        if self.start_layer is not None:
+            self.start_at_layer(self.start_layer)
         try:
             self.file_obj.seek(self.file_position)
         except:
@@ -115,44 +126,68 @@ class PrintJob:
             self.gcode.respond_error("Unable to seek file")
             self.set_state('aborting')
         gcode_mutex = self.gcode.get_mutex()
-        partial_input = ""
+        # Lines are handled as bytes so file_position is a byte offset
+        partial_input = b""
         lines = []
+        excluded_blocks = {}
 
         while self.state == 'printing':
             # Read more lines if necessary
             if not lines:
                 try:
-                    data = self.file_obj.read(8192).decode()
+                    data = self.file_obj.read(8192)
                 except:
                     self.set_state('aborting')
                     logging.exception("virtual_sdcard read")
                     self.reactor.send_event("klippy:error", "Error reading File")
                     self.gcode.respond_error("Error on virtual sdcard read")
                     break
-                if not data:
+                if data:
+                    lines = (partial_input + data).split(b'\n')
+                    partial_input = lines.pop()
+                elif partial_input:
+                    # Last line without newline
+                    lines = partial_input.split(b'\n')
+                    partial_input = b""
+                else:
                     # End of file
                     self.set_state('finished')
                     self.gcode.respond_raw("Done printing file")
                     break
-                lines = data.split('\n')
-                lines[0] = partial_input + lines[0]
-                partial_input = lines.pop()
                 lines.reverse()
+                excluded_blocks = self.get_excluded_blocks()
                 self.reactor.pause(self.reactor.NOW)
                 continue
             # Pause if any other request is pending in the gcode class
             if gcode_mutex.test():
                 self.reactor.pause(self.reactor.monotonic() + 0.050)
                 continue
+            # Jump over blocks of excluded objects
+            if self.file_position in excluded_blocks:
+                end = excluded_blocks[self.file_position]
+                buffered = b'\n'.join(reversed(lines)) + b'\n' + partial_input
+                try:
+                    rest = self.skip_block(buffered, end - self.file_position)
+                except Exception as e:
+                    self.reactor.send_event("klippy:error", "Error skipping excluded object \n" + str(e))
+                    self.set_state('aborting')
+                    logging.exception("Virtual sdcard error skipping object")
+                    break
+                if rest is not None:
+                    lines = []
+                    partial_input = rest
+                    self.file_position = end
+                    continue
             # Dispatch command
+            line = lines.pop()
             try:
-                self.gcode.run_script(lines[-1])
+                self.gcode.run_script(line.decode(errors='replace'))
             except Exception as e:
                 self.reactor.send_event("klippy:error", "Error dispatching Command \n" + str(e))
                 self.set_state('aborting')
                 logging.exception("Virtual sdcard error dispaching command: " + repr(e))
                 break
-            self.file_position += len(lines.pop()) + 1
+            self.file_position += len(line) + 1
 
         logging.info(f"Exiting SD card print in state {self.state} position {self.file_position}")
         self.additional_printed_time += self.toolhead.get_last_move_time() - self.last_start_time
@@ -171,6 +206,106 @@ class PrintJob:
             self.manager.check_queue()
         return self.reactor.NEVER
 
+    def get_excluded_blocks(self):
+        """Return a dict with the start and end offsets of the blocks of
+        all currently excluded objects"""
+        if self.exclude_object is None:
+            return self.excluded_blocks
+        excluded_names = self.exclude_object.excluded_objects
+        if excluded_names is not self.excluded_names:
+            # The list is replaced whenever it changes
+            index = None
+            if excluded_names:
+                try:
+                    index = self.md.get_file_index(wait=False)
+                except Exception:
+                    logging.exception("virtual_sdcard object index")
+                else:
+                    if index is None:
+                        # Print the blocks normally until the index
+                        # thread is done, check again with the next read
+                        return self.excluded_blocks
+            self.excluded_names = excluded_names
+            self.excluded_blocks = {}
+            if index is not None:
+                for name in excluded_names:
+                    for start, end in index.get_object_blocks(name):
+                        self.excluded_blocks[start] = end
+        return self.excluded_blocks
+
+    def skip_block(self, buffered, length):
+        """Skip length bytes of the G-Code, starting with the already read
+        data in buffered, and only run the commands needed to keep the
+        state consistent. Returns the data following the block, or None if
+        the block can't be skipped and has to be printed normally."""
+        if not self.gcode_move.absolute_coord:
+            return None
+        if length <= len(buffered):
+            data, rest = buffered[:length], buffered[length:]
+        else:
+            data = buffered + self.file_obj.read(length - len(buffered))
+            rest = b""
+        commands, last_e = get_skip_commands(data)
+        if commands is None:
+            # Not skipped, rewind to the block start
+            self.file_obj.seek(self.file_position + len(buffered))
+            return None
+        if commands:
+            self.gcode.run_script("\n".join(commands))
+        if last_e is not None and self.gcode_move.absolute_extrude:
+            self.gcode.run_script(f"G92 E{last_e}")
+        logging.info(f"Skipped excluded object at {self.file_position} ({length} bytes)")
+        return rest
+
+    def start_at_layer(self, layer):
+        """Move the file position to the start of the given layer and
+        restore the state the G-Code before it would have set"""
+        try:
+            index = self.md.get_file_index(wait=False)
+            while index is None:
+                # Wait for the index thread, without blocking the reactor.
+                # If paused meanwhile, the layer is looked up on resume.
+                if self.state != 'printing':
+                    return
+                self.reactor.pause(self.reactor.monotonic() + 0.100)
+                index = self.md.get_file_index(wait=False)
+            self.start_layer = None
+            entry = index.get_layer(layer)
+            last_e = None
+            if entry.absolute_extrude:
+                last_e = find_last_extrude_position(self.file_obj, entry.offset)
+        except IndexError:
+            self.gcode.respond_error(f"File has no layer {layer}")
+            self.set_state('aborting')
+            return
+        except Exception:
+            logging.exception("virtual_sdcard layer index")
+            self.gcode.respond_error("Unable to find layer in file")
+            self.set_state('aborting')
+            return
+        logging.info(f"Starting print at layer {layer} (position {entry.offset})")
+        script = [f"M140 S{entry.bed_temp}", f"M104 S{entry.extruder_temp}",
+                  f"M190 S{entry.bed_temp}", f"M109 S{entry.extruder_temp}",
+                  f"M106 S{entry.fan_speed}" if entry.fan_speed else "M107",
+                  "G90"]
+        if entry.z is not None:
+            script.append(f"G1 Z{entry.z} F600")
+        if not entry.absolute_coordinates:
+            script.append("G91")
+        if entry.absolute_extrude:
+            script.append("M82")
+            if last_e is not None:
+                script.append(f"G92 E{last_e}")
+        else:
+            script.append("M83")
+        try:
+            self.gcode.run_script("\n".join(script))
+        except self.gcode.error as e:
+            self.gcode.respond_error(str(e))
+            self.set_state('aborting')
+            return
+        self.file_position = entry.offset
+
     def get_printed_time(self, print_time=None):
         if not print_time:
             print_time = self.toolhead.mcu.estimated_print_time(self.reactor.monotonic())
@@ -197,7 +332,7 @@ class PrintJobManager:
         self.gcode.register_command('STOP', self.cmd_STOP)
         self.jobs = [] # Print jobs, first is current
 
-    def add_print(self, path, assume_clear_after=None):
+    def add_print(self, path, assume_clear_after=None, start_layer=None):
         """Add new print job to queue
 
         By specifying a timespan in seconds for assume_clear_after the print
@@ -205,6 +340,8 @@ class PrintJobManager:
         has not been confirmed clear yet. If 0 is specified, the print always
         starts in that case, otherwise only if that many seconds have passed,
         since the last print has concluded.
+        With start_layer the print starts at the given layer index instead
+        of at the beginning of the file.
         """
         if (len(self.jobs) == 1 and
                 self.jobs[0].state in ('finished', 'aborted') and
@@ -214,7 +351,7 @@ class PrintJobManager:
             if (assume_clear_after == 0
             or self.jobs[0].print_end_time is not None and assume_clear_after < (now - self.jobs[0].print_end_time)):
                 self.clear_buildplate()
-        job = PrintJob(path, self)
+        job = PrintJob(path, self, start_layer)
         self.jobs.append(job)
         self.check_queue()
         self.printer.send_event("virtual_sdcard:print_added", self.jobs, job)
@@ -337,7 +474,8 @@ class PrintJobManager:
 
     def cmd_PRINT(self, gcmd):
         filename = os.path.join(self.sdcard_dirname, gcmd.get("FILE"))
-        self.add_print(filename, 1, True)
+        start_layer = gcmd.get_int("LAYER", None, minval=0)
+        self.add_print(filename, 1, start_layer)
 
     def cmd_PAUSE(self, gcmd):
         # Allow the gcode lock to be released before pausing
@@ -3,7 +3,7 @@
 # Copyright (C) 2016-2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import os, re, logging, collections, shlex
+import os, re, time, logging, collections, shlex
 
 class CommandError(Exception):
     pass
@@ -12,14 +12,19 @@ Coord = collections.namedtuple('Coord', ('x', 'y', 'z', 'e'))
 
 class GCodeCommand:
     error = CommandError
+    # One instance is created per G-Code line - avoid a per-instance dict
+    __slots__ = ('_gcode', '_command', '_commandline', '_params', '_need_ack')
     def __init__(self, gcode, command, commandline, params, need_ack):
+        self._gcode = gcode
         self._command = command
         self._commandline = commandline
         self._params = params
         self._need_ack = need_ack
-        # Method wrappers
-        self.respond_info = gcode.respond_info
-        self.respond_raw = gcode.respond_raw
+    # Method wrappers
+    def respond_info(self, msg, log=True):
+        self._gcode.respond_info(msg, log)
+    def respond_raw(self, msg):
+        self._gcode.respond_raw(msg)
     def get_command(self):
         return self._command
     def get_commandline(self):
@@ -182,10 +187,7 @@ class GCodeDispatch:
             # Ignore comments and leading/trailing spaces
             line = origline = line.strip()
             cpos = line.find(';')
-            if cpos == 0: 
-                # The whole line is a comment, send event for modules to read it
-                print_time = self.printer.lookup_object('toolhead').get_last_move_time()
-                self.printer.send_event("gcode:read_metadata", print_time, line)
+            if cpos == 0:
                 continue
             elif cpos >= 0:
                 line = line[:cpos]
@@ -384,13 +386,35 @@ class GCodeIO:
                                                       self._process_data)
         self.partial_input = ""
         self.pending_commands = []
-        self.bytes_read = 0
+        self.bytes_read = self.lines_read = 0
         self.input_log = collections.deque([], 50)
+        # Throughput statistics for debug file input
+        self.start_times = self.end_print_time = None
+        if self.is_fileinput:
+            printer.register_event_handler("gcode:request_restart",
+                                           self._handle_request_restart)
+            printer.register_event_handler("klippy:disconnect",
+                                           self._handle_disconnect)
     def _handle_ready(self):
         self.is_printer_ready = True
         if self.is_fileinput and self.fd_handle is None:
+            self.start_times = (self.reactor.monotonic(), time.process_time())
             self.fd_handle = self.reactor.register_fd(self.fd,
                                                       self._process_data)
+    def _handle_request_restart(self, print_time):
+        self.end_print_time = print_time
+    def _handle_disconnect(self):
+        if self.start_times is None or self.end_print_time is None:
+            return
+        start_walltime, start_cputime = self.start_times
+        toolhead = self.printer.lookup_object('toolhead')
+        move_count, peak_lookahead = toolhead.get_move_queue_stats()
+        logging.info("File input stats: bytes=%d lines=%d moves=%d"
+                     " peak_lookahead=%d print_time=%.3f cputime=%.3f"
+                     " walltime=%.3f", self.bytes_read, self.lines_read,
+                     move_count, peak_lookahead, self.end_print_time,
+                     time.process_time() - start_cputime,
+                     self.reactor.monotonic() - start_walltime)
     def _dump_debug(self):
         out = []
         out.append("Dumping gcode input %d blocks" % (len(self.input_log),))
@@ -417,6 +441,7 @@ class GCodeIO:
         lines = data.split('\n')
         lines[0] = self.partial_input + lines[0]
         self.partial_input = lines.pop()
+        self.lines_read += len(lines)
         pending_commands = self.pending_commands
         pending_commands.extend(lines)
         self.pipe_is_active = True
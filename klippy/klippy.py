@@ -5,6 +5,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import sys, os, gc, optparse, logging, time, collections, importlib
+import contextlib
 import util, reactor, queuelogger, msgproto
 import gcode, configfile, pins, mcu, toolhead, webhooks
 import signal, traceback, multiprocessing, datetime
@@ -51,6 +52,55 @@ config, and restart the host software.
 Printer is shutdown
 """
 
+# Wall and cpu time of the startup phases and of loading each module
+class StartupProfile:
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.total = self.rss = None
+        self.phases = []
+        self.modules = collections.OrderedDict()
+        self.event_handlers = []
+    @contextlib.contextmanager
+    def phase(self, name, results=None):
+        wall, cpu = time.monotonic(), time.process_time()
+        try:
+            yield
+        finally:
+            if results is None:
+                results = self.phases
+            results.append((name, time.monotonic() - wall,
+                            time.process_time() - cpu))
+    def note_module(self, name, import_time, load_time):
+        self.modules[name] = (import_time, load_time)
+    def get_status(self):
+        return {
+            'total': self.total,
+            'rss': self.rss,
+            'phases': [{'name': n, 'wall': w, 'cpu': c}
+                       for n, w, c in self.phases],
+            'event_handlers': [{'name': n, 'wall': w, 'cpu': c}
+                               for n, w, c in self.event_handlers],
+            'modules': [{'name': n, 'import': i, 'load_config': l}
+                        for n, (i, l) in self.modules.items()]}
+    def note_ready(self):
+        self.total = time.monotonic() - self.start_time
+        self.rss = util.get_rss()
+        self.log()
+    def log(self):
+        lines = ["Startup profile (%.3fs until ready, rss=%.1fMiB):" % (
+            self.total, (self.rss or 0) / (1024. * 1024.))]
+        for name, wall, cpu in self.phases:
+            lines.append("  %-24s wall=%.3f cpu=%.3f" % (name, wall, cpu))
+        handlers = sorted(self.event_handlers, key=lambda h: -h[1])
+        for name, wall, cpu in handlers[:10]:
+            lines.append("  handler %-40s wall=%.3f cpu=%.3f" % (
+                name, wall, cpu))
+        modules = sorted(self.modules.items(), key=lambda m: -sum(m[1]))
+        for name, (import_time, load_time) in modules[:20]:
+            lines.append("  module %-41s import=%.3f load_config=%.3f" % (
+                name, import_time, load_time))
+        logging.info("\n".join(lines))
+
 class Printer:
     config_error = configfile.error
     command_error = gcode.CommandError
@@ -67,11 +117,14 @@ class Printer:
         self.objects = collections.OrderedDict()
         self.parallel_objects = {}
         self.parallel_queues = {}
+        self.startup_profile = StartupProfile()
         # Init printer components that must be setup prior to config
         for m in [gcode, webhooks]:
             m.add_early_printer_objects(self)
     def get_start_args(self):
         return self.start_args
+    def get_startup_profile(self):
+        return self.startup_profile.get_status()
     def get_reactor(self):
         return self.reactor
     def get_state_message(self):
@@ -123,13 +176,18 @@ class Printer:
         parallel_module  = join(dirname(__file__), 'parallel_extras', module_name + '.py')
         parallel_package = join(dirname(__file__), 'parallel_extras', module_name, '__init__.py')
         if exists(module) or exists(package):
+            start_time = time.monotonic()
             mod = importlib.import_module('extras.' + module_name)
+            import_time = time.monotonic()
             init_func = getattr(mod, init_func, None)
             if init_func is None:
                 if default is not configfile.sentinel:
                     return default
                 raise self.config_error("Unable to load module '%s'" % (section,))
             self.objects[section] = init_func(config.getsection(section))
+            # Times include modules loaded by this one
+            self.startup_profile.note_module(section, import_time - start_time,
+                                             time.monotonic() - import_time)
             return self.objects[section]
         elif exists(parallel_module) or exists(parallel_package):
             self.parallel_queues[section] = multiprocessing.Queue()
@@ -144,31 +202,36 @@ class Printer:
                 return default
             raise self.config_error("Unable to load module '%s'" % (section,))
     def _read_config(self):
-        self.objects['configfile'] = pconfig = configfile.PrinterConfig(self)
-        config = pconfig.read_main_config()
-        if self.bglogger is not None:
-            pconfig.log_config(config)
+        profile = self.startup_profile
+        with profile.phase("read_config"):
+            self.objects['configfile'] = pconfig = configfile.PrinterConfig(self)
+            config = pconfig.read_main_config()
+            if self.bglogger is not None:
+                pconfig.log_config(config)
         # Create printer components
-        for m in [pins, mcu]:
-            m.add_printer_objects(config)
-        for section_config in config.get_prefix_sections(''):
-            self.load_object(config, section_config.get_name(), None)
-        self.parallel_queues['printer'] = multiprocessing.Queue()
-        self.reactor.setup_mp_queues(self.parallel_queues)
-        for proc in self.parallel_objects.values():
-            proc.start(self.parallel_queues)
+        with profile.phase("load_config"):
+            for m in [pins, mcu]:
+                m.add_printer_objects(config)
+            for section_config in config.get_prefix_sections(''):
+                self.load_object(config, section_config.get_name(), None)
+        with profile.phase("start_parallel_extras"):
+            self.parallel_queues['printer'] = multiprocessing.Queue()
+            self.reactor.setup_mp_queues(self.parallel_queues)
+            for proc in self.parallel_objects.values():
+                proc.start(self.parallel_queues)
 
-        # Wait for config access_tracking to be reported back
-        for proc in self.parallel_objects.values():
-            access_tracking = proc.completion.wait(waketime=self.reactor.monotonic() + 20)
-            if access_tracking is None:
-                raise TimeoutError(
-                    f"{proc.name} did not return access tracking within 20 seconds!")
-            else:
-                config.access_tracking.update(access_tracking)
+            # Wait for config access_tracking to be reported back
+            for proc in self.parallel_objects.values():
+                access_tracking = proc.completion.wait(waketime=self.reactor.monotonic() + 20)
+                if access_tracking is None:
+                    raise TimeoutError(
+                        f"{proc.name} did not return access tracking within 20 seconds!")
+                else:
+                    config.access_tracking.update(access_tracking)
 
-        for m in [toolhead]:
-            m.add_printer_objects(config)
+        with profile.phase("load_toolhead"):
+            for m in [toolhead]:
+                m.add_printer_objects(config)
         # Validate that there are no undefined parameters in the config file
         pconfig.check_unused_options(config)
     def _build_protocol_error_message(self, e):
@@ -199,10 +262,15 @@ class Printer:
         msg += [message_protocol_error2, str(e)]
         return "\n".join(msg)
     def _connect(self, eventtime):
+        profile = self.startup_profile
         try:
             self._read_config()
-            self.send_event("klippy:mcu_identify")
-            self.reactor.send_event_wait("klippy:connect", check_status=message_startup)
+            with profile.phase("mcu_identify"):
+                self.send_event("klippy:mcu_identify")
+            with profile.phase("connect"):
+                self.reactor.send_event_wait(
+                    "klippy:connect", check_status=message_startup,
+                    profile=profile)
         except (self.config_error, pins.error) as e:
             logging.exception("Config error")
             self.send_event("klippy:critical_error", "Config Error", str(e))
@@ -228,7 +296,15 @@ class Printer:
             return
         try:
             self._set_state(message_ready)
-            self.reactor.send_event_wait("klippy:ready", check_status=message_ready)
+            with profile.phase("ready"):
+                self.reactor.send_event_wait("klippy:ready",
+                                             check_status=message_ready,
+                                             profile=profile)
+            profile.note_ready()
+            # Objects created during startup live until restart - move
+            # them out of reach of the cyclic garbage collector
+            gc.collect()
+            gc.freeze()
         except Exception as e:
             logging.exception("Unhandled exception during ready callback")
             self.invoke_shutdown("Internal error during ready callback: %s"
@@ -334,6 +410,8 @@ class ExtraProcess:
             logging.info(f"\nRestart {datetime.datetime.now()}\n")
             reactor.setup_mp_queues(mp_queues)
             reactor.root = init_func(self.config)
+            logging.info("%s started, rss=%.1fMiB", self.name,
+                         (util.get_rss() or 0) / (1024. * 1024.))
             reactor.cb(ExtraProcess._report_access_tracking,
                     self.config.section, self.config.access_tracking)
         try:
@@ -470,6 +548,7 @@ def main():
         if bglogger is not None:
             bglogger.clear_rollover_info()
             bglogger.set_rollover_info('versions', versions)
+        gc.unfreeze()
         gc.collect()
         main_reactor = reactor.Reactor(gc_checking=True)
         printer = Printer(main_reactor, bglogger, start_args)
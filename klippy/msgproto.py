@@ -159,6 +159,49 @@ def convert_msg_format(msgformat):
         msgformat = msgformat.replace(c, '%s')
     return msgformat
 
+# Generate specialized decoding functions for a message format.  The
+# generated code inlines the variable length integer decoding of
+# PT_uint32.parse() so that no per-field method calls are needed.
+def build_parsers(param_names):
+    body = ["    pos += 1"]
+    namespace = {}
+    for i, (name, t) in enumerate(param_names):
+        if type(t) in (PT_uint32, PT_int32, PT_uint16, PT_int16, PT_byte):
+            body.extend([
+                "    c = s[pos]",
+                "    pos += 1",
+                "    if c < 0x60:",
+                "        v%d = c" % (i,),
+                "    else:",
+                "        v%d = c & 0x7f" % (i,),
+                "        if (c & 0x60) == 0x60:",
+                "            v%d |= -0x20" % (i,),
+                "        while c & 0x80:",
+                "            c = s[pos]",
+                "            pos += 1",
+                "            v%d = (v%d<<7) | (c & 0x7f)" % (i, i)])
+            if not t.signed:
+                body.append("        v%d &= 0xffffffff" % (i,))
+        elif type(t) in (PT_string, PT_progmem_buffer, PT_buffer):
+            body.extend([
+                "    l = s[pos]",
+                "    v%d = bytes(bytearray(s[pos+1:pos+l+1]))" % (i,),
+                "    pos += l + 1"])
+        else:
+            namespace['t%d' % (i,)] = t.parse
+            body.append("    v%d, pos = t%d(s, pos)" % (i, i))
+    vnames = ["v%d" % (i,) for i in range(len(param_names))]
+    dict_items = ["%s: v%d" % (repr(name), i)
+                  for i, (name, t) in enumerate(param_names)]
+    code = "\n".join(
+        ["def parse(s, pos):"] + body
+        + ["    return {%s}, pos" % (", ".join(dict_items),), ""]
+        + ["def parse_values(s, pos):"] + body
+        + ["    return (%s), pos" % ("".join([v + ", " for v in vnames]),)])
+    exec(compile(code, "<msgproto %s>" % (
+        " ".join([name for name, t in param_names]),), "exec"), namespace)
+    return namespace['parse'], namespace['parse_values']
+
 class MessageFormat:
     def __init__(self, msgid, msgformat, enumerations={}):
         self.msgid = msgid
@@ -168,6 +211,12 @@ class MessageFormat:
         self.param_names = lookup_params(msgformat, enumerations)
         self.param_types = [t for name, t in self.param_names]
         self.name_to_type = dict(self.param_names)
+        self.oid_index = None
+        for i, (name, t) in enumerate(self.param_names):
+            if name == 'oid':
+                self.oid_index = i
+                break
+        self.parse, self.parse_values = build_parsers(self.param_names)
     def encode(self, params):
         out = []
         out.append(self.msgid)
@@ -180,7 +229,7 @@ class MessageFormat:
         for name, t in self.param_names:
             t.encode(out, params[name])
         return out
-    def parse(self, s, pos):
+    def generic_parse(self, s, pos):
         pos += 1
         out = {}
         for name, t in self.param_names:
@@ -290,6 +339,13 @@ class MessageParser:
             self._error("Extra data at end of message")
         params['#name'] = mid.name
         return params
+    def lookup_msgid(self, s):
+        return self.messages_by_id.get(s[MESSAGE_HEADER_SIZE], self.unknown)
+    def parse_values(self, mid, s):
+        values, pos = mid.parse_values(s, MESSAGE_HEADER_SIZE)
+        if pos != len(s)-MESSAGE_TRAILER_SIZE:
+            self._error("Extra data at end of message")
+        return values
     def encode(self, seq, cmd):
         msglen = MESSAGE_MIN + len(cmd)
         seq = (seq & MESSAGE_SEQ_MASK) | MESSAGE_DEST
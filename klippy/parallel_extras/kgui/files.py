@@ -147,7 +147,7 @@ class FilechooserItem(RecycleDataViewBehavior, Label):
             if weight is not None:
                 precision = max(1-int(log10(weight)), 0)
                 self.details = f"{weight:.{precision}f}g"
-            self.thumbnail = md.get_thumbnail_path()
+            self.thumbnail = md.get_thumbnail_path(small=True)
 
     def on_touch_down(self, touch):
         # Add selection on touch down
@@ -140,7 +140,7 @@ class MainApp(App, threading.Thread):
 
     def handle_ready(self):
         self.state = "ready"
-        self.reactor.cb(printer_cmd.update)
+        self.reactor.cb(printer_cmd.update, force=True)
         self.reactor.cb(printer_cmd.get_material)
         self.reactor.cb(printer_cmd.get_tbc)
         self.reactor.cb(printer_cmd.get_collision_config)
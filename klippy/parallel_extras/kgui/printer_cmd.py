@@ -6,6 +6,32 @@ def set_attribute(root, property_name, val):
 def update_dict(root, dict_name, val):
     getattr(root, dict_name).update(val)
 
+# Properties that are updated entry by entry instead of being replaced
+DICT_PROPERTIES = ('temp',)
+# Status values last sent to kgui, only changes are sent again
+last_status = {}
+
+def push_status(printer, values, status=None):
+    """
+    Send the values (property name -> value) to kgui, or add them to
+    status if given, to send everything with one message later
+    """
+    if status is not None:
+        status.update(values)
+        return
+    last_status.update(values)
+    printer.reactor.cb(apply_status, values, process='kgui')
+
+def apply_status(kgui, values):
+    """Set all properties of a status push at once, in one frame"""
+    for name, val in values.items():
+        if name == 'print_progress':
+            set_print_progress(kgui, *val)
+        elif name in DICT_PROPERTIES:
+            getattr(kgui, name).update(val)
+        else:
+            setattr(kgui, name, val)
+
 def load_object(printer, object_name): # config objects can't be pickled
     klipper_config = printer.objects['configfile'].read_main_config()
     printer.load_object(klipper_config, object_name)
@@ -24,30 +50,30 @@ def reset_tuning(printer):
     reset_pressure_advance(printer)
     update(printer)
 
-def get_z_offset(printer):
+def get_z_offset(printer, status=None):
     z_offset = printer.objects['gcode_move'].homing_position[2]
-    printer.reactor.cb(set_attribute, 'z_offset', z_offset, process='kgui')
+    push_status(printer, {'z_offset': z_offset}, status)
 def send_z_offset(printer, z_offset):
     printer.objects['gcode'].run_script(f"SET_GCODE_OFFSET Z={z_offset} MOVE=1 MOVE_SPEED=5")
     get_z_offset(printer)
 
-def get_speed(printer):
+def get_speed(printer, status=None):
     e = printer.reactor.monotonic()
     motion_status = printer.objects['motion_report'].get_status(e)
-    status = printer.objects['gcode_move'].get_status(e)
-    printer.reactor.cb(set_attribute, 'speed_factor', status['speed_factor']*100, process='kgui')
-    printer.reactor.cb(set_attribute, 'speed', motion_status['live_velocity'], process='kgui')
+    move_status = printer.objects['gcode_move'].get_status(e)
+    push_status(printer, {'speed_factor': move_status['speed_factor']*100,
+                          'speed': motion_status['live_velocity']}, status)
 def send_speed(printer, val):
     val = val/(60.*100.)
     printer.objects['gcode_move'].speed = printer.objects['gcode_move']._get_gcode_speed() * val
     printer.objects['gcode_move'].speed_factor = val
     get_speed(printer)
 
-def get_flow(printer):
+def get_flow(printer, status=None):
     flow_factor = printer.objects['gcode_move'].extrude_factor*100
-    status = printer.objects['motion_report'].get_status(printer.reactor.monotonic())
-    printer.reactor.cb(set_attribute, 'flow_factor', flow_factor, process='kgui')
-    printer.reactor.cb(set_attribute, 'flow', status['live_extruder_velocity'], process='kgui')
+    motion_status = printer.objects['motion_report'].get_status(printer.reactor.monotonic())
+    push_status(printer, {'flow_factor': flow_factor,
+                          'flow': motion_status['live_extruder_velocity']}, status)
 def send_flow(printer, val):
     new_extrude_factor = val/100.
     gcode_move = printer.objects['gcode_move']
@@ -57,29 +83,29 @@ def send_flow(printer, val):
     gcode_move.extrude_factor = new_extrude_factor
     get_flow(printer)
 
-def get_fan(printer):
+def get_fan(printer, status=None):
     if 'fan' in printer.objects:
         fan_speed = printer.objects['fan'].fan.last_fan_value * 100 / printer.objects['fan'].fan.max_power
-        printer.reactor.cb(set_attribute, 'fan_speed', fan_speed, process='kgui')
+        push_status(printer, {'fan_speed': fan_speed}, status)
 def send_fan(printer, speed):
     if 'fan' in printer.objects:
         printer.objects['fan'].fan.set_speed_from_command(speed/100)
         get_fan(printer)
 
-def get_chamber_fan(printer):
+def get_chamber_fan(printer, status=None):
     if "temperature_fan chamber_fan" in printer.objects:
         state = printer.objects['temperature_fan chamber_fan'].get_status(printer.reactor.monotonic())
         speed = state['speed']*100/printer.objects['temperature_fan chamber_fan'].fan.max_power
-        printer.reactor.cb(set_attribute, 'chamber_fan_speed', speed, process='kgui')
-        printer.reactor.cb(set_attribute, 'chamber_temp', [state['target'], state['temperature']], process='kgui')
+        push_status(printer, {'chamber_fan_speed': speed,
+                              'chamber_temp': [state['target'], state['temperature']]}, status)
 def send_chamber_fan(printer, val):
     if "temperature_fan chamber_fan" in printer.objects:
         printer.objects['gcode'].run_script(f"SET_TEMPERATURE_FAN_TARGET TEMPERATURE_FAN=chamber_fan TARGET={val}")
         get_chamber_fan(printer)
 
-def get_pressure_advance(printer): # gives pressure_advance value of 1. extruder
+def get_pressure_advance(printer, status=None): # gives pressure_advance value of 1. extruder
     pressure_advance = printer.objects['extruder'].get_status(printer.reactor.monotonic())['pressure_advance']
-    printer.reactor.cb(set_attribute, 'pressure_advance', pressure_advance, process='kgui')
+    push_status(printer, {'pressure_advance': pressure_advance}, status)
 def send_pressure_advance(printer, val):
     for i in range(10):
         extruder_id = f"extruder{'' if i==0 else i}"
@@ -98,11 +124,11 @@ def reset_pressure_advance(printer):
             pa = klipper_config.getsection(extruder.name).getfloat('pressure_advance', 0., minval=0.)
             extruder.extruder_stepper._set_pressure_advance(pa, extruder.extruder_stepper.pressure_advance_smooth_time)
 
-def get_acceleration(printer):
+def get_acceleration(printer, status=None):
     acceleration = printer.objects['toolhead'].max_accel/1000
     acceleration_factor = printer.objects['toolhead'].accel_factor*100
-    printer.reactor.cb(set_attribute, 'acceleration', acceleration, process='kgui')
-    printer.reactor.cb(set_attribute, 'acceleration_factor', acceleration_factor, process='kgui')
+    push_status(printer, {'acceleration': acceleration,
+                          'acceleration_factor': acceleration_factor}, status)
 def send_acceleration(printer, val):
     val /= 100
     printer.objects['toolhead'].max_accel = printer.objects['toolhead'].max_accel * val/printer.objects['toolhead'].accel_factor
@@ -114,17 +140,36 @@ def send_acceleration(printer, val):
 # Other Commands
 ######################################################################
 
-def update(printer):
-    get_homing_state(printer)
-    get_print_progress(printer)
-    get_pressure_advance(printer)
-    get_acceleration(printer)
-    get_z_offset(printer)
-    get_speed(printer)
-    get_flow(printer)
-    get_temp(printer)
-    get_fan(printer)
-    get_chamber_fan(printer)
+def update(printer, force=False):
+    """
+    Send all changed status values to kgui in one message.
+    With force, everything is sent, e.g. when kgui has (re)started.
+    """
+    status = {}
+    get_homing_state(printer, status)
+    get_print_progress(printer, status)
+    get_pressure_advance(printer, status)
+    get_acceleration(printer, status)
+    get_z_offset(printer, status)
+    get_speed(printer, status)
+    get_flow(printer, status)
+    get_temp(printer, status)
+    get_fan(printer, status)
+    get_chamber_fan(printer, status)
+    if force:
+        last_status.clear()
+    delta = {}
+    for name, val in status.items():
+        last = last_status.get(name)
+        if name in DICT_PROPERTIES and last is not None:
+            val = {k: v for k, v in val.items() if last.get(k) != v}
+            if val:
+                delta[name] = val
+                last_status[name] = dict(last, **val)
+        elif name not in last_status or last != val:
+            delta[name] = last_status[name] = val
+    if delta:
+        printer.reactor.cb(apply_status, delta, process='kgui')
 
 def save_config(printer):
     printer.objects['configfile'].cmd_SAVE_CONFIG(None)
@@ -138,21 +183,21 @@ def write_pressure_advance(printer, value, extruder_count):
         printer.objects['configfile'].set(f"extruder{'' if i==0 else i}", "pressure_advance", value)
     printer.objects['configfile'].cmd_SAVE_CONFIG(None)
 
-def get_temp(printer):
+def get_temp(printer, status=None):
     if 'heaters' in printer.objects:
         temp = {}
         for name, heater in printer.objects['heaters'].heaters.items():
             current, target = heater.get_temp(printer.reactor.monotonic())
             temp[name] = [target, current]
-        printer.reactor.cb(update_dict, 'temp', temp, process='kgui')
+        push_status(printer, {'temp': temp}, status)
 def send_temp(printer, temp, extruder_id):
     pheaters = printer.objects['heaters']
     pheaters.set_temperature(pheaters.heaters[extruder_id], temp)
     get_temp(printer)
 
-def get_homing_state(printer):
-    status = printer.objects['toolhead'].kin.get_status(printer.reactor.monotonic())
-    printer.reactor.cb(set_attribute, 'homed', status['homed_axes'], process='kgui')
+def get_homing_state(printer, status=None):
+    kin_status = printer.objects['toolhead'].kin.get_status(printer.reactor.monotonic())
+    push_status(printer, {'homed': kin_status['homed_axes']}, status)
 def send_home(printer, axis):
     printer.objects['gcode'].run_script("G28" + axis.upper())
 
@@ -217,10 +262,16 @@ def set_gcode_console(kgui, gcode):
     kgui.gcode_output += gcode + '\n'
     kgui.gcode_output = kgui.gcode_output[-1000:]
 
-def get_print_progress(printer):
+def get_print_progress(printer, status=None):
     est_remaining, progress = printer.objects['print_stats'].get_print_time_prediction()
-    printer.reactor.cb(set_print_progress, est_remaining, progress, process='kgui')
-def set_print_progress(kgui, est_remaining, progress):
+    done_time = None
+    if progress is not None:
+        # Absolute finish time, so it moves on while est_remaining stays
+        # the same (e.g. when paused). Only minutes are shown.
+        done = datetime.now() + timedelta(seconds=est_remaining)
+        done_time = done.replace(second=0, microsecond=0).timestamp()
+    push_status(printer, {'print_progress': (est_remaining, progress, done_time)}, status)
+def set_print_progress(kgui, est_remaining, progress, done_time):
     if kgui.print_state in ('printing', 'pausing', 'paused'):
         if progress is None: # no prediction could be made yet
             kgui.progress = 0
@@ -228,7 +279,7 @@ def set_print_progress(kgui, est_remaining, progress):
             kgui.print_done_time = ""
         else:
             remaining = timedelta(seconds=est_remaining)
-            done = datetime.now() + remaining
+            done = datetime.fromtimestamp(done_time)
             tomorrow = datetime.now() + timedelta(days=1)
             kgui.progress = progress
             kgui.print_time = format_time(remaining.total_seconds()) + " remaining"
@@ -27,7 +27,7 @@ class Timeline(RecycleView):
 
     def load_all(self, *args, clear_scroll_pos=False, clear_selection=True):
         queue = [{'name': job.name, 'path': job.path, 'state': job.state, 'continuous': job.continuous,
-                  'thumbnail': self.app.gcode_metadata.get_metadata(job.path).get_thumbnail_path()}
+                  'thumbnail': self.app.gcode_metadata.get_metadata(job.path).get_thumbnail_path(small=True)}
                       for job in reversed(self.app.jobs)]
         if len(queue) > 0:
             queue.insert(-1, {'name': "Currently printing", "state": 'header'})
@@ -49,7 +49,7 @@ class Timeline(RecycleView):
                     "state": job[1],
                     "timestamp": job[2],
                     "name": splitext(basename(job[0]))[0],
-                    'thumbnail': md.get_thumbnail_path(),
+                    'thumbnail': md.get_thumbnail_path(small=True),
                     'continuous': job[3]}
                 history.append(new)
             history.append({"name": new_date.strftime("%d. %b %Y"), "state": 'date_header'})
@@ -2,7 +2,6 @@ from functools import partial
 import logging
 import lzma
 import os
-import requests
 import subprocess
 from threading import Thread
 import time
@@ -56,6 +55,8 @@ class Updater(EventDispatcher):
         Thread(target=self.do_fetch).start()
 
     def do_fetch(self, *args):
+        # requests is slow to import and only needed here and for downloads
+        import requests
         try:
             requ = requests.get(self.RELEASES_URL,
                 headers=self._headers | {"Accept": "application/vnd.github+json"},
@@ -134,6 +135,7 @@ class Release(EventDispatcher):
         Thread(target=self._download_thread, name="Download-Update-Thread").start()
 
     def _download_thread(self):
+        import requests
         aborted = False
         # Download to PATH.part first
         download_path = self.update_path + '.part'
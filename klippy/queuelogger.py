@@ -3,40 +3,111 @@
 # Copyright (C) 2016-2019  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, logging.handlers, threading, queue, time
+import logging, logging.handlers, threading, queue, time, os, gzip, shutil
+import collections
+
+# Maximum number of records waiting to be written, records are dropped
+# (and counted) when the writer can't keep up
+QUEUE_SIZE = 10000
+# Maximum number of records written at once
+BATCH_SIZE = 200
 
 # Class to forward all messages through a queue to a background thread
 class QueueHandler(logging.Handler):
     def __init__(self, queue):
         logging.Handler.__init__(self)
         self.queue = queue
+        # Level name -> number of records dropped since the last report
+        self.dropped = collections.Counter()
+    def _report_dropped(self):
+        counts = ", ".join("%s=%d" % item for item in self.dropped.items())
+        record = logging.makeLogRecord({
+            'msg': "Dropped %d log messages (%s)" % (
+                sum(self.dropped.values()), counts),
+            'levelno': logging.WARNING, 'levelname': 'WARNING'})
+        record.message = record.msg
+        self.queue.put_nowait(record)
+        self.dropped.clear()
     def emit(self, record):
         try:
             self.format(record)
             record.msg = record.message
             record.args = None
             record.exc_info = None
+            if self.dropped:
+                self._report_dropped()
             self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped[record.levelname] += 1
         except Exception:
             self.handleError(record)
 
+# Compress a rotated log file, run in a background thread
+def _compress_log(source, dest):
+    try:
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+    except OSError:
+        logging.exception("Unable to compress log file %s", source)
+
 # Class to poll a queue in a background thread and log each message
 class QueueListener(logging.handlers.TimedRotatingFileHandler):
     def __init__(self, filename):
         logging.handlers.TimedRotatingFileHandler.__init__(
             self, filename, when='midnight', backupCount=5)
-        self.bg_queue = queue.Queue()
+        # Rotated files are compressed off the writer thread
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self._rotate
+        self.bg_queue = queue.Queue(QUEUE_SIZE)
         self.bg_thread = threading.Thread(target=self._bg_thread, name="Queuelogger-Thread")
         self.bg_thread.start()
         self.rollover_info = {}
+    def _rotate(self, source, dest):
+        tmp = dest + ".tmp"
+        os.rename(source, tmp)
+        threading.Thread(target=_compress_log, args=(tmp, dest),
+                         name="Log-Compress-Thread").start()
     def _bg_thread(self):
         while 1:
-            record = self.bg_queue.get(True)
-            if record is None:
+            records = [self.bg_queue.get(True)]
+            # Take what else is waiting, so the batch is written with a
+            # single write and flush (during which the GIL is released)
+            while records[-1] is not None and len(records) < BATCH_SIZE:
+                try:
+                    records.append(self.bg_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = records[-1] is None
+            if stop:
+                records.pop()
+            self._write_records(records)
+            if stop:
                 break
-            self.handle(record)
+    def _write_records(self, records):
+        self.acquire()
+        try:
+            lines = []
+            for record in records:
+                if self.shouldRollover(record):
+                    self._write_lines(lines)
+                    lines = []
+                    self.doRollover()
+                lines.append(self.format(record) + self.terminator)
+            self._write_lines(lines)
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+    def _write_lines(self, lines):
+        if not lines:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write("".join(lines))
+        self.stream.flush()
     def stop(self):
-        self.bg_queue.put_nowait(None)
+        self.bg_queue.put(None)
         self.bg_thread.join()
     def set_rollover_info(self, name, info):
         if info is None:
@@ -148,6 +148,9 @@ class SelectReactor:
         # Python garbage collection
         self._check_gc = gc_checking
         self._last_gc_times = [0., 0., 0.]
+        self._gc_counts = [0, 0, 0]
+        self._gc_pause_time = 0.
+        self._gc_max_pause = 0.
         # Timers
         self._timers = []
         self._next_timer = self.NEVER
@@ -178,6 +181,12 @@ class SelectReactor:
         self.register_fd(self.mp_queue._reader.fileno(), self._handle_mp_msg)
     def get_gc_stats(self):
         return tuple(self._last_gc_times)
+    def get_gc_pause_stats(self):
+        # Returns collection counts per generation, total pause time
+        # and the longest pause since the last call
+        max_pause = self._gc_max_pause
+        self._gc_max_pause = 0.
+        return tuple(self._gc_counts), self._gc_pause_time, max_pause
     # Timers
     def update_timer(self, timer_handler, waketime):
         timer_handler.waketime = waketime
@@ -211,6 +220,9 @@ class SelectReactor:
                     start = self.monotonic()
                     gc.collect(gc_level)
                     delta = self.monotonic() - start
+                    self._gc_counts[gc_level] += 1
+                    self._gc_pause_time += delta
+                    self._gc_max_pause = max(self._gc_max_pause, delta)
                     if delta > 0.05:
                         logging.info(f"gc collect took {delta:.4f}")
                     return 0.
@@ -410,7 +422,7 @@ class SelectReactor:
         for process in self.mp_queues:
             self.cb(self.run_event, event, params, process=process)
         return self.run_event(self.root, event, params)
-    def send_event_wait(self, event, *params, check_status=None):
+    def send_event_wait(self, event, *params, check_status=None, profile=None):
         # Start event handlers in other processes
         completions = [self.cb(self.run_event, event, params, completion=True, process=process)
             for process in self.mp_queues]
@@ -421,7 +433,13 @@ class SelectReactor:
         for cb in self.event_handlers.get(event, []):
             if self.root.state_message != check_status != None:
                 return
-            cb(*params)
+            if profile is None:
+                cb(*params)
+                continue
+            # Record the time taken by each handler
+            name = "%s %s" % (event, getattr(cb, '__qualname__', repr(cb)))
+            with profile.phase(name, profile.event_handlers):
+                cb(*params)
         # Wait for other processes to finish event handlers
         for completion in completions:
             completion.wait()
@@ -3,10 +3,10 @@
 # Copyright (C) 2016-2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, threading, os
+import logging, threading, os, hashlib, time, zlib
 import serial
 
-import msgproto, chelper, util
+import msgproto, chelper, util, location
 
 class error(Exception):
     pass
@@ -30,6 +30,9 @@ class SerialReader:
         self.handlers = {}
         self.register_response(self._handle_unknown_init, '#unknown')
         self.register_response(self.handle_output, '#output')
+        # Bulk message handlers (receive a tuple of values, not a dict)
+        self.bulk_handlers = {}
+        self.bulk_names = set()
         # Sent message notification tracking
         self.last_notify_id = 0
         self.pending_notifications = {}
@@ -46,7 +49,10 @@ class SerialReader:
                 completion = self.pending_notifications.pop(response.notify_id)
                 self.reactor.async_complete(completion, params)
                 continue
-            params = self.msgparser.parse(response.msg[0:count])
+            msg = response.msg[0:count]
+            if self.bulk_names and self._handle_bulk(msg):
+                continue
+            params = self.msgparser.parse(msg)
             params['#sent_time'] = response.sent_time
             params['#receive_time'] = response.receive_time
             hdl = (params['#name'], params.get('oid'))
@@ -57,25 +63,108 @@ class SerialReader:
             except:
                 logging.exception("%sException in serial callback",
                                   self.warn_prefix)
+    def _handle_bulk(self, msg):
+        msgparser = self.msgparser
+        mid = msgparser.lookup_msgid(msg)
+        if mid.name not in self.bulk_names:
+            return False
+        try:
+            values = msgparser.parse_values(mid, msg)
+            oid = None
+            if mid.oid_index is not None:
+                oid = values[mid.oid_index]
+            with self.lock:
+                hdl = self.bulk_handlers.get((mid.name, oid))
+                if hdl is None:
+                    return False
+                hdl(values)
+        except:
+            logging.exception("%sException in serial bulk callback",
+                              self.warn_prefix)
+        return True
     def _error(self, msg, *params):
         raise error(self.warn_prefix + (msg % params))
+    def _get_identify_chunk(self, offset):
+        msg = "identify offset=%d count=%d" % (offset, 40)
+        while 1:
+            params = self.send_with_response(msg, 'identify_response')
+            if params['offset'] == offset:
+                return params['data']
+    def _get_identify_key(self):
+        # Find the size of the compressed data dictionary. Reads past its
+        # end return no data and a read of its end returns less than 40
+        # bytes, so the size is found with a few reads.
+        head = self._get_identify_chunk(0)
+        low, high = 0, None
+        size = len(head) if len(head) < 40 else None
+        offset = 4096
+        while size is None:
+            count = len(self._get_identify_chunk(offset))
+            if 0 < count < 40:
+                size = offset + count
+                break
+            if count:
+                low = offset
+            else:
+                high = offset
+            if high is None:
+                offset *= 2
+            elif high - low <= 40:
+                size = low + 40
+            else:
+                offset = (low + high) // 2
+        # The last bytes of the zlib stream contain the adler32 checksum of
+        # the dictionary, which together with the size and the first bytes
+        # identifies the firmware build
+        tail = self._get_identify_chunk(max(0, size - 40))
+        return hashlib.sha1(b"%d:%s:%s" % (size, head, tail)).hexdigest()
     def _get_identify_data(self, eventtime):
         # Query the "data dictionary" from the micro-controller
+        start_time = time.time()
+        try:
+            key = self._get_identify_key()
+        except error as e:
+            logging.exception("%sWait for identify_response",
+                              self.warn_prefix)
+            return None
+        cache_file = os.path.join(location.identify_cache(), key + ".json")
+        try:
+            with open(cache_file, 'rb') as f:
+                identify_data = f.read()
+        except OSError:
+            pass
+        else:
+            logging.info("%sLoaded data dictionary from cache in %.3fs",
+                         self.warn_prefix, time.time() - start_time)
+            return identify_data
         identify_data = b""
         while 1:
-            msg = "identify offset=%d count=%d" % (len(identify_data), 40)
             try:
-                params = self.send_with_response(msg, 'identify_response')
+                msgdata = self._get_identify_chunk(len(identify_data))
             except error as e:
                 logging.exception("%sWait for identify_response",
                                   self.warn_prefix)
                 return None
-            if params['offset'] == len(identify_data):
-                msgdata = params['data']
-                if not msgdata:
-                    # Done
-                    return identify_data
-                identify_data += msgdata
+            if not msgdata:
+                # Done
+                break
+            identify_data += msgdata
+        logging.info("%sDownloaded data dictionary (%d bytes) in %.3fs",
+                     self.warn_prefix, len(identify_data),
+                     time.time() - start_time)
+        try:
+            identify_data = zlib.decompress(identify_data)
+        except zlib.error:
+            logging.exception("%sInvalid data dictionary", self.warn_prefix)
+            return None
+        try:
+            with open(cache_file + ".tmp", 'wb') as f:
+                f.write(identify_data)
+            os.rename(cache_file + ".tmp", cache_file)
+        except OSError:
+            logging.exception("%sUnable to cache data dictionary",
+                              self.warn_prefix)
+        return identify_data
     def _start_session(self, serial_dev, serial_fd_type=b'u', client_id=0):
         self.serial_dev = serial_dev
         self.serialqueue = self.ffi_main.gc(
@@ -92,7 +181,7 @@ class SerialReader:
             self.disconnect()
             return False
         msgparser = msgproto.MessageParser(warn_prefix=self.warn_prefix)
-        msgparser.process_identify(identify_data)
+        msgparser.process_identify(identify_data, decompress=False)
         self.msgparser = msgparser
         self.register_response(self.handle_unknown, '#unknown')
         # Setup baud adjust
@@ -237,6 +326,15 @@ class SerialReader:
                 del self.handlers[name, oid]
             else:
                 self.handlers[name, oid] = callback
+    def register_bulk_response(self, callback, name, oid=None):
+        # Bulk handlers are invoked with a tuple of the message
+        # parameters (in message format order) instead of a params dict
+        with self.lock:
+            if callback is None:
+                del self.bulk_handlers[name, oid]
+            else:
+                self.bulk_handlers[name, oid] = callback
+            self.bulk_names = set([n for n, o in self.bulk_handlers])
     # Command sending
     def raw_send(self, cmd, minclock, reqclock, cmd_queue):
         self.ffi_lib.serialqueue_send(self.serialqueue, cmd_queue,
@@ -211,7 +211,7 @@ class MCU_stepper:
         return old_tq
     def add_active_callback(self, cb):
         self._active_callbacks.append(cb)
-    def generate_steps(self, flush_time):
+    def generate_steps(self, flush_time, batch=None):
         # Check for activity if necessary
         if self._active_callbacks:
             sk = self._stepper_kinematics
@@ -223,6 +223,10 @@ class MCU_stepper:
                     cb(ret)
         # Generate steps
         sk = self._stepper_kinematics
+        if batch is not None:
+            # Steps are generated by the caller for the whole batch
+            batch.append(sk)
+            return
         ret = self._itersolve_generate_steps(sk, flush_time)
         if ret:
             raise error("Internal error in stepcompress")
@@ -409,9 +413,9 @@ class PrinterRail:
     def setup_itersolve(self, alloc_func, *params):
         for stepper in self.steppers:
             stepper.setup_itersolve(alloc_func, *params)
-    def generate_steps(self, flush_time):
+    def generate_steps(self, flush_time, batch=None):
         for stepper in self.steppers:
-            stepper.generate_steps(flush_time)
+            stepper.generate_steps(flush_time, batch)
     def set_trapq(self, trapq):
         for stepper in self.steppers:
             stepper.set_trapq(trapq)
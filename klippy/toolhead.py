@@ -12,13 +12,20 @@ import mcu, chelper, kinematics.extruder
 
 # Class to track each move request
 class Move:
+    # A Move is created for every queued move - avoid a per-instance dict
+    __slots__ = ('toolhead', 'start_pos', 'end_pos', 'accel',
+                 'junction_deviation', 'timing_callbacks', 'is_kinematic_move',
+                 'axes_d', 'move_d', 'axes_r', 'min_move_t', 'max_start_v2',
+                 'max_cruise_v2', 'delta_v2', 'max_smoothed_v2',
+                 'smooth_delta_v2', 'start_v', 'cruise_v', 'end_v',
+                 'accel_t', 'cruise_t', 'decel_t')
     def __init__(self, toolhead, start_pos, end_pos, speed):
         self.toolhead = toolhead
         self.start_pos = tuple(start_pos)
         self.end_pos = tuple(end_pos)
         self.accel = toolhead.max_accel
         self.junction_deviation = toolhead.junction_deviation
-        self.timing_callbacks = []
+        self.timing_callbacks = ()
         velocity = min(speed, toolhead.max_velocity)
         self.is_kinematic_move = True
         self.axes_d = axes_d = [end_pos[i] - start_pos[i] for i in (0, 1, 2, 3)]
@@ -115,6 +122,7 @@ class MoveQueue:
         self.toolhead = toolhead
         self.queue = []
         self.junction_flush = LOOKAHEAD_FLUSH_TIME
+        self.move_count = self.peak_size = 0
     def reset(self):
         del self.queue[:]
         self.junction_flush = LOOKAHEAD_FLUSH_TIME
@@ -176,9 +184,15 @@ class MoveQueue:
         self.toolhead._process_moves(queue[:flush_count])
         # Remove processed moves from the queue
         del queue[:flush_count]
+    def get_stats(self):
+        return self.move_count, self.peak_size
     def add_move(self, move):
         self.queue.append(move)
-        if len(self.queue) == 1:
+        self.move_count += 1
+        qlen = len(self.queue)
+        if qlen > self.peak_size:
+            self.peak_size = qlen
+        if qlen == 1:
             return
         move.calc_junction(self.queue[-2])
         self.junction_flush -= move.min_move_t
@@ -249,6 +263,18 @@ class ToolHead:
         self.trapq_append = ffi_lib.trapq_append
         self.trapq_finalize_moves = ffi_lib.trapq_finalize_moves
         self.step_generators = []
+        # Optional worker threads generating the steps of all steppers
+        # of a flush window concurrently
+        self.stepgen_pool = None
+        stepgen_threads = config.getint('step_generation_threads', 0,
+                                        minval=0)
+        if stepgen_threads:
+            pool = ffi_lib.stepgen_pool_alloc(stepgen_threads)
+            if pool == ffi_main.NULL:
+                raise config.error("Unable to start step generation threads")
+            self.stepgen_pool = ffi_main.gc(pool, ffi_lib.stepgen_pool_free)
+            self.stepgen_pool_generate_steps = (
+                ffi_lib.stepgen_pool_generate_steps)
         # Create kinematics class
         gcode = self.printer.lookup_object('gcode')
         self.Coord = gcode.Coord
@@ -285,8 +311,11 @@ class ToolHead:
         while 1:
             self.print_time = min(self.print_time + batch_time, next_print_time)
             sg_flush_time = max(fft, self.print_time - kin_flush_delay)
-            for sg in self.step_generators:
-                sg(sg_flush_time)
+            if self.stepgen_pool is None:
+                for sg in self.step_generators:
+                    sg(sg_flush_time)
+            else:
+                self._generate_steps_parallel(sg_flush_time)
             free_time = max(fft, sg_flush_time - kin_flush_delay)
             self.trapq_finalize_moves(self.trapq, free_time)
             self.extruder.update_move_time(free_time)
@@ -295,6 +324,14 @@ class ToolHead:
                 m.flush_moves(mcu_flush_time)
             if self.print_time >= next_print_time:
                 break
+    def _generate_steps_parallel(self, flush_time):
+        batch = []
+        for sg in self.step_generators:
+            sg(flush_time, batch)
+        ret = self.stepgen_pool_generate_steps(
+            self.stepgen_pool, batch, len(batch), flush_time)
+        if ret:
+            raise mcu.error("Internal error in stepcompress")
     def _calc_print_time(self):
         curtime = self.reactor.monotonic()
         est_print_time = self.mcu.estimated_print_time(curtime)
@@ -430,6 +467,30 @@ class ToolHead:
         self.move_queue.add_move(move)
         if self.print_time > self.need_check_stall:
             self._check_stall()
+    def move_batch(self, positions, speed):
+        # Queue a series of moves (eg, the segments of an arc) and only
+        # check for a stall once all of them are in the lookahead queue
+        kin_check_move = self.kin.check_move
+        extruder_check_move = self.extruder.check_move
+        add_move = self.move_queue.add_move
+        distance_tracker = self.distance_tracker
+        start_pos = self.commanded_pos
+        for newpos in positions:
+            move = Move(self, start_pos, newpos, speed)
+            axes_d = move.axes_d
+            for i in (0, 1, 2, 3):
+                distance_tracker[i] += abs(axes_d[i])
+            if not move.move_d:
+                continue
+            if move.is_kinematic_move:
+                kin_check_move(move)
+            if axes_d[3]:
+                extruder_check_move(move)
+            start_pos = move.end_pos
+            self.commanded_pos[:] = start_pos
+            add_move(move)
+        if self.print_time > self.need_check_stall:
+            self._check_stall()
     def manual_move(self, coord, speed):
         curpos = list(self.commanded_pos)
         for i in range(len(coord)):
@@ -529,6 +590,8 @@ class ToolHead:
         return self.kin
     def get_trapq(self):
         return self.trapq
+    def get_move_queue_stats(self):
+        return self.move_queue.get_stats()
     def register_step_generator(self, handler):
         self.step_generators.append(handler)
     def note_step_generation_scan_time(self, delay, old_delay=0.):
@@ -545,7 +608,7 @@ class ToolHead:
         if last_move is None:
             callback(self.get_last_move_time())
             return
-        last_move.timing_callbacks.append(callback)
+        last_move.timing_callbacks += (callback,)
     def note_kinematic_activity(self, kin_time):
         self.last_kin_move_time = max(self.last_kin_move_time, kin_time)
     def get_max_velocity(self):
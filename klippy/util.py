@@ -125,6 +125,18 @@ def get_cpu_info():
     model_name = dict(lines).get("model name", "?")
     return "%d core %s" % (core_count, model_name)
 
+def get_rss():
+    # Resident memory of this process in bytes
+    try:
+        f = open('/proc/self/statm', 'r')
+        data = f.read()
+        f.close()
+        return int(data.split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError) as e:
+        logging.debug("Exception on read /proc/self/statm: %s",
+                      traceback.format_exc())
+        return None
+
 def get_version_from_file(klippy_src):
     try:
         with open(os.path.join(klippy_src, '.version')) as h:
@@ -273,6 +273,15 @@ class ClientConnection:
         if not self.is_blocking:
             self._do_send()
 
+    def send_raw(self, data):
+        # Send pre-encoded data (eg, binary frames) to the client
+        self.send_buffer += data
+        if not self.is_blocking:
+            self._do_send()
+
+    def get_send_backlog(self):
+        return len(self.send_buffer)
+
     def _do_send(self, eventtime=None):
         if self.fd_handle is None:
             return
@@ -302,6 +311,8 @@ class WebHooks:
         self._mux_endpoints = {}
         self.register_endpoint("info", self._handle_info_request)
         self.register_endpoint("emergency_stop", self._handle_estop_request)
+        self.register_endpoint("startup_profile",
+                               self._handle_startup_profile)
         self.register_endpoint("register_remote_method",
                                self._handle_rpc_registration)
         self.sconn = ServerSocket(self, printer)
@@ -356,6 +367,9 @@ class WebHooks:
             response[sa] = start_args.get(sa)
         web_request.send(response)
 
+    def _handle_startup_profile(self, web_request):
+        web_request.send(self.printer.get_startup_profile())
+
     def _handle_estop_request(self, web_request):
         self.printer.invoke_shutdown("Shutdown due to webhooks request")
 
@@ -445,6 +459,9 @@ class GCodeHelper:
 
 SUBSCRIPTION_REFRESH_TIME = .25
 
+# Printer objects may implement get_status_version() returning a value
+# that changes whenever their get_status() result changes.  Objects with
+# an unchanged version are not queried again.
 class QueryStatusHelper:
     def __init__(self, printer):
         self.printer = printer
@@ -452,6 +469,7 @@ class QueryStatusHelper:
         self.pending_queries = []
         self.query_timer = None
         self.last_query = {}
+        self.last_versions = {}
         # Register webhooks
         webhooks = printer.lookup_object('webhooks')
         webhooks.register_endpoint("objects/list", self._handle_list)
@@ -461,12 +479,27 @@ class QueryStatusHelper:
         objects = [n for n, o in self.printer.lookup_objects()
                    if hasattr(o, 'get_status')]
         web_request.send({'objects': objects})
+    def _query_object(self, obj_name, eventtime, versions):
+        po = self.printer.lookup_object(obj_name, None)
+        if po is None or not hasattr(po, 'get_status'):
+            return {}
+        get_status_version = getattr(po, 'get_status_version', None)
+        if get_status_version is not None:
+            version = versions[obj_name] = get_status_version()
+            if (version == self.last_versions.get(obj_name)
+                and obj_name in self.last_query):
+                return self.last_query[obj_name]
+        return po.get_status(eventtime)
     def _do_query(self, eventtime):
         last_query = self.last_query
-        query = self.last_query = {}
+        query = {}
+        versions = {}
         msglist = self.pending_queries
         self.pending_queries = []
         msglist.extend(self.clients.values())
+        # Changes are shared between clients subscribed to the same items
+        deltas = {}
+        encoded = {}
         # Generate get_status() info for each client
         for cconn, subscription, send_func, template in msglist:
             is_query = cconn is None
@@ -478,28 +511,46 @@ class QueryStatusHelper:
             for obj_name, req_items in subscription.items():
                 res = query.get(obj_name, None)
                 if res is None:
-                    po = self.printer.lookup_object(obj_name, None)
-                    if po is None or not hasattr(po, 'get_status'):
-                        res = query[obj_name] = {}
-                    else:
-                        res = query[obj_name] = po.get_status(eventtime)
+                    res = query[obj_name] = self._query_object(
+                        obj_name, eventtime, versions)
                 if req_items is None:
                     req_items = list(res.keys())
                     if req_items:
                         subscription[obj_name] = req_items
-                lres = last_query.get(obj_name, {})
-                cres = {}
-                for ri in req_items:
-                    rd = res.get(ri, None)
-                    if is_query or rd != lres.get(ri):
-                        cres[ri] = rd
-                if cres or is_query:
+                if is_query:
+                    cquery[obj_name] = {ri: res.get(ri, None)
+                                        for ri in req_items}
+                    continue
+                dkey = (obj_name, tuple(req_items))
+                cres = deltas.get(dkey)
+                if cres is None:
+                    lres = last_query.get(obj_name, {})
+                    cres = {}
+                    if res is not lres:
+                        for ri in req_items:
+                            rd = res.get(ri, None)
+                            if rd != lres.get(ri):
+                                cres[ri] = rd
+                    deltas[dkey] = cres
+                if cres:
                     cquery[obj_name] = cres
             # Send data
-            if cquery or is_query:
+            if is_query:
                 tmp = dict(template)
                 tmp['params'] = {'eventtime': eventtime, 'status': cquery}
                 send_func(tmp)
+            elif cquery:
+                # Identical changes are only json encoded once
+                ekey = tuple([(obj_name, id(cres))
+                              for obj_name, cres in cquery.items()])
+                params = encoded.get(ekey)
+                if params is None:
+                    params = encoded[ekey] = json.dumps(
+                        {'eventtime': eventtime, 'status': cquery},
+                        separators=(',', ':'))
+                self._send_encoded(cconn, send_func, template, params)
+        self.last_query = query
+        self.last_versions = versions
         if not query:
             # Unregister timer if there are no longer any subscriptions
             reactor = self.printer.get_reactor()
@@ -507,6 +558,17 @@ class QueryStatusHelper:
             self.query_timer = None
             return reactor.NEVER
         return eventtime + SUBSCRIPTION_REFRESH_TIME
+    def _send_encoded(self, cconn, send_func, template, params):
+        if 'params' in template:
+            tmp = dict(template)
+            tmp['params'] = json.loads(params)
+            send_func(tmp)
+            return
+        tmpl = json.dumps(template, separators=(',', ':'))[1:-1]
+        if tmpl:
+            tmpl += ','
+        cconn.send_raw(('{%s"params":%s}' % (tmpl, params)).encode()
+                       + b"\x03")
     def _handle_query(self, web_request, is_subscribe=False):
         objects = web_request.get_dict('objects')
         # Validate subscription format
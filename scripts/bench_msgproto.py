@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Benchmark decoding throughput of captured mcu messages
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import optparse, os, sys, time
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '..', 'klippy'))
+import msgproto
+
+def read_messages(mp, filename):
+    # Split a raw serial capture into individual message blocks
+    f = open(filename, 'rb')
+    data = bytearray(f.read())
+    f.close()
+    msgs = []
+    while data:
+        l = mp.check_packet(data)
+        if l == 0:
+            break
+        if l < 0:
+            # Resync on next message sync byte
+            pos = data.find(bytearray([msgproto.MESSAGE_SYNC]))
+            data = data[pos+1:] if pos >= 0 else bytearray()
+            continue
+        msgs.append(list(data[:l]))
+        data = data[l:]
+    return msgs
+
+def run_generic(mp, msgs):
+    hs = msgproto.MESSAGE_HEADER_SIZE
+    for msg in msgs:
+        mid = mp.lookup_msgid(msg)
+        if isinstance(mid, msgproto.MessageFormat):
+            mid.generic_parse(msg, hs)
+        else:
+            mid.parse(msg, hs)
+
+def run_compiled(mp, msgs):
+    for msg in msgs:
+        mp.parse(msg)
+
+def run_bulk(mp, msgs):
+    for msg in msgs:
+        mid = mp.lookup_msgid(msg)
+        if isinstance(mid, msgproto.MessageFormat):
+            mp.parse_values(mid, msg)
+        else:
+            mid.parse(msg, msgproto.MESSAGE_HEADER_SIZE)
+
+def main():
+    usage = "%prog [options] <data dictionary> <serial capture>"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-r", "--repeat", type="int", dest="repeat", default=5,
+                    help="number of passes over the capture")
+    options, args = opts.parse_args()
+    if len(args) != 2:
+        opts.error("Incorrect number of arguments")
+    f = open(args[0], 'rb')
+    dictionary = f.read()
+    f.close()
+    mp = msgproto.MessageParser()
+    mp.process_identify(dictionary, decompress=False)
+    msgs = read_messages(mp, args[1])
+    if not msgs:
+        opts.error("No messages found in capture")
+    count = len(msgs) * options.repeat
+    print("Decoding %d messages (%d passes)" % (count, options.repeat))
+    for name, func in [("generic", run_generic), ("compiled", run_compiled),
+                       ("bulk", run_bulk)]:
+        start_time = time.process_time()
+        for i in range(options.repeat):
+            func(mp, msgs)
+        duration = time.process_time() - start_time
+        print("%-10s %8.3fs %12.0f msgs/sec" % (
+            name, duration, count / max(duration, 0.000001)))
+
+if __name__ == '__main__':
+    main()
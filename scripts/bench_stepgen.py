@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# Benchmark serial and parallel step generation
+#
+# The default profile resembles a 4-core ARM host (eg, Raspberry Pi 4)
+# driving input shaped steppers at high microstepping: three worker
+# threads are used, the calling thread works on each flush as well.
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import optparse, os, sys, time
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '..', 'klippy'))
+import chelper
+from extras import shaper_defs
+
+MCU_FREQ = 72000000.
+MOVE_BATCH_TIME = 0.500
+
+def fill_trapq(ffi_lib, trapq, duration, velocity, accel):
+    # Zig-zag infill like moves, alternating in x and y
+    print_time = 0.1
+    length = 40.
+    accel_t = velocity / accel
+    accel_d = .5 * accel * accel_t**2
+    cruise_t = (length - 2. * accel_d) / velocity
+    move_t = 2. * accel_t + cruise_t
+    x = y = 0.
+    count = 0
+    while print_time < duration:
+        dx, dy = (1., 0.) if count % 2 else (.6, .8)
+        direction = -1. if count % 4 >= 2 else 1.
+        ffi_lib.trapq_append(trapq, print_time, accel_t, cruise_t, accel_t,
+                             x, y, 0., dx * direction, dy * direction, 0.,
+                             0., velocity, accel)
+        x += dx * direction * length
+        y += dy * direction * length
+        print_time += move_t
+        count += 1
+    return print_time
+
+def setup_steppers(ffi_main, ffi_lib, trapq, count, step_dist, shaper_freq):
+    A, T = shaper_defs.get_mzv_shaper(shaper_freq,
+                                      shaper_defs.DEFAULT_DAMPING_RATIO)
+    sks = []
+    scs = []
+    for i in range(count):
+        axis = b'xy'[i % 2:i % 2 + 1]
+        orig_sk = ffi_main.gc(ffi_lib.cartesian_stepper_alloc(axis),
+                              ffi_lib.free)
+        sk = ffi_main.gc(ffi_lib.input_shaper_alloc(), ffi_lib.free)
+        ffi_lib.input_shaper_set_sk(sk, orig_sk)
+        ffi_lib.input_shaper_set_shaper_params(sk, axis, len(A), A, T)
+        sc = ffi_main.gc(ffi_lib.stepcompress_alloc(i),
+                         ffi_lib.stepcompress_free)
+        ffi_lib.stepcompress_fill(sc, int(.000025 * MCU_FREQ), 1, 2)
+        ffi_lib.itersolve_set_stepcompress(sk, sc, step_dist)
+        ffi_lib.itersolve_set_trapq(sk, trapq)
+        sks.append((sk, orig_sk))
+        scs.append(sc)
+    ss = ffi_main.gc(ffi_lib.steppersync_alloc(ffi_main.NULL, scs, len(scs), 16),
+                     ffi_lib.steppersync_free)
+    ffi_lib.steppersync_set_time(ss, 0., MCU_FREQ)
+    return [sk for sk, orig_sk in sks], (sks, scs, ss)
+
+def run_serial(ffi_lib, pool, sks, flush_time):
+    for sk in sks:
+        if ffi_lib.itersolve_generate_steps(sk, flush_time):
+            raise Exception("Internal error in stepcompress")
+
+def run_parallel(ffi_lib, pool, sks, flush_time):
+    if ffi_lib.stepgen_pool_generate_steps(pool, sks, len(sks), flush_time):
+        raise Exception("Internal error in stepcompress")
+
+def main():
+    usage = "%prog [options]"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-j", "--threads", type="int", dest="threads", default=3,
+                    help="number of worker threads (default 3)")
+    opts.add_option("-s", "--steppers", type="int", dest="steppers",
+                    default=4, help="number of shaped steppers")
+    opts.add_option("-d", "--duration", type="float", dest="duration",
+                    default=30., help="seconds of simulated motion")
+    opts.add_option("-v", "--velocity", type="float", dest="velocity",
+                    default=300., help="move velocity in mm/s")
+    opts.add_option("--step-distance", type="float", dest="step_dist",
+                    default=40. / (200 * 256), help="step distance in mm")
+    options, args = opts.parse_args()
+    if args:
+        opts.error("Incorrect number of arguments")
+    ffi_main, ffi_lib = chelper.get_ffi()
+    pool = ffi_main.gc(ffi_lib.stepgen_pool_alloc(options.threads),
+                       ffi_lib.stepgen_pool_free)
+    print("%d steppers, %.0fs of motion at %.0fmm/s, %d worker threads" % (
+        options.steppers, options.duration, options.velocity,
+        options.threads))
+    results = {}
+    for name, func in [("serial", run_serial), ("parallel", run_parallel)]:
+        trapq = ffi_main.gc(ffi_lib.trapq_alloc(), ffi_lib.trapq_free)
+        end_time = fill_trapq(ffi_lib, trapq, options.duration,
+                              options.velocity, 5000.)
+        sks, keep = setup_steppers(ffi_main, ffi_lib, trapq, options.steppers,
+                                   options.step_dist, 60.)
+        flush_time = 0.
+        start_time = time.perf_counter()
+        while flush_time < end_time + 1.:
+            flush_time += MOVE_BATCH_TIME
+            func(ffi_lib, pool, sks, flush_time)
+            ffi_lib.trapq_finalize_moves(trapq, flush_time - 0.05)
+        duration = time.perf_counter() - start_time
+        results[name] = duration
+        print("%-10s %8.3fs %8.1fx realtime" % (
+            name, duration, end_time / max(duration, 0.000001)))
+    print("speedup    %8.2fx" % (results["serial"]
+                                / max(results["parallel"], 0.000001),))
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,13 @@ shaper_calibrate = importlib.import_module('.shaper_calibrate', 'extras')
 MAX_TITLE_LENGTH=65
 
 def parse_log(logname):
+    if logname.endswith('.npy'):
+        # Raw accelerometer data in numpy binary format
+        return np.load(logname)
+    if logname.endswith('.npz'):
+        d = np.load(logname)
+        return np.column_stack((d['time'], d['accel_x'], d['accel_y'],
+                                d['accel_z']))
     with open(logname) as f:
         for header in f:
             if not header.startswith('#'):
@@ -6,6 +6,7 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import optparse, datetime
 import matplotlib
+import logstream
 
 MAXBANDWIDTH=25000.
 MAXBUFFER=2.
@@ -18,37 +19,98 @@ APPLY_PREFIX = [
     'target', 'temp', 'pwm'
 ]
 
-def parse_log(logname, mcu):
-    if mcu is None:
-        mcu = "mcu"
-    mcu_prefix = mcu + ":"
-    apply_prefix = { p: 1 for p in APPLY_PREFIX }
-    f = open(logname, 'r')
-    out = []
-    for line in f:
+# Stats samples are aggregated into time buckets.  A bucket holds the
+# last value of each field, except for the fields below where the
+# lowest or highest value during the bucket is more useful.
+BUCKET_MIN = ['buffer_time', 'memavail']
+BUCKET_MAX = ['mcu_awake', 'mcu_task_avg', 'mcu_task_stddev', 'sysload']
+MAX_BUCKETS = 4000
+
+class StatsBuckets:
+    def __init__(self, mcu, bucket_time):
+        if mcu is None:
+            mcu = "mcu"
+        self.mcu_prefix = mcu + ":"
+        self.apply_prefix = { p: 1 for p in APPLY_PREFIX }
+        self.bucket_time = bucket_time
+        self.buckets = []
+        self.merge_funcs = {}
+    def _get_merge_func(self, name):
+        if name in self.merge_funcs:
+            return self.merge_funcs[name]
+        field = name.split(':')[-1]
+        func = None
+        if field in BUCKET_MIN:
+            func = min
+        elif field in BUCKET_MAX:
+            func = max
+        self.merge_funcs[name] = func
+        return func
+    def _merge(self, bucket, sample):
+        for name, val in sample.items():
+            old = bucket.get(name)
+            func = self._get_merge_func(name)
+            if old is None or func is None:
+                bucket[name] = val
+            else:
+                bucket[name] = func(old, val)
+    def _rebucket(self):
+        # Too many buckets - double the time covered by each bucket
+        buckets = self.buckets
+        span = buckets[-1]['#sampletime'] - buckets[0]['#bucketstart']
+        self.bucket_time = max(2. * self.bucket_time,
+                               2. * span / MAX_BUCKETS)
+        self.buckets = out = [buckets[0]]
+        for b in buckets[1:]:
+            last = out[-1]
+            start = last['#bucketstart']
+            if start <= b['#bucketstart'] < start + self.bucket_time:
+                self._merge(last, b)
+                last['#bucketstart'] = start
+            else:
+                out.append(b)
+    def add_line(self, line_num, line):
         parts = line.split()
-        if not parts or parts[0] not in ('Stats', 'INFO:root:Stats'):
-            #if parts and parts[0] == 'INFO:root:shutdown:':
-            #    break
-            continue
         prefix = ""
         keyparts = {}
         for p in parts[2:]:
             if '=' not in p:
                 prefix = p
-                if prefix == mcu_prefix:
+                if prefix == self.mcu_prefix:
                     prefix = ''
                 continue
             name, val = p.split('=', 1)
-            if name in apply_prefix:
+            if name in self.apply_prefix:
                 name = prefix + name
-            keyparts[name] = val
+            try:
+                keyparts[name] = float(val)
+            except ValueError:
+                pass
         if 'print_time' not in keyparts:
-            continue
-        keyparts['#sampletime'] = float(parts[1][:-1])
-        out.append(keyparts)
-    f.close()
-    return out
+            return
+        sampletime = float(parts[1][:-1])
+        keyparts['#sampletime'] = sampletime
+        buckets = self.buckets
+        if buckets:
+            last = buckets[-1]
+            start = last['#bucketstart']
+            if start <= sampletime < start + self.bucket_time:
+                self._merge(last, keyparts)
+                return
+        keyparts['#bucketstart'] = sampletime
+        buckets.append(keyparts)
+        if len(buckets) > MAX_BUCKETS:
+            self._rebucket()
+    def get_data(self):
+        return self.buckets
+
+def parse_log(lognames, mcu, bucket_time=0.):
+    stream = logstream.LogStream(lognames)
+    stats = StatsBuckets(mcu, bucket_time)
+    stream.register_word_handler('Stats', stats.add_line)
+    stream.register_word_handler('INFO:root:Stats', stats.add_line)
+    stream.run()
+    return stats.get_data()
 
 def setup_matplotlib(output_to_file):
     global matplotlib
@@ -192,7 +254,7 @@ def plot_mcu_frequencies(data):
         st = datetime.datetime.utcfromtimestamp(d['#sampletime'])
         for key, (times, values) in graph_keys.items():
             val = d.get(key)
-            if val not in (None, '0', '1'):
+            if val not in (None, 0., 1.):
                 times.append(st)
                 values.append(float(val))
     est_mhz = { key: round((sum(values)/len(values)) / 1000000.)
@@ -227,7 +289,7 @@ def plot_mcu_frequency(data, mcu):
         st = datetime.datetime.utcfromtimestamp(d['#sampletime'])
         for key, (times, values) in graph_keys.items():
             val = d.get(key)
-            if val not in (None, '0', '1'):
+            if val not in (None, 0., 1.):
                 times.append(st)
                 values.append(float(val))
 
@@ -290,7 +352,7 @@ def plot_temperature(data, heaters):
 
 def main():
     # Parse command-line arguments
-    usage = "%prog [options] <logfile>"
+    usage = "%prog [options] <logfile> [<rotated logfile> ...]"
     opts = optparse.OptionParser(usage)
     opts.add_option("-f", "--frequency", action="store_true",
                     help="graph mcu frequency")
@@ -302,13 +364,14 @@ def main():
                     default=None, help="graph heater temperature")
     opts.add_option("-m", "--mcu", type="string", dest="mcu", default=None,
                     help="limit stats to the given mcu")
+    opts.add_option("-b", "--bucket", type="float", dest="bucket",
+                    default=0., help="minimum time (in seconds) per point")
     options, args = opts.parse_args()
-    if len(args) != 1:
+    if len(args) < 1:
         opts.error("Incorrect number of arguments")
-    logname = args[0]
 
     # Parse data
-    data = parse_log(logname, options.mcu)
+    data = parse_log(args, options.mcu, options.bucket)
     if not data:
         return
 
@@ -5,6 +5,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import sys, re, collections, ast
+import logstream
 
 def format_comment(line_num, line):
     return "# %6d: %s" % (line_num, line)
@@ -570,41 +571,56 @@ class GatherShutdown:
 # Startup
 ######################################################################
 
-def main():
-    logname = sys.argv[1]
-    last_git = last_start = None
-    configs = {}
-    handler = None
-    recent_lines = collections.deque([], 200)
-    # Parse log file
-    f = open(logname, 'rb')
-    for line_num, line in enumerate(f):
-        line = line.rstrip()
-        line_num += 1
+# Dispatch log lines to the config and shutdown handlers
+class LogExtract:
+    def __init__(self, logname):
+        self.logname = logname
+        self.last_git = self.last_start = None
+        self.configs = {}
+        self.handler = None
+        self.recent_lines = collections.deque([], 200)
+    def add_line(self, line_num, line):
+        recent_lines = self.recent_lines
         recent_lines.append((line_num, line))
-        if handler is not None:
-            ret = handler.add_line(line_num, line)
+        if self.handler is not None:
+            ret = self.handler.add_line(line_num, line)
             if ret:
-                continue
+                return
             recent_lines.clear()
-            handler = None
+            self.handler = None
         if line.startswith('Git version'):
-            last_git = format_comment(line_num, line)
+            self.last_git = format_comment(line_num, line)
         elif line.startswith('Start printer at'):
-            last_start = format_comment(line_num, line)
+            self.last_start = format_comment(line_num, line)
         elif line == '===== Config file =====':
-            handler = GatherConfig(configs, line_num, recent_lines, logname)
-            handler.add_comment(last_git)
-            handler.add_comment(last_start)
+            self.handler = GatherConfig(self.configs, line_num, recent_lines,
+                                        self.logname)
+            self.handler.add_comment(self.last_git)
+            self.handler.add_comment(self.last_start)
         elif 'shutdown: ' in line or line.startswith('Dumping '):
-            handler = GatherShutdown(configs, line_num, recent_lines, logname)
-            handler.add_comment(last_git)
-            handler.add_comment(last_start)
-    if handler is not None:
-        handler.finalize()
-    # Write found config files
-    for cfg in configs.values():
-        cfg.write_file()
+            self.handler = GatherShutdown(self.configs, line_num, recent_lines,
+                                          self.logname)
+            self.handler.add_comment(self.last_git)
+            self.handler.add_comment(self.last_start)
+    def finalize(self):
+        if self.handler is not None:
+            self.handler.finalize()
+        # Write found config files
+        for cfg in self.configs.values():
+            cfg.write_file()
+
+def main():
+    # Rotated logs (eg, klippy.log.2021-01-31.gz) may be given as well,
+    # they are read in order along with the current log.  Line numbers
+    # count through all of them.
+    stream = logstream.LogStream(sys.argv[1:])
+    logname = stream.get_filenames()[-1]
+    if logname.endswith('.gz'):
+        logname = logname[:-3]
+    extract = LogExtract(logname)
+    stream.register_line_handler(extract.add_line)
+    stream.run()
+    extract.finalize()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,59 @@
+# Helpers to read klippy.log files (and their rotations) in one pass
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import gzip, re
+
+# Rotated logs are named like "klippy.log.2021-01-31.gz"
+rotation_r = re.compile(r"[.](?P<suffix>[0-9]{4}-[0-9]{2}-[0-9]{2}[0-9_-]*)"
+                        + r"(?:[.]gz)?$")
+
+def open_log(filename):
+    if filename.endswith('.gz'):
+        return gzip.open(filename, 'rb')
+    return open(filename, 'rb')
+
+# Order log files oldest first (rotations by date, then the current log)
+def sort_logs(filenames):
+    def sort_key(filename):
+        m = rotation_r.search(filename)
+        if m is None:
+            return (1, '')
+        return (0, m.group('suffix'))
+    return sorted(filenames, key=sort_key)
+
+# Read log lines and pass them to the handlers interested in them.  Line
+# handlers get every line, word handlers only the lines starting with
+# their word - those lines are found without decoding or splitting all
+# other lines.
+class LogStream:
+    def __init__(self, filenames):
+        self.filenames = sort_logs(filenames)
+        self.line_handlers = []
+        self.word_handlers = {}
+    def get_filenames(self):
+        return self.filenames
+    def register_line_handler(self, cb):
+        self.line_handlers.append(cb)
+    def register_word_handler(self, word, cb):
+        self.word_handlers.setdefault(word.encode(), []).append(cb)
+    def run(self):
+        line_handlers = self.line_handlers
+        word_handlers = self.word_handlers
+        decode = str is not bytes
+        line_num = 0
+        for filename in self.filenames:
+            f = open_log(filename)
+            for raw_line in f:
+                line_num += 1
+                whs = word_handlers.get(raw_line.split(b' ', 1)[0])
+                if whs is None and not line_handlers:
+                    continue
+                line = raw_line.rstrip()
+                if decode:
+                    line = line.decode('utf-8', 'replace')
+                for cb in line_handlers:
+                    cb(line_num, line)
+                if whs is not None:
+                    for cb in whs:
+                        cb(line_num, line)
+            f.close()
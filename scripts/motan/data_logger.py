@@ -4,7 +4,7 @@
 # Copyright (C) 2020-2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import sys, os, optparse, socket, select, json, errno, time, zlib
+import sys, os, optparse, socket, select, json, errno, time, zlib, struct
 
 INDEX_UPDATE_TIME = 5.0
 ClientInfo = {'program': 'motan_data_logger', 'version': 'v0.1'}
@@ -52,16 +52,147 @@ class LogWriter:
         self.file = None
         self.comp = None
 
+# Log in the older gzip json format (a json.gz data file and index.gz)
+class JsonLogWriter:
+    def __init__(self, log_prefix):
+        self.logger = LogWriter(log_prefix + ".json.gz")
+        self.index = LogWriter(log_prefix + ".index.gz")
+    def add_message(self, raw_msg, qid=None):
+        self.logger.add_data(raw_msg)
+    def add_frame(self, frame):
+        pass
+    def write_index(self, db):
+        db['file_position'] = self.logger.flush()
+        self.index.add_data(json.dumps(db, separators=(',', ':')).encode())
+    def close(self):
+        self.logger.close()
+        self.index.close()
+
+# Indexed log format.  The data file (kmlog) is a series of chunks, each
+# a CHUNK_HEADER (magic, print time at chunk start, compressed size)
+# followed by the zlib compressed frames of the chunk.  Frames use the
+# layout of motion_report.py binary frames: trapq and stepper frames are
+# stored as received, other subscription messages are stored as json
+# frames named by their subscription id.  The first chunk only holds an
+# info frame (the initial status and subscriptions); every following
+# chunk starts with a key frame holding all status changes since then.
+# The index file (kmidx) has a fixed size INDEX_RECORD (print time, file
+# offset) per chunk, so readers can binary search it for a time.  The
+# print time of a chunk is the earliest time of the trapq and stepper
+# frames in it (or the last status print time if it has none).
+FRAME_SYNC = 0x00
+FRAME_HEADER = struct.Struct('<BcHI')
+FRAME_INFO, FRAME_KEY, FRAME_JSON = b'i', b'k', b'j'
+# Payload offset of the first print time of trapq (print_time of the
+# first record) and stepper frames (first_step_time of the header), and
+# the payload size of a frame with one record
+FRAME_TIMES = {b't': (0, 80), b's': (32, 96)}
+FRAME_TIME = struct.Struct('<d')
+CHUNK_MAGIC = b'KMLC'
+CHUNK_HEADER = struct.Struct('<4sdI')
+INDEX_RECORD = struct.Struct('<dQ')
+CHUNK_SIZE = 4 * 1024 * 1024
+
+def encode_frame(ftype, name, payload):
+    bname = name.encode()
+    return b"".join([FRAME_HEADER.pack(FRAME_SYNC, ftype, len(bname),
+                                       len(payload)), bname, payload])
+
+def get_frame_time(frame):
+    sync, ftype, name_len, payload_len = FRAME_HEADER.unpack_from(frame)
+    if ftype not in FRAME_TIMES:
+        return None
+    offset, min_size = FRAME_TIMES[ftype]
+    if payload_len < min_size:
+        return None
+    return FRAME_TIME.unpack_from(
+        frame, FRAME_HEADER.size + name_len + offset)[0]
+
+class IndexedLogWriter:
+    def __init__(self, log_prefix):
+        self.file = open(log_prefix + ".kmlog", "wb")
+        self.index = open(log_prefix + ".kmidx", "wb")
+        self.file_pos = 0
+        self.frames = []
+        self.raw_size = 0
+        # Earliest print time of the frames of the current chunk
+        self.chunk_time = None
+        self.last_chunk_time = 0.
+        self.key_frame = None
+        # Status changes since the info frame
+        self.status = {}
+        self.toolhead = {}
+        self.print_time = 0.
+    def add_message(self, raw_msg, qid=None):
+        if qid is not None:
+            self.add_frame(encode_frame(FRAME_JSON, qid, raw_msg))
+    def add_frame(self, frame):
+        self.frames.append(frame)
+        self.raw_size += len(frame)
+        frame_time = get_frame_time(frame)
+        if frame_time is not None and (self.chunk_time is None
+                                       or frame_time < self.chunk_time):
+            self.chunk_time = frame_time
+        if self.raw_size >= CHUNK_SIZE and self.key_frame is not None:
+            self._flush_chunk()
+    def _write_chunk(self, print_time, frames):
+        data = zlib.compress(b"".join(frames))
+        self.file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, print_time, len(data)))
+        self.file.write(data)
+        self.file.flush()
+        self.index.write(INDEX_RECORD.pack(print_time, self.file_pos))
+        self.index.flush()
+        self.file_pos += CHUNK_HEADER.size + len(data)
+    def _flush_chunk(self):
+        # Messages received before the info frame stay in the first chunk
+        if self.frames and self.key_frame is not None:
+            chunk_time = self.chunk_time
+            if chunk_time is None:
+                chunk_time = self.print_time
+            # Keep the index sorted for the binary search of the readers
+            chunk_time = max(chunk_time, self.last_chunk_time)
+            self._write_chunk(chunk_time, [self.key_frame] + self.frames)
+            self.last_chunk_time = chunk_time
+            self.frames = []
+            self.raw_size = 0
+            self.chunk_time = None
+        self.key_frame = encode_frame(FRAME_KEY, "status", json.dumps(
+            self.status, separators=(',', ':')).encode())
+    def write_index(self, db):
+        status = db['status']
+        if self.key_frame is None:
+            self.toolhead = dict(status.get('toolhead', {}))
+        else:
+            for k, v in status.items():
+                self.status.setdefault(k, {}).update(v)
+            self.toolhead.update(status.get('toolhead', {}))
+        th = self.toolhead
+        self.print_time = max(th.get('estimated_print_time', 0.),
+                              th.get('print_time', 0.))
+        if self.key_frame is None:
+            info = json.dumps(db, separators=(',', ':')).encode()
+            self._write_chunk(self.print_time,
+                              [encode_frame(FRAME_INFO, "info", info)])
+        self._flush_chunk()
+    def close(self):
+        if self.key_frame is not None:
+            self._flush_chunk()
+        self.file.close()
+        self.index.close()
+
 class DataLogger:
-    def __init__(self, uds_filename, log_prefix):
+    def __init__(self, uds_filename, log_prefix, use_json=False):
         # IO
         self.webhook_socket = webhook_socket_create(uds_filename)
         self.poll = select.poll()
         self.poll.register(self.webhook_socket, select.POLLIN | select.POLLHUP)
         self.socket_data = b""
         # Data log
-        self.logger = LogWriter(log_prefix + ".json.gz")
-        self.index = LogWriter(log_prefix + ".index.gz")
+        if use_json:
+            self.logger = JsonLogWriter(log_prefix)
+        else:
+            self.logger = IndexedLogWriter(log_prefix)
+        self.binary_dumps = not use_json
         # Handlers
         self.query_handlers = {}
         self.async_handlers = {}
@@ -76,7 +207,6 @@ class DataLogger:
     def finish(self, msg):
         self.error(msg)
         self.logger.close()
-        self.index.close()
         sys.exit(0)
     # Unix Domain Socket IO
     def send_query(self, msg_id, method, params, cb):
@@ -85,34 +215,52 @@ class DataLogger:
         cm = json.dumps(msg, separators=(',', ':')).encode()
         self.webhook_socket.send(cm + b"\x03")
     def process_socket(self):
-        data = self.webhook_socket.recv(4096)
+        data = self.webhook_socket.recv(65536)
         if not data:
             self.finish("Socket closed")
-        parts = data.split(b"\x03")
-        parts[0] = self.socket_data + parts[0]
-        self.socket_data = parts.pop()
-        for part in parts:
-            try:
-                msg = json.loads(part)
-            except:
-                self.error("ERROR: Unable to parse line")
-                continue
-            self.logger.add_data(part)
-            msg_q = msg.get("q")
-            if msg_q is not None:
-                hdl = self.async_handlers.get(msg_q)
-                if hdl is not None:
-                    hdl(msg, part)
+        buf = self.socket_data + data
+        pos = 0
+        while pos < len(buf):
+            if buf[pos] == FRAME_SYNC:
+                # Binary frame from a motion_report dump
+                if len(buf) - pos < FRAME_HEADER.size:
+                    break
+                sync, ftype, name_len, payload_len = FRAME_HEADER.unpack_from(
+                    buf, pos)
+                end = pos + FRAME_HEADER.size + name_len + payload_len
+                if end > len(buf):
+                    break
+                self.logger.add_frame(buf[pos:end])
+                pos = end
                 continue
-            msg_id = msg.get("id")
-            hdl = self.query_handlers.get(msg_id)
+            end = buf.find(b"\x03", pos)
+            if end < 0:
+                break
+            self.process_message(buf[pos:end])
+            pos = end + 1
+        self.socket_data = buf[pos:]
+    def process_message(self, part):
+        try:
+            msg = json.loads(part)
+        except:
+            self.error("ERROR: Unable to parse line")
+            return
+        msg_q = msg.get("q")
+        self.logger.add_message(part, msg_q)
+        if msg_q is not None:
+            hdl = self.async_handlers.get(msg_q)
             if hdl is not None:
-                del self.query_handlers[msg_id]
                 hdl(msg, part)
-                if not self.query_handlers:
-                    self.flush_index()
-                continue
-            self.error("ERROR: Message with unknown id")
+            return
+        msg_id = msg.get("id")
+        hdl = self.query_handlers.get(msg_id)
+        if hdl is not None:
+            del self.query_handlers[msg_id]
+            hdl(msg, part)
+            if not self.query_handlers:
+                self.flush_index()
+            return
+        self.error("ERROR: Message with unknown id")
     def run(self):
         try:
             while 1:
@@ -145,11 +293,17 @@ class DataLogger:
         # Subscribe to trapq and stepper queue updates
         motion_report = status.get("motion_report", {})
         for trapq in motion_report.get("trapq", []):
+            params = {"name": trapq}
+            if self.binary_dumps:
+                params["format"] = "binary"
             self.send_subscribe("trapq:" + trapq, "motion_report/dump_trapq",
-                                {"name": trapq})
+                                params)
         for stepper in motion_report.get("steppers", []):
+            params = {"name": stepper}
+            if self.binary_dumps:
+                params["format"] = "binary"
             self.send_subscribe("stepq:" + stepper,
-                                "motion_report/dump_stepper", {"name": stepper})
+                                "motion_report/dump_stepper", params)
         # Subscribe to additional sensor data
         config = status["configfile"]["settings"]
         for cfgname in config.keys():
@@ -169,8 +323,7 @@ class DataLogger:
             return
         self.db.setdefault("subscriptions", {})[msg_id] = msg["result"]
     def flush_index(self):
-        self.db['file_position'] = self.logger.flush()
-        self.index.add_data(json.dumps(self.db, separators=(',', ':')).encode())
+        self.logger.write_index(self.db)
         self.db = {"status": {}}
     def handle_async_db(self, msg, raw_msg):
         params = msg["params"]
@@ -192,12 +345,14 @@ def nice():
 def main():
     usage = "%prog [options] <socket filename> <log name>"
     opts = optparse.OptionParser(usage)
+    opts.add_option("--json", action="store_true",
+                    help="write the older gzip json log format")
     options, args = opts.parse_args()
     if len(args) != 2:
         opts.error("Incorrect number of arguments")
 
     nice()
-    dl = DataLogger(args[0], args[1])
+    dl = DataLogger(args[0], args[1], options.json)
     dl.run()
 
 if __name__ == '__main__':
@@ -3,7 +3,7 @@
 # Copyright (C) 2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import json, zlib
+import json, zlib, glob, struct, logging, os
 
 class error(Exception):
     pass
@@ -505,6 +505,211 @@ class JsonDispatcher:
                 mq.append(json_msg['params'])
 
 
+# Frame definitions of binary motion captures (see motion_report.py)
+FRAME_HEADER = struct.Struct('<BcHI')
+TRAPQ_RECORD = struct.Struct('<10d')
+STEPQ_HEADER = struct.Struct('<dqdQdQd')
+STEPQ_RECORD = struct.Struct('<QQqiii4x')
+
+# Read frames from the segment files of a MOTION_REPORT_CAPTURE
+class BinaryCaptureReader:
+    def __init__(self, log_prefix):
+        self.segments = sorted(glob.glob(log_prefix + ".*.kmr"))
+        if not self.segments:
+            raise error("No capture segments found for '%s'" % (log_prefix,))
+        self.seg_index = 0
+        self.file = open(self.segments[0], "rb")
+    def get_segment_count(self):
+        return len(self.segments)
+    def get_info(self, seg_index):
+        f = open(self.segments[seg_index], "rb")
+        frame = self._read_frame(f)
+        f.close()
+        if frame is None or frame[0] != b'i':
+            raise error("Invalid capture segment '%s'"
+                        % (self.segments[seg_index],))
+        return json.loads(frame[2])
+    def seek_segment(self, seg_index):
+        self.file.close()
+        self.seg_index = seg_index
+        self.file = open(self.segments[seg_index], "rb")
+    def _read_frame(self, f):
+        hdr = f.read(FRAME_HEADER.size)
+        if len(hdr) < FRAME_HEADER.size:
+            return None
+        sync, ftype, name_len, payload_len = FRAME_HEADER.unpack(hdr)
+        name = f.read(name_len).decode()
+        payload = f.read(payload_len)
+        if sync or len(payload) < payload_len:
+            return None
+        return ftype, name, payload
+    def pull_frame(self):
+        while 1:
+            frame = self._read_frame(self.file)
+            if frame is not None:
+                return frame
+            if self.seg_index + 1 >= len(self.segments):
+                return None
+            self.seek_segment(self.seg_index + 1)
+
+# Chunk and index definitions of indexed logs (see data_logger.py)
+FRAME_INFO, FRAME_KEY, FRAME_JSON = b'i', b'k', b'j'
+CHUNK_MAGIC = b'KMLC'
+CHUNK_HEADER = struct.Struct('<4sdI')
+INDEX_RECORD = struct.Struct('<dQ')
+
+# Read frames from the chunks of an indexed log built by data_logger.py
+class IndexedLogReader:
+    def __init__(self, log_prefix):
+        self.file = open(log_prefix + ".kmlog", "rb")
+        self.index = open(log_prefix + ".kmidx", "rb")
+        self.index.seek(0, os.SEEK_END)
+        self.chunk_count = self.index.tell() // INDEX_RECORD.size
+        if not self.chunk_count:
+            raise error("Empty log index for '%s'" % (log_prefix,))
+        self.data = b""
+        self.data_pos = 0
+    def _read_index(self, chunk):
+        self.index.seek(chunk * INDEX_RECORD.size)
+        return INDEX_RECORD.unpack(self.index.read(INDEX_RECORD.size))
+    def _read_chunk(self):
+        hdr = self.file.read(CHUNK_HEADER.size)
+        if len(hdr) < CHUNK_HEADER.size:
+            return False
+        magic, print_time, size = CHUNK_HEADER.unpack(hdr)
+        data = self.file.read(size)
+        if magic != CHUNK_MAGIC or len(data) < size:
+            # Truncated at the end of the log
+            return False
+        self.data = zlib.decompress(data)
+        self.data_pos = 0
+        return True
+    def _next_frame(self):
+        data = self.data
+        pos = self.data_pos
+        if pos >= len(data):
+            if not self._read_chunk():
+                return None
+            data = self.data
+            pos = 0
+        sync, ftype, name_len, payload_len = FRAME_HEADER.unpack_from(data, pos)
+        pos += FRAME_HEADER.size
+        name = data[pos:pos+name_len].decode()
+        pos += name_len
+        self.data_pos = pos + payload_len
+        return ftype, name, data[pos:pos+payload_len]
+    def get_info(self):
+        self.file.seek(0)
+        self._read_chunk()
+        frame = self._next_frame()
+        if frame is None or frame[0] != FRAME_INFO:
+            raise error("Invalid log info chunk")
+        return json.loads(frame[2])
+    def find_chunk(self, req_time):
+        # Binary search for the last data chunk starting before req_time
+        low, high = 1, self.chunk_count
+        while low < high:
+            mid = (low + high) // 2
+            if self._read_index(mid)[0] > req_time:
+                high = mid
+            else:
+                low = mid + 1
+        chunk = max(1, low - 1)
+        # Chunks with the same start time may all hold data after it
+        chunk_time = self._read_index(chunk)[0]
+        while chunk > 1 and self._read_index(chunk - 1)[0] == chunk_time:
+            chunk -= 1
+        return chunk
+    def seek_chunk(self, chunk):
+        # Position at the start of the given chunk and return the status
+        # changes recorded in its key frame
+        self.data = b""
+        self.data_pos = 0
+        if chunk >= self.chunk_count:
+            self.file.seek(0, os.SEEK_END)
+            return {}
+        self.file.seek(self._read_index(chunk)[1])
+        if not self._read_chunk():
+            return {}
+        frame = self._next_frame()
+        if frame is None or frame[0] != FRAME_KEY:
+            raise error("Invalid log chunk %d" % (chunk,))
+        return json.loads(frame[2])
+    def pull_frame(self):
+        while 1:
+            frame = self._next_frame()
+            if frame is None or frame[0] != FRAME_KEY:
+                return frame
+
+# Convert binary capture frames into the messages of the json log format
+def decode_trapq_frame(payload):
+    data = [(pt, mt, sv, a, (sx, sy, sz), (xr, yr, zr))
+            for pt, mt, sv, a, sx, sy, sz, xr, yr, zr
+            in TRAPQ_RECORD.iter_unpack(payload)]
+    return {'data': data}
+def decode_stepq_frame(payload):
+    hsize = STEPQ_HEADER.size
+    (start_position, start_mcu_position, step_distance, first_clock,
+     first_step_time, last_clock, last_step_time) = STEPQ_HEADER.unpack(
+         payload[:hsize])
+    data = [(interval, count, add)
+            for fc, lc, sp, count, interval, add
+            in STEPQ_RECORD.iter_unpack(payload[hsize:])]
+    return {'data': data, 'start_position': start_position,
+            'start_mcu_position': start_mcu_position,
+            'step_distance': step_distance, 'first_clock': first_clock,
+            'first_step_time': first_step_time, 'last_clock': last_clock,
+            'last_step_time': last_step_time}
+
+# Dispatch messages of a binary capture or indexed log to per-subscription
+# queues
+class BinaryDispatcher(JsonDispatcher):
+    def __init__(self, capture_reader):
+        self.names = {}
+        self.queues = {}
+        self.last_read_time = 0.
+        self.log_reader = capture_reader
+        self.is_eof = False
+    def pull_msg(self, req_time, name):
+        q = self.names[name]
+        while 1:
+            if q:
+                return q.pop(0)
+            if req_time + 1. < self.last_read_time:
+                return None
+            frame = self.log_reader.pull_frame()
+            if frame is None:
+                self.is_eof = True
+                return None
+            ftype, fname, payload = frame
+            if ftype == b't':
+                qid = "trapq:" + fname
+                queues = self.queues.get(qid)
+                if not queues:
+                    continue
+                msg = decode_trapq_frame(payload)
+                if msg['data']:
+                    self.last_read_time = msg['data'][-1][0]
+            elif ftype == b's':
+                qid = "stepq:" + fname
+                queues = self.queues.get(qid)
+                if not queues:
+                    continue
+                msg = decode_stepq_frame(payload)
+                self.last_read_time = msg['last_step_time']
+            elif ftype == FRAME_JSON:
+                # Subscription messages of indexed logs - only parsed
+                # when a dataset needs them
+                queues = self.queues.get(fname)
+                if not queues:
+                    continue
+                msg = json.loads(payload)['params']
+            else:
+                continue
+            for mq in queues:
+                mq.append(msg)
+
+
 ######################################################################
 # Dataset and log tracking
 ######################################################################
@@ -566,8 +771,17 @@ def list_datasets():
 class LogManager:
     error = error
     def __init__(self, log_prefix):
-        self.index_reader = JsonLogReader(log_prefix + ".index.gz")
-        self.jdispatch = JsonDispatcher(log_prefix)
+        self.capture_reader = self.index_reader = self.indexed_reader = None
+        if glob.glob(log_prefix + ".*.kmr"):
+            # Binary capture from MOTION_REPORT_CAPTURE
+            self.capture_reader = BinaryCaptureReader(log_prefix)
+            self.jdispatch = BinaryDispatcher(self.capture_reader)
+        elif os.path.exists(log_prefix + ".kmlog"):
+            self.indexed_reader = IndexedLogReader(log_prefix)
+            self.jdispatch = BinaryDispatcher(self.indexed_reader)
+        else:
+            self.index_reader = JsonLogReader(log_prefix + ".index.gz")
+            self.jdispatch = JsonDispatcher(log_prefix)
         self.initial_start_time = self.start_time = 0.
         self.datasets = {}
         self.initial_status = {}
@@ -575,7 +789,12 @@ class LogManager:
         self.log_subscriptions = {}
         self.status_tracker = None
     def setup_index(self):
-        fmsg = self.index_reader.pull_msg()
+        if self.capture_reader is not None:
+            fmsg = self.capture_reader.get_info(0)
+        elif self.indexed_reader is not None:
+            fmsg = self.indexed_reader.get_info()
+        else:
+            fmsg = self.index_reader.pull_msg()
         self.initial_status = status = fmsg['status']
         self.start_status = dict(status)
         start_time = status['toolhead']['estimated_print_time']
@@ -591,6 +810,22 @@ class LogManager:
         self.start_time = req_start_time = self.initial_start_time + req_time
         start_status = self.start_status
         seek_time = max(self.initial_start_time, req_start_time - 1.)
+        if self.capture_reader is not None:
+            # Start at the last capture segment before the requested time
+            capture_reader = self.capture_reader
+            seg_index = 0
+            for i in range(1, capture_reader.get_segment_count()):
+                th = capture_reader.get_info(i)['status']['toolhead']
+                if th['estimated_print_time'] > seek_time:
+                    break
+                seg_index = i
+            capture_reader.seek_segment(seg_index)
+            return
+        if self.indexed_reader is not None:
+            chunk = self.indexed_reader.find_chunk(seek_time)
+            for k, v in self.indexed_reader.seek_chunk(chunk).items():
+                start_status.setdefault(k, {}).update(v)
+            return
         file_position = 0
         while 1:
             fmsg = self.index_reader.pull_msg()
@@ -18,12 +18,15 @@ class error(Exception):
     pass
 
 class TestCase:
-    def __init__(self, fname, dictdir, tempdir, verbose, keepfiles):
+    def __init__(self, fname, dictdir, tempdir, verbose, keepfiles,
+                 benchmark=False):
         self.fname = fname
         self.dictdir = dictdir
         self.tempdir = tempdir
         self.verbose = verbose
         self.keepfiles = keepfiles
+        self.benchmark = benchmark
+        self.bench_results = []
     def relpath(self, fname, rel='test'):
         if rel == 'dict':
             reldir = self.dictdir
@@ -94,7 +97,7 @@ class TestCase:
                  '-i', gcode_fname, '-o', TEMP_OUTPUT_FILE, '-v' ]
         for df in dict_fnames:
             args += ['-d', df]
-        if not self.verbose:
+        if not self.verbose or self.benchmark:
             args += ['-l', TEMP_LOG_FILE]
         res = subprocess.call(args)
         is_fail = (should_fail and not res) or (not should_fail and res)
@@ -104,13 +107,16 @@ class TestCase:
             if should_fail:
                 raise error("Test failed to raise an error")
             raise error("Error during test")
+        if self.benchmark:
+            self.bench_results.append((os.path.basename(gcode_fname),
+                                       self.parse_bench_stats()))
         # Do cleanup
         if self.keepfiles:
             return
         for fname in os.listdir(self.tempdir):
             if fname.startswith(TEMP_OUTPUT_FILE):
                 os.unlink(fname)
-        if not self.verbose:
+        if not self.verbose or self.benchmark:
             os.unlink(TEMP_LOG_FILE)
         else:
             sys.stderr.write('\n')
@@ -125,6 +131,20 @@ class TestCase:
             logging.exception("Unhandled exception during test run")
             return "internal error"
         return "success"
+    def parse_bench_stats(self):
+        # Extract the "File input stats" line written by klippy on exit
+        stats = None
+        f = open(TEMP_LOG_FILE, 'r')
+        for line in f:
+            pos = line.find("File input stats: ")
+            if pos >= 0:
+                parts = line[pos+18:].split()
+                stats = {k: float(v) for k, v in
+                         [p.split('=', 1) for p in parts]}
+        f.close()
+        if stats is None:
+            raise error("Benchmark statistics not found in log")
+        return stats
     def show_log(self):
         f = open(TEMP_LOG_FILE, 'r')
         data = f.read()
@@ -132,6 +152,26 @@ class TestCase:
         sys.stdout.write(data)
 
 
+######################################################################
+# Benchmark reporting
+######################################################################
+
+def report_benchmark(results):
+    # Report the best (lowest cpu time) run of each gcode file
+    best = {}
+    for name, stats in results:
+        if name not in best or stats['cputime'] < best[name]['cputime']:
+            best[name] = stats
+    sys.stdout.write("%-20s %10s %10s %12s %10s\n" % (
+        "gcode", "lines/sec", "moves/sec", "cpu/minute", "lookahead"))
+    for name, stats in sorted(best.items()):
+        cputime = max(stats['cputime'], .000001)
+        print_minutes = max(stats['print_time'] / 60., .000001)
+        sys.stdout.write("%-20s %10.0f %10.0f %12.3f %10d\n" % (
+            name, stats['lines'] / cputime, stats['moves'] / cputime,
+            stats['cputime'] / print_minutes, stats['peak_lookahead']))
+
+
 ######################################################################
 # Startup
 ######################################################################
@@ -148,21 +188,33 @@ def main():
                     help="do not remove temporary files")
     opts.add_option("-v", action="store_true", dest="verbose",
                     help="show all output from tests")
+    opts.add_option("-b", action="store_true", dest="benchmark",
+                    help="report host throughput of each test")
+    opts.add_option("-r", "--repeat", type="int", dest="repeat", default=3,
+                    help="number of benchmark runs per test (default 3)")
     options, args = opts.parse_args()
     if len(args) < 1:
         opts.error("Incorrect number of arguments")
     logging.basicConfig(level=logging.DEBUG)
 
     # Run each test
+    bench_results = []
+    repeat = options.repeat if options.benchmark else 1
     for fname in args:
-        tc = TestCase(fname, options.dictdir, options.tempdir, options.verbose,
-                      options.keepfiles)
-        res = tc.run()
-        if res != 'success':
-            sys.stderr.write("\n\nTest case %s FAILED (%s)!\n\n" % (fname, res))
-            sys.exit(-1)
+        for i in range(repeat):
+            tc = TestCase(fname, options.dictdir, options.tempdir,
+                          options.verbose, options.keepfiles,
+                          options.benchmark)
+            res = tc.run()
+            if res != 'success':
+                sys.stderr.write("\n\nTest case %s FAILED (%s)!\n\n" % (
+                    fname, res))
+                sys.exit(-1)
+            bench_results.extend(tc.bench_results)
 
     sys.stderr.write("\n    All %d test cases passed\n" % (len(args),))
+    if options.benchmark:
+        report_benchmark(bench_results)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,1207 @@
+; Benchmark - dense G2/G3 arcs
+G28
+G90
+M83
+G1 Z0.3 F600
+G1 X100 Y100 F6000
+G1 X142.000 Y100.000 F9000
+G2 X140.000 Y98.000 I-2.000 J0 E0.1037 F3600
+G1 X134.695 Y124.073 F9000
+G3 X130.001 Y126.017 I-2.750 J0 E0.2138 F3600
+G1 X114.525 Y138.450 F9000
+G2 X107.525 Y138.450 I-3.500 J0 E0.3629 F3600
+G1 X89.915 Y137.343 F9000
+G3 X82.660 Y134.338 I-4.250 J0 E0.5508 F3600
+G1 X71.078 Y121.197 F9000
+G2 X66.078 Y126.197 I-5.000 J0 E0.7775 F3600
+G1 X65.902 Y96.514 F9000
+G3 X64.218 Y92.448 I-5.750 J0 E1.0432 F3600
+G1 X76.774 Y73.235 F9000
+G2 X76.774 Y73.235 I-6.500 J0 E1.3477 F3600
+G1 X99.618 Y60.735 F9000
+G3 X92.368 Y67.985 I-7.250 J0 E0.3758 F3600
+G1 X125.535 Y64.048 F9000
+G2 X111.878 Y58.391 I-8.000 J0 E0.6220 F3600
+G1 X144.390 Y81.840 F9000
+G3 X126.890 Y81.840 I-8.750 J0 E0.9071 F3600
+G1 X148.892 Y106.946 F9000
+G2 X132.675 Y113.663 I-9.500 J0 E1.2311 F3600
+G1 X137.530 Y129.254 F9000
+G3 X127.280 Y119.004 I-10.250 J0 E1.5940 F3600
+G1 X115.181 Y139.781 F9000
+G2 X111.959 Y147.559 I-11.000 J0 E1.9957 F3600
+G1 X91.148 Y134.287 F9000
+G3 X91.148 Y134.287 I-11.750 J0 E2.4363 F3600
+G1 X75.413 Y114.984 F9000
+G2 X62.913 Y102.484 I-12.500 J0 E0.6480 F3600
+G1 X74.613 Y89.647 F9000
+G3 X51.994 Y99.016 I-13.250 J0 E1.0302 F3600
+G1 X89.374 Y68.480 F9000
+G2 X61.374 Y68.480 I-14.000 J0 E1.4514 F3600
+G1 X101.302 Y60.006 F9000
+G3 X97.888 Y58.592 I-2.000 J0 E0.2592 F3600
+G1 X126.261 Y67.639 F9000
+G2 X123.511 Y70.389 I-2.750 J0 E0.4276 F3600
+G1 X141.752 Y88.305 F9000
+G3 X140.727 Y85.830 I-3.500 J0 E0.6350 F3600
+G1 X141.838 Y113.681 F9000
+G2 X141.838 Y113.681 I-4.250 J0 E0.8812 F3600
+G1 X126.786 Y133.547 F9000
+G3 X121.786 Y138.547 I-5.000 J0 E0.2592 F3600
+G1 X102.960 Y139.903 F9000
+G2 X93.144 Y135.837 I-5.750 J0 E0.4471 F3600
+G1 X80.258 Y130.188 F9000
+G3 X67.258 Y130.188 I-6.500 J0 E0.6739 F3600
+G1 X68.124 Y108.316 F9000
+G2 X55.748 Y113.443 I-7.250 J0 E0.9395 F3600
+G1 X71.748 Y83.095 F9000
+G3 X63.748 Y75.095 I-8.000 J0 E1.2441 F3600
+G1 X89.971 Y64.682 F9000
+G2 X87.408 Y70.869 I-8.750 J0 E1.5875 F3600
+G1 X115.757 Y60.492 F9000
+G3 X115.757 Y60.492 I-9.500 J0 E1.9698 F3600
+G1 X139.024 Y72.214 F9000
+G2 X128.774 Y61.964 I-10.250 J0 E0.5313 F3600
+G1 X150.702 Y95.125 F9000
+G3 X131.924 Y102.903 I-11.000 J0 E0.8553 F3600
+G1 X146.391 Y120.000 F9000
+G2 X122.891 Y120.000 I-11.750 J0 E1.2182 F3600
+G1 X128.129 Y136.820 F9000
+G3 X106.790 Y127.981 I-12.500 J0 E1.6199 F3600
+G1 X103.573 Y138.812 F9000
+G2 X90.323 Y152.062 I-13.250 J0 E2.0605 F3600
+G1 X82.914 Y125.173 F9000
+G3 X78.814 Y115.273 I-14.000 J0 E2.5400 F3600
+G1 X62.024 Y101.396 F9000
+G2 X62.024 Y101.396 I-2.000 J0 E0.4147 F3600
+G1 X69.984 Y77.057 F9000
+G3 X67.234 Y79.807 I-2.750 J0 E0.1425 F3600
+G1 X91.139 Y61.958 F9000
+G2 X85.164 Y59.483 I-3.500 J0 E0.2721 F3600
+G1 X117.273 Y62.179 F9000
+G3 X108.773 Y62.179 I-4.250 J0 E0.4406 F3600
+G1 X138.162 Y77.632 F9000
+G2 X129.626 Y81.168 I-5.000 J0 E0.6480 F3600
+G1 X145.695 Y102.093 F9000
+G3 X139.945 Y96.343 I-5.750 J0 E0.8942 F3600
+G1 X137.142 Y125.712 F9000
+G2 X135.238 Y130.308 I-6.500 J0 E1.1793 F3600
+G1 X116.248 Y138.975 F9000
+G3 X116.248 Y138.975 I-7.250 J0 E1.5033 F3600
+G1 X91.731 Y136.542 F9000
+G2 X83.731 Y128.542 I-8.000 J0 E0.4147 F3600
+G1 X73.765 Y119.392 F9000
+G3 X58.828 Y125.580 I-8.750 J0 E0.6804 F3600
+G1 X69.889 Y94.433 F9000
+G2 X50.889 Y94.433 I-9.500 J0 E0.9849 F3600
+G1 X81.966 Y71.716 F9000
+G3 X64.468 Y64.468 I-10.250 J0 E1.3283 F3600
+G1 X105.433 Y60.389 F9000
+G2 X94.433 Y71.389 I-11.000 J0 E1.7106 F3600
+G1 X131.142 Y65.015 F9000
+G3 X127.701 Y56.707 I-11.750 J0 E2.1318 F3600
+G1 X149.042 Y83.731 F9000
+G2 X149.042 Y83.731 I-12.500 J0 E2.5918 F3600
+G1 X152.225 Y108.998 F9000
+G3 X138.975 Y122.248 I-13.250 J0 E0.6868 F3600
+G1 X139.712 Y130.642 F9000
+G2 X115.812 Y120.742 I-14.000 J0 E1.0886 F3600
+G1 X104.093 Y139.945 F9000
+G3 X100.093 Y139.945 I-2.000 J0 E0.2073 F3600
+G1 X80.382 Y133.162 F9000
+G2 X75.688 Y135.106 I-2.750 J0 E0.3564 F3600
+G1 X65.679 Y113.023 F9000
+G3 X62.179 Y109.523 I-3.500 J0 E0.5443 F3600
+G1 X66.208 Y87.639 F9000
+G2 X64.963 Y90.645 I-4.250 J0 E0.7711 F3600
+G1 X82.057 Y67.234 F9000
+G3 X82.057 Y67.234 I-5.000 J0 E1.0367 F3600
+G1 X107.146 Y60.024 F9000
+G2 X101.396 Y54.274 I-5.750 J0 E0.2981 F3600
+G1 X131.673 Y68.914 F9000
+G3 X120.577 Y73.510 I-6.500 J0 E0.5054 F3600
+G1 X146.062 Y90.323 F9000
+G2 X131.562 Y90.323 I-7.250 J0 E0.7516 F3600
+G1 X144.820 Y115.629 F9000
+G3 X131.163 Y109.972 I-8.000 J0 E1.0367 F3600
+G1 X128.750 Y134.641 F9000
+G2 X120.000 Y143.391 I-8.750 J0 E1.3607 F3600
+G1 X104.625 Y139.702 F9000
+G3 X101.843 Y132.984 I-9.500 J0 E1.7236 F3600
+G1 X82.464 Y128.774 F9000
+G2 X82.464 Y128.774 I-10.250 J0 E2.1253 F3600
+G1 X71.492 Y106.257 F9000
+G3 X60.492 Y117.257 I-11.000 J0 E0.5702 F3600
+G1 X76.432 Y81.221 F9000
+G2 X56.374 Y72.913 I-11.750 J0 E0.9136 F3600
+G1 X95.595 Y63.748 F9000
+G3 X70.595 Y63.748 I-12.500 J0 E1.2959 F3600
+G1 X121.566 Y60.874 F9000
+G2 X98.947 Y70.243 I-13.250 J0 E1.7171 F3600
+G1 X144.188 Y73.758 F9000
+G3 X130.188 Y59.758 I-14.000 J0 E2.1771 F3600
+G1 X141.903 Y97.210 F9000
+G2 X141.317 Y98.624 I-2.000 J0 E0.3629 F3600
+G1 X136.297 Y121.786 F9000
+G3 X136.297 Y121.786 I-2.750 J0 E0.5702 F3600
+G1 X117.181 Y137.588 F9000
+G2 X113.681 Y134.088 I-3.500 J0 E0.1814 F3600
+G1 X92.555 Y138.252 F9000
+G3 X85.300 Y141.257 I-4.250 J0 E0.3305 F3600
+G1 X72.639 Y123.511 F9000
+G2 X62.639 Y123.511 I-5.000 J0 E0.5184 F3600
+G1 X65.756 Y99.302 F9000
+G3 X55.940 Y95.236 I-5.750 J0 E0.7451 F3600
+G1 X74.980 Y75.374 F9000
+G2 X68.480 Y81.874 I-6.500 J0 E1.0108 F3600
+G1 X96.897 Y61.363 F9000
+G3 X94.774 Y56.236 I-7.250 J0 E1.3153 F3600
+G1 X122.984 Y62.913 F9000
+G2 X122.984 Y62.913 I-8.000 J0 E1.6588 F3600
+G1 X143.037 Y79.398 F9000
+G3 X134.287 Y88.148 I-8.750 J0 E0.4536 F3600
+G1 X149.281 Y104.181 F9000
+G2 X133.063 Y97.464 I-9.500 J0 E0.7387 F3600
+G1 X139.504 Y127.280 F9000
+G3 X119.004 Y127.280 I-10.250 J0 E1.0626 F3600
+G1 X117.946 Y139.392 F9000
+G2 X99.168 Y147.170 I-11.000 J0 E1.4255 F3600
+G1 X93.590 Y135.640 F9000
+G3 X81.840 Y123.890 I-11.750 J0 E1.8272 F3600
+G1 X76.548 Y117.535 F9000
+G2 X72.887 Y126.374 I-12.500 J0 E2.2678 F3600
+G1 X73.985 Y92.368 F9000
+G3 X73.985 Y92.368 I-13.250 J0 E2.7473 F3600
+G1 X87.235 Y70.274 F9000
+G2 X73.235 Y56.274 I-14.000 J0 E0.7257 F3600
+G1 X98.514 Y60.152 F9000
+G3 X95.100 Y61.566 I-2.000 J0 E0.1555 F3600
+G1 X123.947 Y66.078 F9000
+G2 X118.447 Y66.078 I-2.750 J0 E0.2851 F3600
+G1 X140.843 Y85.665 F9000
+G3 X134.868 Y83.190 I-3.500 J0 E0.4536 F3600
+G1 X142.700 Y111.025 F9000
+G2 X138.450 Y115.275 I-4.250 J0 E0.6609 F3600
+G1 X129.073 Y131.945 F9000
+G3 X127.608 Y128.410 I-5.000 J0 E0.9071 F3600
+G1 X105.750 Y140.000 F9000
+G2 X105.750 Y140.000 I-5.750 J0 E1.1922 F3600
+G1 X82.427 Y131.945 F9000
+G3 X75.927 Y138.445 I-6.500 J0 E0.3369 F3600
+G1 X68.800 Y111.025 F9000
+G2 X56.423 Y105.899 I-7.250 J0 E0.5637 F3600
+G1 X70.657 Y85.665 F9000
+G3 X54.657 Y85.665 I-8.000 J0 E0.8294 F3600
+G1 X87.553 Y66.078 F9000
+G2 X72.616 Y72.265 I-8.750 J0 E1.1339 F3600
+G1 X112.986 Y60.152 F9000
+G3 X103.486 Y50.652 I-9.500 J0 E1.4773 F3600
+G1 X137.015 Y70.274 F9000
+G2 X134.013 Y77.522 I-10.250 J0 E1.8596 F3600
+G1 X150.265 Y92.368 F9000
+G3 X150.265 Y92.368 I-11.000 J0 E2.2808 F3600
+G1 X147.702 Y117.535 F9000
+G2 X135.952 Y105.785 I-11.750 J0 E0.6091 F3600
+G1 X130.660 Y135.640 F9000
+G3 X109.321 Y144.479 I-12.500 J0 E0.9719 F3600
+G1 X106.304 Y139.392 F9000
+G2 X79.804 Y139.392 I-13.250 J0 E1.3737 F3600
+G1 X84.746 Y127.280 F9000
+G3 X60.846 Y117.380 I-14.000 J0 E1.8143 F3600
+G1 X62.219 Y104.181 F9000
+G2 X60.219 Y106.181 I-2.000 J0 E0.3110 F3600
+G1 X68.463 Y79.398 F9000
+G3 X67.658 Y77.454 I-2.750 J0 E0.4989 F3600
+G1 X88.516 Y62.913 F9000
+G2 X88.516 Y62.913 I-3.500 J0 E0.7257 F3600
+G1 X114.603 Y61.363 F9000
+G3 X110.353 Y65.613 I-4.250 J0 E0.2203 F3600
+G1 X136.520 Y75.374 F9000
+G2 X127.985 Y71.838 I-5.000 J0 E0.3888 F3600
+G1 X145.744 Y99.302 F9000
+G3 X134.244 Y99.302 I-5.750 J0 E0.5961 F3600
+G1 X138.861 Y123.511 F9000
+G2 X127.764 Y128.108 I-6.500 J0 E0.8423 F3600
+G1 X118.945 Y138.252 F9000
+G3 X111.695 Y131.002 I-7.250 J0 E1.1274 F3600
+G1 X94.319 Y137.588 F9000
+G2 X91.976 Y143.245 I-8.000 J0 E1.4514 F3600
+G1 X75.203 Y121.786 F9000
+G3 X75.203 Y121.786 I-8.750 J0 E1.8143 F3600
+G1 X69.597 Y97.210 F9000
+G2 X60.097 Y87.710 I-9.500 J0 E0.4924 F3600
+G1 X80.062 Y73.758 F9000
+G3 X62.564 Y81.005 I-10.250 J0 E0.7970 F3600
+G1 X102.684 Y60.874 F9000
+G2 X80.684 Y60.874 I-11.000 J0 E1.1404 F3600
+G1 X128.655 Y63.748 F9000
+G3 X108.596 Y55.439 I-11.750 J0 E1.5227 F3600
+G1 X147.818 Y81.221 F9000
+G2 X135.318 Y93.721 I-12.500 J0 E1.9439 F3600
+G1 X152.758 Y106.257 F9000
+G3 X148.877 Y96.888 I-13.250 J0 E2.4039 F3600
+G1 X141.786 Y128.774 F9000
+G2 X141.786 Y128.774 I-14.000 J0 E2.9028 F3600
+G1 X106.875 Y139.702 F9000
+G3 X104.875 Y141.702 I-2.000 J0 E0.1037 F3600
+G1 X82.750 Y134.641 F9000
+G2 X78.055 Y132.696 I-2.750 J0 E0.2138 F3600
+G1 X66.680 Y115.629 F9000
+G3 X59.680 Y115.629 I-3.500 J0 E0.3629 F3600
+G1 X65.438 Y90.323 F9000
+G2 X58.183 Y93.328 I-4.250 J0 E0.5508 F3600
+G1 X79.827 Y68.914 F9000
+G3 X74.827 Y63.914 I-5.000 J0 E0.7775 F3600
+G1 X104.354 Y60.024 F9000
+G2 X102.670 Y64.090 I-5.750 J0 E1.0432 F3600
+G1 X129.443 Y67.234 F9000
+G3 X129.443 Y67.234 I-6.500 J0 E1.3477 F3600
+G1 X145.292 Y87.639 F9000
+G2 X138.042 Y80.389 I-7.250 J0 E0.3758 F3600
+G1 X145.821 Y113.023 F9000
+G3 X132.164 Y118.680 I-8.000 J0 E0.6220 F3600
+G1 X131.118 Y133.162 F9000
+G2 X113.618 Y133.162 I-8.750 J0 E0.9071 F3600
+G1 X107.407 Y139.945 F9000
+G3 X91.189 Y133.228 I-9.500 J0 E1.2311 F3600
+G1 X84.538 Y130.642 F9000
+G2 X74.288 Y140.892 I-10.250 J0 E1.5940 F3600
+G1 X72.025 Y108.998 F9000
+G3 X68.803 Y101.220 I-11.000 J0 E1.9957 F3600
+G1 X75.208 Y83.731 F9000
+G2 X75.208 Y83.731 I-11.750 J0 E2.4363 F3600
+G1 X93.108 Y65.015 F9000
+G3 X80.608 Y77.515 I-12.500 J0 E0.6480 F3600
+G1 X118.817 Y60.389 F9000
+G2 X96.198 Y51.020 I-13.250 J0 E1.0302 F3600
+G1 X142.284 Y71.716 F9000
+G3 X114.284 Y71.716 I-14.000 J0 E1.4514 F3600
+G1 X141.611 Y94.433 F9000
+G2 X138.197 Y95.847 I-2.000 J0 E0.2592 F3600
+G1 X137.735 Y119.392 F9000
+G3 X134.985 Y116.642 I-2.750 J0 E0.4276 F3600
+G1 X119.769 Y136.542 F9000
+G2 X118.744 Y139.017 I-3.500 J0 E0.6350 F3600
+G1 X95.252 Y138.975 F9000
+G3 X95.252 Y138.975 I-4.250 J0 E0.8812 F3600
+G1 X74.358 Y125.712 F9000
+G2 X69.358 Y120.712 I-5.000 J0 E0.2592 F3600
+G1 X65.805 Y102.093 F9000
+G3 X55.989 Y106.159 I-5.750 J0 E0.4471 F3600
+G1 X73.338 Y77.632 F9000
+G2 X60.338 Y77.632 I-6.500 J0 E0.6739 F3600
+G1 X94.227 Y62.179 F9000
+G3 X81.851 Y57.053 I-7.250 J0 E0.9395 F3600
+G1 X120.361 Y61.958 F9000
+G2 X112.361 Y69.958 I-8.000 J0 E1.2441 F3600
+G1 X141.516 Y77.057 F9000
+G3 X138.953 Y70.870 I-8.750 J0 E1.5875 F3600
+G1 X149.476 Y101.396 F9000
+G2 X149.476 Y101.396 I-9.500 J0 E1.9698 F3600
+G1 X141.336 Y125.173 F9000
+G3 X131.086 Y135.423 I-10.250 J0 E0.5313 F3600
+G1 X120.677 Y138.812 F9000
+G2 X101.899 Y131.034 I-11.000 J0 E0.8553 F3600
+G1 X96.121 Y136.820 F9000
+G3 X72.621 Y136.820 I-11.750 J0 E1.2182 F3600
+G1 X77.859 Y120.000 F9000
+G2 X56.520 Y128.839 I-12.500 J0 E1.6199 F3600
+G1 X73.548 Y95.125 F9000
+G3 X60.298 Y81.875 I-13.250 J0 E2.0605 F3600
+G1 X85.226 Y72.214 F9000
+G2 X81.126 Y82.113 I-14.000 J0 E2.5400 F3600
+G1 X95.743 Y60.492 F9000
+G3 X95.743 Y60.492 I-2.000 J0 E0.4147 F3600
+G1 X121.529 Y64.682 F9000
+G2 X118.779 Y61.932 I-2.750 J0 E0.1425 F3600
+G1 X139.752 Y83.095 F9000
+G3 X133.777 Y85.570 I-3.500 J0 E0.2721 F3600
+G1 X143.376 Y108.316 F9000
+G2 X134.876 Y108.316 I-4.250 J0 E0.4406 F3600
+G1 X131.242 Y130.188 F9000
+G3 X122.707 Y126.653 I-5.000 J0 E0.6480 F3600
+G1 X108.540 Y139.903 F9000
+G2 X102.790 Y145.653 I-5.750 J0 E0.8942 F3600
+G1 X84.714 Y133.547 F9000
+G3 X82.811 Y128.951 I-6.500 J0 E1.1793 F3600
+G1 X69.662 Y113.681 F9000
+G2 X69.662 Y113.681 I-7.250 J0 E1.5033 F3600
+G1 X69.748 Y88.305 F9000
+G3 X61.748 Y96.305 I-8.000 J0 E0.4147 F3600
+G1 X85.239 Y67.639 F9000
+G2 X70.301 Y61.452 I-8.750 J0 E0.6804 F3600
+G1 X110.198 Y60.006 F9000
+G3 X91.198 Y60.006 I-9.500 J0 E0.9849 F3600
+G1 X134.876 Y68.480 F9000
+G2 X117.379 Y75.727 I-10.250 J0 E1.3283 F3600
+G1 X149.637 Y89.647 F9000
+G3 X138.637 Y78.647 I-11.000 J0 E1.7106 F3600
+G1 X148.837 Y114.984 F9000
+G2 X145.396 Y123.293 I-11.750 J0 E2.1318 F3600
+G1 X133.102 Y134.287 F9000
+G3 X133.102 Y134.287 I-12.500 J0 E2.5918 F3600
+G1 X109.069 Y139.781 F9000
+G2 X95.819 Y126.531 I-13.250 J0 E0.6868 F3600
+G1 X86.720 Y129.254 F9000
+G3 X62.821 Y139.154 I-14.000 J0 E1.0886 F3600
+G1 X62.608 Y106.946 F9000
+G2 X58.608 Y106.946 I-2.000 J0 E0.2073 F3600
+G1 X67.110 Y81.840 F9000
+G3 X62.415 Y79.896 I-2.750 J0 E0.3564 F3600
+G1 X85.965 Y64.048 F9000
+G2 X82.465 Y67.548 I-3.500 J0 E0.5443 F3600
+G1 X111.882 Y60.735 F9000
+G3 X110.638 Y57.730 I-4.250 J0 E0.7711 F3600
+G1 X134.726 Y73.235 F9000
+G2 X134.726 Y73.235 I-5.000 J0 E1.0367 F3600
+G1 X145.598 Y96.514 F9000
+G3 X139.848 Y102.264 I-5.750 J0 E0.2981 F3600
+G1 X140.422 Y121.197 F9000
+G2 X129.326 Y116.601 I-6.500 J0 E0.5054 F3600
+G1 X121.585 Y137.343 F9000
+G3 X107.085 Y137.343 I-7.250 J0 E0.7516 F3600
+G1 X96.975 Y138.450 F9000
+G2 X83.318 Y144.107 I-8.000 J0 E1.0367 F3600
+G1 X76.805 Y124.073 F9000
+G3 X68.055 Y115.323 I-8.750 J0 E1.3607 F3600
+G1 X69.500 Y100.000 F9000
+G2 X66.718 Y106.718 I-9.500 J0 E1.7236 F3600
+G1 X78.305 Y75.927 F9000
+G3 X78.305 Y75.927 I-10.250 J0 E2.1253 F3600
+G1 X99.975 Y61.550 F9000
+G2 X88.975 Y50.550 I-11.000 J0 E0.5702 F3600
+G1 X126.085 Y62.657 F9000
+G3 X106.026 Y70.965 I-11.750 J0 E0.9136 F3600
+G1 X146.422 Y78.803 F9000
+G2 X121.422 Y78.803 I-12.500 J0 E1.2959 F3600
+G1 X153.098 Y103.486 F9000
+G3 X130.479 Y94.117 I-13.250 J0 E1.7171 F3600
+G1 X143.726 Y126.765 F9000
+G2 X129.726 Y140.765 I-14.000 J0 E2.1771 F3600
+G1 X109.632 Y139.265 F9000
+G3 X109.047 Y137.851 I-2.000 J0 E0.3629 F3600
+G1 X85.215 Y135.952 F9000
+G2 X85.215 Y135.952 I-2.750 J0 E0.5702 F3600
+G1 X67.860 Y118.160 F9000
+G3 X64.360 Y121.660 I-3.500 J0 E0.1814 F3600
+G1 X64.858 Y93.054 F9000
+G2 X57.602 Y90.049 I-4.250 J0 E0.3305 F3600
+G1 X77.720 Y70.746 F9000
+G3 X67.720 Y70.746 I-5.000 J0 E0.5184 F3600
+G1 X101.569 Y60.219 F9000
+G2 X91.753 Y64.285 I-5.750 J0 E0.7451 F3600
+G1 X127.102 Y65.713 F9000
+G3 X120.602 Y59.213 I-6.500 J0 E1.0108 F3600
+G1 X144.337 Y85.016 F9000
+G2 X142.214 Y90.142 I-7.250 J0 E1.3153 F3600
+G1 X146.637 Y110.353 F9000
+G3 X146.637 Y110.353 I-8.000 J0 E1.6588 F3600
+G1 X133.376 Y131.520 F9000
+G2 X124.626 Y122.770 I-8.750 J0 E0.4536 F3600
+G1 X110.198 Y139.994 F9000
+G3 X93.981 Y146.711 I-9.500 J0 E0.7387 F3600
+G1 X86.739 Y132.361 F9000
+G2 X66.239 Y132.361 I-10.250 J0 E1.0626 F3600
+G1 X72.748 Y111.695 F9000
+G3 X53.970 Y103.917 I-11.000 J0 E1.4255 F3600
+G1 X74.162 Y86.319 F9000
+G2 X62.412 Y98.069 I-11.750 J0 E1.8272 F3600
+G1 X90.714 Y66.453 F9000
+G3 X87.053 Y57.614 I-12.500 J0 E2.2678 F3600
+G1 X116.040 Y60.097 F9000
+G2 X116.040 Y60.097 I-13.250 J0 E2.7473 F3600
+G1 X140.242 Y69.812 F9000
+G3 X126.242 Y83.812 I-14.000 J0 E0.7257 F3600
+G1 X141.126 Y91.684 F9000
+G2 X137.712 Y90.269 I-2.000 J0 E0.1555 F3600
+G1 X139.002 Y116.905 F9000
+G3 X133.502 Y116.905 I-2.750 J0 E0.2851 F3600
+G1 X122.279 Y135.318 F9000
+G2 X116.304 Y137.793 I-3.500 J0 E0.4536 F3600
+G1 X97.993 Y139.508 F9000
+G3 X93.743 Y135.258 I-4.250 J0 E0.6609 F3600
+G1 X76.226 Y127.786 F9000
+G2 X74.762 Y131.322 I-5.000 J0 E0.9071 F3600
+G1 X66.048 Y104.875 F9000
+G3 X66.048 Y104.875 I-5.750 J0 E1.1922 F3600
+G1 X71.859 Y80.000 F9000
+G2 X65.359 Y73.500 I-6.500 J0 E0.3369 F3600
+G1 X91.621 Y63.180 F9000
+G3 X79.244 Y68.306 I-7.250 J0 E0.5637 F3600
+G1 X117.677 Y61.188 F9000
+G2 X101.677 Y61.188 I-8.000 J0 E0.8294 F3600
+G1 X139.836 Y74.827 F9000
+G3 X124.899 Y68.640 I-8.750 J0 E1.1339 F3600
+G1 X149.476 Y98.604 F9000
+G2 X139.976 Y108.104 I-9.500 J0 E1.4773 F3600
+G1 X143.016 Y122.943 F9000
+G3 X140.014 Y115.695 I-10.250 J0 E1.8596 F3600
+G1 X123.361 Y138.042 F9000
+G2 X123.361 Y138.042 I-11.000 J0 E2.2808 F3600
+G1 X98.727 Y137.821 F9000
+G3 X86.977 Y149.571 I-11.750 J0 E0.6091 F3600
+G1 X79.338 Y122.368 F9000
+G2 X58.000 Y113.529 I-12.500 J0 E0.9719 F3600
+G1 X73.305 Y97.907 F9000
+G3 X46.805 Y97.907 I-13.250 J0 E1.3737 F3600
+G1 X83.358 Y74.288 F9000
+G2 X59.459 Y84.188 I-14.000 J0 E1.8143 F3600
+G1 X93.002 Y61.025 F9000
+G3 X91.002 Y59.025 I-2.000 J0 E0.3110 F3600
+G1 X119.019 Y63.458 F9000
+G2 X118.214 Y65.403 I-2.750 J0 E0.4989 F3600
+G1 X138.485 Y80.608 F9000
+G3 X138.485 Y80.608 I-3.500 J0 E0.7257 F3600
+G1 X143.861 Y105.567 F9000
+G2 X139.611 Y101.317 I-4.250 J0 E0.2203 F3600
+G1 X133.284 Y128.284 F9000
+G3 X124.749 Y131.820 I-5.000 J0 E0.3888 F3600
+G1 X111.317 Y139.611 F9000
+G2 X99.817 Y139.611 I-5.750 J0 E0.5961 F3600
+G1 X87.108 Y134.985 F9000
+G3 X76.011 Y130.389 I-6.500 J0 E0.8423 F3600
+G1 X70.708 Y116.269 F9000
+G2 X63.458 Y123.519 I-7.250 J0 E1.1274 F3600
+G1 X69.025 Y91.002 F9000
+G3 X66.682 Y85.345 I-8.000 J0 E1.4514 F3600
+G1 X83.038 Y69.358 F9000
+G2 X83.038 Y69.358 I-8.750 J0 E1.8143 F3600
+G1 X107.407 Y60.055 F9000
+G3 X97.907 Y69.555 I-9.500 J0 E0.4924 F3600
+G1 X132.618 Y66.838 F9000
+G2 X115.120 Y59.591 I-10.250 J0 E0.7970 F3600
+G1 X148.821 Y86.977 F9000
+G3 X126.821 Y86.977 I-11.000 J0 E1.1404 F3600
+G1 X149.792 Y112.361 F9000
+G2 X129.734 Y120.669 I-11.750 J0 E1.5227 F3600
+G1 X135.443 Y132.766 F9000
+G3 X122.943 Y120.266 I-12.500 J0 E1.9439 F3600
+G1 X111.854 Y139.976 F9000
+G2 X107.973 Y149.345 I-13.250 J0 E2.4039 F3600
+G1 X88.827 Y131.086 F9000
+G3 X88.827 Y131.086 I-14.000 J0 E2.9028 F3600
+G1 X63.188 Y109.677 F9000
+G2 X61.188 Y107.677 I-2.000 J0 E0.1037 F3600
+G1 X65.930 Y84.371 F9000
+G3 X61.235 Y86.315 I-2.750 J0 E0.2138 F3600
+G1 X83.500 Y65.359 F9000
+G2 X76.500 Y65.359 I-3.500 J0 E0.3629 F3600
+G1 X109.125 Y60.298 F9000
+G3 X101.870 Y57.293 I-4.250 J0 E0.5508 F3600
+G1 X132.786 Y71.226 F9000
+G2 X127.786 Y76.226 I-5.000 J0 E0.7775 F3600
+G1 X145.258 Y93.743 F9000
+G3 X143.573 Y89.677 I-5.750 J0 E1.0432 F3600
+G1 X141.818 Y118.779 F9000
+G2 X141.818 Y118.779 I-6.500 J0 E1.3477 F3600
+G1 X124.155 Y136.252 F9000
+G3 X116.905 Y143.502 I-7.250 J0 E0.3758 F3600
+G1 X99.684 Y139.126 F9000
+G2 X86.027 Y133.469 I-8.000 J0 E0.6220 F3600
+G1 X78.562 Y126.242 F9000
+G3 X61.062 Y126.242 I-8.750 J0 E0.9071 F3600
+G1 X69.597 Y102.790 F9000
+G2 X53.380 Y109.508 I-9.500 J0 E1.2311 F3600
+G1 X76.703 Y78.214 F9000
+G3 X66.453 Y67.964 I-10.250 J0 E1.5940 F3600
+G1 X97.319 Y62.412 F9000
+G2 X94.097 Y70.190 I-11.000 J0 E1.9957 F3600
+G1 X123.445 Y61.748 F9000
+G3 X123.445 Y61.748 I-11.750 J0 E2.4363 F3600
+G1 X144.861 Y76.489 F9000
+G2 X132.361 Y63.989 I-12.500 J0 E0.6480 F3600
+G1 X153.244 Y100.698 F9000
+G3 X130.625 Y110.067 I-13.250 J0 E1.0302 F3600
+G1 X145.520 Y124.626 F9000
+G2 X117.520 Y124.626 I-14.000 J0 E1.4514 F3600
+G1 X112.353 Y138.637 F9000
+G3 X108.939 Y137.223 I-2.000 J0 E0.2592 F3600
+G1 X87.766 Y137.087 F9000
+G2 X85.016 Y139.837 I-2.750 J0 E0.4276 F3600
+G1 X69.213 Y120.602 F9000
+G3 X68.188 Y118.127 I-3.500 J0 E0.6350 F3600
+G1 X64.469 Y95.819 F9000
+G2 X64.469 Y95.819 I-4.250 J0 E0.8812 F3600
+G1 X75.746 Y72.720 F9000
+G3 X70.746 Y77.720 I-5.000 J0 E0.2592 F3600
+G1 X98.804 Y60.608 F9000
+G2 X88.988 Y56.542 I-5.750 J0 E0.4471 F3600
+G1 X124.660 Y64.360 F9000
+G3 X111.660 Y64.360 I-6.500 J0 E0.6739 F3600
+G1 X143.202 Y82.465 F9000
+G2 X130.825 Y87.592 I-7.250 J0 E0.9395 F3600
+G1 X147.265 Y107.632 F9000
+G3 X139.265 Y99.632 I-8.000 J0 E1.2441 F3600
+G1 X135.515 Y129.726 F9000
+G2 X132.952 Y135.913 I-8.750 J0 E1.5875 F3600
+G1 X112.986 Y139.848 F9000
+G3 X112.986 Y139.848 I-9.500 J0 E1.9698 F3600
+G1 X89.053 Y133.922 F9000
+G2 X78.803 Y123.672 I-10.250 J0 E0.5313 F3600
+G1 X73.657 Y114.335 F9000
+G3 X54.879 Y122.113 I-11.000 J0 E0.8553 F3600
+G1 X73.300 Y88.975 F9000
+G2 X49.800 Y88.975 I-11.750 J0 E1.2182 F3600
+G1 X88.427 Y68.055 F9000
+G3 X67.089 Y59.216 I-12.500 J0 E1.6199 F3600
+G1 X113.250 Y60.000 F9000
+G2 X100.000 Y73.250 I-13.250 J0 E2.0605 F3600
+G1 X138.073 Y68.055 F9000
+G3 X133.972 Y58.155 I-14.000 J0 E2.5400 F3600
+G1 X140.450 Y88.975 F9000
+G2 X140.450 Y88.975 I-2.000 J0 E0.4147 F3600
+G1 X140.093 Y114.335 F9000
+G3 X137.343 Y117.085 I-2.750 J0 E0.1425 F3600
+G1 X124.697 Y133.922 F9000
+G2 X118.722 Y131.447 I-3.500 J0 E0.2721 F3600
+G1 X100.764 Y139.848 F9000
+G3 X92.264 Y139.848 I-4.250 J0 E0.4406 F3600
+G1 X78.235 Y129.726 F9000
+G2 X69.699 Y133.261 I-5.000 J0 E0.6480 F3600
+G1 X66.485 Y107.632 F9000
+G3 X60.735 Y101.882 I-5.750 J0 E0.8942 F3600
+G1 X70.548 Y82.465 F9000
+G2 X68.644 Y87.061 I-6.500 J0 E1.1793 F3600
+G1 X89.090 Y64.360 F9000
+G3 X89.090 Y64.360 I-7.250 J0 E1.5033 F3600
+G1 X114.946 Y60.608 F9000
+G2 X106.946 Y52.608 I-8.000 J0 E0.4147 F3600
+G1 X138.004 Y72.720 F9000
+G3 X123.067 Y78.907 I-8.750 J0 E0.6804 F3600
+G1 X149.281 Y95.819 F9000
+G2 X130.281 Y95.819 I-9.500 J0 E0.9849 F3600
+G1 X144.537 Y120.602 F9000
+G3 X127.039 Y113.354 I-10.250 J0 E1.3283 F3600
+G1 X125.984 Y137.087 F9000
+G2 X114.984 Y148.087 I-11.000 J0 E1.7106 F3600
+G1 X101.397 Y138.637 F9000
+G3 X97.956 Y130.329 I-11.750 J0 E2.1318 F3600
+G1 X80.980 Y124.626 F9000
+G2 X80.980 Y124.626 I-12.500 J0 E2.5918 F3600
+G1 X73.256 Y100.698 F9000
+G3 X60.006 Y113.948 I-13.250 J0 E0.6868 F3600
+G1 X81.639 Y76.489 F9000
+G2 X57.740 Y66.589 I-14.000 J0 E1.0886 F3600
+G1 X90.305 Y61.748 F9000
+G3 X86.305 Y61.748 I-2.000 J0 E0.2073 F3600
+G1 X116.431 Y62.412 F9000
+G2 X111.736 Y64.357 I-2.750 J0 E0.3564 F3600
+G1 X137.047 Y78.214 F9000
+G3 X133.547 Y74.714 I-3.500 J0 E0.5443 F3600
+G1 X144.153 Y102.790 F9000
+G2 X142.908 Y105.795 I-4.250 J0 E0.7711 F3600
+G1 X135.188 Y126.242 F9000
+G3 X135.188 Y126.242 I-5.000 J0 E1.0367 F3600
+G1 X114.066 Y139.126 F9000
+G2 X108.316 Y133.376 I-5.750 J0 E0.2981 F3600
+G1 X89.595 Y136.252 F9000
+G3 X78.499 Y140.849 I-6.500 J0 E0.5054 F3600
+G1 X71.932 Y118.779 F9000
+G2 X57.432 Y118.779 I-7.250 J0 E0.7516 F3600
+G1 X68.492 Y93.743 F9000
+G3 X54.836 Y88.086 I-8.000 J0 E1.0367 F3600
+G1 X80.964 Y71.226 F9000
+G2 X72.214 Y79.976 I-8.750 J0 E1.3607 F3600
+G1 X104.625 Y60.298 F9000
+G3 X101.843 Y53.581 I-9.500 J0 E1.7236 F3600
+G1 X130.250 Y65.359 F9000
+G2 X130.250 Y65.359 I-10.250 J0 E2.1253 F3600
+G1 X147.820 Y84.371 F9000
+G3 X136.820 Y95.371 I-11.000 J0 E0.5702 F3600
+G1 X150.562 Y109.677 F9000
+G2 X130.503 Y101.368 I-11.750 J0 E0.9136 F3600
+G1 X137.673 Y131.086 F9000
+G3 X112.673 Y131.086 I-12.500 J0 E1.2959 F3600
+G1 X114.646 Y139.976 F9000
+G2 X92.027 Y149.345 I-13.250 J0 E1.7171 F3600
+G1 X91.057 Y132.766 F9000
+G3 X77.057 Y118.766 I-14.000 J0 E2.1771 F3600
+G1 X63.958 Y112.361 F9000
+G2 X63.372 Y113.775 I-2.000 J0 E0.3629 F3600
+G1 X64.929 Y86.977 F9000
+G3 X64.929 Y86.977 I-2.750 J0 E0.5702 F3600
+G1 X81.132 Y66.838 F9000
+G2 X77.632 Y63.338 I-3.500 J0 E0.1814 F3600
+G1 X106.343 Y60.055 F9000
+G3 X99.088 Y63.060 I-4.250 J0 E0.3305 F3600
+G1 X130.712 Y69.358 F9000
+G2 X120.712 Y69.358 I-5.000 J0 E0.5184 F3600
+G1 X144.725 Y91.002 F9000
+G3 X134.909 Y86.936 I-5.750 J0 E0.7451 F3600
+G1 X143.042 Y116.269 F9000
+G2 X136.542 Y122.769 I-6.500 J0 E1.0108 F3600
+G1 X126.642 Y134.985 F9000
+G3 X124.519 Y129.858 I-7.250 J0 E1.3153 F3600
+G1 X102.433 Y139.611 F9000
+G2 X102.433 Y139.611 I-8.000 J0 E1.6588 F3600
+G1 X80.466 Y128.284 F9000
+G3 X71.716 Y137.034 I-8.750 J0 E0.4536 F3600
+G1 X69.889 Y105.567 F9000
+G2 X53.672 Y98.849 I-9.500 J0 E0.7387 F3600
+G1 X75.265 Y80.608 F9000
+G3 X54.765 Y80.608 I-10.250 J0 E1.0626 F3600
+G1 X94.731 Y63.458 F9000
+G2 X75.952 Y71.236 I-11.000 J0 E1.4255 F3600
+G1 X120.748 Y61.025 F9000
+G3 X108.998 Y49.275 I-11.750 J0 E1.8272 F3600
+G1 X143.142 Y74.288 F9000
+G2 X139.481 Y83.127 I-12.500 J0 E2.2678 F3600
+G1 X153.195 Y97.907 F9000
+G3 X153.195 Y97.907 I-13.250 J0 E2.7473 F3600
+G1 X147.162 Y122.368 F9000
+G2 X133.162 Y108.368 I-14.000 J0 E0.7257 F3600
+G1 X115.023 Y137.821 F9000
+G3 X111.609 Y139.235 I-2.000 J0 E0.1555 F3600
+G1 X90.389 Y138.042 F9000
+G2 X84.889 Y138.042 I-2.750 J0 E0.2851 F3600
+G1 X70.734 Y122.943 F9000
+G3 X64.759 Y120.468 I-3.500 J0 E0.4536 F3600
+G1 X64.274 Y98.604 F9000
+G2 X60.024 Y102.854 I-4.250 J0 E0.6609 F3600
+G1 X73.914 Y74.827 F9000
+G3 X72.450 Y71.292 I-5.000 J0 E0.9071 F3600
+G1 X96.073 Y61.188 F9000
+G2 X96.073 Y61.188 I-5.750 J0 E1.1922 F3600
+G1 X122.129 Y63.180 F9000
+G3 X115.629 Y69.680 I-6.500 J0 E0.3369 F3600
+G1 X141.891 Y80.000 F9000
+G2 X129.514 Y74.873 I-7.250 J0 E0.5637 F3600
+G1 X147.702 Y104.875 F9000
+G3 X131.702 Y104.875 I-8.000 J0 E0.8294 F3600
+G1 X137.524 Y127.786 F9000
+G2 X122.586 Y133.974 I-8.750 J0 E1.1339 F3600
+G1 X115.757 Y139.508 F9000
+G3 X106.257 Y130.008 I-9.500 J0 E1.4773 F3600
+G1 X91.471 Y135.318 F9000
+G2 X88.469 Y142.566 I-10.250 J0 E1.8596 F3600
+G1 X74.748 Y116.905 F9000
+G3 X74.748 Y116.905 I-11.000 J0 E2.2808 F3600
+G1 X72.624 Y91.684 F9000
+G2 X60.874 Y79.934 I-11.750 J0 E0.6091 F3600
+G1 X86.258 Y69.812 F9000
+G3 X64.919 Y78.650 I-12.500 J0 E0.9719 F3600
+G1 X110.460 Y60.097 F9000
+G2 X83.960 Y60.097 I-13.250 J0 E1.3737 F3600
+G1 X135.786 Y66.453 F9000
+G3 X111.886 Y56.554 I-14.000 J0 E1.8143 F3600
+G1 X139.588 Y86.319 F9000
+G2 X137.588 Y88.319 I-2.000 J0 E0.3110 F3600
+G1 X141.002 Y111.695 F9000
+G3 X140.197 Y109.750 I-2.750 J0 E0.4989 F3600
+G1 X127.011 Y132.361 F9000
+G2 X127.011 Y132.361 I-3.500 J0 E0.7257 F3600
+G1 X103.552 Y139.994 F9000
+G3 X99.302 Y144.244 I-4.250 J0 E0.2203 F3600
+G1 X80.374 Y131.520 F9000
+G2 X71.838 Y127.985 I-5.000 J0 E0.3888 F3600
+G1 X67.113 Y110.353 F9000
+G3 X55.613 Y110.353 I-5.750 J0 E0.5961 F3600
+G1 X69.413 Y85.016 F9000
+G2 X58.316 Y89.612 I-6.500 J0 E0.8423 F3600
+G1 X86.648 Y65.713 F9000
+G3 X79.398 Y58.463 I-7.250 J0 E1.1274 F3600
+G1 X112.181 Y60.219 F9000
+G2 X109.838 Y65.876 I-8.000 J0 E1.4514 F3600
+G1 X136.030 Y70.746 F9000
+G3 X136.030 Y70.746 I-8.750 J0 E1.8143 F3600
+G1 X148.892 Y93.054 F9000
+G2 X139.392 Y83.554 I-9.500 J0 E0.4924 F3600
+G1 X145.890 Y118.160 F9000
+G3 X128.392 Y125.407 I-10.250 J0 E0.7970 F3600
+G1 X128.535 Y135.952 F9000
+G2 X106.535 Y135.952 I-11.000 J0 E1.1404 F3600
+G1 X104.118 Y139.265 F9000
+G3 X84.059 Y130.957 I-11.750 J0 E1.5227 F3600
+G1 X82.774 Y126.765 F9000
+G2 X70.274 Y139.265 I-12.500 J0 E1.9439 F3600
+G1 X73.402 Y103.486 F9000
+G3 X69.521 Y94.117 I-13.250 J0 E2.4039 F3600
+G1 X80.078 Y78.803 F9000
+G2 X80.078 Y78.803 I-14.000 J0 E2.9028 F3600
+G1 X87.665 Y62.657 F9000
+G3 X85.665 Y64.657 I-2.000 J0 E0.1037 F3600
+G1 X113.775 Y61.550 F9000
+G2 X109.081 Y59.605 I-2.750 J0 E0.2138 F3600
+G1 X135.445 Y75.927 F9000
+G3 X128.445 Y75.927 I-3.500 J0 E0.3629 F3600
+G1 X144.250 Y100.000 F9000
+G2 X136.995 Y103.005 I-4.250 J0 E0.5508 F3600
+G1 X136.945 Y124.073 F9000
+G3 X131.945 Y119.073 I-5.000 J0 E0.7775 F3600
+G1 X116.775 Y138.450 F9000
+G2 X115.091 Y142.516 I-5.750 J0 E1.0432 F3600
+G1 X92.165 Y137.343 F9000
+G3 X92.165 Y137.343 I-6.500 J0 E1.3477 F3600
+G1 X73.328 Y121.197 F9000
+G2 X66.078 Y113.947 I-7.250 J0 E0.3758 F3600
+G1 X68.152 Y96.514 F9000
+G3 X54.495 Y102.171 I-8.000 J0 E0.6220 F3600
+G1 X79.024 Y73.235 F9000
+G2 X61.524 Y73.235 I-8.750 J0 E0.9071 F3600
+G1 X101.868 Y60.735 F9000
+G3 X85.650 Y54.017 I-9.500 J0 E1.2311 F3600
+G1 X127.785 Y64.048 F9000
+G2 X117.535 Y74.298 I-10.250 J0 E1.5940 F3600
+G1 X146.640 Y81.840 F9000
+G3 X143.418 Y74.062 I-11.000 J0 E1.9957 F3600
+G1 X151.142 Y106.946 F9000
+G2 X151.142 Y106.946 I-11.750 J0 E2.4363 F3600
+G1 X139.780 Y129.254 F9000
+G3 X127.280 Y141.754 I-12.500 J0 E0.6480 F3600
+G1 X117.431 Y139.781 F9000
+G2 X94.812 Y130.412 I-13.250 J0 E1.0302 F3600
+G1 X93.398 Y134.287 F9000
+G3 X65.398 Y134.287 I-14.000 J0 E1.4514 F3600
+G1 X64.913 Y114.984 F9000
+G2 X61.498 Y116.398 I-2.000 J0 E0.2592 F3600
+G1 X64.113 Y89.647 F9000
+G3 X61.363 Y86.897 I-2.750 J0 E0.4276 F3600
+G1 X78.874 Y68.480 F9000
+G2 X77.848 Y70.954 I-3.500 J0 E0.6350 F3600
+G1 X103.552 Y60.006 F9000
+G3 X103.552 Y60.006 I-4.250 J0 E0.8812 F3600
+G1 X128.511 Y67.639 F9000
+G2 X123.511 Y62.639 I-5.000 J0 E0.2592 F3600
+G1 X144.002 Y88.305 F9000
+G3 X134.186 Y92.371 I-5.750 J0 E0.4471 F3600
+G1 X144.088 Y113.681 F9000
+G2 X131.088 Y113.681 I-6.500 J0 E0.6739 F3600
+G1 X129.036 Y133.547 F9000
+G3 X116.659 Y128.420 I-7.250 J0 E0.9395 F3600
+G1 X105.210 Y139.903 F9000
+G2 X97.210 Y147.903 I-8.000 J0 E1.2441 F3600
+G1 X82.508 Y130.188 F9000
+G3 X79.945 Y124.001 I-8.750 J0 E1.5875 F3600
+G1 X70.374 Y108.316 F9000
+G2 X70.374 Y108.316 I-9.500 J0 E1.9698 F3600
+G1 X73.998 Y83.095 F9000
+G3 X63.748 Y93.345 I-10.250 J0 E0.5313 F3600
+G1 X92.221 Y64.682 F9000
+G2 X73.443 Y56.904 I-11.000 J0 E0.8553 F3600
+G1 X118.007 Y60.492 F9000
+G3 X94.507 Y60.492 I-11.750 J0 E1.2182 F3600
+G1 X141.274 Y72.214 F9000
+G2 X119.935 Y81.052 I-12.500 J0 E1.6199 F3600
+G1 X152.952 Y95.125 F9000
+G3 X139.702 Y81.875 I-13.250 J0 E2.0605 F3600
+G1 X148.641 Y120.000 F9000
+G2 X144.541 Y129.899 I-14.000 J0 E2.5400 F3600
+G1 X117.629 Y136.820 F9000
+G3 X117.629 Y136.820 I-2.000 J0 E0.4147 F3600
+G1 X93.073 Y138.812 F9000
+G2 X90.323 Y136.062 I-2.750 J0 E0.1425 F3600
+G1 X72.414 Y125.173 F9000
+G3 X66.439 Y127.648 I-3.500 J0 E0.2721 F3600
+G1 X64.274 Y101.396 F9000
+G2 X55.774 Y101.396 I-4.250 J0 E0.4406 F3600
+G1 X72.234 Y77.057 F9000
+G3 X63.698 Y73.521 I-5.000 J0 E0.6480 F3600
+G1 X93.389 Y61.958 F9000
+G2 X87.639 Y67.708 I-5.750 J0 E0.8942 F3600
+G1 X119.523 Y62.179 F9000
+G3 X117.619 Y57.583 I-6.500 J0 E1.1793 F3600
+G1 X140.412 Y77.632 F9000
+G2 X140.412 Y77.632 I-7.250 J0 E1.5033 F3600
+G1 X147.945 Y102.093 F9000
+G3 X139.945 Y110.093 I-8.000 J0 E0.4147 F3600
+G1 X139.392 Y125.712 F9000
+G2 X124.455 Y119.524 I-8.750 J0 E0.6804 F3600
+G1 X118.498 Y138.975 F9000
+G3 X99.498 Y138.975 I-9.500 J0 E0.9849 F3600
+G1 X93.981 Y136.542 F9000
+G2 X76.483 Y143.790 I-10.250 J0 E1.3283 F3600
+G1 X76.015 Y119.392 F9000
+G3 X65.015 Y108.392 I-11.000 J0 E1.7106 F3600
+G1 X72.139 Y94.433 F9000
+G2 X68.698 Y102.742 I-11.750 J0 E2.1318 F3600
+G1 X84.216 Y71.716 F9000
+G3 X84.216 Y71.716 I-12.500 J0 E2.5918 F3600
+G1 X107.683 Y60.389 F9000
+G2 X94.433 Y47.139 I-13.250 J0 E0.6868 F3600
+G1 X133.392 Y65.015 F9000
+G3 X109.493 Y74.915 I-14.000 J0 E1.0886 F3600
+G1 X138.542 Y83.731 F9000
+G2 X134.542 Y83.731 I-2.000 J0 E0.2073 F3600
+G1 X141.725 Y108.998 F9000
+G3 X137.030 Y107.053 I-2.750 J0 E0.3564 F3600
+G1 X129.212 Y130.642 F9000
+G2 X125.712 Y134.142 I-3.500 J0 E0.5443 F3600
+G1 X106.343 Y139.945 F9000
+G3 X105.099 Y136.940 I-4.250 J0 E0.7711 F3600
+G1 X82.632 Y133.162 F9000
+G2 X82.632 Y133.162 I-5.000 J0 E1.0367 F3600
+G1 X67.929 Y113.023 F9000
+G3 X62.179 Y118.773 I-5.750 J0 E0.2981 F3600
+G1 X68.458 Y87.639 F9000
+G2 X57.362 Y83.043 I-6.500 J0 E0.5054 F3600
+G1 X84.307 Y67.234 F9000
+G3 X69.807 Y67.234 I-7.250 J0 E0.7516 F3600
+G1 X109.396 Y60.024 F9000
+G2 X95.739 Y65.681 I-8.000 J0 E1.0367 F3600
+G1 X133.923 Y68.914 F9000
+G3 X125.173 Y60.164 I-8.750 J0 E1.3607 F3600
+G1 X148.312 Y90.323 F9000
+G2 X145.529 Y97.041 I-9.500 J0 E1.7236 F3600
+G1 X147.070 Y115.629 F9000
+G3 X147.070 Y115.629 I-10.250 J0 E2.1253 F3600
+G1 X131.000 Y134.641 F9000
+G2 X120.000 Y123.641 I-11.000 J0 E0.5702 F3600
+G1 X106.875 Y139.702 F9000
+G3 X86.817 Y148.010 I-11.750 J0 E0.9136 F3600
+G1 X84.714 Y128.774 F9000
+G2 X59.714 Y128.774 I-12.500 J0 E1.2959 F3600
+G1 X73.742 Y106.257 F9000
+G3 X51.123 Y96.888 I-13.250 J0 E1.7171 F3600
+G1 X78.682 Y81.221 F9000
+G2 X64.682 Y95.221 I-14.000 J0 E2.1771 F3600
+G1 X85.095 Y63.748 F9000
+G3 X84.509 Y62.333 I-2.000 J0 E0.3629 F3600
+G1 X111.066 Y60.874 F9000
+G2 X111.066 Y60.874 I-2.750 J0 E0.5702 F3600
+G1 X133.688 Y73.758 F9000
+G3 X130.188 Y77.258 I-3.500 J0 E0.1814 F3600
+G1 X144.153 Y97.210 F9000
+G2 X136.897 Y94.205 I-4.250 J0 E0.3305 F3600
+G1 X138.547 Y121.786 F9000
+G3 X128.547 Y121.786 I-5.000 J0 E0.5184 F3600
+G1 X119.431 Y137.588 F9000
+G2 X109.615 Y141.654 I-5.750 J0 E0.7451 F3600
+G1 X94.805 Y138.252 F9000
+G3 X88.305 Y131.752 I-6.500 J0 E1.0108 F3600
+G1 X74.889 Y123.511 F9000
+G2 X72.766 Y128.638 I-7.250 J0 E1.3153 F3600
+G1 X68.006 Y99.302 F9000
+G3 X68.006 Y99.302 I-8.000 J0 E1.6588 F3600
+G1 X77.230 Y75.374 F9000
+G2 X68.480 Y66.624 I-8.750 J0 E0.4536 F3600
+G1 X99.147 Y61.363 F9000
+G3 X82.930 Y68.080 I-9.500 J0 E0.7387 F3600
+G1 X125.234 Y62.913 F9000
+G2 X104.734 Y62.913 I-10.250 J0 E1.0626 F3600
+G1 X145.287 Y79.398 F9000
+G3 X126.509 Y71.620 I-11.000 J0 E1.4255 F3600
+G1 X151.531 Y104.181 F9000
+G2 X139.781 Y115.931 I-11.750 J0 E1.8272 F3600
+G1 X141.754 Y127.280 F9000
+G3 X138.093 Y118.441 I-12.500 J0 E2.2678 F3600
+G1 X120.196 Y139.392 F9000
+G2 X120.196 Y139.392 I-13.250 J0 E2.7473 F3600
+G1 X95.840 Y135.640 F9000
+G3 X81.840 Y149.640 I-14.000 J0 E0.7257 F3600
+G1 X66.048 Y117.535 F9000
+G2 X62.634 Y116.121 I-2.000 J0 E0.1555 F3600
+G1 X63.485 Y92.368 F9000
+G3 X57.985 Y92.368 I-2.750 J0 E0.2851 F3600
+G1 X76.735 Y70.274 F9000
+G2 X70.760 Y72.749 I-3.500 J0 E0.4536 F3600
+G1 X100.764 Y60.152 F9000
+G3 X96.514 Y55.902 I-4.250 J0 E0.6609 F3600
+G1 X126.197 Y66.078 F9000
+G2 X124.732 Y69.614 I-5.000 J0 E0.9071 F3600
+G1 X143.093 Y85.665 F9000
+G3 X143.093 Y85.665 I-5.750 J0 E1.1922 F3600
+G1 X144.950 Y111.025 F9000
+G2 X138.450 Y104.525 I-6.500 J0 E0.3369 F3600
+G1 X131.323 Y131.945 F9000
+G3 X118.946 Y137.072 I-7.250 J0 E0.5637 F3600
+G1 X108.000 Y140.000 F9000
+G2 X92.000 Y140.000 I-8.000 J0 E0.8294 F3600
+G1 X84.677 Y131.945 F9000
+G3 X69.740 Y125.758 I-8.750 J0 E1.1339 F3600
+G1 X71.050 Y111.025 F9000
+G2 X61.550 Y120.525 I-9.500 J0 E1.4773 F3600
+G1 X72.907 Y85.665 F9000
+G3 X69.905 Y78.417 I-10.250 J0 E1.8596 F3600
+G1 X89.803 Y66.078 F9000
+G2 X89.803 Y66.078 I-11.000 J0 E2.2808 F3600
+G1 X115.236 Y60.152 F9000
+G3 X103.486 Y71.902 I-11.750 J0 E0.6091 F3600
+G1 X139.265 Y70.274 F9000
+G2 X117.926 Y61.435 I-12.500 J0 E0.9719 F3600
+G1 X152.515 Y92.368 F9000
+G3 X126.015 Y92.368 I-13.250 J0 E1.3737 F3600
+G1 X149.952 Y117.535 F9000
+G2 X126.052 Y127.434 I-14.000 J0 E1.8143 F3600
+G1 X120.160 Y135.640 F9000
+G3 X118.160 Y133.640 I-2.000 J0 E0.3110 F3600
+G1 X95.804 Y139.392 F9000
+G2 X94.999 Y141.337 I-2.750 J0 E0.4989 F3600
+G1 X74.246 Y127.280 F9000
+G3 X74.246 Y127.280 I-3.500 J0 E0.7257 F3600
+G1 X64.469 Y104.181 F9000
+G2 X60.219 Y99.931 I-4.250 J0 E0.2203 F3600
+G1 X70.713 Y79.398 F9000
+G3 X62.178 Y82.934 I-5.000 J0 E0.3888 F3600
+G1 X90.766 Y62.913 F9000
+G2 X79.266 Y62.913 I-5.750 J0 E0.5961 F3600
+G1 X116.853 Y61.363 F9000
+G3 X105.757 Y56.767 I-6.500 J0 E0.8423 F3600
+G1 X138.770 Y75.374 F9000
+G2 X131.520 Y82.624 I-7.250 J0 E1.1274 F3600
+G1 X147.994 Y99.302 F9000
+G3 X145.651 Y93.645 I-8.000 J0 E1.4514 F3600
+G1 X141.111 Y123.511 F9000
+G2 X141.111 Y123.511 I-8.750 J0 E1.8143 F3600
+G1 X121.195 Y138.252 F9000
+G3 X111.695 Y147.752 I-9.500 J0 E0.4924 F3600
+G1 X96.569 Y137.588 F9000
+G2 X79.071 Y130.340 I-10.250 J0 E0.7970 F3600
+G1 X77.453 Y121.786 F9000
+G3 X55.453 Y121.786 I-11.000 J0 E1.1404 F3600
+G1 X71.847 Y97.210 F9000
+G2 X51.789 Y105.518 I-11.750 J0 E1.5227 F3600
+G1 X82.312 Y73.758 F9000
+G3 X69.812 Y61.258 I-12.500 J0 E1.9439 F3600
+G1 X104.934 Y60.874 F9000
+G2 X101.053 Y70.243 I-13.250 J0 E2.4039 F3600
+G1 X130.905 Y63.748 F9000
+G3 X130.905 Y63.748 I-14.000 J0 E2.9028 F3600
+G1 X137.318 Y81.221 F9000
+G2 X135.318 Y79.221 I-2.000 J0 E0.1037 F3600
+G1 X142.258 Y106.257 F9000
+G3 X137.563 Y108.202 I-2.750 J0 E0.2138 F3600
+G1 X131.286 Y128.774 F9000
+G2 X124.286 Y128.774 I-3.500 J0 E0.3629 F3600
+G1 X109.125 Y139.702 F9000
+G3 X101.870 Y136.697 I-4.250 J0 E0.5508 F3600
+G1 X85.000 Y134.641 F9000
+G2 X80.000 Y139.641 I-5.000 J0 E0.7775 F3600
+G1 X68.930 Y115.629 F9000
+G3 X67.246 Y111.563 I-5.750 J0 E1.0432 F3600
+G1 X67.688 Y90.323 F9000
+G2 X67.688 Y90.323 I-6.500 J0 E1.3477 F3600
+G1 X82.077 Y68.914 F9000
+G3 X74.827 Y76.164 I-7.250 J0 E0.3758 F3600
+G1 X106.604 Y60.024 F9000
+G2 X92.947 Y54.368 I-8.000 J0 E0.6220 F3600
+G1 X131.693 Y67.234 F9000
+G3 X114.193 Y67.234 I-8.750 J0 E0.9071 F3600
+G1 X147.542 Y87.639 F9000
+G2 X131.325 Y94.357 I-9.500 J0 E1.2311 F3600
+G1 X148.071 Y113.023 F9000
+G3 X137.821 Y102.773 I-10.250 J0 E1.5940 F3600
+G1 X133.368 Y133.162 F9000
+G2 X130.146 Y140.940 I-11.000 J0 E1.9957 F3600
+G1 X109.657 Y139.945 F9000
+G3 X109.657 Y139.945 I-11.750 J0 E2.4363 F3600
+G1 X86.788 Y130.642 F9000
+G2 X74.288 Y118.142 I-12.500 J0 E0.6480 F3600
+G1 X74.275 Y108.998 F9000
+G3 X51.656 Y118.367 I-13.250 J0 E1.0302 F3600
+G1 X77.458 Y83.731 F9000
+G2 X49.458 Y83.731 I-14.000 J0 E1.4514 F3600
+G1 X82.608 Y65.015 F9000
+G3 X79.193 Y63.601 I-2.000 J0 E0.2592 F3600
+G1 X108.317 Y60.389 F9000
+G2 X105.567 Y63.139 I-2.750 J0 E0.4276 F3600
+G1 X131.784 Y71.716 F9000
+G3 X130.759 Y69.241 I-3.500 J0 E0.6350 F3600
+G1 X143.861 Y94.433 F9000
+G2 X143.861 Y94.433 I-4.250 J0 E0.8812 F3600
+G1 X139.985 Y119.392 F9000
+G3 X134.985 Y124.392 I-5.000 J0 E0.2592 F3600
+G1 X122.019 Y136.542 F9000
+G2 X112.204 Y132.476 I-5.750 J0 E0.4471 F3600
+G1 X97.502 Y138.975 F9000
+G3 X84.502 Y138.975 I-6.500 J0 E0.6739 F3600
+G1 X76.608 Y125.712 F9000
+G2 X64.232 Y130.838 I-7.250 J0 E0.9395 F3600
+G1 X68.055 Y102.093 F9000
+G3 X60.055 Y94.093 I-8.000 J0 E1.2441 F3600
+G1 X75.588 Y77.632 F9000
+G2 X73.026 Y83.819 I-8.750 J0 E1.5875 F3600
+G1 X96.477 Y62.179 F9000
+G3 X96.477 Y62.179 I-9.500 J0 E1.9698 F3600
+G1 X122.611 Y61.958 F9000
+G2 X112.361 Y51.708 I-10.250 J0 E0.5313 F3600
+G1 X143.766 Y77.057 F9000
+G3 X124.988 Y84.835 I-11.000 J0 E0.8553 F3600
+G1 X151.726 Y101.396 F9000
+G2 X128.226 Y101.396 I-11.750 J0 E1.2182 F3600
+G1 X143.586 Y125.173 F9000
+G3 X122.247 Y116.334 I-12.500 J0 E1.6199 F3600
+G1 X122.927 Y138.812 F9000
+G2 X109.677 Y152.062 I-13.250 J0 E2.0605 F3600
+G1 X98.371 Y136.820 F9000
+G3 X94.270 Y126.921 I-14.000 J0 E2.5400 F3600
+G1 X67.359 Y120.000 F9000
+G2 X67.359 Y120.000 I-2.000 J0 E0.4147 F3600
+G1 X63.048 Y95.125 F9000
+G3 X60.298 Y97.875 I-2.750 J0 E0.1425 F3600
+G1 X74.726 Y72.214 F9000
+G2 X68.752 Y69.739 I-3.500 J0 E0.2721 F3600
+G1 X97.993 Y60.492 F9000
+G3 X89.493 Y60.492 I-4.250 J0 E0.4406 F3600
+G1 X123.779 Y64.682 F9000
+G2 X115.243 Y68.218 I-5.000 J0 E0.6480 F3600
+G1 X142.002 Y83.095 F9000
+G3 X136.252 Y77.345 I-5.750 J0 E0.8942 F3600
+G1 X145.626 Y108.316 F9000
+G2 X143.722 Y112.913 I-6.500 J0 E1.1793 F3600
+G1 X133.492 Y130.188 F9000
+G3 X133.492 Y130.188 I-7.250 J0 E1.5033 F3600
+G1 X110.790 Y139.903 F9000
+G2 X102.790 Y131.903 I-8.000 J0 E0.4147 F3600
+G1 X86.964 Y133.547 F9000
+G3 X72.027 Y139.734 I-8.750 J0 E0.6804 F3600
+G1 X71.912 Y113.681 F9000
+G2 X52.912 Y113.681 I-9.500 J0 E0.9849 F3600
+G1 X71.998 Y88.305 F9000
+G3 X54.500 Y81.057 I-10.250 J0 E1.3283 F3600
+G1 X87.489 Y67.639 F9000
+G2 X76.489 Y78.639 I-11.000 J0 E1.7106 F3600
+G1 X112.448 Y60.006 F9000
+G3 X109.007 Y51.698 I-11.750 J0 E2.1318 F3600
+G1 X137.126 Y68.480 F9000
+G2 X137.126 Y68.480 I-12.500 J0 E2.5918 F3600
+G1 X151.887 Y89.647 F9000
+G3 X138.637 Y102.897 I-13.250 J0 E0.6868 F3600
+G1 X151.087 Y114.984 F9000
+G2 X127.188 Y105.085 I-14.000 J0 E1.0886 F3600
+G1 X122.602 Y134.287 F9000
+G3 X118.602 Y134.287 I-2.000 J0 E0.2073 F3600
+G1 X98.569 Y139.781 F9000
+G2 X93.874 Y141.725 I-2.750 J0 E0.3564 F3600
+G1 X76.220 Y129.254 F9000
+G3 X72.720 Y125.754 I-3.500 J0 E0.5443 F3600
+G1 X64.858 Y106.946 F9000
+G2 X63.613 Y109.951 I-4.250 J0 E0.7711 F3600
+G1 X69.360 Y81.840 F9000
+G3 X69.360 Y81.840 I-5.000 J0 E1.0367 F3600
+G1 X88.215 Y64.048 F9000
+G2 X82.465 Y58.298 I-5.750 J0 E0.2981 F3600
+G1 X114.132 Y60.735 F9000
+G3 X103.036 Y65.331 I-6.500 J0 E0.5054 F3600
+G1 X136.976 Y73.235 F9000
+G2 X122.476 Y73.235 I-7.250 J0 E0.7516 F3600
+G1 X147.848 Y96.514 F9000
+G3 X134.191 Y90.857 I-8.000 J0 E1.0367 F3600
+G1 X142.672 Y121.197 F9000
+G2 X133.922 Y129.947 I-8.750 J0 E1.3607 F3600
+G1 X123.835 Y137.343 F9000
+G3 X121.052 Y130.626 I-9.500 J0 E1.7236 F3600
+G1 X99.225 Y138.450 F9000
+G2 X99.225 Y138.450 I-10.250 J0 E2.1253 F3600
+G1 X79.055 Y124.073 F9000
+G3 X68.055 Y135.073 I-11.000 J0 E0.5702 F3600
+G1 X71.750 Y100.000 F9000
+G2 X51.691 Y91.691 I-11.750 J0 E0.9136 F3600
+G1 X80.555 Y75.927 F9000
+G3 X55.555 Y75.927 I-12.500 J0 E1.2959 F3600
+G1 X102.225 Y61.550 F9000
+G2 X79.605 Y70.919 I-13.250 J0 E1.7171 F3600
+G1 X128.335 Y62.657 F9000
+G3 X114.335 Y48.657 I-14.000 J0 E2.1771 F3600
+G1 X135.922 Y78.803 F9000
+G2 X135.336 Y80.217 I-2.000 J0 E0.3629 F3600
+G1 X142.598 Y103.486 F9000
+G3 X142.598 Y103.486 I-2.750 J0 E0.5702 F3600
+G1 X133.226 Y126.765 F9000
+G2 X129.726 Y123.265 I-3.500 J0 E0.1814 F3600
+G1 X111.882 Y139.265 F9000
+G3 X104.627 Y142.270 I-4.250 J0 E0.3305 F3600
+G1 X87.465 Y135.952 F9000
+G2 X77.465 Y135.952 I-5.000 J0 E0.5184 F3600
+G1 X70.110 Y118.160 F9000
+G3 X60.294 Y114.094 I-5.750 J0 E0.7451 F3600
+G1 X67.108 Y93.054 F9000
+G2 X60.608 Y99.554 I-6.500 J0 E1.0108 F3600
+G1 X79.970 Y70.746 F9000
+G3 X77.847 Y65.619 I-7.250 J0 E1.3153 F3600
+G1 X103.819 Y60.219 F9000
+G2 X103.819 Y60.219 I-8.000 J0 E1.6588 F3600
+G1 X129.352 Y65.713 F9000
+G3 X120.602 Y74.463 I-8.750 J0 E0.4536 F3600
+G1 X146.587 Y85.016 F9000
+G2 X130.370 Y78.298 I-9.500 J0 E0.7387 F3600
+G1 X148.887 Y110.353 F9000
+G3 X128.387 Y110.353 I-10.250 J0 E1.0626 F3600
+G1 X135.626 Y131.520 F9000
+G2 X116.848 Y139.299 I-11.000 J0 E1.4255 F3600
+G1 X112.448 Y139.994 F9000
+G3 X100.698 Y128.244 I-11.750 J0 E1.8272 F3600
+G1 X88.989 Y132.361 F9000
+G2 X85.327 Y141.200 I-12.500 J0 E2.2678 F3600
+G1 X74.998 Y111.695 F9000
+G3 X74.998 Y111.695 I-13.250 J0 E2.7473 F3600
+G1 X76.412 Y86.319 F9000
+G2 X62.412 Y72.319 I-14.000 J0 E0.7257 F3600
+G1 X80.214 Y66.453 F9000
+G3 X76.800 Y67.867 I-2.000 J0 E0.1555 F3600
+G1 X105.540 Y60.097 F9000
+G2 X100.040 Y60.097 I-2.750 J0 E0.2851 F3600
+G1 X129.742 Y69.812 F9000
+G3 X123.767 Y67.337 I-3.500 J0 E0.4536 F3600
+G1 X143.376 Y91.684 F9000
+G2 X139.126 Y95.934 I-4.250 J0 E0.6609 F3600
+G1 X141.252 Y116.905 F9000
+G3 X139.788 Y113.369 I-5.000 J0 E0.9071 F3600
+G1 X124.529 Y135.318 F9000
+G2 X124.529 Y135.318 I-5.750 J0 E1.1922 F3600
+G1 X100.243 Y139.508 F9000
+G3 X93.743 Y146.008 I-6.500 J0 E0.3369 F3600
+G1 X78.476 Y127.786 F9000
+G2 X66.100 Y122.660 I-7.250 J0 E0.5637 F3600
+G1 X68.298 Y104.875 F9000
+G3 X52.298 Y104.875 I-8.000 J0 E0.8294 F3600
+G1 X74.109 Y80.000 F9000
+G2 X59.172 Y86.187 I-8.750 J0 E1.1339 F3600
+G1 X93.871 Y63.180 F9000
+G3 X84.371 Y53.680 I-9.500 J0 E1.4773 F3600
+G1 X119.927 Y61.188 F9000
+G2 X116.925 Y68.436 I-10.250 J0 E1.8596 F3600
+G1 X142.086 Y74.827 F9000
+G3 X142.086 Y74.827 I-11.000 J0 E2.2808 F3600
+G1 X151.726 Y98.604 F9000
+G2 X139.976 Y86.854 I-11.750 J0 E0.6091 F3600
+G1 X145.266 Y122.943 F9000
+G3 X123.927 Y131.782 I-12.500 J0 E0.9719 F3600
+G1 X125.611 Y138.042 F9000
+G2 X99.111 Y138.042 I-13.250 J0 E1.3737 F3600
+G1 X100.977 Y137.821 F9000
+G3 X77.078 Y127.921 I-14.000 J0 E1.8143 F3600
+G1 X68.838 Y122.368 F9000
+G2 X66.838 Y124.368 I-2.000 J0 E0.3110 F3600
+G1 X62.805 Y97.907 F9000
+G3 X61.999 Y95.962 I-2.750 J0 E0.4989 F3600
+G1 X72.858 Y74.288 F9000
+G2 X72.858 Y74.288 I-3.500 J0 E0.7257 F3600
+G1 X95.252 Y61.025 F9000
+G3 X91.002 Y65.275 I-4.250 J0 E0.2203 F3600
+G1 X121.269 Y63.458 F9000
+G2 X112.734 Y59.923 I-5.000 J0 E0.3888 F3600
+G1 X140.735 Y80.608 F9000
+G3 X129.235 Y80.608 I-5.750 J0 E0.5961 F3600
+G1 X146.111 Y105.567 F9000
+G2 X135.015 Y110.163 I-6.500 J0 E0.8423 F3600
+G1 X135.534 Y128.284 F9000
+G3 X128.284 Y121.034 I-7.250 J0 E1.1274 F3600
+G1 X113.567 Y139.611 F9000
+G2 X111.224 Y145.268 I-8.000 J0 E1.4514 F3600
+G1 X89.358 Y134.985 F9000
+G3 X89.358 Y134.985 I-8.750 J0 E1.8143 F3600
+G1 X72.958 Y116.269 F9000
+G2 X63.458 Y106.769 I-9.500 J0 E0.4924 F3600
+G1 X71.275 Y91.002 F9000
+G3 X53.777 Y98.250 I-10.250 J0 E0.7970 F3600
+G1 X85.288 Y69.358 F9000
+G2 X63.288 Y69.358 I-11.000 J0 E1.1404 F3600
+G1 X109.657 Y60.055 F9000
+G3 X89.598 Y51.746 I-11.750 J0 E1.5227 F3600
+G1 X134.868 Y66.838 F9000
+G2 X122.368 Y79.338 I-12.500 J0 E1.9439 F3600
+G1 X151.071 Y86.977 F9000
+G3 X147.190 Y77.608 I-13.250 J0 E2.4039 F3600
+G1 X152.042 Y112.361 F9000
+G2 X152.042 Y112.361 I-14.000 J0 E2.9028 F3600
+G1 X124.943 Y132.766 F9000
+G3 X122.943 Y134.766 I-2.000 J0 E0.1037 F3600
+G1 X101.354 Y139.976 F9000
+G2 X96.659 Y138.031 I-2.750 J0 E0.2138 F3600
+G1 X78.327 Y131.086 F9000
+G3 X71.327 Y131.086 I-3.500 J0 E0.3629 F3600
+G1 X65.438 Y109.677 F9000
+G2 X58.183 Y112.682 I-4.250 J0 E0.5508 F3600
+G1 X68.180 Y84.371 F9000
+G3 X63.180 Y79.371 I-5.000 J0 E0.7775 F3600
+M400
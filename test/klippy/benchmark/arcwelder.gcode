@@ -0,0 +1,4582 @@
+; Benchmark - ArcWelder style G2/G3 output (chained arcs, wide radii)
+G28
+G90
+M83
+G1 Z0.3 F600
+G1 X100 Y100 F6000
+G1 X160.000 Y100.000 F9000
+G3 X137.560 Y146.789 I-60.000 J0.000 E1.77088 F3600
+G3 X99.446 Y159.997 I-37.560 J-46.789 E1.35759 F3600
+G3 X45.113 Y124.237 I0.554 J-59.997 E2.26854 F3600
+G3 X43.662 Y79.359 I54.887 J-24.237 E1.51872 F3600
+G3 X66.543 Y50.194 I56.338 J20.641 E1.24360 F3600
+G3 X132.018 Y49.257 I33.457 J49.806 E2.28574 F3600
+G3 X160.000 Y100.000 I-32.018 J50.743 E1.99564 F3600
+G1 X135.000 Y100.000 F9000
+G3 X92.699 Y134.230 I-35.000 J0.000 E2.05699 F3600
+G3 X67.304 Y87.511 I7.301 J-34.230 E1.99297 F3600
+G3 X88.535 Y66.931 I32.696 J12.489 E1.00739 F3600
+G3 X130.057 Y82.068 I11.465 J33.069 E1.57844 F3600
+G3 X135.000 Y100.000 I-30.057 J17.932 E0.62128 F3600
+G1 X118.000 Y100.000 F9000
+G3 X112.607 Y112.847 I-18.000 J0.000 E0.47212 F3600
+G3 X101.539 Y117.934 I-12.607 J-12.847 E0.41009 F3600
+G3 X87.408 Y112.862 I-1.539 J-17.934 E0.51106 F3600
+G3 X93.218 Y83.327 I12.592 J-12.862 E1.17640 F3600
+G3 X117.845 Y97.641 I6.782 J16.673 E1.08444 F3600
+G3 X118.000 Y100.000 I-17.845 J2.359 E0.07809 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X57.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y76.000 F9000
+G3 X56.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y92.000 F9000
+G3 X56.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y108.000 F9000
+G3 X57.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y124.000 F9000
+G3 X57.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y140.000 F9000
+G3 X57.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G1 Z0.600 F600
+G1 X160.000 Y100.000 F9000
+G2 X147.406 Y63.222 I-60.000 J0.000 E1.30643 F3600
+G2 X67.911 Y49.302 I-47.406 J36.778 E2.92103 F3600
+G2 X49.557 Y132.489 I32.089 J50.698 E3.12584 F3600
+G2 X118.860 Y156.959 I50.443 J-32.489 E2.61033 F3600
+G2 X154.074 Y125.999 I-18.860 J-56.959 E1.58968 F3600
+G2 X160.000 Y100.000 I-54.074 J-25.999 E0.88739 F3600
+G1 X135.000 Y100.000 F9000
+G2 X127.565 Y78.432 I-35.000 J0.000 E0.76685 F3600
+G2 X69.053 Y83.652 I-27.565 J21.568 E2.30035 F3600
+G2 X93.951 Y134.473 I30.947 J16.348 E2.17498 F3600
+G2 X132.748 Y112.352 I6.049 J-34.473 E1.59832 F3600
+G2 X135.000 Y100.000 I-32.748 J-12.352 E0.41657 F3600
+G1 X118.000 Y100.000 F9000
+G2 X93.316 Y83.287 I-18.000 J0.000 E1.15904 F3600
+G2 X82.484 Y104.144 I6.684 J16.713 E0.84507 F3600
+G2 X109.730 Y115.144 I17.516 J-4.144 E1.13427 F3600
+G2 X118.000 Y100.000 I-9.730 J-15.144 E0.59384 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X56.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y76.000 F9000
+G3 X60.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y92.000 F9000
+G3 X60.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y108.000 F9000
+G3 X57.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y108.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y108.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y108.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y124.000 F9000
+G3 X60.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y140.000 F9000
+G3 X60.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G1 Z0.900 F600
+G1 X160.000 Y100.000 F9000
+G3 X142.781 Y142.069 I-60.000 J0.000 E1.53846 F3600
+G3 X87.547 Y158.693 I-42.781 J-42.069 E1.98568 F3600
+G3 X45.671 Y74.536 I12.453 J-58.693 E3.56403 F3600
+G3 X69.101 Y48.568 I54.329 J25.464 E1.17120 F3600
+G3 X103.321 Y40.092 I30.899 J51.432 E1.18080 F3600
+G3 X159.998 Y99.523 I-3.321 J59.908 E2.98479 F3600
+G3 X160.000 Y100.000 I-59.998 J0.477 E0.01575 F3600
+G1 X135.000 Y100.000 F9000
+G3 X107.208 Y134.250 I-35.000 J0.000 E1.57470 F3600
+G3 X69.529 Y117.220 I-7.208 J-34.250 E1.45971 F3600
+G3 X70.120 Y81.773 I30.471 J-17.220 E1.22677 F3600
+G3 X130.653 Y83.106 I29.880 J18.227 E2.41409 F3600
+G3 X135.000 Y100.000 I-30.653 J16.894 E0.58180 F3600
+G1 X118.000 Y100.000 F9000
+G3 X106.989 Y116.588 I-18.000 J0.000 E0.69618 F3600
+G3 X92.281 Y116.261 I-6.989 J-16.588 E0.50012 F3600
+G3 X83.350 Y93.161 I7.719 J-16.261 E0.90133 F3600
+G3 X96.012 Y82.447 I16.650 J6.839 E0.56882 F3600
+G3 X113.631 Y88.244 I3.988 J17.553 E0.64303 F3600
+G3 X118.000 Y100.000 I-13.631 J11.756 E0.42274 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X57.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y76.000 F9000
+G3 X56.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y92.000 F9000
+G3 X57.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y108.000 F9000
+G3 X55.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y124.000 F9000
+G3 X55.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y140.000 F9000
+G3 X56.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G1 Z1.200 F600
+G1 X160.000 Y100.000 F9000
+G2 X134.438 Y50.867 I-60.000 J0.000 E1.89973 F3600
+G2 X55.855 Y59.365 I-34.438 J49.133 E2.84747 F3600
+G2 X74.605 Y154.361 I44.145 J40.635 E3.71801 F3600
+G2 X116.491 Y157.689 I25.395 J-54.361 E1.41662 F3600
+G2 X160.000 Y100.000 I-16.491 J-57.689 E2.55888 F3600
+G1 X135.000 Y100.000 F9000
+G2 X119.479 Y70.921 I-35.000 J0.000 E1.13257 F3600
+G2 X100.920 Y65.012 I-19.479 J29.079 E0.65134 F3600
+G2 X69.498 Y82.835 I-0.920 J34.988 E1.25260 F3600
+G2 X65.346 Y104.911 I30.502 J17.165 E0.75463 F3600
+G2 X120.010 Y128.716 I34.654 J-4.911 E2.35457 F3600
+G2 X135.000 Y100.000 I-20.010 J-28.716 E1.11136 F3600
+G1 X118.000 Y100.000 F9000
+G2 X99.758 Y82.002 I-18.000 J0.000 E0.94103 F3600
+G2 X84.379 Y91.057 I0.242 J17.998 E0.61624 F3600
+G2 X84.297 Y108.799 I15.621 J8.943 E0.61222 F3600
+G2 X99.439 Y117.991 I15.703 J-8.799 E0.61116 F3600
+G2 X112.039 Y113.382 I0.561 J-17.991 E0.45369 F3600
+G2 X118.000 Y100.000 I-12.039 J-13.382 E0.49788 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X55.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y76.000 F9000
+G3 X57.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y92.000 F9000
+G3 X56.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y92.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y92.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y108.000 F9000
+G3 X60.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y124.000 F9000
+G3 X57.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y140.000 F9000
+G3 X56.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y140.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y140.000 I0.750 J0.000 E0.07775 F3600
+G1 Z1.500 F600
+G1 X160.000 Y100.000 F9000
+G3 X136.522 Y147.604 I-60.000 J0.000 E1.81442 F3600
+G3 X56.552 Y141.379 I-36.522 J-47.604 E2.89913 F3600
+G3 X40.004 Y99.268 I43.448 J-41.379 E1.53095 F3600
+G3 X91.937 Y40.544 I59.996 J0.732 E2.81914 F3600
+G3 X149.135 Y65.565 I8.063 J59.456 E2.16673 F3600
+G3 X160.000 Y100.000 I-49.135 J34.435 E1.21035 F3600
+G1 X135.000 Y100.000 F9000
+G3 X115.962 Y131.148 I-35.000 J0.000 E1.26731 F3600
+G3 X66.152 Y108.906 I-15.962 J-31.148 E2.06406 F3600
+G3 X109.062 Y66.193 I33.848 J-8.906 E2.41392 F3600
+G3 X135.000 Y100.000 I-9.062 J33.807 E1.51179 F3600
+G1 X118.000 Y100.000 F9000
+G3 X106.292 Y116.864 I-18.000 J0.000 E0.72093 F3600
+G3 X91.497 Y115.865 I-6.292 J-16.864 E0.50438 F3600
+G3 X88.594 Y86.075 I8.503 J-15.865 E1.16619 F3600
+G3 X100.284 Y82.002 I11.406 J13.925 E0.41703 F3600
+G3 X110.708 Y85.531 I-0.284 J17.998 E0.36906 F3600
+G3 X118.000 Y100.000 I-10.708 J14.469 E0.55462 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X56.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y76.000 F9000
+G3 X55.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y76.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y76.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y76.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y92.000 F9000
+G3 X60.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y108.000 F9000
+G3 X56.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y124.000 F9000
+G3 X57.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y140.000 F9000
+G3 X55.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G1 Z1.800 F600
+G1 X160.000 Y100.000 F9000
+G2 X145.279 Y60.633 I-60.000 J0.000 E1.41702 F3600
+G2 X71.245 Y47.339 I-45.279 J39.367 E2.68276 F3600
+G2 X52.899 Y137.168 I28.755 J52.661 E3.44336 F3600
+G2 X115.647 Y157.924 I47.101 J-37.168 E2.30979 F3600
+G2 X160.000 Y100.000 I-15.647 J-57.924 E2.58779 F3600
+G1 X135.000 Y100.000 F9000
+G2 X110.234 Y66.530 I-35.000 J0.000 E1.47155 F3600
+G2 X80.042 Y71.248 I-10.234 J33.470 E1.04356 F3600
+G2 X65.730 Y107.111 I19.958 J28.752 E1.34974 F3600
+G2 X75.269 Y124.766 I34.270 J-7.111 E0.67165 F3600
+G2 X113.648 Y132.230 I24.731 J-24.766 E1.36897 F3600
+G2 X133.858 Y108.868 I-13.648 J-32.230 E1.05576 F3600
+G2 X135.000 Y100.000 I-33.858 J-8.868 E0.29587 F3600
+G1 X118.000 Y100.000 F9000
+G2 X95.404 Y82.597 I-18.000 J0.000 E1.08643 F3600
+G2 X82.000 Y99.895 I4.596 J17.403 E0.77622 F3600
+G2 X84.821 Y109.675 I18.000 J0.105 E0.34055 F3600
+G2 X98.560 Y117.942 I15.179 J-9.675 E0.54838 F3600
+G2 X113.213 Y112.224 I1.440 J-17.942 E0.53718 F3600
+G2 X118.000 Y100.000 I-13.213 J-12.224 E0.44346 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X56.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y76.000 F9000
+G3 X60.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y92.000 F9000
+G3 X57.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y108.000 F9000
+G3 X56.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y124.000 F9000
+G3 X57.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y140.000 F9000
+G3 X55.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G1 Z2.100 F600
+G1 X160.000 Y100.000 F9000
+G3 X79.290 Y156.312 I-60.000 J0.000 E3.80797 F3600
+G3 X41.205 Y111.963 I20.710 J-56.312 E2.01493 F3600
+G3 X47.531 Y70.897 I58.795 J-11.963 E1.40017 F3600
+G3 X120.806 Y43.723 I52.469 J29.103 E2.80862 F3600
+G3 X160.000 Y100.000 I-20.806 J56.277 E2.40902 F3600
+G1 X135.000 Y100.000 F9000
+G3 X100.753 Y134.992 I-35.000 J0.000 E1.78942 F3600
+G3 X66.556 Y89.681 I-0.753 J-34.992 E2.18480 F3600
+G3 X112.947 Y67.483 I33.444 J10.319 E1.90623 F3600
+G3 X128.794 Y80.103 I-12.947 J32.517 E0.67824 F3600
+G3 X135.000 Y100.000 I-28.794 J19.897 E0.69839 F3600
+G1 X118.000 Y100.000 F9000
+G3 X106.536 Y116.772 I-18.000 J0.000 E0.71233 F3600
+G3 X82.016 Y99.245 I-6.536 J-16.772 E1.17869 F3600
+G3 X98.091 Y82.102 I17.984 J0.755 E0.84501 F3600
+G3 X118.000 Y100.000 I1.909 J17.898 E0.99618 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X56.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y60.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y60.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y76.000 F9000
+G3 X57.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y92.000 F9000
+G3 X57.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y92.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y92.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y92.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y108.000 F9000
+G3 X60.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y124.000 F9000
+G3 X57.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y124.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y124.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y124.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y140.000 F9000
+G3 X60.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G1 Z2.400 F600
+G1 X160.000 Y100.000 F9000
+G2 X112.964 Y41.417 I-60.000 J0.000 E2.67897 F3600
+G2 X41.671 Y85.940 I-12.964 J58.583 E3.07306 F3600
+G2 X87.714 Y158.729 I58.329 J14.060 E3.17018 F3600
+G2 X140.405 Y144.356 I12.286 J-58.729 E1.87118 F3600
+G2 X160.000 Y100.000 I-40.405 J-44.356 E1.64731 F3600
+G1 X135.000 Y100.000 F9000
+G2 X84.621 Y68.560 I-35.000 J0.000 E2.33970 F3600
+G2 X68.882 Y83.979 I15.379 J31.440 E0.73970 F3600
+G2 X100.096 Y135.000 I31.118 J16.021 E2.36657 F3600
+G2 X135.000 Y100.000 I-0.096 J-35.000 E1.81110 F3600
+G1 X118.000 Y100.000 F9000
+G2 X99.952 Y82.000 I-18.000 J0.000 E0.93463 F3600
+G2 X89.893 Y85.106 I0.048 J18.000 E0.35258 F3600
+G2 X89.693 Y114.757 I10.107 J14.894 E1.14980 F3600
+G2 X102.055 Y117.882 I10.307 J-14.757 E0.43011 F3600
+G2 X118.000 Y100.000 I-2.055 J-17.882 E0.86510 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X55.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y60.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y60.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y60.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y76.000 F9000
+G3 X56.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y76.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y76.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y92.000 F9000
+G3 X60.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y108.000 F9000
+G3 X60.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y124.000 F9000
+G3 X60.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y124.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y140.000 F9000
+G3 X60.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y140.000 I2.500 J0.000 E0.25918 F3600
+G1 Z2.700 F600
+G1 X160.000 Y100.000 F9000
+G3 X138.832 Y145.739 I-60.000 J0.000 E1.71643 F3600
+G3 X110.457 Y159.082 I-38.832 J-45.739 E1.04691 F3600
+G3 X41.532 Y86.528 I-10.457 J-59.082 E3.90543 F3600
+G3 X56.953 Y58.203 I58.468 J13.472 E1.07750 F3600
+G3 X153.477 Y72.792 I43.047 J41.797 E3.76256 F3600
+G3 X160.000 Y100.000 I-53.477 J27.208 E0.93188 F3600
+G1 X135.000 Y100.000 F9000
+G3 X92.193 Y134.118 I-35.000 J0.000 E2.07408 F3600
+G3 X67.868 Y86.125 I7.807 J-34.118 E2.02527 F3600
+G3 X123.585 Y74.140 I32.132 J13.875 E2.19746 F3600
+G3 X135.000 Y100.000 I-23.585 J25.860 E0.96026 F3600
+G1 X118.000 Y100.000 F9000
+G3 X94.115 Y117.011 I-18.000 J0.000 E1.13090 F3600
+G3 X83.402 Y106.965 I5.885 J-17.011 E0.49919 F3600
+G3 X93.160 Y83.350 I16.598 J-6.965 E0.93755 F3600
+G3 X110.939 Y85.705 I6.840 J16.650 E0.61953 F3600
+G3 X118.000 Y100.000 I-10.939 J14.295 E0.54506 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X60.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y76.000 F9000
+G3 X60.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y92.000 F9000
+G3 X55.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y108.000 F9000
+G3 X55.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y124.000 F9000
+G3 X55.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y140.000 F9000
+G3 X55.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y140.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y140.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y140.000 I0.400 J0.000 E0.04147 F3600
+G1 Z3.000 F600
+G1 X160.000 Y100.000 F9000
+G2 X116.543 Y42.326 I-60.000 J0.000 E2.55708 F3600
+G2 X40.030 Y101.905 I-16.543 J57.674 E3.72616 F3600
+G2 X96.390 Y159.891 I59.970 J-1.905 E2.92810 F3600
+G2 X137.791 Y146.603 I3.610 J-59.891 E1.46830 F3600
+G2 X160.000 Y100.000 I-37.791 J-46.603 E1.76107 F3600
+G1 X135.000 Y100.000 F9000
+G2 X94.475 Y65.439 I-35.000 J0.000 E1.99735 F3600
+G2 X65.079 Y97.650 I5.525 J34.561 E1.55359 F3600
+G2 X68.843 Y115.944 I34.921 J2.350 E0.62390 F3600
+G2 X123.642 Y125.808 I31.157 J-15.944 E2.12455 F3600
+G2 X135.000 Y100.000 I-23.642 J-25.808 E0.95768 F3600
+G1 X118.000 Y100.000 F9000
+G2 X114.249 Y89.002 I-18.000 J0.000 E0.39046 F3600
+G2 X91.950 Y83.901 I-14.249 J10.998 E0.81802 F3600
+G2 X82.002 Y100.274 I8.050 J16.099 E0.66666 F3600
+G2 X103.661 Y117.624 I17.998 J-0.274 E1.04569 F3600
+G2 X116.886 Y106.233 I-3.661 J-17.624 E0.60136 F3600
+G2 X118.000 Y100.000 I-16.886 J-6.233 E0.21003 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X60.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y60.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y76.000 F9000
+G3 X60.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y92.000 F9000
+G3 X55.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y108.000 F9000
+G3 X55.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y108.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y108.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y108.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y124.000 F9000
+G3 X55.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y140.000 F9000
+G3 X57.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G1 Z3.300 F600
+G1 X160.000 Y100.000 F9000
+G3 X114.391 Y158.249 I-60.000 J0.000 E2.63061 F3600
+G3 X50.744 Y134.261 I-14.391 J-58.249 E2.38640 F3600
+G3 X81.842 Y42.813 I49.256 J-34.261 E3.70477 F3600
+G3 X159.456 Y91.937 I18.158 J57.187 E3.45205 F3600
+G3 X160.000 Y100.000 I-59.456 J8.063 E0.26688 F3600
+G1 X135.000 Y100.000 F9000
+G3 X88.421 Y133.029 I-35.000 J0.000 E2.20372 F3600
+G3 X67.795 Y113.706 I11.579 J-33.029 E0.96009 F3600
+G3 X71.036 Y80.351 I32.205 J-13.706 E1.15322 F3600
+G3 X126.588 Y77.238 I28.964 J19.649 E2.12229 F3600
+G3 X135.000 Y100.000 I-26.588 J22.762 E0.81777 F3600
+G1 X118.000 Y100.000 F9000
+G3 X96.303 Y117.616 I-18.000 J0.000 E1.05592 F3600
+G3 X84.918 Y109.826 I3.697 J-17.616 E0.46719 F3600
+G3 X95.524 Y82.565 I15.082 J-9.826 E1.12677 F3600
+G3 X109.398 Y84.648 I4.476 J17.435 E0.47556 F3600
+G3 X117.379 Y95.314 I-9.398 J15.352 E0.45033 F3600
+G3 X118.000 Y100.000 I-17.379 J4.686 E0.15644 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X57.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y76.000 F9000
+G3 X57.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y76.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y76.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y76.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y92.000 F9000
+G3 X55.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y92.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y92.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y92.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y108.000 F9000
+G3 X56.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y108.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y108.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y124.000 F9000
+G3 X55.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X56.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X57.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X58.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X59.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X59.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X60.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X61.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X62.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X63.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X63.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X64.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X65.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X66.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X67.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X67.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X68.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X69.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X70.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X71.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X71.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X72.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X73.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X74.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X75.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X75.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X76.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X77.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X78.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X79.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X79.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X80.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X81.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X82.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X83.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X83.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X84.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X85.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X86.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X87.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X87.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X88.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X89.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X90.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X91.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X91.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X92.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X93.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X94.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X95.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X95.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X96.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X97.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X98.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X99.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X99.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X100.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X101.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X102.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X103.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X103.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X104.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X105.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X106.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X107.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X107.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X108.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X109.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X110.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X111.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X111.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X112.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X113.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X114.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X115.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X115.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X116.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X117.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X118.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X119.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X119.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X120.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X121.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X122.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X123.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X123.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X124.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X125.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X126.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X127.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X127.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X128.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X129.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X130.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X131.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X131.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X132.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X133.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X134.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X135.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X135.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X136.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X137.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X138.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X139.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X139.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X140.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X141.400 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X142.200 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X143.000 Y124.000 I0.400 J0.000 E0.04147 F3600
+G3 X143.800 Y124.000 I0.400 J0.000 E0.04147 F3600
+G2 X144.600 Y124.000 I0.400 J0.000 E0.04147 F3600
+G1 X55.000 Y140.000 F9000
+G3 X57.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G1 Z3.600 F600
+G1 X160.000 Y100.000 F9000
+G2 X145.361 Y60.727 I-60.000 J0.000 E1.41291 F3600
+G2 X109.530 Y40.762 I-45.361 J39.273 E1.38145 F3600
+G2 X40.024 Y101.697 I-9.530 J59.238 E3.48201 F3600
+G2 X95.512 Y159.832 I59.976 J-1.697 E2.90593 F3600
+G2 X157.402 Y117.464 I4.488 J-59.832 E2.67364 F3600
+G2 X160.000 Y100.000 I-57.402 J-17.464 E0.58476 F3600
+G1 X135.000 Y100.000 F9000
+G2 X113.672 Y67.781 I-35.000 J0.000 E1.35074 F3600
+G2 X80.725 Y70.786 I-13.672 J32.219 E1.13716 F3600
+G2 X65.189 Y96.369 I19.275 J29.214 E1.02060 F3600
+G2 X73.300 Y122.629 I34.811 J3.631 E0.93208 F3600
+G2 X129.694 Y118.528 I26.700 J-22.629 E2.17219 F3600
+G2 X134.983 Y101.105 I-29.694 J-18.528 E0.60783 F3600
+G2 X135.000 Y100.000 I-34.983 J-1.105 E0.03648 F3600
+G1 X118.000 Y100.000 F9000
+G2 X93.348 Y83.274 I-18.000 J0.000 E1.15789 F3600
+G2 X82.310 Y103.328 I6.652 J16.726 E0.81868 F3600
+G2 X109.666 Y115.185 I17.690 J-3.328 E1.15930 F3600
+G2 X118.000 Y100.000 I-9.666 J-15.185 E0.59634 F3600
+G1 X70.800 Y70.000 F9000
+G1 X129.200 Y70.000 E1.92720 F3600
+G3 X130.000 Y70.800 I0.000 J0.800 E0.04147 F3600
+G1 X130.000 Y129.200 E1.92720 F3600
+G3 X129.200 Y130.000 I-0.800 J0.000 E0.04147 F3600
+G1 X70.800 Y130.000 E1.92720 F3600
+G3 X70.000 Y129.200 I0.000 J-0.800 E0.04147 F3600
+G1 X70.000 Y70.800 E1.92720 F3600
+G3 X70.800 Y70.000 I0.800 J0.000 E0.04147 F3600
+G1 X71.500 Y70.000 F9000
+G1 X128.500 Y70.000 E1.88100 F3600
+G3 X130.000 Y71.500 I0.000 J1.500 E0.07775 F3600
+G1 X130.000 Y128.500 E1.88100 F3600
+G3 X128.500 Y130.000 I-1.500 J0.000 E0.07775 F3600
+G1 X71.500 Y130.000 E1.88100 F3600
+G3 X70.000 Y128.500 I0.000 J-1.500 E0.07775 F3600
+G1 X70.000 Y71.500 E1.88100 F3600
+G3 X71.500 Y70.000 I1.500 J0.000 E0.07775 F3600
+G1 X73.000 Y70.000 F9000
+G1 X127.000 Y70.000 E1.78200 F3600
+G3 X130.000 Y73.000 I0.000 J3.000 E0.15551 F3600
+G1 X130.000 Y127.000 E1.78200 F3600
+G3 X127.000 Y130.000 I-3.000 J0.000 E0.15551 F3600
+G1 X73.000 Y130.000 E1.78200 F3600
+G3 X70.000 Y127.000 I0.000 J-3.000 E0.15551 F3600
+G1 X70.000 Y73.000 E1.78200 F3600
+G3 X73.000 Y70.000 I3.000 J0.000 E0.15551 F3600
+G1 X75.000 Y70.000 F9000
+G1 X125.000 Y70.000 E1.65000 F3600
+G3 X130.000 Y75.000 I0.000 J5.000 E0.25918 F3600
+G1 X130.000 Y125.000 E1.65000 F3600
+G3 X125.000 Y130.000 I-5.000 J0.000 E0.25918 F3600
+G1 X75.000 Y130.000 E1.65000 F3600
+G3 X70.000 Y125.000 I0.000 J-5.000 E0.25918 F3600
+G1 X70.000 Y75.000 E1.65000 F3600
+G3 X75.000 Y70.000 I5.000 J0.000 E0.25918 F3600
+G1 X55.000 Y60.000 F9000
+G3 X57.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y60.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y60.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y60.000 I1.200 J0.000 E0.12441 F3600
+G1 X55.000 Y76.000 F9000
+G3 X60.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y76.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y92.000 F9000
+G3 X60.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y92.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y108.000 F9000
+G3 X60.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X65.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X70.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X75.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X80.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X85.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X90.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X95.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X100.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X105.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X110.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X115.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X120.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X125.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X130.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X135.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G3 X140.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G2 X145.000 Y108.000 I2.500 J0.000 E0.25918 F3600
+G1 X55.000 Y124.000 F9000
+G3 X56.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X58.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X59.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X61.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X62.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X64.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X65.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X67.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X68.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X70.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X71.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X73.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X74.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X76.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X77.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X79.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X80.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X82.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X83.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X85.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X86.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X88.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X89.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X91.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X92.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X94.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X95.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X97.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X98.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X100.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X101.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X103.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X104.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X106.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X107.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X109.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X110.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X112.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X113.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X115.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X116.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X118.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X119.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X121.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X122.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X124.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X125.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X127.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X128.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X130.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X131.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X133.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X134.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X136.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X137.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X139.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X140.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X142.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G3 X143.500 Y124.000 I0.750 J0.000 E0.07775 F3600
+G2 X145.000 Y124.000 I0.750 J0.000 E0.07775 F3600
+G1 X55.000 Y140.000 F9000
+G3 X57.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X59.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X62.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X64.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X67.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X69.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X71.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X74.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X76.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X79.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X81.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X83.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X86.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X88.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X91.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X93.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X95.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X98.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X100.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X103.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X105.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X107.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X110.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X112.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X115.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X117.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X119.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X122.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X124.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X127.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X129.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X131.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X134.200 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X136.600 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X139.000 Y140.000 I1.200 J0.000 E0.12441 F3600
+G2 X141.400 Y140.000 I1.200 J0.000 E0.12441 F3600
+G3 X143.800 Y140.000 I1.200 J0.000 E0.12441 F3600
+G1 Z3.900 F600
+M400
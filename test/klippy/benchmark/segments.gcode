@@ -0,0 +1,5007 @@
+; Benchmark - tiny segments
+G28
+G90
+M83
+G1 Z0.2 F600
+G1 X150 Y100 F6000
+G1 X150.000 Y100.000 E0.00660 F4800
+G1 X149.996 Y100.200 E0.00660 F4800
+G1 X149.990 Y100.400 E0.00660 F4800
+G1 X149.984 Y100.600 E0.00660 F4800
+G1 X149.978 Y100.800 E0.00660 F4800
+G1 X149.970 Y101.000 E0.00660 F4800
+G1 X149.962 Y101.199 E0.00660 F4800
+G1 X149.952 Y101.399 E0.00660 F4800
+G1 X149.942 Y101.599 E0.00660 F4800
+G1 X149.932 Y101.798 E0.00660 F4800
+G1 X149.920 Y101.998 E0.00660 F4800
+G1 X149.908 Y102.197 E0.00660 F4800
+G1 X149.894 Y102.397 E0.00660 F4800
+G1 X149.880 Y102.596 E0.00660 F4800
+G1 X149.866 Y102.795 E0.00660 F4800
+G1 X149.850 Y102.995 E0.00660 F4800
+G1 X149.834 Y103.194 E0.00660 F4800
+G1 X149.817 Y103.393 E0.00660 F4800
+G1 X149.799 Y103.592 E0.00660 F4800
+G1 X149.780 Y103.791 E0.00660 F4800
+G1 X149.760 Y103.989 E0.00660 F4800
+G1 X149.740 Y104.188 E0.00660 F4800
+G1 X149.719 Y104.387 E0.00660 F4800
+G1 X149.697 Y104.585 E0.00660 F4800
+G1 X149.674 Y104.783 E0.00660 F4800
+G1 X149.651 Y104.982 E0.00660 F4800
+G1 X149.626 Y105.180 E0.00660 F4800
+G1 X149.601 Y105.378 E0.00660 F4800
+G1 X149.575 Y105.576 E0.00660 F4800
+G1 X149.549 Y105.774 E0.00660 F4800
+G1 X149.521 Y105.971 E0.00660 F4800
+G1 X149.493 Y106.169 E0.00660 F4800
+G1 X149.464 Y106.366 E0.00660 F4800
+G1 X149.434 Y106.563 E0.00660 F4800
+G1 X149.404 Y106.761 E0.00660 F4800
+G1 X149.372 Y106.958 E0.00660 F4800
+G1 X149.340 Y107.154 E0.00660 F4800
+G1 X149.307 Y107.351 E0.00660 F4800
+G1 X149.273 Y107.548 E0.00660 F4800
+G1 X149.239 Y107.744 E0.00660 F4800
+G1 X149.203 Y107.940 E0.00660 F4800
+G1 X149.167 Y108.137 E0.00660 F4800
+G1 X149.130 Y108.332 E0.00660 F4800
+G1 X149.093 Y108.528 E0.00660 F4800
+G1 X149.054 Y108.724 E0.00660 F4800
+G1 X149.015 Y108.919 E0.00660 F4800
+G1 X148.975 Y109.115 E0.00660 F4800
+G1 X148.934 Y109.310 E0.00660 F4800
+G1 X148.893 Y109.504 E0.00660 F4800
+G1 X148.850 Y109.699 E0.00660 F4800
+G1 X148.807 Y109.894 E0.00660 F4800
+G1 X148.763 Y110.088 E0.00660 F4800
+G1 X148.719 Y110.282 E0.00660 F4800
+G1 X148.673 Y110.476 E0.00660 F4800
+G1 X148.627 Y110.670 E0.00660 F4800
+G1 X148.580 Y110.863 E0.00660 F4800
+G1 X148.532 Y111.057 E0.00660 F4800
+G1 X148.484 Y111.250 E0.00660 F4800
+G1 X148.435 Y111.443 E0.00660 F4800
+G1 X148.385 Y111.636 E0.00660 F4800
+G1 X148.334 Y111.828 E0.00660 F4800
+G1 X148.282 Y112.020 E0.00660 F4800
+G1 X148.230 Y112.212 E0.00660 F4800
+G1 X148.177 Y112.404 E0.00660 F4800
+G1 X148.123 Y112.596 E0.00660 F4800
+G1 X148.068 Y112.787 E0.00660 F4800
+G1 X148.013 Y112.978 E0.00660 F4800
+G1 X147.957 Y113.169 E0.00660 F4800
+G1 X147.900 Y113.360 E0.00660 F4800
+G1 X147.842 Y113.550 E0.00660 F4800
+G1 X147.784 Y113.740 E0.00660 F4800
+G1 X147.724 Y113.930 E0.00660 F4800
+G1 X147.665 Y114.120 E0.00660 F4800
+G1 X147.604 Y114.309 E0.00660 F4800
+G1 X147.542 Y114.498 E0.00660 F4800
+G1 X147.480 Y114.687 E0.00660 F4800
+G1 X147.417 Y114.876 E0.00660 F4800
+G1 X147.354 Y115.064 E0.00660 F4800
+G1 X147.289 Y115.252 E0.00660 F4800
+G1 X147.224 Y115.440 E0.00660 F4800
+G1 X147.158 Y115.628 E0.00660 F4800
+G1 X147.091 Y115.815 E0.00660 F4800
+G1 X147.024 Y116.002 E0.00660 F4800
+G1 X146.956 Y116.189 E0.00660 F4800
+G1 X146.887 Y116.375 E0.00660 F4800
+G1 X146.817 Y116.561 E0.00660 F4800
+G1 X146.747 Y116.747 E0.00660 F4800
+G1 X146.676 Y116.932 E0.00660 F4800
+G1 X146.604 Y117.117 E0.00660 F4800
+G1 X146.531 Y117.302 E0.00660 F4800
+G1 X146.458 Y117.487 E0.00660 F4800
+G1 X146.384 Y117.671 E0.00660 F4800
+G1 X146.309 Y117.855 E0.00660 F4800
+G1 X146.234 Y118.039 E0.00660 F4800
+G1 X146.157 Y118.222 E0.00660 F4800
+G1 X146.080 Y118.405 E0.00660 F4800
+G1 X146.003 Y118.588 E0.00660 F4800
+G1 X145.924 Y118.770 E0.00660 F4800
+G1 X145.845 Y118.952 E0.00660 F4800
+G1 X145.765 Y119.134 E0.00660 F4800
+G1 X145.685 Y119.315 E0.00660 F4800
+G1 X145.603 Y119.496 E0.00660 F4800
+G1 X145.521 Y119.677 E0.00660 F4800
+G1 X145.439 Y119.857 E0.00660 F4800
+G1 X145.355 Y120.037 E0.00660 F4800
+G1 X145.271 Y120.217 E0.00660 F4800
+G1 X145.186 Y120.396 E0.00660 F4800
+G1 X145.100 Y120.575 E0.00660 F4800
+G1 X145.014 Y120.754 E0.00660 F4800
+G1 X144.927 Y120.932 E0.00660 F4800
+G1 X144.839 Y121.110 E0.00660 F4800
+G1 X144.751 Y121.287 E0.00660 F4800
+G1 X144.662 Y121.464 E0.00660 F4800
+G1 X144.572 Y121.641 E0.00660 F4800
+G1 X144.482 Y121.817 E0.00660 F4800
+G1 X144.390 Y121.993 E0.00660 F4800
+G1 X144.299 Y122.169 E0.00660 F4800
+G1 X144.206 Y122.344 E0.00660 F4800
+G1 X144.113 Y122.519 E0.00660 F4800
+G1 X144.019 Y122.693 E0.00660 F4800
+G1 X143.924 Y122.867 E0.00660 F4800
+G1 X143.829 Y123.041 E0.00660 F4800
+G1 X143.733 Y123.214 E0.00660 F4800
+G1 X143.636 Y123.387 E0.00660 F4800
+G1 X143.538 Y123.560 E0.00660 F4800
+G1 X143.440 Y123.732 E0.00660 F4800
+G1 X143.342 Y123.903 E0.00660 F4800
+G1 X143.242 Y124.074 E0.00660 F4800
+G1 X143.142 Y124.245 E0.00660 F4800
+G1 X143.041 Y124.416 E0.00660 F4800
+G1 X142.940 Y124.586 E0.00660 F4800
+G1 X142.838 Y124.755 E0.00660 F4800
+G1 X142.735 Y124.924 E0.00660 F4800
+G1 X142.631 Y125.093 E0.00660 F4800
+G1 X142.527 Y125.261 E0.00660 F4800
+G1 X142.422 Y125.429 E0.00660 F4800
+G1 X142.317 Y125.597 E0.00660 F4800
+G1 X142.211 Y125.764 E0.00660 F4800
+G1 X142.104 Y125.930 E0.00660 F4800
+G1 X141.996 Y126.096 E0.00660 F4800
+G1 X141.888 Y126.262 E0.00660 F4800
+G1 X141.780 Y126.427 E0.00660 F4800
+G1 X141.670 Y126.592 E0.00660 F4800
+G1 X141.560 Y126.756 E0.00660 F4800
+G1 X141.449 Y126.920 E0.00660 F4800
+G1 X141.338 Y127.083 E0.00660 F4800
+G1 X141.226 Y127.246 E0.00660 F4800
+G1 X141.113 Y127.409 E0.00660 F4800
+G1 X141.000 Y127.571 E0.00660 F4800
+G1 X140.886 Y127.732 E0.00660 F4800
+G1 X140.772 Y127.893 E0.00660 F4800
+G1 X140.656 Y128.054 E0.00660 F4800
+G1 X140.541 Y128.214 E0.00660 F4800
+G1 X140.424 Y128.374 E0.00660 F4800
+G1 X140.307 Y128.533 E0.00660 F4800
+G1 X140.189 Y128.692 E0.00660 F4800
+G1 X140.071 Y128.850 E0.00660 F4800
+G1 X139.952 Y129.007 E0.00660 F4800
+G1 X139.832 Y129.165 E0.00660 F4800
+G1 X139.712 Y129.321 E0.00660 F4800
+G1 X139.591 Y129.478 E0.00660 F4800
+G1 X139.470 Y129.633 E0.00660 F4800
+G1 X139.348 Y129.789 E0.00660 F4800
+G1 X139.225 Y129.943 E0.00660 F4800
+G1 X139.102 Y130.097 E0.00660 F4800
+G1 X138.978 Y130.251 E0.00660 F4800
+G1 X138.854 Y130.404 E0.00660 F4800
+G1 X138.729 Y130.557 E0.00660 F4800
+G1 X138.603 Y130.709 E0.00660 F4800
+G1 X138.477 Y130.861 E0.00660 F4800
+G1 X138.350 Y131.012 E0.00660 F4800
+G1 X138.222 Y131.163 E0.00660 F4800
+G1 X138.094 Y131.313 E0.00660 F4800
+G1 X137.966 Y131.462 E0.00660 F4800
+G1 X137.837 Y131.611 E0.00660 F4800
+G1 X137.707 Y131.760 E0.00660 F4800
+G1 X137.576 Y131.908 E0.00660 F4800
+G1 X137.445 Y132.055 E0.00660 F4800
+G1 X137.314 Y132.202 E0.00660 F4800
+G1 X137.182 Y132.349 E0.00660 F4800
+G1 X137.049 Y132.494 E0.00660 F4800
+G1 X136.916 Y132.640 E0.00660 F4800
+G1 X136.782 Y132.785 E0.00660 F4800
+G1 X136.647 Y132.929 E0.00660 F4800
+G1 X136.512 Y133.072 E0.00660 F4800
+G1 X136.377 Y133.215 E0.00660 F4800
+G1 X136.241 Y133.358 E0.00660 F4800
+G1 X136.104 Y133.500 E0.00660 F4800
+G1 X135.967 Y133.641 E0.00660 F4800
+G1 X135.829 Y133.782 E0.00660 F4800
+G1 X135.691 Y133.922 E0.00660 F4800
+G1 X135.552 Y134.062 E0.00660 F4800
+G1 X135.413 Y134.201 E0.00660 F4800
+G1 X135.273 Y134.340 E0.00660 F4800
+G1 X135.132 Y134.478 E0.00660 F4800
+G1 X134.991 Y134.615 E0.00660 F4800
+G1 X134.850 Y134.752 E0.00660 F4800
+G1 X134.707 Y134.889 E0.00660 F4800
+G1 X134.565 Y135.024 E0.00660 F4800
+G1 X134.422 Y135.159 E0.00660 F4800
+G1 X134.278 Y135.294 E0.00660 F4800
+G1 X134.134 Y135.428 E0.00660 F4800
+G1 X133.989 Y135.561 E0.00660 F4800
+G1 X133.844 Y135.694 E0.00660 F4800
+G1 X133.698 Y135.826 E0.00660 F4800
+G1 X133.552 Y135.958 E0.00660 F4800
+G1 X133.405 Y136.089 E0.00660 F4800
+G1 X133.257 Y136.219 E0.00660 F4800
+G1 X133.110 Y136.349 E0.00660 F4800
+G1 X132.961 Y136.478 E0.00660 F4800
+G1 X132.812 Y136.607 E0.00660 F4800
+G1 X132.663 Y136.735 E0.00660 F4800
+G1 X132.513 Y136.862 E0.00660 F4800
+G1 X132.363 Y136.989 E0.00660 F4800
+G1 X132.212 Y137.115 E0.00660 F4800
+G1 X132.061 Y137.240 E0.00660 F4800
+G1 X131.909 Y137.365 E0.00660 F4800
+G1 X131.757 Y137.490 E0.00660 F4800
+G1 X131.604 Y137.613 E0.00660 F4800
+G1 X131.451 Y137.736 E0.00660 F4800
+G1 X131.297 Y137.859 E0.00660 F4800
+G1 X131.143 Y137.980 E0.00660 F4800
+G1 X130.988 Y138.102 E0.00660 F4800
+G1 X130.833 Y138.222 E0.00660 F4800
+G1 X130.677 Y138.342 E0.00660 F4800
+G1 X130.521 Y138.461 E0.00660 F4800
+G1 X130.364 Y138.580 E0.00660 F4800
+G1 X130.207 Y138.698 E0.00660 F4800
+G1 X130.050 Y138.815 E0.00660 F4800
+G1 X129.892 Y138.932 E0.00660 F4800
+G1 X129.734 Y139.048 E0.00660 F4800
+G1 X129.575 Y139.164 E0.00660 F4800
+G1 X129.416 Y139.278 E0.00660 F4800
+G1 X129.256 Y139.392 E0.00660 F4800
+G1 X129.096 Y139.506 E0.00660 F4800
+G1 X128.935 Y139.619 E0.00660 F4800
+G1 X128.774 Y139.731 E0.00660 F4800
+G1 X128.612 Y139.843 E0.00660 F4800
+G1 X128.451 Y139.953 E0.00660 F4800
+G1 X128.288 Y140.064 E0.00660 F4800
+G1 X128.125 Y140.173 E0.00660 F4800
+G1 X127.962 Y140.282 E0.00660 F4800
+G1 X127.799 Y140.390 E0.00660 F4800
+G1 X127.635 Y140.498 E0.00660 F4800
+G1 X127.470 Y140.605 E0.00660 F4800
+G1 X127.305 Y140.711 E0.00660 F4800
+G1 X127.140 Y140.817 E0.00660 F4800
+G1 X126.974 Y140.921 E0.00660 F4800
+G1 X126.808 Y141.026 E0.00660 F4800
+G1 X126.642 Y141.129 E0.00660 F4800
+G1 X126.475 Y141.232 E0.00660 F4800
+G1 X126.308 Y141.334 E0.00660 F4800
+G1 X126.140 Y141.436 E0.00660 F4800
+G1 X125.972 Y141.537 E0.00660 F4800
+G1 X125.803 Y141.637 E0.00660 F4800
+G1 X125.634 Y141.736 E0.00660 F4800
+G1 X125.465 Y141.835 E0.00660 F4800
+G1 X125.296 Y141.933 E0.00660 F4800
+G1 X125.126 Y142.031 E0.00660 F4800
+G1 X124.955 Y142.127 E0.00660 F4800
+G1 X124.785 Y142.223 E0.00660 F4800
+G1 X124.613 Y142.319 E0.00660 F4800
+G1 X124.442 Y142.413 E0.00660 F4800
+G1 X124.270 Y142.507 E0.00660 F4800
+G1 X124.098 Y142.601 E0.00660 F4800
+G1 X123.925 Y142.693 E0.00660 F4800
+G1 X123.752 Y142.785 E0.00660 F4800
+G1 X123.579 Y142.876 E0.00660 F4800
+G1 X123.406 Y142.967 E0.00660 F4800
+G1 X123.232 Y143.056 E0.00660 F4800
+G1 X123.057 Y143.145 E0.00660 F4800
+G1 X122.883 Y143.234 E0.00660 F4800
+G1 X122.708 Y143.321 E0.00660 F4800
+G1 X122.532 Y143.408 E0.00660 F4800
+G1 X122.357 Y143.495 E0.00660 F4800
+G1 X122.181 Y143.580 E0.00660 F4800
+G1 X122.005 Y143.665 E0.00660 F4800
+G1 X121.828 Y143.749 E0.00660 F4800
+G1 X121.651 Y143.832 E0.00660 F4800
+G1 X121.474 Y143.915 E0.00660 F4800
+G1 X121.296 Y143.997 E0.00660 F4800
+G1 X121.118 Y144.078 E0.00660 F4800
+G1 X120.940 Y144.159 E0.00660 F4800
+G1 X120.762 Y144.238 E0.00660 F4800
+G1 X120.583 Y144.317 E0.00660 F4800
+G1 X120.404 Y144.396 E0.00660 F4800
+G1 X120.224 Y144.473 E0.00660 F4800
+G1 X120.045 Y144.550 E0.00660 F4800
+G1 X119.865 Y144.627 E0.00660 F4800
+G1 X119.684 Y144.702 E0.00660 F4800
+G1 X119.504 Y144.777 E0.00660 F4800
+G1 X119.323 Y144.851 E0.00660 F4800
+G1 X119.142 Y144.924 E0.00660 F4800
+G1 X118.960 Y144.996 E0.00660 F4800
+G1 X118.779 Y145.068 E0.00660 F4800
+G1 X118.597 Y145.139 E0.00660 F4800
+G1 X118.415 Y145.210 E0.00660 F4800
+G1 X118.232 Y145.279 E0.00660 F4800
+G1 X118.049 Y145.348 E0.00660 F4800
+G1 X117.866 Y145.416 E0.00660 F4800
+G1 X117.683 Y145.484 E0.00660 F4800
+G1 X117.500 Y145.550 E0.00660 F4800
+G1 X117.316 Y145.616 E0.00660 F4800
+G1 X117.132 Y145.681 E0.00660 F4800
+G1 X116.948 Y145.746 E0.00660 F4800
+G1 X116.763 Y145.809 E0.00660 F4800
+G1 X116.578 Y145.872 E0.00660 F4800
+G1 X116.393 Y145.934 E0.00660 F4800
+G1 X116.208 Y145.996 E0.00660 F4800
+G1 X116.023 Y146.056 E0.00660 F4800
+G1 X115.837 Y146.116 E0.00660 F4800
+G1 X115.651 Y146.176 E0.00660 F4800
+G1 X115.465 Y146.234 E0.00660 F4800
+G1 X115.279 Y146.292 E0.00660 F4800
+G1 X115.092 Y146.349 E0.00660 F4800
+G1 X114.906 Y146.405 E0.00660 F4800
+G1 X114.719 Y146.460 E0.00660 F4800
+G1 X114.531 Y146.515 E0.00660 F4800
+G1 X114.344 Y146.569 E0.00660 F4800
+G1 X114.157 Y146.622 E0.00660 F4800
+G1 X113.969 Y146.675 E0.00660 F4800
+G1 X113.781 Y146.726 E0.00660 F4800
+G1 X113.593 Y146.777 E0.00660 F4800
+G1 X113.404 Y146.827 E0.00660 F4800
+G1 X113.216 Y146.877 E0.00660 F4800
+G1 X113.027 Y146.925 E0.00660 F4800
+G1 X112.838 Y146.973 E0.00660 F4800
+G1 X112.649 Y147.020 E0.00660 F4800
+G1 X112.460 Y147.067 E0.00660 F4800
+G1 X112.271 Y147.112 E0.00660 F4800
+G1 X112.081 Y147.157 E0.00660 F4800
+G1 X111.891 Y147.201 E0.00660 F4800
+G1 X111.702 Y147.244 E0.00660 F4800
+G1 X111.512 Y147.287 E0.00660 F4800
+G1 X111.321 Y147.329 E0.00660 F4800
+G1 X111.131 Y147.370 E0.00660 F4800
+G1 X110.941 Y147.410 E0.00660 F4800
+G1 X110.750 Y147.449 E0.00660 F4800
+G1 X110.559 Y147.488 E0.00660 F4800
+G1 X110.368 Y147.526 E0.00660 F4800
+G1 X110.177 Y147.563 E0.00660 F4800
+G1 X109.986 Y147.600 E0.00660 F4800
+G1 X109.795 Y147.635 E0.00660 F4800
+G1 X109.604 Y147.670 E0.00660 F4800
+G1 X109.412 Y147.704 E0.00660 F4800
+G1 X109.220 Y147.738 E0.00660 F4800
+G1 X109.029 Y147.770 E0.00660 F4800
+G1 X108.837 Y147.802 E0.00660 F4800
+G1 X108.645 Y147.833 E0.00660 F4800
+G1 X108.453 Y147.863 E0.00660 F4800
+G1 X108.260 Y147.893 E0.00660 F4800
+G1 X108.068 Y147.922 E0.00660 F4800
+G1 X107.876 Y147.950 E0.00660 F4800
+G1 X107.683 Y147.977 E0.00660 F4800
+G1 X107.491 Y148.003 E0.00660 F4800
+G1 X107.298 Y148.029 E0.00660 F4800
+G1 X107.105 Y148.054 E0.00660 F4800
+G1 X106.912 Y148.078 E0.00660 F4800
+G1 X106.719 Y148.101 E0.00660 F4800
+G1 X106.526 Y148.123 E0.00660 F4800
+G1 X106.333 Y148.145 E0.00660 F4800
+G1 X106.140 Y148.166 E0.00660 F4800
+G1 X105.947 Y148.186 E0.00660 F4800
+G1 X105.754 Y148.206 E0.00660 F4800
+G1 X105.560 Y148.224 E0.00660 F4800
+G1 X105.367 Y148.242 E0.00660 F4800
+G1 X105.174 Y148.259 E0.00660 F4800
+G1 X104.980 Y148.276 E0.00660 F4800
+G1 X104.787 Y148.291 E0.00660 F4800
+G1 X104.593 Y148.306 E0.00660 F4800
+G1 X104.399 Y148.320 E0.00660 F4800
+G1 X104.206 Y148.333 E0.00660 F4800
+G1 X104.012 Y148.346 E0.00660 F4800
+G1 X103.818 Y148.357 E0.00660 F4800
+G1 X103.625 Y148.368 E0.00660 F4800
+G1 X103.431 Y148.379 E0.00660 F4800
+G1 X103.237 Y148.388 E0.00660 F4800
+G1 X103.043 Y148.396 E0.00660 F4800
+G1 X102.849 Y148.404 E0.00660 F4800
+G1 X102.655 Y148.411 E0.00660 F4800
+G1 X102.462 Y148.417 E0.00660 F4800
+G1 X102.268 Y148.423 E0.00660 F4800
+G1 X102.074 Y148.428 E0.00660 F4800
+G1 X101.880 Y148.432 E0.00660 F4800
+G1 X101.686 Y148.435 E0.00660 F4800
+G1 X101.492 Y148.437 E0.00660 F4800
+G1 X101.298 Y148.439 E0.00660 F4800
+G1 X101.104 Y148.439 E0.00660 F4800
+G1 X100.911 Y148.439 E0.00660 F4800
+G1 X100.717 Y148.439 E0.00660 F4800
+G1 X100.523 Y148.437 E0.00660 F4800
+G1 X100.329 Y148.435 E0.00660 F4800
+G1 X100.135 Y148.432 E0.00660 F4800
+G1 X99.942 Y148.428 E0.00660 F4800
+G1 X99.748 Y148.423 E0.00660 F4800
+G1 X99.554 Y148.418 E0.00660 F4800
+G1 X99.361 Y148.412 E0.00660 F4800
+G1 X99.167 Y148.405 E0.00660 F4800
+G1 X98.974 Y148.397 E0.00660 F4800
+G1 X98.780 Y148.389 E0.00660 F4800
+G1 X98.587 Y148.379 E0.00660 F4800
+G1 X98.393 Y148.369 E0.00660 F4800
+G1 X98.200 Y148.359 E0.00660 F4800
+G1 X98.007 Y148.347 E0.00660 F4800
+G1 X97.814 Y148.335 E0.00660 F4800
+G1 X97.620 Y148.321 E0.00660 F4800
+G1 X97.427 Y148.308 E0.00660 F4800
+G1 X97.234 Y148.293 E0.00660 F4800
+G1 X97.042 Y148.277 E0.00660 F4800
+G1 X96.849 Y148.261 E0.00660 F4800
+G1 X96.656 Y148.244 E0.00660 F4800
+G1 X96.463 Y148.226 E0.00660 F4800
+G1 X96.271 Y148.208 E0.00660 F4800
+G1 X96.078 Y148.189 E0.00660 F4800
+G1 X95.886 Y148.169 E0.00660 F4800
+G1 X95.694 Y148.148 E0.00660 F4800
+G1 X95.501 Y148.126 E0.00660 F4800
+G1 X95.309 Y148.104 E0.00660 F4800
+G1 X95.117 Y148.081 E0.00660 F4800
+G1 X94.926 Y148.057 E0.00660 F4800
+G1 X94.734 Y148.032 E0.00660 F4800
+G1 X94.542 Y148.007 E0.00660 F4800
+G1 X94.351 Y147.981 E0.00660 F4800
+G1 X94.159 Y147.954 E0.00660 F4800
+G1 X93.968 Y147.926 E0.00660 F4800
+G1 X93.777 Y147.897 E0.00660 F4800
+G1 X93.586 Y147.868 E0.00660 F4800
+G1 X93.395 Y147.838 E0.00660 F4800
+G1 X93.204 Y147.807 E0.00660 F4800
+G1 X93.014 Y147.776 E0.00660 F4800
+G1 X92.823 Y147.744 E0.00660 F4800
+G1 X92.633 Y147.711 E0.00660 F4800
+G1 X92.443 Y147.677 E0.00660 F4800
+G1 X92.253 Y147.642 E0.00660 F4800
+G1 X92.063 Y147.607 E0.00660 F4800
+G1 X91.873 Y147.571 E0.00660 F4800
+G1 X91.684 Y147.534 E0.00660 F4800
+G1 X91.494 Y147.496 E0.00660 F4800
+G1 X91.305 Y147.458 E0.00660 F4800
+G1 X91.116 Y147.419 E0.00660 F4800
+G1 X90.927 Y147.379 E0.00660 F4800
+G1 X90.738 Y147.339 E0.00660 F4800
+G1 X90.550 Y147.297 E0.00660 F4800
+G1 X90.362 Y147.255 E0.00660 F4800
+G1 X90.174 Y147.212 E0.00660 F4800
+G1 X89.986 Y147.169 E0.00660 F4800
+G1 X89.798 Y147.124 E0.00660 F4800
+G1 X89.610 Y147.079 E0.00660 F4800
+G1 X89.423 Y147.033 E0.00660 F4800
+G1 X89.236 Y146.987 E0.00660 F4800
+G1 X89.049 Y146.939 E0.00660 F4800
+G1 X88.862 Y146.891 E0.00660 F4800
+G1 X88.676 Y146.843 E0.00660 F4800
+G1 X88.489 Y146.793 E0.00660 F4800
+G1 X88.303 Y146.743 E0.00660 F4800
+G1 X88.117 Y146.692 E0.00660 F4800
+G1 X87.932 Y146.640 E0.00660 F4800
+G1 X87.746 Y146.587 E0.00660 F4800
+G1 X87.561 Y146.534 E0.00660 F4800
+G1 X87.376 Y146.480 E0.00660 F4800
+G1 X87.191 Y146.425 E0.00660 F4800
+G1 X87.007 Y146.370 E0.00660 F4800
+G1 X86.822 Y146.314 E0.00660 F4800
+G1 X86.638 Y146.257 E0.00660 F4800
+G1 X86.455 Y146.199 E0.00660 F4800
+G1 X86.271 Y146.141 E0.00660 F4800
+G1 X86.088 Y146.082 E0.00660 F4800
+G1 X85.905 Y146.022 E0.00660 F4800
+G1 X85.722 Y145.961 E0.00660 F4800
+G1 X85.539 Y145.900 E0.00660 F4800
+G1 X85.357 Y145.838 E0.00660 F4800
+G1 X85.175 Y145.775 E0.00660 F4800
+G1 X84.993 Y145.712 E0.00660 F4800
+G1 X84.812 Y145.648 E0.00660 F4800
+G1 X84.631 Y145.583 E0.00660 F4800
+G1 X84.450 Y145.517 E0.00660 F4800
+G1 X84.269 Y145.451 E0.00660 F4800
+G1 X84.089 Y145.384 E0.00660 F4800
+G1 X83.909 Y145.316 E0.00660 F4800
+G1 X83.729 Y145.247 E0.00660 F4800
+G1 X83.549 Y145.178 E0.00660 F4800
+G1 X83.370 Y145.108 E0.00660 F4800
+G1 X83.191 Y145.038 E0.00660 F4800
+G1 X83.013 Y144.966 E0.00660 F4800
+G1 X82.834 Y144.894 E0.00660 F4800
+G1 X82.656 Y144.821 E0.00660 F4800
+G1 X82.479 Y144.748 E0.00660 F4800
+G1 X82.301 Y144.674 E0.00660 F4800
+G1 X82.124 Y144.599 E0.00660 F4800
+G1 X81.948 Y144.523 E0.00660 F4800
+G1 X81.771 Y144.447 E0.00660 F4800
+G1 X81.595 Y144.370 E0.00660 F4800
+G1 X81.419 Y144.293 E0.00660 F4800
+G1 X81.244 Y144.214 E0.00660 F4800
+G1 X81.069 Y144.135 E0.00660 F4800
+G1 X80.894 Y144.055 E0.00660 F4800
+G1 X80.719 Y143.975 E0.00660 F4800
+G1 X80.545 Y143.894 E0.00660 F4800
+G1 X80.371 Y143.812 E0.00660 F4800
+G1 X80.198 Y143.729 E0.00660 F4800
+G1 X80.025 Y143.646 E0.00660 F4800
+G1 X79.852 Y143.562 E0.00660 F4800
+G1 X79.680 Y143.478 E0.00660 F4800
+G1 X79.508 Y143.393 E0.00660 F4800
+G1 X79.336 Y143.307 E0.00660 F4800
+G1 X79.165 Y143.220 E0.00660 F4800
+G1 X78.994 Y143.133 E0.00660 F4800
+G1 X78.823 Y143.045 E0.00660 F4800
+G1 X78.653 Y142.956 E0.00660 F4800
+G1 X78.483 Y142.867 E0.00660 F4800
+G1 X78.314 Y142.777 E0.00660 F4800
+G1 X78.145 Y142.686 E0.00660 F4800
+G1 X77.976 Y142.595 E0.00660 F4800
+G1 X77.807 Y142.503 E0.00660 F4800
+G1 X77.639 Y142.410 E0.00660 F4800
+G1 X77.472 Y142.317 E0.00660 F4800
+G1 X77.305 Y142.223 E0.00660 F4800
+G1 X77.138 Y142.128 E0.00660 F4800
+G1 X76.971 Y142.033 E0.00660 F4800
+G1 X76.805 Y141.937 E0.00660 F4800
+G1 X76.640 Y141.841 E0.00660 F4800
+G1 X76.475 Y141.743 E0.00660 F4800
+G1 X76.310 Y141.645 E0.00660 F4800
+G1 X76.145 Y141.547 E0.00660 F4800
+G1 X75.981 Y141.448 E0.00660 F4800
+G1 X75.818 Y141.348 E0.00660 F4800
+G1 X75.655 Y141.247 E0.00660 F4800
+G1 X75.492 Y141.146 E0.00660 F4800
+G1 X75.330 Y141.044 E0.00660 F4800
+G1 X75.168 Y140.942 E0.00660 F4800
+G1 X75.006 Y140.839 E0.00660 F4800
+G1 X74.845 Y140.735 E0.00660 F4800
+G1 X74.685 Y140.631 E0.00660 F4800
+G1 X74.524 Y140.526 E0.00660 F4800
+G1 X74.365 Y140.420 E0.00660 F4800
+G1 X74.205 Y140.314 E0.00660 F4800
+G1 X74.046 Y140.207 E0.00660 F4800
+G1 X73.888 Y140.100 E0.00660 F4800
+G1 X73.730 Y139.991 E0.00660 F4800
+G1 X73.572 Y139.883 E0.00660 F4800
+G1 X73.415 Y139.773 E0.00660 F4800
+G1 X73.259 Y139.663 E0.00660 F4800
+G1 X73.103 Y139.553 E0.00660 F4800
+G1 X72.947 Y139.442 E0.00660 F4800
+G1 X72.792 Y139.330 E0.00660 F4800
+G1 X72.637 Y139.217 E0.00660 F4800
+G1 X72.482 Y139.104 E0.00660 F4800
+G1 X72.328 Y138.991 E0.00660 F4800
+G1 X72.175 Y138.876 E0.00660 F4800
+G1 X72.022 Y138.762 E0.00660 F4800
+G1 X71.870 Y138.646 E0.00660 F4800
+G1 X71.718 Y138.530 E0.00660 F4800
+G1 X71.566 Y138.413 E0.00660 F4800
+G1 X71.415 Y138.296 E0.00660 F4800
+G1 X71.265 Y138.178 E0.00660 F4800
+G1 X71.114 Y138.060 E0.00660 F4800
+G1 X70.965 Y137.941 E0.00660 F4800
+G1 X70.816 Y137.821 E0.00660 F4800
+G1 X70.667 Y137.701 E0.00660 F4800
+G1 X70.519 Y137.580 E0.00660 F4800
+G1 X70.372 Y137.459 E0.00660 F4800
+G1 X70.224 Y137.337 E0.00660 F4800
+G1 X70.078 Y137.214 E0.00660 F4800
+G1 X69.932 Y137.091 E0.00660 F4800
+G1 X69.786 Y136.968 E0.00660 F4800
+G1 X69.641 Y136.843 E0.00660 F4800
+G1 X69.496 Y136.719 E0.00660 F4800
+G1 X69.352 Y136.593 E0.00660 F4800
+G1 X69.209 Y136.467 E0.00660 F4800
+G1 X69.066 Y136.341 E0.00660 F4800
+G1 X68.923 Y136.214 E0.00660 F4800
+G1 X68.781 Y136.086 E0.00660 F4800
+G1 X68.640 Y135.958 E0.00660 F4800
+G1 X68.499 Y135.829 E0.00660 F4800
+G1 X68.359 Y135.700 E0.00660 F4800
+G1 X68.219 Y135.570 E0.00660 F4800
+G1 X68.079 Y135.440 E0.00660 F4800
+G1 X67.940 Y135.309 E0.00660 F4800
+G1 X67.802 Y135.177 E0.00660 F4800
+G1 X67.664 Y135.045 E0.00660 F4800
+G1 X67.527 Y134.913 E0.00660 F4800
+G1 X67.391 Y134.780 E0.00660 F4800
+G1 X67.254 Y134.646 E0.00660 F4800
+G1 X67.119 Y134.512 E0.00660 F4800
+G1 X66.984 Y134.377 E0.00660 F4800
+G1 X66.849 Y134.242 E0.00660 F4800
+G1 X66.716 Y134.106 E0.00660 F4800
+G1 X66.582 Y133.970 E0.00660 F4800
+G1 X66.449 Y133.833 E0.00660 F4800
+G1 X66.317 Y133.696 E0.00660 F4800
+G1 X66.185 Y133.558 E0.00660 F4800
+G1 X66.054 Y133.420 E0.00660 F4800
+G1 X65.924 Y133.281 E0.00660 F4800
+G1 X65.794 Y133.142 E0.00660 F4800
+G1 X65.664 Y133.002 E0.00660 F4800
+G1 X65.536 Y132.861 E0.00660 F4800
+G1 X65.407 Y132.721 E0.00660 F4800
+G1 X65.280 Y132.579 E0.00660 F4800
+G1 X65.153 Y132.437 E0.00660 F4800
+G1 X65.026 Y132.295 E0.00660 F4800
+G1 X64.900 Y132.152 E0.00660 F4800
+G1 X64.775 Y132.009 E0.00660 F4800
+G1 X64.650 Y131.865 E0.00660 F4800
+G1 X64.526 Y131.721 E0.00660 F4800
+G1 X64.402 Y131.576 E0.00660 F4800
+G1 X64.279 Y131.430 E0.00660 F4800
+G1 X64.157 Y131.285 E0.00660 F4800
+G1 X64.035 Y131.138 E0.00660 F4800
+G1 X63.914 Y130.992 E0.00660 F4800
+G1 X63.793 Y130.845 E0.00660 F4800
+G1 X63.673 Y130.697 E0.00660 F4800
+G1 X63.554 Y130.549 E0.00660 F4800
+G1 X63.435 Y130.400 E0.00660 F4800
+G1 X63.316 Y130.251 E0.00660 F4800
+G1 X63.199 Y130.102 E0.00660 F4800
+G1 X63.082 Y129.952 E0.00660 F4800
+G1 X62.965 Y129.801 E0.00660 F4800
+G1 X62.850 Y129.650 E0.00660 F4800
+G1 X62.735 Y129.499 E0.00660 F4800
+G1 X62.620 Y129.347 E0.00660 F4800
+G1 X62.506 Y129.195 E0.00660 F4800
+G1 X62.393 Y129.042 E0.00660 F4800
+G1 X62.280 Y128.889 E0.00660 F4800
+G1 X62.168 Y128.736 E0.00660 F4800
+G1 X62.056 Y128.582 E0.00660 F4800
+G1 X61.946 Y128.427 E0.00660 F4800
+G1 X61.835 Y128.273 E0.00660 F4800
+G1 X61.726 Y128.117 E0.00660 F4800
+G1 X61.617 Y127.962 E0.00660 F4800
+G1 X61.509 Y127.806 E0.00660 F4800
+G1 X61.401 Y127.649 E0.00660 F4800
+G1 X61.294 Y127.492 E0.00660 F4800
+G1 X61.188 Y127.335 E0.00660 F4800
+G1 X61.082 Y127.177 E0.00660 F4800
+G1 X60.977 Y127.019 E0.00660 F4800
+G1 X60.872 Y126.860 E0.00660 F4800
+G1 X60.768 Y126.701 E0.00660 F4800
+G1 X60.665 Y126.542 E0.00660 F4800
+G1 X60.563 Y126.382 E0.00660 F4800
+G1 X60.461 Y126.222 E0.00660 F4800
+G1 X60.360 Y126.061 E0.00660 F4800
+G1 X60.259 Y125.900 E0.00660 F4800
+G1 X60.159 Y125.739 E0.00660 F4800
+G1 X60.060 Y125.577 E0.00660 F4800
+G1 X59.961 Y125.415 E0.00660 F4800
+G1 X59.863 Y125.253 E0.00660 F4800
+G1 X59.766 Y125.090 E0.00660 F4800
+G1 X59.669 Y124.927 E0.00660 F4800
+G1 X59.573 Y124.763 E0.00660 F4800
+G1 X59.478 Y124.599 E0.00660 F4800
+G1 X59.383 Y124.435 E0.00660 F4800
+G1 X59.289 Y124.270 E0.00660 F4800
+G1 X59.196 Y124.105 E0.00660 F4800
+G1 X59.104 Y123.940 E0.00660 F4800
+G1 X59.012 Y123.774 E0.00660 F4800
+G1 X58.920 Y123.608 E0.00660 F4800
+G1 X58.830 Y123.441 E0.00660 F4800
+G1 X58.740 Y123.274 E0.00660 F4800
+G1 X58.650 Y123.107 E0.00660 F4800
+G1 X58.562 Y122.940 E0.00660 F4800
+G1 X58.474 Y122.772 E0.00660 F4800
+G1 X58.387 Y122.604 E0.00660 F4800
+G1 X58.300 Y122.435 E0.00660 F4800
+G1 X58.214 Y122.266 E0.00660 F4800
+G1 X58.129 Y122.097 E0.00660 F4800
+G1 X58.045 Y121.927 E0.00660 F4800
+G1 X57.961 Y121.758 E0.00660 F4800
+G1 X57.878 Y121.587 E0.00660 F4800
+G1 X57.795 Y121.417 E0.00660 F4800
+G1 X57.713 Y121.246 E0.00660 F4800
+G1 X57.632 Y121.075 E0.00660 F4800
+G1 X57.552 Y120.904 E0.00660 F4800
+G1 X57.472 Y120.732 E0.00660 F4800
+G1 X57.393 Y120.560 E0.00660 F4800
+G1 X57.315 Y120.388 E0.00660 F4800
+G1 X57.237 Y120.215 E0.00660 F4800
+G1 X57.160 Y120.042 E0.00660 F4800
+G1 X57.084 Y119.869 E0.00660 F4800
+G1 X57.009 Y119.695 E0.00660 F4800
+G1 X56.934 Y119.522 E0.00660 F4800
+G1 X56.860 Y119.348 E0.00660 F4800
+G1 X56.787 Y119.173 E0.00660 F4800
+G1 X56.714 Y118.999 E0.00660 F4800
+G1 X56.642 Y118.824 E0.00660 F4800
+G1 X56.571 Y118.649 E0.00660 F4800
+G1 X56.500 Y118.473 E0.00660 F4800
+G1 X56.430 Y118.298 E0.00660 F4800
+G1 X56.361 Y118.122 E0.00660 F4800
+G1 X56.293 Y117.945 E0.00660 F4800
+G1 X56.225 Y117.769 E0.00660 F4800
+G1 X56.158 Y117.592 E0.00660 F4800
+G1 X56.092 Y117.415 E0.00660 F4800
+G1 X56.026 Y117.238 E0.00660 F4800
+G1 X55.961 Y117.060 E0.00660 F4800
+G1 X55.897 Y116.883 E0.00660 F4800
+G1 X55.834 Y116.705 E0.00660 F4800
+G1 X55.771 Y116.527 E0.00660 F4800
+G1 X55.709 Y116.348 E0.00660 F4800
+G1 X55.648 Y116.169 E0.00660 F4800
+G1 X55.587 Y115.991 E0.00660 F4800
+G1 X55.527 Y115.811 E0.00660 F4800
+G1 X55.468 Y115.632 E0.00660 F4800
+G1 X55.410 Y115.453 E0.00660 F4800
+G1 X55.352 Y115.273 E0.00660 F4800
+G1 X55.295 Y115.093 E0.00660 F4800
+G1 X55.239 Y114.913 E0.00660 F4800
+G1 X55.183 Y114.732 E0.00660 F4800
+G1 X55.129 Y114.552 E0.00660 F4800
+G1 X55.074 Y114.371 E0.00660 F4800
+G1 X55.021 Y114.190 E0.00660 F4800
+G1 X54.969 Y114.008 E0.00660 F4800
+G1 X54.917 Y113.827 E0.00660 F4800
+G1 X54.866 Y113.645 E0.00660 F4800
+G1 X54.815 Y113.464 E0.00660 F4800
+G1 X54.766 Y113.282 E0.00660 F4800
+G1 X54.717 Y113.100 E0.00660 F4800
+G1 X54.668 Y112.917 E0.00660 F4800
+G1 X54.621 Y112.735 E0.00660 F4800
+G1 X54.574 Y112.552 E0.00660 F4800
+G1 X54.528 Y112.369 E0.00660 F4800
+G1 X54.483 Y112.186 E0.00660 F4800
+G1 X54.439 Y112.003 E0.00660 F4800
+G1 X54.395 Y111.820 E0.00660 F4800
+G1 X54.352 Y111.636 E0.00660 F4800
+G1 X54.309 Y111.452 E0.00660 F4800
+G1 X54.268 Y111.269 E0.00660 F4800
+G1 X54.227 Y111.085 E0.00660 F4800
+G1 X54.187 Y110.901 E0.00660 F4800
+G1 X54.148 Y110.716 E0.00660 F4800
+G1 X54.109 Y110.532 E0.00660 F4800
+G1 X54.071 Y110.347 E0.00660 F4800
+G1 X54.034 Y110.163 E0.00660 F4800
+G1 X53.998 Y109.978 E0.00660 F4800
+G1 X53.962 Y109.793 E0.00660 F4800
+G1 X53.927 Y109.608 E0.00660 F4800
+G1 X53.893 Y109.423 E0.00660 F4800
+G1 X53.860 Y109.238 E0.00660 F4800
+G1 X53.827 Y109.052 E0.00660 F4800
+G1 X53.795 Y108.867 E0.00660 F4800
+G1 X53.764 Y108.681 E0.00660 F4800
+G1 X53.733 Y108.495 E0.00660 F4800
+G1 X53.704 Y108.309 E0.00660 F4800
+G1 X53.675 Y108.123 E0.00660 F4800
+G1 X53.647 Y107.937 E0.00660 F4800
+G1 X53.619 Y107.751 E0.00660 F4800
+G1 X53.593 Y107.565 E0.00660 F4800
+G1 X53.567 Y107.379 E0.00660 F4800
+G1 X53.541 Y107.192 E0.00660 F4800
+G1 X53.517 Y107.006 E0.00660 F4800
+G1 X53.493 Y106.819 E0.00660 F4800
+G1 X53.470 Y106.633 E0.00660 F4800
+G1 X53.448 Y106.446 E0.00660 F4800
+G1 X53.427 Y106.259 E0.00660 F4800
+G1 X53.406 Y106.072 E0.00660 F4800
+G1 X53.386 Y105.885 E0.00660 F4800
+G1 X53.367 Y105.698 E0.00660 F4800
+G1 X53.348 Y105.511 E0.00660 F4800
+G1 X53.331 Y105.324 E0.00660 F4800
+G1 X53.314 Y105.137 E0.00660 F4800
+G1 X53.298 Y104.950 E0.00660 F4800
+G1 X53.282 Y104.763 E0.00660 F4800
+G1 X53.267 Y104.575 E0.00660 F4800
+G1 X53.253 Y104.388 E0.00660 F4800
+G1 X53.240 Y104.201 E0.00660 F4800
+G1 X53.228 Y104.013 E0.00660 F4800
+G1 X53.216 Y103.826 E0.00660 F4800
+G1 X53.205 Y103.638 E0.00660 F4800
+G1 X53.195 Y103.451 E0.00660 F4800
+G1 X53.186 Y103.263 E0.00660 F4800
+G1 X53.177 Y103.076 E0.00660 F4800
+G1 X53.169 Y102.888 E0.00660 F4800
+G1 X53.162 Y102.701 E0.00660 F4800
+G1 X53.155 Y102.513 E0.00660 F4800
+G1 X53.150 Y102.325 E0.00660 F4800
+G1 X53.145 Y102.138 E0.00660 F4800
+G1 X53.141 Y101.950 E0.00660 F4800
+G1 X53.137 Y101.763 E0.00660 F4800
+G1 X53.134 Y101.575 E0.00660 F4800
+G1 X53.133 Y101.387 E0.00660 F4800
+G1 X53.131 Y101.200 E0.00660 F4800
+G1 X53.131 Y101.012 E0.00660 F4800
+G1 X53.131 Y100.825 E0.00660 F4800
+G1 X53.132 Y100.637 E0.00660 F4800
+G1 X53.134 Y100.450 E0.00660 F4800
+G1 X53.137 Y100.262 E0.00660 F4800
+G1 X53.140 Y100.075 E0.00660 F4800
+G1 X53.144 Y99.887 E0.00660 F4800
+G1 X53.149 Y99.700 E0.00660 F4800
+G1 X53.155 Y99.512 E0.00660 F4800
+G1 X53.161 Y99.325 E0.00660 F4800
+G1 X53.168 Y99.138 E0.00660 F4800
+G1 X53.176 Y98.951 E0.00660 F4800
+G1 X53.184 Y98.763 E0.00660 F4800
+G1 X53.194 Y98.576 E0.00660 F4800
+G1 X53.204 Y98.389 E0.00660 F4800
+G1 X53.215 Y98.202 E0.00660 F4800
+G1 X53.226 Y98.015 E0.00660 F4800
+G1 X53.238 Y97.828 E0.00660 F4800
+G1 X53.251 Y97.642 E0.00660 F4800
+G1 X53.265 Y97.455 E0.00660 F4800
+G1 X53.280 Y97.268 E0.00660 F4800
+G1 X53.295 Y97.081 E0.00660 F4800
+G1 X53.311 Y96.895 E0.00660 F4800
+G1 X53.328 Y96.709 E0.00660 F4800
+G1 X53.345 Y96.522 E0.00660 F4800
+G1 X53.364 Y96.336 E0.00660 F4800
+G1 X53.383 Y96.150 E0.00660 F4800
+G1 X53.402 Y95.964 E0.00660 F4800
+G1 X53.423 Y95.778 E0.00660 F4800
+G1 X53.444 Y95.592 E0.00660 F4800
+G1 X53.466 Y95.406 E0.00660 F4800
+G1 X53.489 Y95.220 E0.00660 F4800
+G1 X53.512 Y95.035 E0.00660 F4800
+G1 X53.537 Y94.849 E0.00660 F4800
+G1 X53.562 Y94.664 E0.00660 F4800
+G1 X53.587 Y94.479 E0.00660 F4800
+G1 X53.614 Y94.293 E0.00660 F4800
+G1 X53.641 Y94.108 E0.00660 F4800
+G1 X53.669 Y93.924 E0.00660 F4800
+G1 X53.697 Y93.739 E0.00660 F4800
+G1 X53.727 Y93.554 E0.00660 F4800
+G1 X53.757 Y93.370 E0.00660 F4800
+G1 X53.788 Y93.185 E0.00660 F4800
+G1 X53.819 Y93.001 E0.00660 F4800
+G1 X53.852 Y92.817 E0.00660 F4800
+G1 X53.885 Y92.633 E0.00660 F4800
+G1 X53.918 Y92.450 E0.00660 F4800
+G1 X53.953 Y92.266 E0.00660 F4800
+G1 X53.988 Y92.082 E0.00660 F4800
+G1 X54.024 Y91.899 E0.00660 F4800
+G1 X54.061 Y91.716 E0.00660 F4800
+G1 X54.098 Y91.533 E0.00660 F4800
+G1 X54.137 Y91.350 E0.00660 F4800
+G1 X54.175 Y91.168 E0.00660 F4800
+G1 X54.215 Y90.985 E0.00660 F4800
+G1 X54.255 Y90.803 E0.00660 F4800
+G1 X54.296 Y90.621 E0.00660 F4800
+G1 X54.338 Y90.439 E0.00660 F4800
+G1 X54.381 Y90.257 E0.00660 F4800
+G1 X54.424 Y90.076 E0.00660 F4800
+G1 X54.468 Y89.894 E0.00660 F4800
+G1 X54.513 Y89.713 E0.00660 F4800
+G1 X54.558 Y89.532 E0.00660 F4800
+G1 X54.604 Y89.351 E0.00660 F4800
+G1 X54.651 Y89.171 E0.00660 F4800
+G1 X54.699 Y88.990 E0.00660 F4800
+G1 X54.747 Y88.810 E0.00660 F4800
+G1 X54.796 Y88.630 E0.00660 F4800
+G1 X54.846 Y88.451 E0.00660 F4800
+G1 X54.896 Y88.271 E0.00660 F4800
+G1 X54.947 Y88.092 E0.00660 F4800
+G1 X54.999 Y87.913 E0.00660 F4800
+G1 X55.052 Y87.734 E0.00660 F4800
+G1 X55.105 Y87.555 E0.00660 F4800
+G1 X55.159 Y87.377 E0.00660 F4800
+G1 X55.214 Y87.199 E0.00660 F4800
+G1 X55.269 Y87.021 E0.00660 F4800
+G1 X55.325 Y86.843 E0.00660 F4800
+G1 X55.382 Y86.666 E0.00660 F4800
+G1 X55.439 Y86.488 E0.00660 F4800
+G1 X55.498 Y86.311 E0.00660 F4800
+G1 X55.557 Y86.135 E0.00660 F4800
+G1 X55.616 Y85.958 E0.00660 F4800
+G1 X55.677 Y85.782 E0.00660 F4800
+G1 X55.738 Y85.606 E0.00660 F4800
+G1 X55.799 Y85.430 E0.00660 F4800
+G1 X55.862 Y85.255 E0.00660 F4800
+G1 X55.925 Y85.080 E0.00660 F4800
+G1 X55.989 Y84.905 E0.00660 F4800
+G1 X56.053 Y84.730 E0.00660 F4800
+G1 X56.118 Y84.556 E0.00660 F4800
+G1 X56.184 Y84.382 E0.00660 F4800
+G1 X56.251 Y84.208 E0.00660 F4800
+G1 X56.318 Y84.035 E0.00660 F4800
+G1 X56.386 Y83.862 E0.00660 F4800
+G1 X56.455 Y83.689 E0.00660 F4800
+G1 X56.524 Y83.516 E0.00660 F4800
+G1 X56.594 Y83.344 E0.00660 F4800
+G1 X56.665 Y83.172 E0.00660 F4800
+G1 X56.736 Y83.000 E0.00660 F4800
+G1 X56.808 Y82.828 E0.00660 F4800
+G1 X56.881 Y82.657 E0.00660 F4800
+G1 X56.954 Y82.486 E0.00660 F4800
+G1 X57.029 Y82.316 E0.00660 F4800
+G1 X57.103 Y82.146 E0.00660 F4800
+G1 X57.179 Y81.976 E0.00660 F4800
+G1 X57.255 Y81.806 E0.00660 F4800
+G1 X57.332 Y81.637 E0.00660 F4800
+G1 X57.409 Y81.468 E0.00660 F4800
+G1 X57.487 Y81.299 E0.00660 F4800
+G1 X57.566 Y81.131 E0.00660 F4800
+G1 X57.646 Y80.963 E0.00660 F4800
+G1 X57.726 Y80.796 E0.00660 F4800
+G1 X57.806 Y80.628 E0.00660 F4800
+G1 X57.888 Y80.461 E0.00660 F4800
+G1 X57.970 Y80.295 E0.00660 F4800
+G1 X58.053 Y80.129 E0.00660 F4800
+G1 X58.136 Y79.963 E0.00660 F4800
+G1 X58.220 Y79.797 E0.00660 F4800
+G1 X58.305 Y79.632 E0.00660 F4800
+G1 X58.390 Y79.467 E0.00660 F4800
+G1 X58.476 Y79.303 E0.00660 F4800
+G1 X58.563 Y79.138 E0.00660 F4800
+G1 X58.650 Y78.975 E0.00660 F4800
+G1 X58.738 Y78.811 E0.00660 F4800
+G1 X58.827 Y78.648 E0.00660 F4800
+G1 X58.916 Y78.486 E0.00660 F4800
+G1 X59.006 Y78.323 E0.00660 F4800
+G1 X59.097 Y78.161 E0.00660 F4800
+G1 X59.188 Y78.000 E0.00660 F4800
+G1 X59.280 Y77.839 E0.00660 F4800
+G1 X59.372 Y77.678 E0.00660 F4800
+G1 X59.466 Y77.517 E0.00660 F4800
+G1 X59.559 Y77.357 E0.00660 F4800
+G1 X59.654 Y77.198 E0.00660 F4800
+G1 X59.749 Y77.039 E0.00660 F4800
+G1 X59.844 Y76.880 E0.00660 F4800
+G1 X59.941 Y76.721 E0.00660 F4800
+G1 X60.037 Y76.563 E0.00660 F4800
+G1 X60.135 Y76.406 E0.00660 F4800
+G1 X60.233 Y76.249 E0.00660 F4800
+G1 X60.332 Y76.092 E0.00660 F4800
+G1 X60.431 Y75.935 E0.00660 F4800
+G1 X60.531 Y75.779 E0.00660 F4800
+G1 X60.632 Y75.624 E0.00660 F4800
+G1 X60.733 Y75.469 E0.00660 F4800
+G1 X60.835 Y75.314 E0.00660 F4800
+G1 X60.937 Y75.160 E0.00660 F4800
+G1 X61.040 Y75.006 E0.00660 F4800
+G1 X61.144 Y74.852 E0.00660 F4800
+G1 X61.248 Y74.699 E0.00660 F4800
+G1 X61.353 Y74.547 E0.00660 F4800
+G1 X61.458 Y74.394 E0.00660 F4800
+G1 X61.565 Y74.243 E0.00660 F4800
+G1 X61.671 Y74.091 E0.00660 F4800
+G1 X61.778 Y73.940 E0.00660 F4800
+G1 X61.886 Y73.790 E0.00660 F4800
+G1 X61.995 Y73.640 E0.00660 F4800
+G1 X62.104 Y73.491 E0.00660 F4800
+G1 X62.213 Y73.342 E0.00660 F4800
+G1 X62.324 Y73.193 E0.00660 F4800
+G1 X62.434 Y73.045 E0.00660 F4800
+G1 X62.546 Y72.897 E0.00660 F4800
+G1 X62.658 Y72.750 E0.00660 F4800
+G1 X62.770 Y72.603 E0.00660 F4800
+G1 X62.883 Y72.457 E0.00660 F4800
+G1 X62.997 Y72.311 E0.00660 F4800
+G1 X63.111 Y72.165 E0.00660 F4800
+G1 X63.226 Y72.021 E0.00660 F4800
+G1 X63.341 Y71.876 E0.00660 F4800
+G1 X63.457 Y71.732 E0.00660 F4800
+G1 X63.574 Y71.589 E0.00660 F4800
+G1 X63.691 Y71.446 E0.00660 F4800
+G1 X63.809 Y71.303 E0.00660 F4800
+G1 X63.927 Y71.161 E0.00660 F4800
+G1 X64.045 Y71.020 E0.00660 F4800
+G1 X64.165 Y70.879 E0.00660 F4800
+G1 X64.285 Y70.738 E0.00660 F4800
+G1 X64.405 Y70.598 E0.00660 F4800
+G1 X64.526 Y70.458 E0.00660 F4800
+G1 X64.648 Y70.319 E0.00660 F4800
+G1 X64.770 Y70.181 E0.00660 F4800
+G1 X64.892 Y70.043 E0.00660 F4800
+G1 X65.015 Y69.905 E0.00660 F4800
+G1 X65.139 Y69.768 E0.00660 F4800
+G1 X65.263 Y69.631 E0.00660 F4800
+G1 X65.388 Y69.495 E0.00660 F4800
+G1 X65.513 Y69.360 E0.00660 F4800
+G1 X65.639 Y69.225 E0.00660 F4800
+G1 X65.765 Y69.090 E0.00660 F4800
+G1 X65.892 Y68.956 E0.00660 F4800
+G1 X66.020 Y68.823 E0.00660 F4800
+G1 X66.148 Y68.690 E0.00660 F4800
+G1 X66.276 Y68.557 E0.00660 F4800
+G1 X66.405 Y68.425 E0.00660 F4800
+G1 X66.535 Y68.294 E0.00660 F4800
+G1 X66.665 Y68.163 E0.00660 F4800
+G1 X66.795 Y68.033 E0.00660 F4800
+G1 X66.926 Y67.903 E0.00660 F4800
+G1 X67.058 Y67.774 E0.00660 F4800
+G1 X67.190 Y67.645 E0.00660 F4800
+G1 X67.322 Y67.517 E0.00660 F4800
+G1 X67.455 Y67.389 E0.00660 F4800
+G1 X67.589 Y67.262 E0.00660 F4800
+G1 X67.723 Y67.136 E0.00660 F4800
+G1 X67.857 Y67.010 E0.00660 F4800
+G1 X67.992 Y66.884 E0.00660 F4800
+G1 X68.128 Y66.759 E0.00660 F4800
+G1 X68.264 Y66.635 E0.00660 F4800
+G1 X68.400 Y66.511 E0.00660 F4800
+G1 X68.537 Y66.388 E0.00660 F4800
+G1 X68.674 Y66.265 E0.00660 F4800
+G1 X68.812 Y66.143 E0.00660 F4800
+G1 X68.951 Y66.022 E0.00660 F4800
+G1 X69.090 Y65.901 E0.00660 F4800
+G1 X69.229 Y65.780 E0.00660 F4800
+G1 X69.369 Y65.661 E0.00660 F4800
+G1 X69.509 Y65.541 E0.00660 F4800
+G1 X69.650 Y65.423 E0.00660 F4800
+G1 X69.791 Y65.305 E0.00660 F4800
+G1 X69.932 Y65.187 E0.00660 F4800
+G1 X70.074 Y65.070 E0.00660 F4800
+G1 X70.217 Y64.954 E0.00660 F4800
+G1 X70.360 Y64.838 E0.00660 F4800
+G1 X70.503 Y64.723 E0.00660 F4800
+G1 X70.647 Y64.608 E0.00660 F4800
+G1 X70.792 Y64.494 E0.00660 F4800
+G1 X70.937 Y64.381 E0.00660 F4800
+G1 X71.082 Y64.268 E0.00660 F4800
+G1 X71.227 Y64.156 E0.00660 F4800
+G1 X71.374 Y64.044 E0.00660 F4800
+G1 X71.520 Y63.933 E0.00660 F4800
+G1 X71.667 Y63.822 E0.00660 F4800
+G1 X71.814 Y63.712 E0.00660 F4800
+G1 X71.962 Y63.603 E0.00660 F4800
+G1 X72.110 Y63.494 E0.00660 F4800
+G1 X72.259 Y63.386 E0.00660 F4800
+G1 X72.408 Y63.279 E0.00660 F4800
+G1 X72.558 Y63.172 E0.00660 F4800
+G1 X72.708 Y63.066 E0.00660 F4800
+G1 X72.858 Y62.960 E0.00660 F4800
+G1 X73.009 Y62.855 E0.00660 F4800
+G1 X73.160 Y62.751 E0.00660 F4800
+G1 X73.311 Y62.647 E0.00660 F4800
+G1 X73.463 Y62.544 E0.00660 F4800
+G1 X73.616 Y62.441 E0.00660 F4800
+G1 X73.768 Y62.339 E0.00660 F4800
+G1 X73.921 Y62.238 E0.00660 F4800
+G1 X74.075 Y62.137 E0.00660 F4800
+G1 X74.229 Y62.037 E0.00660 F4800
+G1 X74.383 Y61.938 E0.00660 F4800
+G1 X74.538 Y61.839 E0.00660 F4800
+G1 X74.693 Y61.740 E0.00660 F4800
+G1 X74.848 Y61.643 E0.00660 F4800
+G1 X75.004 Y61.546 E0.00660 F4800
+G1 X75.160 Y61.450 E0.00660 F4800
+G1 X75.317 Y61.354 E0.00660 F4800
+G1 X75.474 Y61.259 E0.00660 F4800
+G1 X75.631 Y61.165 E0.00660 F4800
+G1 X75.789 Y61.071 E0.00660 F4800
+G1 X75.947 Y60.978 E0.00660 F4800
+G1 X76.105 Y60.885 E0.00660 F4800
+G1 X76.264 Y60.793 E0.00660 F4800
+G1 X76.423 Y60.702 E0.00660 F4800
+G1 X76.582 Y60.612 E0.00660 F4800
+G1 X76.742 Y60.522 E0.00660 F4800
+G1 X76.902 Y60.432 E0.00660 F4800
+G1 X77.063 Y60.344 E0.00660 F4800
+G1 X77.223 Y60.256 E0.00660 F4800
+G1 X77.385 Y60.168 E0.00660 F4800
+G1 X77.546 Y60.082 E0.00660 F4800
+G1 X77.708 Y59.996 E0.00660 F4800
+G1 X77.870 Y59.910 E0.00660 F4800
+G1 X78.032 Y59.826 E0.00660 F4800
+G1 X78.195 Y59.742 E0.00660 F4800
+G1 X78.358 Y59.658 E0.00660 F4800
+G1 X78.522 Y59.576 E0.00660 F4800
+G1 X78.685 Y59.494 E0.00660 F4800
+G1 X78.850 Y59.412 E0.00660 F4800
+G1 X79.014 Y59.332 E0.00660 F4800
+G1 X79.179 Y59.251 E0.00660 F4800
+G1 X79.343 Y59.172 E0.00660 F4800
+G1 X79.509 Y59.093 E0.00660 F4800
+G1 X79.674 Y59.015 E0.00660 F4800
+G1 X79.840 Y58.938 E0.00660 F4800
+G1 X80.006 Y58.861 E0.00660 F4800
+G1 X80.173 Y58.785 E0.00660 F4800
+G1 X80.340 Y58.710 E0.00660 F4800
+G1 X80.507 Y58.635 E0.00660 F4800
+G1 X80.674 Y58.561 E0.00660 F4800
+G1 X80.841 Y58.488 E0.00660 F4800
+G1 X81.009 Y58.415 E0.00660 F4800
+G1 X81.177 Y58.343 E0.00660 F4800
+G1 X81.346 Y58.272 E0.00660 F4800
+G1 X81.515 Y58.201 E0.00660 F4800
+G1 X81.683 Y58.131 E0.00660 F4800
+G1 X81.853 Y58.062 E0.00660 F4800
+G1 X82.022 Y57.993 E0.00660 F4800
+G1 X82.192 Y57.925 E0.00660 F4800
+G1 X82.362 Y57.858 E0.00660 F4800
+G1 X82.532 Y57.792 E0.00660 F4800
+G1 X82.703 Y57.726 E0.00660 F4800
+G1 X82.873 Y57.661 E0.00660 F4800
+G1 X83.044 Y57.596 E0.00660 F4800
+G1 X83.216 Y57.533 E0.00660 F4800
+G1 X83.387 Y57.470 E0.00660 F4800
+G1 X83.559 Y57.407 E0.00660 F4800
+G1 X83.731 Y57.345 E0.00660 F4800
+G1 X83.903 Y57.284 E0.00660 F4800
+G1 X84.075 Y57.224 E0.00660 F4800
+G1 X84.248 Y57.165 E0.00660 F4800
+G1 X84.421 Y57.106 E0.00660 F4800
+G1 X84.594 Y57.047 E0.00660 F4800
+G1 X84.767 Y56.990 E0.00660 F4800
+G1 X84.940 Y56.933 E0.00660 F4800
+G1 X85.114 Y56.877 E0.00660 F4800
+G1 X85.288 Y56.822 E0.00660 F4800
+G1 X85.462 Y56.767 E0.00660 F4800
+G1 X85.636 Y56.713 E0.00660 F4800
+G1 X85.811 Y56.660 E0.00660 F4800
+G1 X85.986 Y56.607 E0.00660 F4800
+G1 X86.161 Y56.555 E0.00660 F4800
+G1 X86.336 Y56.504 E0.00660 F4800
+G1 X86.511 Y56.453 E0.00660 F4800
+G1 X86.686 Y56.404 E0.00660 F4800
+G1 X86.862 Y56.355 E0.00660 F4800
+G1 X87.038 Y56.306 E0.00660 F4800
+G1 X87.214 Y56.258 E0.00660 F4800
+G1 X87.390 Y56.212 E0.00660 F4800
+G1 X87.566 Y56.165 E0.00660 F4800
+G1 X87.743 Y56.120 E0.00660 F4800
+G1 X87.920 Y56.075 E0.00660 F4800
+G1 X88.096 Y56.031 E0.00660 F4800
+G1 X88.273 Y55.987 E0.00660 F4800
+G1 X88.451 Y55.945 E0.00660 F4800
+G1 X88.628 Y55.903 E0.00660 F4800
+G1 X88.805 Y55.862 E0.00660 F4800
+G1 X88.983 Y55.821 E0.00660 F4800
+G1 X89.161 Y55.781 E0.00660 F4800
+G1 X89.339 Y55.742 E0.00660 F4800
+G1 X89.517 Y55.704 E0.00660 F4800
+G1 X89.695 Y55.666 E0.00660 F4800
+G1 X89.873 Y55.629 E0.00660 F4800
+G1 X90.052 Y55.593 E0.00660 F4800
+G1 X90.230 Y55.557 E0.00660 F4800
+G1 X90.409 Y55.522 E0.00660 F4800
+G1 X90.588 Y55.488 E0.00660 F4800
+G1 X90.767 Y55.455 E0.00660 F4800
+G1 X90.946 Y55.422 E0.00660 F4800
+G1 X91.125 Y55.390 E0.00660 F4800
+G1 X91.304 Y55.359 E0.00660 F4800
+G1 X91.483 Y55.329 E0.00660 F4800
+G1 X91.663 Y55.299 E0.00660 F4800
+G1 X91.842 Y55.270 E0.00660 F4800
+G1 X92.022 Y55.241 E0.00660 F4800
+G1 X92.202 Y55.214 E0.00660 F4800
+G1 X92.382 Y55.187 E0.00660 F4800
+G1 X92.562 Y55.161 E0.00660 F4800
+G1 X92.742 Y55.135 E0.00660 F4800
+G1 X92.922 Y55.111 E0.00660 F4800
+G1 X93.102 Y55.087 E0.00660 F4800
+G1 X93.283 Y55.063 E0.00660 F4800
+G1 X93.463 Y55.041 E0.00660 F4800
+G1 X93.643 Y55.019 E0.00660 F4800
+G1 X93.824 Y54.998 E0.00660 F4800
+G1 X94.004 Y54.977 E0.00660 F4800
+G1 X94.185 Y54.958 E0.00660 F4800
+G1 X94.366 Y54.939 E0.00660 F4800
+G1 X94.547 Y54.921 E0.00660 F4800
+G1 X94.727 Y54.903 E0.00660 F4800
+G1 X94.908 Y54.886 E0.00660 F4800
+G1 X95.089 Y54.870 E0.00660 F4800
+G1 X95.270 Y54.855 E0.00660 F4800
+G1 X95.451 Y54.841 E0.00660 F4800
+G1 X95.632 Y54.827 E0.00660 F4800
+G1 X95.813 Y54.814 E0.00660 F4800
+G1 X95.994 Y54.801 E0.00660 F4800
+G1 X96.176 Y54.789 E0.00660 F4800
+G1 X96.357 Y54.779 E0.00660 F4800
+G1 X96.538 Y54.768 E0.00660 F4800
+G1 X96.719 Y54.759 E0.00660 F4800
+G1 X96.901 Y54.750 E0.00660 F4800
+G1 X97.082 Y54.742 E0.00660 F4800
+G1 X97.263 Y54.735 E0.00660 F4800
+G1 X97.444 Y54.728 E0.00660 F4800
+G1 X97.626 Y54.722 E0.00660 F4800
+G1 X97.807 Y54.717 E0.00660 F4800
+G1 X97.988 Y54.713 E0.00660 F4800
+G1 X98.170 Y54.709 E0.00660 F4800
+G1 X98.351 Y54.706 E0.00660 F4800
+G1 X98.532 Y54.704 E0.00660 F4800
+G1 X98.714 Y54.702 E0.00660 F4800
+G1 X98.895 Y54.701 E0.00660 F4800
+G1 X99.076 Y54.701 E0.00660 F4800
+G1 X99.258 Y54.702 E0.00660 F4800
+G1 X99.439 Y54.703 E0.00660 F4800
+G1 X99.620 Y54.706 E0.00660 F4800
+G1 X99.801 Y54.708 E0.00660 F4800
+G1 X99.982 Y54.712 E0.00660 F4800
+G1 X100.164 Y54.716 E0.00660 F4800
+G1 X100.345 Y54.721 E0.00660 F4800
+G1 X100.526 Y54.727 E0.00660 F4800
+G1 X100.707 Y54.734 E0.00660 F4800
+G1 X100.888 Y54.741 E0.00660 F4800
+G1 X101.069 Y54.749 E0.00660 F4800
+G1 X101.250 Y54.757 E0.00660 F4800
+G1 X101.430 Y54.767 E0.00660 F4800
+G1 X101.611 Y54.777 E0.00660 F4800
+G1 X101.792 Y54.787 E0.00660 F4800
+G1 X101.973 Y54.799 E0.00660 F4800
+G1 X102.153 Y54.811 E0.00660 F4800
+G1 X102.334 Y54.824 E0.00660 F4800
+G1 X102.514 Y54.838 E0.00660 F4800
+G1 X102.694 Y54.852 E0.00660 F4800
+G1 X102.875 Y54.867 E0.00660 F4800
+G1 X103.055 Y54.883 E0.00660 F4800
+G1 X103.235 Y54.900 E0.00660 F4800
+G1 X103.415 Y54.917 E0.00660 F4800
+G1 X103.595 Y54.935 E0.00660 F4800
+G1 X103.775 Y54.954 E0.00660 F4800
+G1 X103.955 Y54.973 E0.00660 F4800
+G1 X104.135 Y54.994 E0.00660 F4800
+G1 X104.314 Y55.014 E0.00660 F4800
+G1 X104.494 Y55.036 E0.00660 F4800
+G1 X104.673 Y55.058 E0.00660 F4800
+G1 X104.852 Y55.081 E0.00660 F4800
+G1 X105.032 Y55.105 E0.00660 F4800
+G1 X105.211 Y55.130 E0.00660 F4800
+G1 X105.390 Y55.155 E0.00660 F4800
+G1 X105.569 Y55.181 E0.00660 F4800
+G1 X105.747 Y55.207 E0.00660 F4800
+G1 X105.926 Y55.235 E0.00660 F4800
+G1 X106.104 Y55.263 E0.00660 F4800
+G1 X106.283 Y55.291 E0.00660 F4800
+G1 X106.461 Y55.321 E0.00660 F4800
+G1 X106.639 Y55.351 E0.00660 F4800
+G1 X106.817 Y55.382 E0.00660 F4800
+G1 X106.995 Y55.413 E0.00660 F4800
+G1 X107.172 Y55.446 E0.00660 F4800
+G1 X107.350 Y55.479 E0.00660 F4800
+G1 X107.527 Y55.512 E0.00660 F4800
+G1 X107.704 Y55.547 E0.00660 F4800
+G1 X107.882 Y55.582 E0.00660 F4800
+G1 X108.058 Y55.618 E0.00660 F4800
+G1 X108.235 Y55.654 E0.00660 F4800
+G1 X108.412 Y55.691 E0.00660 F4800
+G1 X108.588 Y55.729 E0.00660 F4800
+G1 X108.764 Y55.768 E0.00660 F4800
+G1 X108.940 Y55.807 E0.00660 F4800
+G1 X109.116 Y55.847 E0.00660 F4800
+G1 X109.292 Y55.888 E0.00660 F4800
+G1 X109.468 Y55.929 E0.00660 F4800
+G1 X109.643 Y55.972 E0.00660 F4800
+G1 X109.818 Y56.014 E0.00660 F4800
+G1 X109.993 Y56.058 E0.00660 F4800
+G1 X110.168 Y56.102 E0.00660 F4800
+G1 X110.342 Y56.147 E0.00660 F4800
+G1 X110.517 Y56.193 E0.00660 F4800
+G1 X110.691 Y56.239 E0.00660 F4800
+G1 X110.865 Y56.286 E0.00660 F4800
+G1 X111.039 Y56.334 E0.00660 F4800
+G1 X111.212 Y56.382 E0.00660 F4800
+G1 X111.386 Y56.431 E0.00660 F4800
+G1 X111.559 Y56.481 E0.00660 F4800
+G1 X111.732 Y56.531 E0.00660 F4800
+G1 X111.905 Y56.582 E0.00660 F4800
+G1 X112.077 Y56.634 E0.00660 F4800
+G1 X112.249 Y56.687 E0.00660 F4800
+G1 X112.421 Y56.740 E0.00660 F4800
+G1 X112.593 Y56.794 E0.00660 F4800
+G1 X112.765 Y56.848 E0.00660 F4800
+G1 X112.936 Y56.904 E0.00660 F4800
+G1 X113.107 Y56.960 E0.00660 F4800
+G1 X113.278 Y57.016 E0.00660 F4800
+G1 X113.449 Y57.073 E0.00660 F4800
+G1 X113.619 Y57.131 E0.00660 F4800
+G1 X113.789 Y57.190 E0.00660 F4800
+G1 X113.959 Y57.249 E0.00660 F4800
+G1 X114.129 Y57.309 E0.00660 F4800
+G1 X114.298 Y57.370 E0.00660 F4800
+G1 X114.467 Y57.431 E0.00660 F4800
+G1 X114.636 Y57.493 E0.00660 F4800
+G1 X114.805 Y57.556 E0.00660 F4800
+G1 X114.973 Y57.619 E0.00660 F4800
+G1 X115.141 Y57.683 E0.00660 F4800
+G1 X115.309 Y57.748 E0.00660 F4800
+G1 X115.476 Y57.813 E0.00660 F4800
+G1 X115.644 Y57.879 E0.00660 F4800
+G1 X115.811 Y57.946 E0.00660 F4800
+G1 X115.977 Y58.013 E0.00660 F4800
+G1 X116.144 Y58.081 E0.00660 F4800
+G1 X116.310 Y58.150 E0.00660 F4800
+G1 X116.476 Y58.219 E0.00660 F4800
+G1 X116.641 Y58.289 E0.00660 F4800
+G1 X116.806 Y58.360 E0.00660 F4800
+G1 X116.971 Y58.431 E0.00660 F4800
+G1 X117.136 Y58.503 E0.00660 F4800
+G1 X117.300 Y58.575 E0.00660 F4800
+G1 X117.464 Y58.649 E0.00660 F4800
+G1 X117.628 Y58.722 E0.00660 F4800
+G1 X117.791 Y58.797 E0.00660 F4800
+G1 X117.954 Y58.872 E0.00660 F4800
+G1 X118.117 Y58.948 E0.00660 F4800
+G1 X118.279 Y59.024 E0.00660 F4800
+G1 X118.442 Y59.102 E0.00660 F4800
+G1 X118.603 Y59.179 E0.00660 F4800
+G1 X118.765 Y59.258 E0.00660 F4800
+G1 X118.926 Y59.337 E0.00660 F4800
+G1 X119.087 Y59.416 E0.00660 F4800
+G1 X119.247 Y59.497 E0.00660 F4800
+G1 X119.407 Y59.577 E0.00660 F4800
+G1 X119.567 Y59.659 E0.00660 F4800
+G1 X119.727 Y59.741 E0.00660 F4800
+G1 X119.886 Y59.824 E0.00660 F4800
+G1 X120.044 Y59.907 E0.00660 F4800
+G1 X120.203 Y59.992 E0.00660 F4800
+G1 X120.361 Y60.076 E0.00660 F4800
+G1 X120.519 Y60.162 E0.00660 F4800
+G1 X120.676 Y60.247 E0.00660 F4800
+G1 X120.833 Y60.334 E0.00660 F4800
+G1 X120.990 Y60.421 E0.00660 F4800
+G1 X121.146 Y60.509 E0.00660 F4800
+G1 X121.302 Y60.597 E0.00660 F4800
+G1 X121.457 Y60.686 E0.00660 F4800
+G1 X121.612 Y60.776 E0.00660 F4800
+G1 X121.767 Y60.866 E0.00660 F4800
+G1 X121.922 Y60.957 E0.00660 F4800
+G1 X122.076 Y61.049 E0.00660 F4800
+G1 X122.229 Y61.141 E0.00660 F4800
+G1 X122.382 Y61.234 E0.00660 F4800
+G1 X122.535 Y61.327 E0.00660 F4800
+G1 X122.688 Y61.421 E0.00660 F4800
+G1 X122.840 Y61.515 E0.00660 F4800
+G1 X122.992 Y61.610 E0.00660 F4800
+G1 X123.143 Y61.706 E0.00660 F4800
+G1 X123.294 Y61.802 E0.00660 F4800
+G1 X123.444 Y61.899 E0.00660 F4800
+G1 X123.594 Y61.997 E0.00660 F4800
+G1 X123.744 Y62.095 E0.00660 F4800
+G1 X123.893 Y62.193 E0.00660 F4800
+G1 X124.042 Y62.293 E0.00660 F4800
+G1 X124.191 Y62.392 E0.00660 F4800
+G1 X124.339 Y62.493 E0.00660 F4800
+G1 X124.487 Y62.594 E0.00660 F4800
+G1 X124.634 Y62.695 E0.00660 F4800
+G1 X124.781 Y62.798 E0.00660 F4800
+G1 X124.927 Y62.900 E0.00660 F4800
+G1 X125.073 Y63.004 E0.00660 F4800
+G1 X125.218 Y63.108 E0.00660 F4800
+G1 X125.363 Y63.212 E0.00660 F4800
+G1 X125.508 Y63.317 E0.00660 F4800
+G1 X125.652 Y63.423 E0.00660 F4800
+G1 X125.796 Y63.529 E0.00660 F4800
+G1 X125.940 Y63.636 E0.00660 F4800
+G1 X126.082 Y63.743 E0.00660 F4800
+G1 X126.225 Y63.851 E0.00660 F4800
+G1 X126.367 Y63.959 E0.00660 F4800
+G1 X126.509 Y64.068 E0.00660 F4800
+G1 X126.650 Y64.178 E0.00660 F4800
+G1 X126.790 Y64.288 E0.00660 F4800
+G1 X126.931 Y64.398 E0.00660 F4800
+G1 X127.070 Y64.510 E0.00660 F4800
+G1 X127.210 Y64.621 E0.00660 F4800
+G1 X127.348 Y64.734 E0.00660 F4800
+G1 X127.487 Y64.846 E0.00660 F4800
+G1 X127.625 Y64.960 E0.00660 F4800
+G1 X127.762 Y65.074 E0.00660 F4800
+G1 X127.899 Y65.188 E0.00660 F4800
+G1 X128.036 Y65.303 E0.00660 F4800
+G1 X128.172 Y65.419 E0.00660 F4800
+G1 X128.307 Y65.535 E0.00660 F4800
+G1 X128.442 Y65.651 E0.00660 F4800
+G1 X128.577 Y65.768 E0.00660 F4800
+G1 X128.711 Y65.886 E0.00660 F4800
+G1 X128.845 Y66.004 E0.00660 F4800
+G1 X128.978 Y66.123 E0.00660 F4800
+G1 X129.111 Y66.242 E0.00660 F4800
+G1 X129.243 Y66.362 E0.00660 F4800
+G1 X129.374 Y66.482 E0.00660 F4800
+G1 X129.506 Y66.603 E0.00660 F4800
+G1 X129.636 Y66.724 E0.00660 F4800
+G1 X129.766 Y66.846 E0.00660 F4800
+G1 X129.896 Y66.968 E0.00660 F4800
+G1 X130.025 Y67.091 E0.00660 F4800
+G1 X130.154 Y67.214 E0.00660 F4800
+G1 X130.282 Y67.338 E0.00660 F4800
+G1 X130.410 Y67.462 E0.00660 F4800
+G1 X130.537 Y67.587 E0.00660 F4800
+G1 X130.664 Y67.713 E0.00660 F4800
+G1 X130.790 Y67.838 E0.00660 F4800
+G1 X130.915 Y67.965 E0.00660 F4800
+G1 X131.041 Y68.091 E0.00660 F4800
+G1 X131.165 Y68.219 E0.00660 F4800
+G1 X131.289 Y68.346 E0.00660 F4800
+G1 X131.413 Y68.475 E0.00660 F4800
+G1 X131.536 Y68.603 E0.00660 F4800
+G1 X131.658 Y68.733 E0.00660 F4800
+G1 X131.780 Y68.862 E0.00660 F4800
+G1 X131.902 Y68.993 E0.00660 F4800
+G1 X132.023 Y69.123 E0.00660 F4800
+G1 X132.143 Y69.254 E0.00660 F4800
+G1 X132.263 Y69.386 E0.00660 F4800
+G1 X132.382 Y69.518 E0.00660 F4800
+G1 X132.501 Y69.650 E0.00660 F4800
+G1 X132.619 Y69.783 E0.00660 F4800
+G1 X132.737 Y69.917 E0.00660 F4800
+G1 X132.854 Y70.051 E0.00660 F4800
+G1 X132.970 Y70.185 E0.00660 F4800
+G1 X133.086 Y70.320 E0.00660 F4800
+G1 X133.202 Y70.455 E0.00660 F4800
+G1 X133.317 Y70.591 E0.00660 F4800
+G1 X133.431 Y70.727 E0.00660 F4800
+G1 X133.545 Y70.863 E0.00660 F4800
+G1 X133.658 Y71.000 E0.00660 F4800
+G1 X133.771 Y71.138 E0.00660 F4800
+G1 X133.883 Y71.276 E0.00660 F4800
+G1 X133.995 Y71.414 E0.00660 F4800
+G1 X134.106 Y71.553 E0.00660 F4800
+G1 X134.216 Y71.692 E0.00660 F4800
+G1 X134.326 Y71.832 E0.00660 F4800
+G1 X134.435 Y71.972 E0.00660 F4800
+G1 X134.544 Y72.112 E0.00660 F4800
+G1 X134.652 Y72.253 E0.00660 F4800
+G1 X134.760 Y72.394 E0.00660 F4800
+G1 X134.867 Y72.536 E0.00660 F4800
+G1 X134.973 Y72.678 E0.00660 F4800
+G1 X135.079 Y72.821 E0.00660 F4800
+G1 X135.184 Y72.964 E0.00660 F4800
+G1 X135.289 Y73.107 E0.00660 F4800
+G1 X135.393 Y73.251 E0.00660 F4800
+G1 X135.496 Y73.395 E0.00660 F4800
+G1 X135.599 Y73.540 E0.00660 F4800
+G1 X135.702 Y73.685 E0.00660 F4800
+G1 X135.803 Y73.830 E0.00660 F4800
+G1 X135.905 Y73.976 E0.00660 F4800
+G1 X136.005 Y74.122 E0.00660 F4800
+G1 X136.105 Y74.269 E0.00660 F4800
+G1 X136.204 Y74.416 E0.00660 F4800
+G1 X136.303 Y74.563 E0.00660 F4800
+G1 X136.401 Y74.711 E0.00660 F4800
+G1 X136.499 Y74.859 E0.00660 F4800
+G1 X136.596 Y75.007 E0.00660 F4800
+G1 X136.692 Y75.156 E0.00660 F4800
+G1 X136.788 Y75.305 E0.00660 F4800
+G1 X136.883 Y75.455 E0.00660 F4800
+G1 X136.978 Y75.605 E0.00660 F4800
+G1 X137.072 Y75.755 E0.00660 F4800
+G1 X137.165 Y75.906 E0.00660 F4800
+G1 X137.258 Y76.057 E0.00660 F4800
+G1 X137.350 Y76.208 E0.00660 F4800
+G1 X137.441 Y76.360 E0.00660 F4800
+G1 X137.532 Y76.512 E0.00660 F4800
+G1 X137.622 Y76.664 E0.00660 F4800
+G1 X137.712 Y76.817 E0.00660 F4800
+G1 X137.801 Y76.970 E0.00660 F4800
+G1 X137.890 Y77.124 E0.00660 F4800
+G1 X137.977 Y77.277 E0.00660 F4800
+G1 X138.064 Y77.431 E0.00660 F4800
+G1 X138.151 Y77.586 E0.00660 F4800
+G1 X138.237 Y77.741 E0.00660 F4800
+G1 X138.322 Y77.896 E0.00660 F4800
+G1 X138.407 Y78.051 E0.00660 F4800
+G1 X138.491 Y78.207 E0.00660 F4800
+G1 X138.574 Y78.363 E0.00660 F4800
+G1 X138.657 Y78.520 E0.00660 F4800
+G1 X138.739 Y78.676 E0.00660 F4800
+G1 X138.820 Y78.833 E0.00660 F4800
+G1 X138.901 Y78.991 E0.00660 F4800
+G1 X138.981 Y79.148 E0.00660 F4800
+G1 X139.061 Y79.306 E0.00660 F4800
+G1 X139.140 Y79.465 E0.00660 F4800
+G1 X139.218 Y79.623 E0.00660 F4800
+G1 X139.296 Y79.782 E0.00660 F4800
+G1 X139.373 Y79.941 E0.00660 F4800
+G1 X139.449 Y80.101 E0.00660 F4800
+G1 X139.525 Y80.260 E0.00660 F4800
+G1 X139.600 Y80.420 E0.00660 F4800
+G1 X139.674 Y80.581 E0.00660 F4800
+G1 X139.748 Y80.741 E0.00660 F4800
+G1 X139.821 Y80.902 E0.00660 F4800
+G1 X139.894 Y81.063 E0.00660 F4800
+G1 X139.966 Y81.225 E0.00660 F4800
+G1 X140.037 Y81.386 E0.00660 F4800
+G1 X140.107 Y81.548 E0.00660 F4800
+G1 X140.177 Y81.711 E0.00660 F4800
+G1 X140.246 Y81.873 E0.00660 F4800
+G1 X140.315 Y82.036 E0.00660 F4800
+G1 X140.383 Y82.199 E0.00660 F4800
+G1 X140.450 Y82.362 E0.00660 F4800
+G1 X140.516 Y82.526 E0.00660 F4800
+G1 X140.582 Y82.690 E0.00660 F4800
+G1 X140.648 Y82.854 E0.00660 F4800
+G1 X140.712 Y83.018 E0.00660 F4800
+G1 X140.776 Y83.182 E0.00660 F4800
+G1 X140.839 Y83.347 E0.00660 F4800
+G1 X140.902 Y83.512 E0.00660 F4800
+G1 X140.964 Y83.677 E0.00660 F4800
+G1 X141.025 Y83.843 E0.00660 F4800
+G1 X141.086 Y84.008 E0.00660 F4800
+G1 X141.145 Y84.174 E0.00660 F4800
+G1 X141.205 Y84.340 E0.00660 F4800
+G1 X141.263 Y84.507 E0.00660 F4800
+G1 X141.321 Y84.673 E0.00660 F4800
+G1 X141.378 Y84.840 E0.00660 F4800
+G1 X141.435 Y85.007 E0.00660 F4800
+G1 X141.491 Y85.174 E0.00660 F4800
+G1 X141.546 Y85.342 E0.00660 F4800
+G1 X141.600 Y85.509 E0.00660 F4800
+G1 X141.654 Y85.677 E0.00660 F4800
+G1 X141.707 Y85.845 E0.00660 F4800
+G1 X141.760 Y86.013 E0.00660 F4800
+G1 X141.812 Y86.182 E0.00660 F4800
+G1 X141.863 Y86.350 E0.00660 F4800
+G1 X141.913 Y86.519 E0.00660 F4800
+G1 X141.963 Y86.688 E0.00660 F4800
+G1 X142.012 Y86.857 E0.00660 F4800
+G1 X142.061 Y87.027 E0.00660 F4800
+G1 X142.108 Y87.196 E0.00660 F4800
+G1 X142.155 Y87.366 E0.00660 F4800
+G1 X142.202 Y87.536 E0.00660 F4800
+G1 X142.247 Y87.706 E0.00660 F4800
+G1 X142.292 Y87.876 E0.00660 F4800
+G1 X142.337 Y88.046 E0.00660 F4800
+G1 X142.380 Y88.217 E0.00660 F4800
+G1 X142.423 Y88.387 E0.00660 F4800
+G1 X142.466 Y88.558 E0.00660 F4800
+G1 X142.507 Y88.729 E0.00660 F4800
+G1 X142.548 Y88.900 E0.00660 F4800
+G1 X142.588 Y89.072 E0.00660 F4800
+G1 X142.628 Y89.243 E0.00660 F4800
+G1 X142.667 Y89.415 E0.00660 F4800
+G1 X142.705 Y89.586 E0.00660 F4800
+G1 X142.742 Y89.758 E0.00660 F4800
+G1 X142.779 Y89.930 E0.00660 F4800
+G1 X142.815 Y90.102 E0.00660 F4800
+G1 X142.850 Y90.274 E0.00660 F4800
+G1 X142.885 Y90.447 E0.00660 F4800
+G1 X142.919 Y90.619 E0.00660 F4800
+G1 X142.952 Y90.792 E0.00660 F4800
+G1 X142.985 Y90.965 E0.00660 F4800
+G1 X143.017 Y91.137 E0.00660 F4800
+G1 X143.048 Y91.310 E0.00660 F4800
+G1 X143.078 Y91.483 E0.00660 F4800
+G1 X143.108 Y91.656 E0.00660 F4800
+G1 X143.137 Y91.830 E0.00660 F4800
+G1 X143.165 Y92.003 E0.00660 F4800
+G1 X143.193 Y92.177 E0.00660 F4800
+G1 X143.220 Y92.350 E0.00660 F4800
+G1 X143.247 Y92.524 E0.00660 F4800
+G1 X143.272 Y92.697 E0.00660 F4800
+G1 X143.297 Y92.871 E0.00660 F4800
+G1 X143.321 Y93.045 E0.00660 F4800
+G1 X143.345 Y93.219 E0.00660 F4800
+G1 X143.368 Y93.393 E0.00660 F4800
+G1 X143.390 Y93.567 E0.00660 F4800
+G1 X143.411 Y93.741 E0.00660 F4800
+G1 X143.432 Y93.916 E0.00660 F4800
+G1 X143.452 Y94.090 E0.00660 F4800
+G1 X143.471 Y94.264 E0.00660 F4800
+G1 X143.490 Y94.439 E0.00660 F4800
+G1 X143.508 Y94.613 E0.00660 F4800
+G1 X143.525 Y94.788 E0.00660 F4800
+G1 X143.542 Y94.962 E0.00660 F4800
+G1 X143.557 Y95.137 E0.00660 F4800
+G1 X143.573 Y95.312 E0.00660 F4800
+G1 X143.587 Y95.486 E0.00660 F4800
+G1 X143.601 Y95.661 E0.00660 F4800
+G1 X143.614 Y95.836 E0.00660 F4800
+G1 X143.626 Y96.011 E0.00660 F4800
+G1 X143.638 Y96.186 E0.00660 F4800
+G1 X143.649 Y96.361 E0.00660 F4800
+G1 X143.659 Y96.536 E0.00660 F4800
+G1 X143.668 Y96.711 E0.00660 F4800
+G1 X143.677 Y96.886 E0.00660 F4800
+G1 X143.685 Y97.061 E0.00660 F4800
+G1 X143.693 Y97.236 E0.00660 F4800
+G1 X143.699 Y97.411 E0.00660 F4800
+G1 X143.705 Y97.586 E0.00660 F4800
+G1 X143.711 Y97.761 E0.00660 F4800
+G1 X143.715 Y97.936 E0.00660 F4800
+G1 X143.719 Y98.111 E0.00660 F4800
+G1 X143.722 Y98.286 E0.00660 F4800
+G1 X143.725 Y98.461 E0.00660 F4800
+G1 X143.727 Y98.636 E0.00660 F4800
+G1 X143.728 Y98.811 E0.00660 F4800
+G1 X143.728 Y98.986 E0.00660 F4800
+G1 X143.728 Y99.161 E0.00660 F4800
+G1 X143.727 Y99.336 E0.00660 F4800
+G1 X143.725 Y99.511 E0.00660 F4800
+G1 X143.723 Y99.686 E0.00660 F4800
+G1 X143.720 Y99.861 E0.00660 F4800
+G1 X143.716 Y100.036 E0.00660 F4800
+G1 X143.711 Y100.210 E0.00660 F4800
+G1 X143.706 Y100.385 E0.00660 F4800
+G1 X143.700 Y100.560 E0.00660 F4800
+G1 X143.694 Y100.735 E0.00660 F4800
+G1 X143.687 Y100.909 E0.00660 F4800
+G1 X143.679 Y101.084 E0.00660 F4800
+G1 X143.670 Y101.259 E0.00660 F4800
+G1 X143.660 Y101.433 E0.00660 F4800
+G1 X143.650 Y101.608 E0.00660 F4800
+G1 X143.640 Y101.782 E0.00660 F4800
+G1 X143.628 Y101.956 E0.00660 F4800
+G1 X143.616 Y102.131 E0.00660 F4800
+G1 X143.603 Y102.305 E0.00660 F4800
+G1 X143.590 Y102.479 E0.00660 F4800
+G1 X143.575 Y102.653 E0.00660 F4800
+G1 X143.560 Y102.827 E0.00660 F4800
+G1 X143.545 Y103.001 E0.00660 F4800
+G1 X143.528 Y103.175 E0.00660 F4800
+G1 X143.511 Y103.349 E0.00660 F4800
+G1 X143.494 Y103.523 E0.00660 F4800
+G1 X143.475 Y103.696 E0.00660 F4800
+G1 X143.456 Y103.870 E0.00660 F4800
+G1 X143.436 Y104.043 E0.00660 F4800
+G1 X143.416 Y104.216 E0.00660 F4800
+G1 X143.395 Y104.390 E0.00660 F4800
+G1 X143.373 Y104.563 E0.00660 F4800
+G1 X143.350 Y104.736 E0.00660 F4800
+G1 X143.327 Y104.909 E0.00660 F4800
+G1 X143.303 Y105.082 E0.00660 F4800
+G1 X143.278 Y105.254 E0.00660 F4800
+G1 X143.253 Y105.427 E0.00660 F4800
+G1 X143.227 Y105.599 E0.00660 F4800
+G1 X143.200 Y105.772 E0.00660 F4800
+G1 X143.173 Y105.944 E0.00660 F4800
+G1 X143.145 Y106.116 E0.00660 F4800
+G1 X143.116 Y106.288 E0.00660 F4800
+G1 X143.086 Y106.460 E0.00660 F4800
+G1 X143.056 Y106.631 E0.00660 F4800
+G1 X143.026 Y106.803 E0.00660 F4800
+G1 X142.994 Y106.974 E0.00660 F4800
+G1 X142.962 Y107.146 E0.00660 F4800
+G1 X142.929 Y107.317 E0.00660 F4800
+G1 X142.895 Y107.488 E0.00660 F4800
+G1 X142.861 Y107.658 E0.00660 F4800
+G1 X142.826 Y107.829 E0.00660 F4800
+G1 X142.791 Y108.000 E0.00660 F4800
+G1 X142.754 Y108.170 E0.00660 F4800
+G1 X142.717 Y108.340 E0.00660 F4800
+G1 X142.680 Y108.510 E0.00660 F4800
+G1 X142.642 Y108.680 E0.00660 F4800
+G1 X142.603 Y108.850 E0.00660 F4800
+G1 X142.563 Y109.019 E0.00660 F4800
+G1 X142.523 Y109.189 E0.00660 F4800
+G1 X142.482 Y109.358 E0.00660 F4800
+G1 X142.440 Y109.527 E0.00660 F4800
+G1 X142.398 Y109.695 E0.00660 F4800
+G1 X142.355 Y109.864 E0.00660 F4800
+G1 X142.311 Y110.033 E0.00660 F4800
+G1 X142.266 Y110.201 E0.00660 F4800
+G1 X142.221 Y110.369 E0.00660 F4800
+G1 X142.176 Y110.537 E0.00660 F4800
+G1 X142.129 Y110.704 E0.00660 F4800
+G1 X142.082 Y110.872 E0.00660 F4800
+G1 X142.035 Y111.039 E0.00660 F4800
+G1 X141.986 Y111.206 E0.00660 F4800
+G1 X141.937 Y111.373 E0.00660 F4800
+G1 X141.888 Y111.539 E0.00660 F4800
+G1 X141.837 Y111.706 E0.00660 F4800
+G1 X141.786 Y111.872 E0.00660 F4800
+G1 X141.735 Y112.038 E0.00660 F4800
+G1 X141.682 Y112.204 E0.00660 F4800
+G1 X141.629 Y112.369 E0.00660 F4800
+G1 X141.576 Y112.534 E0.00660 F4800
+G1 X141.521 Y112.699 E0.00660 F4800
+G1 X141.466 Y112.864 E0.00660 F4800
+G1 X141.411 Y113.029 E0.00660 F4800
+G1 X141.355 Y113.193 E0.00660 F4800
+G1 X141.298 Y113.357 E0.00660 F4800
+G1 X141.240 Y113.521 E0.00660 F4800
+G1 X141.182 Y113.684 E0.00660 F4800
+G1 X141.123 Y113.848 E0.00660 F4800
+G1 X141.064 Y114.011 E0.00660 F4800
+G1 X141.003 Y114.174 E0.00660 F4800
+G1 X140.943 Y114.336 E0.00660 F4800
+G1 X140.881 Y114.499 E0.00660 F4800
+G1 X140.819 Y114.661 E0.00660 F4800
+G1 X140.756 Y114.822 E0.00660 F4800
+G1 X140.693 Y114.984 E0.00660 F4800
+G1 X140.629 Y115.145 E0.00660 F4800
+G1 X140.564 Y115.306 E0.00660 F4800
+G1 X140.499 Y115.467 E0.00660 F4800
+G1 X140.433 Y115.627 E0.00660 F4800
+G1 X140.367 Y115.788 E0.00660 F4800
+G1 X140.299 Y115.947 E0.00660 F4800
+G1 X140.232 Y116.107 E0.00660 F4800
+G1 X140.163 Y116.266 E0.00660 F4800
+G1 X140.094 Y116.425 E0.00660 F4800
+G1 X140.024 Y116.584 E0.00660 F4800
+G1 X139.954 Y116.742 E0.00660 F4800
+G1 X139.883 Y116.901 E0.00660 F4800
+G1 X139.811 Y117.058 E0.00660 F4800
+G1 X139.739 Y117.216 E0.00660 F4800
+G1 X139.666 Y117.373 E0.00660 F4800
+G1 X139.593 Y117.530 E0.00660 F4800
+G1 X139.519 Y117.687 E0.00660 F4800
+G1 X139.444 Y117.843 E0.00660 F4800
+G1 X139.369 Y117.999 E0.00660 F4800
+G1 X139.293 Y118.155 E0.00660 F4800
+G1 X139.216 Y118.310 E0.00660 F4800
+G1 X139.139 Y118.465 E0.00660 F4800
+G1 X139.061 Y118.620 E0.00660 F4800
+G1 X138.983 Y118.774 E0.00660 F4800
+G1 X138.904 Y118.928 E0.00660 F4800
+G1 X138.824 Y119.082 E0.00660 F4800
+G1 X138.744 Y119.235 E0.00660 F4800
+G1 X138.663 Y119.388 E0.00660 F4800
+G1 X138.582 Y119.541 E0.00660 F4800
+G1 X138.500 Y119.693 E0.00660 F4800
+G1 X138.417 Y119.845 E0.00660 F4800
+G1 X138.334 Y119.997 E0.00660 F4800
+G1 X138.250 Y120.148 E0.00660 F4800
+G1 X138.166 Y120.299 E0.00660 F4800
+G1 X138.081 Y120.450 E0.00660 F4800
+G1 X137.995 Y120.600 E0.00660 F4800
+G1 X137.909 Y120.750 E0.00660 F4800
+G1 X137.822 Y120.899 E0.00660 F4800
+G1 X137.735 Y121.048 E0.00660 F4800
+G1 X137.647 Y121.197 E0.00660 F4800
+G1 X137.558 Y121.346 E0.00660 F4800
+G1 X137.469 Y121.494 E0.00660 F4800
+G1 X137.379 Y121.641 E0.00660 F4800
+G1 X137.289 Y121.789 E0.00660 F4800
+G1 X137.198 Y121.936 E0.00660 F4800
+G1 X137.106 Y122.082 E0.00660 F4800
+G1 X137.014 Y122.228 E0.00660 F4800
+G1 X136.922 Y122.374 E0.00660 F4800
+G1 X136.828 Y122.520 E0.00660 F4800
+G1 X136.735 Y122.665 E0.00660 F4800
+G1 X136.640 Y122.809 E0.00660 F4800
+G1 X136.545 Y122.954 E0.00660 F4800
+G1 X136.450 Y123.098 E0.00660 F4800
+G1 X136.354 Y123.241 E0.00660 F4800
+G1 X136.257 Y123.384 E0.00660 F4800
+G1 X136.160 Y123.527 E0.00660 F4800
+G1 X136.062 Y123.669 E0.00660 F4800
+G1 X135.964 Y123.811 E0.00660 F4800
+G1 X135.865 Y123.952 E0.00660 F4800
+G1 X135.766 Y124.093 E0.00660 F4800
+G1 X135.666 Y124.234 E0.00660 F4800
+G1 X135.565 Y124.374 E0.00660 F4800
+G1 X135.464 Y124.514 E0.00660 F4800
+G1 X135.363 Y124.653 E0.00660 F4800
+G1 X135.260 Y124.792 E0.00660 F4800
+G1 X135.158 Y124.931 E0.00660 F4800
+G1 X135.054 Y125.069 E0.00660 F4800
+G1 X134.951 Y125.207 E0.00660 F4800
+G1 X134.846 Y125.344 E0.00660 F4800
+G1 X134.741 Y125.481 E0.00660 F4800
+G1 X134.636 Y125.617 E0.00660 F4800
+G1 X134.530 Y125.753 E0.00660 F4800
+G1 X134.424 Y125.888 E0.00660 F4800
+G1 X134.317 Y126.024 E0.00660 F4800
+G1 X134.209 Y126.158 E0.00660 F4800
+G1 X134.101 Y126.292 E0.00660 F4800
+G1 X133.992 Y126.426 E0.00660 F4800
+G1 X133.883 Y126.559 E0.00660 F4800
+G1 X133.774 Y126.692 E0.00660 F4800
+G1 X133.663 Y126.825 E0.00660 F4800
+G1 X133.553 Y126.957 E0.00660 F4800
+G1 X133.442 Y127.088 E0.00660 F4800
+G1 X133.330 Y127.219 E0.00660 F4800
+G1 X133.218 Y127.350 E0.00660 F4800
+G1 X133.105 Y127.480 E0.00660 F4800
+G1 X132.992 Y127.609 E0.00660 F4800
+G1 X132.878 Y127.738 E0.00660 F4800
+G1 X132.764 Y127.867 E0.00660 F4800
+G1 X132.649 Y127.995 E0.00660 F4800
+G1 X132.534 Y128.123 E0.00660 F4800
+G1 X132.418 Y128.250 E0.00660 F4800
+G1 X132.302 Y128.377 E0.00660 F4800
+G1 X132.185 Y128.504 E0.00660 F4800
+G1 X132.068 Y128.629 E0.00660 F4800
+G1 X131.950 Y128.755 E0.00660 F4800
+G1 X131.832 Y128.880 E0.00660 F4800
+G1 X131.713 Y129.004 E0.00660 F4800
+G1 X131.594 Y129.128 E0.00660 F4800
+G1 X131.474 Y129.251 E0.00660 F4800
+G1 X131.354 Y129.374 E0.00660 F4800
+G1 X131.233 Y129.497 E0.00660 F4800
+G1 X131.112 Y129.619 E0.00660 F4800
+G1 X130.990 Y129.740 E0.00660 F4800
+G1 X130.868 Y129.861 E0.00660 F4800
+G1 X130.746 Y129.981 E0.00660 F4800
+G1 X130.623 Y130.101 E0.00660 F4800
+G1 X130.499 Y130.221 E0.00660 F4800
+G1 X130.375 Y130.340 E0.00660 F4800
+G1 X130.251 Y130.458 E0.00660 F4800
+G1 X130.126 Y130.576 E0.00660 F4800
+G1 X130.001 Y130.694 E0.00660 F4800
+G1 X129.875 Y130.810 E0.00660 F4800
+G1 X129.749 Y130.927 E0.00660 F4800
+G1 X129.622 Y131.043 E0.00660 F4800
+G1 X129.495 Y131.158 E0.00660 F4800
+G1 X129.367 Y131.273 E0.00660 F4800
+G1 X129.239 Y131.387 E0.00660 F4800
+G1 X129.111 Y131.501 E0.00660 F4800
+G1 X128.982 Y131.614 E0.00660 F4800
+G1 X128.852 Y131.727 E0.00660 F4800
+G1 X128.722 Y131.839 E0.00660 F4800
+G1 X128.592 Y131.951 E0.00660 F4800
+G1 X128.461 Y132.062 E0.00660 F4800
+G1 X128.330 Y132.172 E0.00660 F4800
+G1 X128.199 Y132.282 E0.00660 F4800
+G1 X128.067 Y132.392 E0.00660 F4800
+G1 X127.934 Y132.501 E0.00660 F4800
+G1 X127.802 Y132.609 E0.00660 F4800
+G1 X127.668 Y132.717 E0.00660 F4800
+G1 X127.535 Y132.825 E0.00660 F4800
+G1 X127.401 Y132.931 E0.00660 F4800
+G1 X127.266 Y133.038 E0.00660 F4800
+G1 X127.131 Y133.143 E0.00660 F4800
+G1 X126.996 Y133.248 E0.00660 F4800
+G1 X126.860 Y133.353 E0.00660 F4800
+G1 X126.724 Y133.457 E0.00660 F4800
+G1 X126.588 Y133.561 E0.00660 F4800
+G1 X126.451 Y133.664 E0.00660 F4800
+G1 X126.313 Y133.766 E0.00660 F4800
+G1 X126.176 Y133.868 E0.00660 F4800
+G1 X126.037 Y133.969 E0.00660 F4800
+G1 X125.899 Y134.070 E0.00660 F4800
+G1 X125.760 Y134.170 E0.00660 F4800
+G1 X125.621 Y134.269 E0.00660 F4800
+G1 X125.481 Y134.368 E0.00660 F4800
+G1 X125.341 Y134.467 E0.00660 F4800
+G1 X125.201 Y134.565 E0.00660 F4800
+G1 X125.060 Y134.662 E0.00660 F4800
+G1 X124.919 Y134.759 E0.00660 F4800
+G1 X124.777 Y134.855 E0.00660 F4800
+G1 X124.635 Y134.950 E0.00660 F4800
+G1 X124.493 Y135.045 E0.00660 F4800
+G1 X124.350 Y135.140 E0.00660 F4800
+G1 X124.207 Y135.234 E0.00660 F4800
+G1 X124.064 Y135.327 E0.00660 F4800
+G1 X123.920 Y135.419 E0.00660 F4800
+G1 X123.776 Y135.512 E0.00660 F4800
+G1 X123.632 Y135.603 E0.00660 F4800
+G1 X123.487 Y135.694 E0.00660 F4800
+G1 X123.342 Y135.784 E0.00660 F4800
+G1 X123.196 Y135.874 E0.00660 F4800
+G1 X123.050 Y135.963 E0.00660 F4800
+G1 X122.904 Y136.052 E0.00660 F4800
+G1 X122.758 Y136.140 E0.00660 F4800
+G1 X122.611 Y136.227 E0.00660 F4800
+G1 X122.464 Y136.314 E0.00660 F4800
+G1 X122.316 Y136.400 E0.00660 F4800
+G1 X122.168 Y136.485 E0.00660 F4800
+G1 X122.020 Y136.570 E0.00660 F4800
+G1 X121.871 Y136.655 E0.00660 F4800
+G1 X121.723 Y136.738 E0.00660 F4800
+G1 X121.573 Y136.822 E0.00660 F4800
+G1 X121.424 Y136.904 E0.00660 F4800
+G1 X121.274 Y136.986 E0.00660 F4800
+G1 X121.124 Y137.067 E0.00660 F4800
+G1 X120.974 Y137.148 E0.00660 F4800
+G1 X120.823 Y137.228 E0.00660 F4800
+G1 X120.672 Y137.308 E0.00660 F4800
+G1 X120.521 Y137.387 E0.00660 F4800
+G1 X120.369 Y137.465 E0.00660 F4800
+G1 X120.217 Y137.542 E0.00660 F4800
+G1 X120.065 Y137.620 E0.00660 F4800
+G1 X119.912 Y137.696 E0.00660 F4800
+G1 X119.760 Y137.772 E0.00660 F4800
+G1 X119.607 Y137.847 E0.00660 F4800
+G1 X119.453 Y137.921 E0.00660 F4800
+G1 X119.300 Y137.995 E0.00660 F4800
+G1 X119.146 Y138.069 E0.00660 F4800
+G1 X118.991 Y138.141 E0.00660 F4800
+G1 X118.837 Y138.214 E0.00660 F4800
+G1 X118.682 Y138.285 E0.00660 F4800
+G1 X118.527 Y138.356 E0.00660 F4800
+G1 X118.372 Y138.426 E0.00660 F4800
+G1 X118.216 Y138.496 E0.00660 F4800
+G1 X118.060 Y138.564 E0.00660 F4800
+G1 X117.904 Y138.633 E0.00660 F4800
+G1 X117.748 Y138.700 E0.00660 F4800
+G1 X117.591 Y138.767 E0.00660 F4800
+G1 X117.435 Y138.834 E0.00660 F4800
+G1 X117.277 Y138.900 E0.00660 F4800
+G1 X117.120 Y138.965 E0.00660 F4800
+G1 X116.963 Y139.029 E0.00660 F4800
+G1 X116.805 Y139.093 E0.00660 F4800
+G1 X116.647 Y139.156 E0.00660 F4800
+G1 X116.488 Y139.219 E0.00660 F4800
+G1 X116.330 Y139.281 E0.00660 F4800
+G1 X116.171 Y139.342 E0.00660 F4800
+G1 X116.012 Y139.403 E0.00660 F4800
+G1 X115.853 Y139.463 E0.00660 F4800
+G1 X115.693 Y139.522 E0.00660 F4800
+G1 X115.534 Y139.581 E0.00660 F4800
+G1 X115.374 Y139.639 E0.00660 F4800
+G1 X115.214 Y139.697 E0.00660 F4800
+G1 X115.053 Y139.753 E0.00660 F4800
+G1 X114.893 Y139.809 E0.00660 F4800
+G1 X114.732 Y139.865 E0.00660 F4800
+G1 X114.571 Y139.920 E0.00660 F4800
+G1 X114.410 Y139.974 E0.00660 F4800
+G1 X114.249 Y140.028 E0.00660 F4800
+G1 X114.087 Y140.081 E0.00660 F4800
+G1 X113.925 Y140.133 E0.00660 F4800
+G1 X113.763 Y140.184 E0.00660 F4800
+G1 X113.601 Y140.235 E0.00660 F4800
+G1 X113.439 Y140.286 E0.00660 F4800
+G1 X113.276 Y140.335 E0.00660 F4800
+G1 X113.114 Y140.384 E0.00660 F4800
+G1 X112.951 Y140.433 E0.00660 F4800
+G1 X112.788 Y140.480 E0.00660 F4800
+G1 X112.625 Y140.527 E0.00660 F4800
+G1 X112.461 Y140.574 E0.00660 F4800
+G1 X112.298 Y140.619 E0.00660 F4800
+G1 X112.134 Y140.664 E0.00660 F4800
+G1 X111.970 Y140.709 E0.00660 F4800
+G1 X111.806 Y140.752 E0.00660 F4800
+G1 X111.642 Y140.795 E0.00660 F4800
+G1 X111.477 Y140.838 E0.00660 F4800
+G1 X111.313 Y140.880 E0.00660 F4800
+G1 X111.148 Y140.921 E0.00660 F4800
+G1 X110.983 Y140.961 E0.00660 F4800
+G1 X110.819 Y141.001 E0.00660 F4800
+G1 X110.653 Y141.040 E0.00660 F4800
+G1 X110.488 Y141.078 E0.00660 F4800
+G1 X110.323 Y141.116 E0.00660 F4800
+G1 X110.157 Y141.153 E0.00660 F4800
+G1 X109.992 Y141.189 E0.00660 F4800
+G1 X109.826 Y141.225 E0.00660 F4800
+G1 X109.660 Y141.260 E0.00660 F4800
+G1 X109.494 Y141.295 E0.00660 F4800
+G1 X109.328 Y141.328 E0.00660 F4800
+G1 X109.162 Y141.361 E0.00660 F4800
+G1 X108.995 Y141.394 E0.00660 F4800
+G1 X108.829 Y141.426 E0.00660 F4800
+G1 X108.662 Y141.457 E0.00660 F4800
+G1 X108.495 Y141.487 E0.00660 F4800
+G1 X108.329 Y141.517 E0.00660 F4800
+G1 X108.162 Y141.546 E0.00660 F4800
+G1 X107.995 Y141.574 E0.00660 F4800
+G1 X107.828 Y141.602 E0.00660 F4800
+G1 X107.660 Y141.629 E0.00660 F4800
+G1 X107.493 Y141.655 E0.00660 F4800
+G1 X107.326 Y141.681 E0.00660 F4800
+G1 X107.158 Y141.706 E0.00660 F4800
+G1 X106.991 Y141.730 E0.00660 F4800
+G1 X106.823 Y141.754 E0.00660 F4800
+G1 X106.655 Y141.777 E0.00660 F4800
+G1 X106.488 Y141.800 E0.00660 F4800
+G1 X106.320 Y141.821 E0.00660 F4800
+G1 X106.152 Y141.842 E0.00660 F4800
+G1 X105.984 Y141.862 E0.00660 F4800
+G1 X105.816 Y141.882 E0.00660 F4800
+G1 X105.648 Y141.901 E0.00660 F4800
+G1 X105.480 Y141.919 E0.00660 F4800
+G1 X105.311 Y141.937 E0.00660 F4800
+G1 X105.143 Y141.954 E0.00660 F4800
+G1 X104.975 Y141.970 E0.00660 F4800
+G1 X104.806 Y141.986 E0.00660 F4800
+G1 X104.638 Y142.001 E0.00660 F4800
+G1 X104.470 Y142.015 E0.00660 F4800
+G1 X104.301 Y142.028 E0.00660 F4800
+G1 X104.133 Y142.041 E0.00660 F4800
+G1 X103.964 Y142.054 E0.00660 F4800
+G1 X103.795 Y142.065 E0.00660 F4800
+G1 X103.627 Y142.076 E0.00660 F4800
+G1 X103.458 Y142.086 E0.00660 F4800
+G1 X103.289 Y142.096 E0.00660 F4800
+G1 X103.121 Y142.105 E0.00660 F4800
+G1 X102.952 Y142.113 E0.00660 F4800
+G1 X102.783 Y142.120 E0.00660 F4800
+G1 X102.614 Y142.127 E0.00660 F4800
+G1 X102.446 Y142.133 E0.00660 F4800
+G1 X102.277 Y142.139 E0.00660 F4800
+G1 X102.108 Y142.143 E0.00660 F4800
+G1 X101.939 Y142.147 E0.00660 F4800
+G1 X101.771 Y142.151 E0.00660 F4800
+G1 X101.602 Y142.154 E0.00660 F4800
+G1 X101.433 Y142.156 E0.00660 F4800
+G1 X101.264 Y142.157 E0.00660 F4800
+G1 X101.096 Y142.158 E0.00660 F4800
+G1 X100.927 Y142.158 E0.00660 F4800
+G1 X100.758 Y142.157 E0.00660 F4800
+G1 X100.589 Y142.156 E0.00660 F4800
+G1 X100.421 Y142.154 E0.00660 F4800
+G1 X100.252 Y142.151 E0.00660 F4800
+G1 X100.084 Y142.148 E0.00660 F4800
+G1 X99.915 Y142.144 E0.00660 F4800
+G1 X99.746 Y142.139 E0.00660 F4800
+G1 X99.578 Y142.134 E0.00660 F4800
+G1 X99.409 Y142.128 E0.00660 F4800
+G1 X99.241 Y142.121 E0.00660 F4800
+G1 X99.073 Y142.114 E0.00660 F4800
+G1 X98.904 Y142.106 E0.00660 F4800
+G1 X98.736 Y142.097 E0.00660 F4800
+G1 X98.568 Y142.088 E0.00660 F4800
+G1 X98.400 Y142.078 E0.00660 F4800
+G1 X98.231 Y142.067 E0.00660 F4800
+G1 X98.063 Y142.055 E0.00660 F4800
+G1 X97.895 Y142.043 E0.00660 F4800
+G1 X97.727 Y142.031 E0.00660 F4800
+G1 X97.559 Y142.017 E0.00660 F4800
+G1 X97.392 Y142.003 E0.00660 F4800
+G1 X97.224 Y141.988 E0.00660 F4800
+G1 X97.056 Y141.973 E0.00660 F4800
+G1 X96.889 Y141.957 E0.00660 F4800
+G1 X96.721 Y141.940 E0.00660 F4800
+G1 X96.554 Y141.923 E0.00660 F4800
+G1 X96.387 Y141.904 E0.00660 F4800
+G1 X96.219 Y141.886 E0.00660 F4800
+G1 X96.052 Y141.866 E0.00660 F4800
+G1 X95.885 Y141.846 E0.00660 F4800
+G1 X95.718 Y141.825 E0.00660 F4800
+G1 X95.551 Y141.804 E0.00660 F4800
+G1 X95.385 Y141.782 E0.00660 F4800
+G1 X95.218 Y141.759 E0.00660 F4800
+G1 X95.051 Y141.736 E0.00660 F4800
+G1 X94.885 Y141.712 E0.00660 F4800
+G1 X94.719 Y141.687 E0.00660 F4800
+G1 X94.553 Y141.661 E0.00660 F4800
+G1 X94.386 Y141.635 E0.00660 F4800
+G1 X94.221 Y141.609 E0.00660 F4800
+G1 X94.055 Y141.581 E0.00660 F4800
+G1 X93.889 Y141.553 E0.00660 F4800
+G1 X93.723 Y141.524 E0.00660 F4800
+G1 X93.558 Y141.495 E0.00660 F4800
+G1 X93.393 Y141.465 E0.00660 F4800
+G1 X93.228 Y141.434 E0.00660 F4800
+G1 X93.063 Y141.403 E0.00660 F4800
+G1 X92.898 Y141.371 E0.00660 F4800
+G1 X92.733 Y141.338 E0.00660 F4800
+G1 X92.568 Y141.305 E0.00660 F4800
+G1 X92.404 Y141.271 E0.00660 F4800
+G1 X92.240 Y141.236 E0.00660 F4800
+G1 X92.075 Y141.201 E0.00660 F4800
+G1 X91.912 Y141.165 E0.00660 F4800
+G1 X91.748 Y141.128 E0.00660 F4800
+G1 X91.584 Y141.091 E0.00660 F4800
+G1 X91.421 Y141.053 E0.00660 F4800
+G1 X91.257 Y141.015 E0.00660 F4800
+G1 X91.094 Y140.975 E0.00660 F4800
+G1 X90.931 Y140.935 E0.00660 F4800
+G1 X90.768 Y140.895 E0.00660 F4800
+G1 X90.606 Y140.854 E0.00660 F4800
+G1 X90.443 Y140.812 E0.00660 F4800
+G1 X90.281 Y140.770 E0.00660 F4800
+G1 X90.119 Y140.726 E0.00660 F4800
+G1 X89.957 Y140.683 E0.00660 F4800
+G1 X89.795 Y140.638 E0.00660 F4800
+G1 X89.634 Y140.593 E0.00660 F4800
+G1 X89.473 Y140.548 E0.00660 F4800
+G1 X89.312 Y140.501 E0.00660 F4800
+G1 X89.151 Y140.454 E0.00660 F4800
+G1 X88.990 Y140.407 E0.00660 F4800
+G1 X88.830 Y140.359 E0.00660 F4800
+G1 X88.669 Y140.310 E0.00660 F4800
+G1 X88.509 Y140.260 E0.00660 F4800
+G1 X88.349 Y140.210 E0.00660 F4800
+G1 X88.190 Y140.159 E0.00660 F4800
+G1 X88.030 Y140.108 E0.00660 F4800
+G1 X87.871 Y140.056 E0.00660 F4800
+G1 X87.712 Y140.003 E0.00660 F4800
+G1 X87.554 Y139.950 E0.00660 F4800
+G1 X87.395 Y139.896 E0.00660 F4800
+G1 X87.237 Y139.842 E0.00660 F4800
+G1 X87.079 Y139.786 E0.00660 F4800
+G1 X86.921 Y139.731 E0.00660 F4800
+G1 X86.763 Y139.674 E0.00660 F4800
+G1 X86.606 Y139.617 E0.00660 F4800
+G1 X86.449 Y139.559 E0.00660 F4800
+G1 X86.292 Y139.501 E0.00660 F4800
+G1 X86.136 Y139.442 E0.00660 F4800
+G1 X85.979 Y139.383 E0.00660 F4800
+G1 X85.823 Y139.323 E0.00660 F4800
+G1 X85.668 Y139.262 E0.00660 F4800
+G1 X85.512 Y139.200 E0.00660 F4800
+G1 X85.357 Y139.138 E0.00660 F4800
+G1 X85.202 Y139.076 E0.00660 F4800
+G1 X85.047 Y139.012 E0.00660 F4800
+G1 X84.892 Y138.949 E0.00660 F4800
+G1 X84.738 Y138.884 E0.00660 F4800
+G1 X84.584 Y138.819 E0.00660 F4800
+G1 X84.431 Y138.753 E0.00660 F4800
+G1 X84.277 Y138.687 E0.00660 F4800
+G1 X84.124 Y138.620 E0.00660 F4800
+G1 X83.971 Y138.553 E0.00660 F4800
+G1 X83.819 Y138.485 E0.00660 F4800
+G1 X83.667 Y138.416 E0.00660 F4800
+G1 X83.515 Y138.347 E0.00660 F4800
+G1 X83.363 Y138.277 E0.00660 F4800
+G1 X83.212 Y138.206 E0.00660 F4800
+G1 X83.061 Y138.135 E0.00660 F4800
+G1 X82.910 Y138.063 E0.00660 F4800
+G1 X82.759 Y137.991 E0.00660 F4800
+G1 X82.609 Y137.918 E0.00660 F4800
+G1 X82.459 Y137.845 E0.00660 F4800
+G1 X82.310 Y137.771 E0.00660 F4800
+G1 X82.161 Y137.696 E0.00660 F4800
+G1 X82.012 Y137.621 E0.00660 F4800
+G1 X81.863 Y137.545 E0.00660 F4800
+G1 X81.715 Y137.468 E0.00660 F4800
+G1 X81.567 Y137.391 E0.00660 F4800
+G1 X81.419 Y137.314 E0.00660 F4800
+G1 X81.272 Y137.235 E0.00660 F4800
+G1 X81.125 Y137.157 E0.00660 F4800
+G1 X80.978 Y137.077 E0.00660 F4800
+G1 X80.832 Y136.997 E0.00660 F4800
+G1 X80.686 Y136.917 E0.00660 F4800
+G1 X80.540 Y136.836 E0.00660 F4800
+G1 X80.395 Y136.754 E0.00660 F4800
+G1 X80.250 Y136.672 E0.00660 F4800
+G1 X80.105 Y136.589 E0.00660 F4800
+G1 X79.961 Y136.506 E0.00660 F4800
+G1 X79.817 Y136.422 E0.00660 F4800
+G1 X79.674 Y136.337 E0.00660 F4800
+G1 X79.530 Y136.252 E0.00660 F4800
+G1 X79.388 Y136.166 E0.00660 F4800
+G1 X79.245 Y136.080 E0.00660 F4800
+G1 X79.103 Y135.994 E0.00660 F4800
+G1 X78.961 Y135.906 E0.00660 F4800
+G1 X78.820 Y135.818 E0.00660 F4800
+G1 X78.679 Y135.730 E0.00660 F4800
+G1 X78.538 Y135.641 E0.00660 F4800
+G1 X78.398 Y135.551 E0.00660 F4800
+G1 X78.258 Y135.461 E0.00660 F4800
+G1 X78.118 Y135.371 E0.00660 F4800
+G1 X77.979 Y135.279 E0.00660 F4800
+G1 X77.840 Y135.188 E0.00660 F4800
+G1 X77.702 Y135.095 E0.00660 F4800
+G1 X77.564 Y135.002 E0.00660 F4800
+G1 X77.426 Y134.909 E0.00660 F4800
+G1 X77.289 Y134.815 E0.00660 F4800
+G1 X77.152 Y134.721 E0.00660 F4800
+G1 X77.015 Y134.626 E0.00660 F4800
+G1 X76.879 Y134.530 E0.00660 F4800
+G1 X76.744 Y134.434 E0.00660 F4800
+G1 X76.608 Y134.337 E0.00660 F4800
+G1 X76.473 Y134.240 E0.00660 F4800
+G1 X76.339 Y134.143 E0.00660 F4800
+G1 X76.205 Y134.044 E0.00660 F4800
+G1 X76.071 Y133.946 E0.00660 F4800
+G1 X75.938 Y133.846 E0.00660 F4800
+G1 X75.805 Y133.747 E0.00660 F4800
+G1 X75.672 Y133.646 E0.00660 F4800
+G1 X75.540 Y133.546 E0.00660 F4800
+G1 X75.409 Y133.444 E0.00660 F4800
+G1 X75.278 Y133.342 E0.00660 F4800
+G1 X75.147 Y133.240 E0.00660 F4800
+G1 X75.017 Y133.137 E0.00660 F4800
+G1 X74.887 Y133.034 E0.00660 F4800
+G1 X74.757 Y132.930 E0.00660 F4800
+G1 X74.628 Y132.826 E0.00660 F4800
+G1 X74.499 Y132.721 E0.00660 F4800
+G1 X74.371 Y132.615 E0.00660 F4800
+G1 X74.243 Y132.509 E0.00660 F4800
+G1 X74.116 Y132.403 E0.00660 F4800
+G1 X73.989 Y132.296 E0.00660 F4800
+G1 X73.863 Y132.189 E0.00660 F4800
+G1 X73.737 Y132.081 E0.00660 F4800
+G1 X73.611 Y131.972 E0.00660 F4800
+G1 X73.486 Y131.863 E0.00660 F4800
+G1 X73.361 Y131.754 E0.00660 F4800
+G1 X73.237 Y131.644 E0.00660 F4800
+G1 X73.113 Y131.534 E0.00660 F4800
+G1 X72.990 Y131.423 E0.00660 F4800
+G1 X72.867 Y131.312 E0.00660 F4800
+G1 X72.745 Y131.200 E0.00660 F4800
+G1 X72.623 Y131.088 E0.00660 F4800
+G1 X72.501 Y130.975 E0.00660 F4800
+G1 X72.380 Y130.862 E0.00660 F4800
+G1 X72.260 Y130.748 E0.00660 F4800
+G1 X72.140 Y130.634 E0.00660 F4800
+G1 X72.020 Y130.519 E0.00660 F4800
+G1 X71.901 Y130.404 E0.00660 F4800
+G1 X71.782 Y130.288 E0.00660 F4800
+G1 X71.664 Y130.172 E0.00660 F4800
+G1 X71.546 Y130.056 E0.00660 F4800
+G1 X71.429 Y129.939 E0.00660 F4800
+G1 X71.312 Y129.822 E0.00660 F4800
+G1 X71.196 Y129.704 E0.00660 F4800
+G1 X71.080 Y129.585 E0.00660 F4800
+G1 X70.965 Y129.467 E0.00660 F4800
+G1 X70.850 Y129.347 E0.00660 F4800
+G1 X70.736 Y129.228 E0.00660 F4800
+G1 X70.622 Y129.108 E0.00660 F4800
+G1 X70.509 Y128.987 E0.00660 F4800
+G1 X70.396 Y128.866 E0.00660 F4800
+G1 X70.284 Y128.745 E0.00660 F4800
+G1 X70.172 Y128.623 E0.00660 F4800
+G1 X70.060 Y128.501 E0.00660 F4800
+G1 X69.949 Y128.378 E0.00660 F4800
+G1 X69.839 Y128.255 E0.00660 F4800
+G1 X69.729 Y128.131 E0.00660 F4800
+G1 X69.620 Y128.007 E0.00660 F4800
+G1 X69.511 Y127.883 E0.00660 F4800
+G1 X69.403 Y127.758 E0.00660 F4800
+G1 X69.295 Y127.632 E0.00660 F4800
+G1 X69.188 Y127.507 E0.00660 F4800
+G1 X69.081 Y127.381 E0.00660 F4800
+G1 X68.975 Y127.254 E0.00660 F4800
+G1 X68.869 Y127.127 E0.00660 F4800
+G1 X68.764 Y127.000 E0.00660 F4800
+G1 X68.659 Y126.872 E0.00660 F4800
+G1 X68.555 Y126.744 E0.00660 F4800
+G1 X68.451 Y126.615 E0.00660 F4800
+G1 X68.348 Y126.486 E0.00660 F4800
+G1 X68.245 Y126.357 E0.00660 F4800
+G1 X68.143 Y126.227 E0.00660 F4800
+G1 X68.042 Y126.097 E0.00660 F4800
+G1 X67.941 Y125.966 E0.00660 F4800
+G1 X67.840 Y125.835 E0.00660 F4800
+G1 X67.740 Y125.704 E0.00660 F4800
+G1 X67.641 Y125.572 E0.00660 F4800
+G1 X67.542 Y125.440 E0.00660 F4800
+G1 X67.444 Y125.308 E0.00660 F4800
+G1 X67.346 Y125.175 E0.00660 F4800
+G1 X67.248 Y125.042 E0.00660 F4800
+G1 X67.152 Y124.908 E0.00660 F4800
+G1 X67.056 Y124.774 E0.00660 F4800
+G1 X66.960 Y124.640 E0.00660 F4800
+G1 X66.865 Y124.505 E0.00660 F4800
+G1 X66.770 Y124.370 E0.00660 F4800
+G1 X66.676 Y124.234 E0.00660 F4800
+G1 X66.583 Y124.099 E0.00660 F4800
+G1 X66.490 Y123.962 E0.00660 F4800
+G1 X66.398 Y123.826 E0.00660 F4800
+G1 X66.306 Y123.689 E0.00660 F4800
+G1 X66.215 Y123.552 E0.00660 F4800
+G1 X66.124 Y123.414 E0.00660 F4800
+G1 X66.034 Y123.276 E0.00660 F4800
+G1 X65.945 Y123.138 E0.00660 F4800
+G1 X65.856 Y122.999 E0.00660 F4800
+G1 X65.767 Y122.860 E0.00660 F4800
+G1 X65.679 Y122.721 E0.00660 F4800
+G1 X65.592 Y122.581 E0.00660 F4800
+G1 X65.505 Y122.441 E0.00660 F4800
+G1 X65.419 Y122.301 E0.00660 F4800
+G1 X65.334 Y122.160 E0.00660 F4800
+G1 X65.249 Y122.019 E0.00660 F4800
+G1 X65.164 Y121.878 E0.00660 F4800
+G1 X65.080 Y121.736 E0.00660 F4800
+G1 X64.997 Y121.594 E0.00660 F4800
+G1 X64.915 Y121.452 E0.00660 F4800
+G1 X64.832 Y121.310 E0.00660 F4800
+G1 X64.751 Y121.167 E0.00660 F4800
+G1 X64.670 Y121.023 E0.00660 F4800
+G1 X64.590 Y120.880 E0.00660 F4800
+G1 X64.510 Y120.736 E0.00660 F4800
+G1 X64.431 Y120.592 E0.00660 F4800
+G1 X64.352 Y120.448 E0.00660 F4800
+G1 X64.274 Y120.303 E0.00660 F4800
+G1 X64.197 Y120.158 E0.00660 F4800
+G1 X64.120 Y120.012 E0.00660 F4800
+G1 X64.043 Y119.867 E0.00660 F4800
+G1 X63.968 Y119.721 E0.00660 F4800
+G1 X63.893 Y119.575 E0.00660 F4800
+G1 X63.818 Y119.428 E0.00660 F4800
+G1 X63.744 Y119.281 E0.00660 F4800
+G1 X63.671 Y119.134 E0.00660 F4800
+G1 X63.598 Y118.987 E0.00660 F4800
+G1 X63.526 Y118.840 E0.00660 F4800
+G1 X63.455 Y118.692 E0.00660 F4800
+G1 X63.384 Y118.544 E0.00660 F4800
+G1 X63.313 Y118.395 E0.00660 F4800
+G1 X63.244 Y118.246 E0.00660 F4800
+G1 X63.175 Y118.098 E0.00660 F4800
+G1 X63.106 Y117.948 E0.00660 F4800
+G1 X63.038 Y117.799 E0.00660 F4800
+G1 X62.971 Y117.649 E0.00660 F4800
+G1 X62.904 Y117.499 E0.00660 F4800
+G1 X62.838 Y117.349 E0.00660 F4800
+G1 X62.773 Y117.199 E0.00660 F4800
+G1 X62.708 Y117.048 E0.00660 F4800
+G1 X62.644 Y116.897 E0.00660 F4800
+G1 X62.580 Y116.746 E0.00660 F4800
+G1 X62.517 Y116.594 E0.00660 F4800
+G1 X62.455 Y116.443 E0.00660 F4800
+G1 X62.393 Y116.291 E0.00660 F4800
+G1 X62.332 Y116.139 E0.00660 F4800
+G1 X62.271 Y115.986 E0.00660 F4800
+G1 X62.211 Y115.834 E0.00660 F4800
+G1 X62.152 Y115.681 E0.00660 F4800
+G1 X62.093 Y115.528 E0.00660 F4800
+G1 X62.035 Y115.374 E0.00660 F4800
+G1 X61.977 Y115.221 E0.00660 F4800
+G1 X61.921 Y115.067 E0.00660 F4800
+G1 X61.864 Y114.913 E0.00660 F4800
+G1 X61.809 Y114.759 E0.00660 F4800
+G1 X61.754 Y114.605 E0.00660 F4800
+G1 X61.699 Y114.450 E0.00660 F4800
+G1 X61.646 Y114.296 E0.00660 F4800
+G1 X61.592 Y114.141 E0.00660 F4800
+G1 X61.540 Y113.986 E0.00660 F4800
+G1 X61.488 Y113.830 E0.00660 F4800
+G1 X61.437 Y113.675 E0.00660 F4800
+G1 X61.386 Y113.519 E0.00660 F4800
+G1 X61.336 Y113.363 E0.00660 F4800
+G1 X61.287 Y113.207 E0.00660 F4800
+G1 X61.238 Y113.051 E0.00660 F4800
+G1 X61.190 Y112.895 E0.00660 F4800
+G1 X61.143 Y112.738 E0.00660 F4800
+G1 X61.096 Y112.581 E0.00660 F4800
+G1 X61.050 Y112.424 E0.00660 F4800
+G1 X61.004 Y112.267 E0.00660 F4800
+G1 X60.959 Y112.110 E0.00660 F4800
+G1 X60.915 Y111.953 E0.00660 F4800
+G1 X60.871 Y111.795 E0.00660 F4800
+G1 X60.828 Y111.637 E0.00660 F4800
+G1 X60.786 Y111.479 E0.00660 F4800
+G1 X60.744 Y111.321 E0.00660 F4800
+G1 X60.703 Y111.163 E0.00660 F4800
+G1 X60.662 Y111.005 E0.00660 F4800
+G1 X60.622 Y110.846 E0.00660 F4800
+G1 X60.583 Y110.688 E0.00660 F4800
+G1 X60.545 Y110.529 E0.00660 F4800
+G1 X60.507 Y110.370 E0.00660 F4800
+G1 X60.469 Y110.211 E0.00660 F4800
+G1 X60.433 Y110.052 E0.00660 F4800
+G1 X60.397 Y109.892 E0.00660 F4800
+G1 X60.361 Y109.733 E0.00660 F4800
+G1 X60.327 Y109.573 E0.00660 F4800
+G1 X60.293 Y109.414 E0.00660 F4800
+G1 X60.259 Y109.254 E0.00660 F4800
+G1 X60.226 Y109.094 E0.00660 F4800
+G1 X60.194 Y108.934 E0.00660 F4800
+G1 X60.163 Y108.774 E0.00660 F4800
+G1 X60.132 Y108.613 E0.00660 F4800
+G1 X60.102 Y108.453 E0.00660 F4800
+G1 X60.072 Y108.293 E0.00660 F4800
+G1 X60.043 Y108.132 E0.00660 F4800
+G1 X60.015 Y107.971 E0.00660 F4800
+G1 X59.987 Y107.811 E0.00660 F4800
+G1 X59.960 Y107.650 E0.00660 F4800
+G1 X59.934 Y107.489 E0.00660 F4800
+G1 X59.908 Y107.328 E0.00660 F4800
+G1 X59.883 Y107.167 E0.00660 F4800
+G1 X59.859 Y107.005 E0.00660 F4800
+G1 X59.835 Y106.844 E0.00660 F4800
+G1 X59.812 Y106.683 E0.00660 F4800
+G1 X59.789 Y106.521 E0.00660 F4800
+G1 X59.768 Y106.360 E0.00660 F4800
+G1 X59.746 Y106.198 E0.00660 F4800
+G1 X59.726 Y106.037 E0.00660 F4800
+G1 X59.706 Y105.875 E0.00660 F4800
+G1 X59.687 Y105.713 E0.00660 F4800
+G1 X59.668 Y105.551 E0.00660 F4800
+G1 X59.650 Y105.389 E0.00660 F4800
+G1 X59.633 Y105.227 E0.00660 F4800
+G1 X59.616 Y105.065 E0.00660 F4800
+G1 X59.600 Y104.903 E0.00660 F4800
+G1 X59.585 Y104.741 E0.00660 F4800
+G1 X59.570 Y104.579 E0.00660 F4800
+G1 X59.556 Y104.417 E0.00660 F4800
+G1 X59.543 Y104.255 E0.00660 F4800
+G1 X59.530 Y104.092 E0.00660 F4800
+G1 X59.518 Y103.930 E0.00660 F4800
+G1 X59.507 Y103.768 E0.00660 F4800
+G1 X59.496 Y103.605 E0.00660 F4800
+G1 X59.486 Y103.443 E0.00660 F4800
+G1 X59.477 Y103.281 E0.00660 F4800
+G1 X59.468 Y103.118 E0.00660 F4800
+G1 X59.460 Y102.956 E0.00660 F4800
+G1 X59.452 Y102.793 E0.00660 F4800
+G1 X59.445 Y102.631 E0.00660 F4800
+G1 X59.439 Y102.468 E0.00660 F4800
+G1 X59.433 Y102.306 E0.00660 F4800
+G1 X59.429 Y102.143 E0.00660 F4800
+G1 X59.424 Y101.981 E0.00660 F4800
+G1 X59.421 Y101.818 E0.00660 F4800
+G1 X59.418 Y101.656 E0.00660 F4800
+G1 X59.415 Y101.493 E0.00660 F4800
+G1 X59.414 Y101.331 E0.00660 F4800
+G1 X59.413 Y101.168 E0.00660 F4800
+G1 X59.412 Y101.006 E0.00660 F4800
+G1 X59.413 Y100.843 E0.00660 F4800
+G1 X59.414 Y100.681 E0.00660 F4800
+G1 X59.415 Y100.519 E0.00660 F4800
+G1 X59.418 Y100.356 E0.00660 F4800
+G1 X59.420 Y100.194 E0.00660 F4800
+G1 X59.424 Y100.032 E0.00660 F4800
+G1 X59.428 Y99.869 E0.00660 F4800
+G1 X59.433 Y99.707 E0.00660 F4800
+G1 X59.439 Y99.545 E0.00660 F4800
+G1 X59.445 Y99.383 E0.00660 F4800
+G1 X59.451 Y99.220 E0.00660 F4800
+G1 X59.459 Y99.058 E0.00660 F4800
+G1 X59.467 Y98.896 E0.00660 F4800
+G1 X59.476 Y98.734 E0.00660 F4800
+G1 X59.485 Y98.572 E0.00660 F4800
+G1 X59.495 Y98.411 E0.00660 F4800
+G1 X59.506 Y98.249 E0.00660 F4800
+G1 X59.517 Y98.087 E0.00660 F4800
+G1 X59.529 Y97.925 E0.00660 F4800
+G1 X59.542 Y97.764 E0.00660 F4800
+G1 X59.555 Y97.602 E0.00660 F4800
+G1 X59.569 Y97.440 E0.00660 F4800
+G1 X59.583 Y97.279 E0.00660 F4800
+G1 X59.599 Y97.118 E0.00660 F4800
+G1 X59.615 Y96.956 E0.00660 F4800
+G1 X59.631 Y96.795 E0.00660 F4800
+G1 X59.648 Y96.634 E0.00660 F4800
+G1 X59.666 Y96.473 E0.00660 F4800
+G1 X59.684 Y96.312 E0.00660 F4800
+G1 X59.703 Y96.151 E0.00660 F4800
+G1 X59.723 Y95.990 E0.00660 F4800
+G1 X59.743 Y95.830 E0.00660 F4800
+G1 X59.764 Y95.669 E0.00660 F4800
+G1 X59.786 Y95.509 E0.00660 F4800
+G1 X59.808 Y95.348 E0.00660 F4800
+G1 X59.831 Y95.188 E0.00660 F4800
+G1 X59.855 Y95.028 E0.00660 F4800
+G1 X59.879 Y94.868 E0.00660 F4800
+G1 X59.904 Y94.708 E0.00660 F4800
+G1 X59.929 Y94.548 E0.00660 F4800
+G1 X59.955 Y94.389 E0.00660 F4800
+G1 X59.982 Y94.229 E0.00660 F4800
+G1 X60.009 Y94.070 E0.00660 F4800
+G1 X60.037 Y93.910 E0.00660 F4800
+G1 X60.066 Y93.751 E0.00660 F4800
+G1 X60.095 Y93.592 E0.00660 F4800
+G1 X60.125 Y93.433 E0.00660 F4800
+G1 X60.156 Y93.274 E0.00660 F4800
+G1 X60.187 Y93.116 E0.00660 F4800
+G1 X60.219 Y92.957 E0.00660 F4800
+G1 X60.251 Y92.799 E0.00660 F4800
+G1 X60.284 Y92.641 E0.00660 F4800
+G1 X60.318 Y92.483 E0.00660 F4800
+G1 X60.352 Y92.325 E0.00660 F4800
+G1 X60.387 Y92.167 E0.00660 F4800
+G1 X60.423 Y92.009 E0.00660 F4800
+G1 X60.459 Y91.852 E0.00660 F4800
+G1 X60.496 Y91.695 E0.00660 F4800
+G1 X60.533 Y91.537 E0.00660 F4800
+G1 X60.571 Y91.381 E0.00660 F4800
+G1 X60.610 Y91.224 E0.00660 F4800
+G1 X60.649 Y91.067 E0.00660 F4800
+G1 X60.689 Y90.911 E0.00660 F4800
+G1 X60.730 Y90.754 E0.00660 F4800
+G1 X60.771 Y90.598 E0.00660 F4800
+G1 X60.813 Y90.443 E0.00660 F4800
+G1 X60.855 Y90.287 E0.00660 F4800
+G1 X60.898 Y90.131 E0.00660 F4800
+G1 X60.942 Y89.976 E0.00660 F4800
+G1 X60.986 Y89.821 E0.00660 F4800
+G1 X61.031 Y89.666 E0.00660 F4800
+G1 X61.076 Y89.511 E0.00660 F4800
+G1 X61.123 Y89.357 E0.00660 F4800
+G1 X61.169 Y89.202 E0.00660 F4800
+G1 X61.217 Y89.048 E0.00660 F4800
+G1 X61.265 Y88.894 E0.00660 F4800
+G1 X61.313 Y88.740 E0.00660 F4800
+G1 X61.362 Y88.587 E0.00660 F4800
+G1 X61.412 Y88.434 E0.00660 F4800
+G1 X61.463 Y88.280 E0.00660 F4800
+G1 X61.514 Y88.128 E0.00660 F4800
+G1 X61.565 Y87.975 E0.00660 F4800
+G1 X61.617 Y87.822 E0.00660 F4800
+G1 X61.670 Y87.670 E0.00660 F4800
+G1 X61.724 Y87.518 E0.00660 F4800
+G1 X61.778 Y87.367 E0.00660 F4800
+G1 X61.832 Y87.215 E0.00660 F4800
+G1 X61.888 Y87.064 E0.00660 F4800
+G1 X61.943 Y86.913 E0.00660 F4800
+G1 X62.000 Y86.762 E0.00660 F4800
+G1 X62.057 Y86.611 E0.00660 F4800
+G1 X62.115 Y86.461 E0.00660 F4800
+G1 X62.173 Y86.311 E0.00660 F4800
+G1 X62.232 Y86.161 E0.00660 F4800
+G1 X62.291 Y86.012 E0.00660 F4800
+G1 X62.351 Y85.862 E0.00660 F4800
+G1 X62.412 Y85.713 E0.00660 F4800
+G1 X62.473 Y85.564 E0.00660 F4800
+G1 X62.535 Y85.416 E0.00660 F4800
+G1 X62.597 Y85.268 E0.00660 F4800
+G1 X62.660 Y85.120 E0.00660 F4800
+G1 X62.723 Y84.972 E0.00660 F4800
+G1 X62.787 Y84.824 E0.00660 F4800
+G1 X62.852 Y84.677 E0.00660 F4800
+G1 X62.917 Y84.530 E0.00660 F4800
+G1 X62.983 Y84.384 E0.00660 F4800
+G1 X63.050 Y84.237 E0.00660 F4800
+G1 X63.117 Y84.091 E0.00660 F4800
+G1 X63.184 Y83.945 E0.00660 F4800
+G1 X63.253 Y83.800 E0.00660 F4800
+G1 X63.321 Y83.655 E0.00660 F4800
+G1 X63.391 Y83.510 E0.00660 F4800
+G1 X63.460 Y83.365 E0.00660 F4800
+G1 X63.531 Y83.221 E0.00660 F4800
+G1 X63.602 Y83.077 E0.00660 F4800
+G1 X63.674 Y82.933 E0.00660 F4800
+G1 X63.746 Y82.789 E0.00660 F4800
+G1 X63.819 Y82.646 E0.00660 F4800
+G1 X63.892 Y82.503 E0.00660 F4800
+G1 X63.966 Y82.361 E0.00660 F4800
+G1 X64.040 Y82.219 E0.00660 F4800
+G1 X64.115 Y82.077 E0.00660 F4800
+G1 X64.191 Y81.935 E0.00660 F4800
+G1 X64.267 Y81.794 E0.00660 F4800
+G1 X64.343 Y81.653 E0.00660 F4800
+G1 X64.421 Y81.512 E0.00660 F4800
+G1 X64.498 Y81.372 E0.00660 F4800
+G1 X64.577 Y81.232 E0.00660 F4800
+G1 X64.656 Y81.092 E0.00660 F4800
+G1 X64.735 Y80.953 E0.00660 F4800
+G1 X64.815 Y80.814 E0.00660 F4800
+G1 X64.896 Y80.675 E0.00660 F4800
+G1 X64.977 Y80.537 E0.00660 F4800
+G1 X65.058 Y80.399 E0.00660 F4800
+G1 X65.140 Y80.261 E0.00660 F4800
+G1 X65.223 Y80.124 E0.00660 F4800
+G1 X65.306 Y79.987 E0.00660 F4800
+G1 X65.390 Y79.850 E0.00660 F4800
+G1 X65.475 Y79.714 E0.00660 F4800
+G1 X65.559 Y79.578 E0.00660 F4800
+G1 X65.645 Y79.443 E0.00660 F4800
+G1 X65.731 Y79.308 E0.00660 F4800
+G1 X65.817 Y79.173 E0.00660 F4800
+G1 X65.904 Y79.038 E0.00660 F4800
+G1 X65.992 Y78.904 E0.00660 F4800
+G1 X66.080 Y78.770 E0.00660 F4800
+G1 X66.168 Y78.637 E0.00660 F4800
+G1 X66.257 Y78.504 E0.00660 F4800
+G1 X66.347 Y78.371 E0.00660 F4800
+G1 X66.437 Y78.239 E0.00660 F4800
+G1 X66.528 Y78.107 E0.00660 F4800
+G1 X66.619 Y77.976 E0.00660 F4800
+G1 X66.711 Y77.845 E0.00660 F4800
+G1 X66.803 Y77.714 E0.00660 F4800
+G1 X66.896 Y77.584 E0.00660 F4800
+G1 X66.989 Y77.454 E0.00660 F4800
+G1 X67.083 Y77.324 E0.00660 F4800
+G1 X67.177 Y77.195 E0.00660 F4800
+G1 X67.272 Y77.066 E0.00660 F4800
+G1 X67.367 Y76.937 E0.00660 F4800
+G1 X67.463 Y76.809 E0.00660 F4800
+G1 X67.559 Y76.682 E0.00660 F4800
+G1 X67.656 Y76.555 E0.00660 F4800
+G1 X67.753 Y76.428 E0.00660 F4800
+G1 X67.851 Y76.301 E0.00660 F4800
+G1 X67.949 Y76.175 E0.00660 F4800
+G1 X68.048 Y76.050 E0.00660 F4800
+G1 X68.147 Y75.925 E0.00660 F4800
+G1 X68.247 Y75.800 E0.00660 F4800
+G1 X68.347 Y75.675 E0.00660 F4800
+G1 X68.448 Y75.551 E0.00660 F4800
+G1 X68.549 Y75.428 E0.00660 F4800
+G1 X68.651 Y75.305 E0.00660 F4800
+G1 X68.753 Y75.182 E0.00660 F4800
+G1 X68.855 Y75.060 E0.00660 F4800
+G1 X68.958 Y74.938 E0.00660 F4800
+G1 X69.062 Y74.816 E0.00660 F4800
+G1 X69.166 Y74.695 E0.00660 F4800
+G1 X69.271 Y74.575 E0.00660 F4800
+G1 X69.376 Y74.455 E0.00660 F4800
+G1 X69.481 Y74.335 E0.00660 F4800
+G1 X69.587 Y74.216 E0.00660 F4800
+G1 X69.694 Y74.097 E0.00660 F4800
+G1 X69.800 Y73.978 E0.00660 F4800
+G1 X69.908 Y73.860 E0.00660 F4800
+G1 X70.016 Y73.743 E0.00660 F4800
+G1 X70.124 Y73.626 E0.00660 F4800
+G1 X70.233 Y73.509 E0.00660 F4800
+G1 X70.342 Y73.393 E0.00660 F4800
+G1 X70.451 Y73.277 E0.00660 F4800
+G1 X70.561 Y73.162 E0.00660 F4800
+G1 X70.672 Y73.047 E0.00660 F4800
+G1 X70.783 Y72.933 E0.00660 F4800
+G1 X70.894 Y72.819 E0.00660 F4800
+G1 X71.006 Y72.705 E0.00660 F4800
+G1 X71.119 Y72.592 E0.00660 F4800
+G1 X71.231 Y72.480 E0.00660 F4800
+G1 X71.345 Y72.368 E0.00660 F4800
+G1 X71.458 Y72.256 E0.00660 F4800
+G1 X71.572 Y72.145 E0.00660 F4800
+G1 X71.687 Y72.034 E0.00660 F4800
+G1 X71.802 Y71.924 E0.00660 F4800
+G1 X71.917 Y71.814 E0.00660 F4800
+G1 X72.033 Y71.705 E0.00660 F4800
+G1 X72.149 Y71.596 E0.00660 F4800
+G1 X72.266 Y71.488 E0.00660 F4800
+G1 X72.383 Y71.380 E0.00660 F4800
+G1 X72.500 Y71.273 E0.00660 F4800
+G1 X72.618 Y71.166 E0.00660 F4800
+G1 X72.736 Y71.060 E0.00660 F4800
+G1 X72.855 Y70.954 E0.00660 F4800
+G1 X72.974 Y70.848 E0.00660 F4800
+G1 X73.094 Y70.743 E0.00660 F4800
+G1 X73.214 Y70.639 E0.00660 F4800
+G1 X73.334 Y70.535 E0.00660 F4800
+G1 X73.455 Y70.432 E0.00660 F4800
+G1 X73.576 Y70.329 E0.00660 F4800
+G1 X73.697 Y70.226 E0.00660 F4800
+G1 X73.819 Y70.124 E0.00660 F4800
+G1 X73.942 Y70.023 E0.00660 F4800
+G1 X74.064 Y69.922 E0.00660 F4800
+G1 X74.188 Y69.821 E0.00660 F4800
+G1 X74.311 Y69.721 E0.00660 F4800
+G1 X74.435 Y69.622 E0.00660 F4800
+G1 X74.559 Y69.523 E0.00660 F4800
+G1 X74.684 Y69.424 E0.00660 F4800
+G1 X74.809 Y69.327 E0.00660 F4800
+G1 X74.934 Y69.229 E0.00660 F4800
+G1 X75.060 Y69.132 E0.00660 F4800
+G1 X75.186 Y69.036 E0.00660 F4800
+G1 X75.313 Y68.940 E0.00660 F4800
+G1 X75.440 Y68.845 E0.00660 F4800
+G1 X75.567 Y68.750 E0.00660 F4800
+G1 X75.695 Y68.655 E0.00660 F4800
+G1 X75.823 Y68.562 E0.00660 F4800
+G1 X75.951 Y68.468 E0.00660 F4800
+G1 X76.080 Y68.376 E0.00660 F4800
+G1 X76.209 Y68.283 E0.00660 F4800
+G1 X76.338 Y68.192 E0.00660 F4800
+G1 X76.468 Y68.100 E0.00660 F4800
+G1 X76.598 Y68.010 E0.00660 F4800
+G1 X76.729 Y67.920 E0.00660 F4800
+G1 X76.860 Y67.830 E0.00660 F4800
+G1 X76.991 Y67.741 E0.00660 F4800
+G1 X77.122 Y67.653 E0.00660 F4800
+G1 X77.254 Y67.565 E0.00660 F4800
+G1 X77.386 Y67.477 E0.00660 F4800
+G1 X77.519 Y67.390 E0.00660 F4800
+G1 X77.652 Y67.304 E0.00660 F4800
+G1 X77.785 Y67.218 E0.00660 F4800
+G1 X77.919 Y67.133 E0.00660 F4800
+G1 X78.052 Y67.048 E0.00660 F4800
+G1 X78.187 Y66.964 E0.00660 F4800
+G1 X78.321 Y66.880 E0.00660 F4800
+G1 X78.456 Y66.797 E0.00660 F4800
+G1 X78.591 Y66.715 E0.00660 F4800
+G1 X78.727 Y66.633 E0.00660 F4800
+G1 X78.862 Y66.551 E0.00660 F4800
+G1 X78.998 Y66.470 E0.00660 F4800
+G1 X79.135 Y66.390 E0.00660 F4800
+G1 X79.272 Y66.310 E0.00660 F4800
+G1 X79.409 Y66.231 E0.00660 F4800
+G1 X79.546 Y66.152 E0.00660 F4800
+G1 X79.683 Y66.074 E0.00660 F4800
+G1 X79.821 Y65.997 E0.00660 F4800
+G1 X79.960 Y65.920 E0.00660 F4800
+G1 X80.098 Y65.843 E0.00660 F4800
+G1 X80.237 Y65.767 E0.00660 F4800
+G1 X80.376 Y65.692 E0.00660 F4800
+G1 X80.515 Y65.617 E0.00660 F4800
+G1 X80.655 Y65.543 E0.00660 F4800
+G1 X80.795 Y65.469 E0.00660 F4800
+G1 X80.935 Y65.396 E0.00660 F4800
+G1 X81.076 Y65.324 E0.00660 F4800
+G1 X81.216 Y65.252 E0.00660 F4800
+G1 X81.357 Y65.181 E0.00660 F4800
+G1 X81.499 Y65.110 E0.00660 F4800
+G1 X81.640 Y65.040 E0.00660 F4800
+G1 X81.782 Y64.970 E0.00660 F4800
+G1 X81.924 Y64.901 E0.00660 F4800
+G1 X82.066 Y64.833 E0.00660 F4800
+G1 X82.209 Y64.765 E0.00660 F4800
+G1 X82.352 Y64.697 E0.00660 F4800
+G1 X82.495 Y64.631 E0.00660 F4800
+G1 X82.638 Y64.565 E0.00660 F4800
+G1 X82.782 Y64.499 E0.00660 F4800
+G1 X82.926 Y64.434 E0.00660 F4800
+G1 X83.070 Y64.370 E0.00660 F4800
+G1 X83.214 Y64.306 E0.00660 F4800
+G1 X83.359 Y64.243 E0.00660 F4800
+G1 X83.504 Y64.180 E0.00660 F4800
+G1 X83.649 Y64.118 E0.00660 F4800
+G1 X83.794 Y64.056 E0.00660 F4800
+G1 X83.940 Y63.996 E0.00660 F4800
+G1 X84.086 Y63.935 E0.00660 F4800
+G1 X84.232 Y63.876 E0.00660 F4800
+G1 X84.378 Y63.816 E0.00660 F4800
+G1 X84.524 Y63.758 E0.00660 F4800
+G1 X84.671 Y63.700 E0.00660 F4800
+G1 X84.818 Y63.643 E0.00660 F4800
+G1 X84.965 Y63.586 E0.00660 F4800
+G1 X85.112 Y63.530 E0.00660 F4800
+G1 X85.260 Y63.474 E0.00660 F4800
+G1 X85.407 Y63.419 E0.00660 F4800
+G1 X85.555 Y63.365 E0.00660 F4800
+G1 X85.703 Y63.311 E0.00660 F4800
+G1 X85.852 Y63.258 E0.00660 F4800
+G1 X86.000 Y63.205 E0.00660 F4800
+G1 X86.149 Y63.153 E0.00660 F4800
+G1 X86.298 Y63.102 E0.00660 F4800
+G1 X86.447 Y63.051 E0.00660 F4800
+G1 X86.596 Y63.001 E0.00660 F4800
+G1 X86.745 Y62.952 E0.00660 F4800
+G1 X86.895 Y62.903 E0.00660 F4800
+G1 X87.045 Y62.854 E0.00660 F4800
+G1 X87.195 Y62.807 E0.00660 F4800
+G1 X87.345 Y62.759 E0.00660 F4800
+G1 X87.495 Y62.713 E0.00660 F4800
+G1 X87.646 Y62.667 E0.00660 F4800
+G1 X87.797 Y62.622 E0.00660 F4800
+G1 X87.947 Y62.577 E0.00660 F4800
+G1 X88.098 Y62.533 E0.00660 F4800
+G1 X88.250 Y62.489 E0.00660 F4800
+G1 X88.401 Y62.447 E0.00660 F4800
+G1 X88.552 Y62.404 E0.00660 F4800
+G1 X88.704 Y62.363 E0.00660 F4800
+G1 X88.856 Y62.322 E0.00660 F4800
+G1 X89.008 Y62.281 E0.00660 F4800
+G1 X89.160 Y62.241 E0.00660 F4800
+G1 X89.312 Y62.202 E0.00660 F4800
+G1 X89.464 Y62.163 E0.00660 F4800
+G1 X89.617 Y62.125 E0.00660 F4800
+G1 X89.769 Y62.088 E0.00660 F4800
+G1 X89.922 Y62.051 E0.00660 F4800
+G1 X90.075 Y62.015 E0.00660 F4800
+G1 X90.228 Y61.980 E0.00660 F4800
+G1 X90.381 Y61.945 E0.00660 F4800
+G1 X90.534 Y61.911 E0.00660 F4800
+G1 X90.688 Y61.877 E0.00660 F4800
+G1 X90.841 Y61.844 E0.00660 F4800
+G1 X90.995 Y61.811 E0.00660 F4800
+G1 X91.149 Y61.780 E0.00660 F4800
+G1 X91.303 Y61.748 E0.00660 F4800
+G1 X91.456 Y61.718 E0.00660 F4800
+G1 X91.611 Y61.688 E0.00660 F4800
+G1 X91.765 Y61.658 E0.00660 F4800
+G1 X91.919 Y61.630 E0.00660 F4800
+G1 X92.073 Y61.602 E0.00660 F4800
+G1 X92.228 Y61.574 E0.00660 F4800
+G1 X92.382 Y61.547 E0.00660 F4800
+G1 X92.537 Y61.521 E0.00660 F4800
+G1 X92.692 Y61.495 E0.00660 F4800
+G1 X92.846 Y61.470 E0.00660 F4800
+G1 X93.001 Y61.446 E0.00660 F4800
+G1 X93.156 Y61.422 E0.00660 F4800
+G1 X93.311 Y61.399 E0.00660 F4800
+G1 X93.466 Y61.377 E0.00660 F4800
+G1 X93.622 Y61.355 E0.00660 F4800
+G1 X93.777 Y61.334 E0.00660 F4800
+G1 X93.932 Y61.313 E0.00660 F4800
+G1 X94.088 Y61.293 E0.00660 F4800
+G1 X94.243 Y61.274 E0.00660 F4800
+G1 X94.399 Y61.255 E0.00660 F4800
+G1 X94.554 Y61.237 E0.00660 F4800
+G1 X94.710 Y61.219 E0.00660 F4800
+G1 X94.866 Y61.202 E0.00660 F4800
+G1 X95.021 Y61.186 E0.00660 F4800
+G1 X95.177 Y61.170 E0.00660 F4800
+G1 X95.333 Y61.155 E0.00660 F4800
+G1 X95.489 Y61.141 E0.00660 F4800
+G1 X95.645 Y61.127 E0.00660 F4800
+G1 X95.801 Y61.114 E0.00660 F4800
+G1 X95.957 Y61.102 E0.00660 F4800
+G1 X96.113 Y61.090 E0.00660 F4800
+G1 X96.269 Y61.078 E0.00660 F4800
+G1 X96.425 Y61.068 E0.00660 F4800
+G1 X96.581 Y61.058 E0.00660 F4800
+G1 X96.737 Y61.048 E0.00660 F4800
+G1 X96.893 Y61.040 E0.00660 F4800
+G1 X97.049 Y61.032 E0.00660 F4800
+G1 X97.206 Y61.024 E0.00660 F4800
+G1 X97.362 Y61.017 E0.00660 F4800
+G1 X97.518 Y61.011 E0.00660 F4800
+G1 X97.674 Y61.005 E0.00660 F4800
+G1 X97.830 Y61.000 E0.00660 F4800
+G1 X97.987 Y60.996 E0.00660 F4800
+G1 X98.143 Y60.992 E0.00660 F4800
+G1 X98.299 Y60.989 E0.00660 F4800
+G1 X98.455 Y60.987 E0.00660 F4800
+G1 X98.611 Y60.985 E0.00660 F4800
+G1 X98.768 Y60.983 E0.00660 F4800
+G1 X98.924 Y60.983 E0.00660 F4800
+G1 X99.080 Y60.983 E0.00660 F4800
+G1 X99.236 Y60.983 E0.00660 F4800
+G1 X99.392 Y60.985 E0.00660 F4800
+G1 X99.548 Y60.987 E0.00660 F4800
+G1 X99.705 Y60.989 E0.00660 F4800
+G1 X99.861 Y60.992 E0.00660 F4800
+G1 X100.017 Y60.996 E0.00660 F4800
+G1 X100.173 Y61.000 E0.00660 F4800
+G1 X100.329 Y61.005 E0.00660 F4800
+G1 X100.484 Y61.011 E0.00660 F4800
+G1 X100.640 Y61.017 E0.00660 F4800
+G1 X100.796 Y61.024 E0.00660 F4800
+G1 X100.952 Y61.032 E0.00660 F4800
+G1 X101.108 Y61.040 E0.00660 F4800
+G1 X101.263 Y61.048 E0.00660 F4800
+G1 X101.419 Y61.058 E0.00660 F4800
+G1 X101.575 Y61.068 E0.00660 F4800
+G1 X101.730 Y61.078 E0.00660 F4800
+G1 X101.886 Y61.090 E0.00660 F4800
+G1 X102.041 Y61.102 E0.00660 F4800
+G1 X102.197 Y61.114 E0.00660 F4800
+G1 X102.352 Y61.127 E0.00660 F4800
+G1 X102.507 Y61.141 E0.00660 F4800
+G1 X102.662 Y61.155 E0.00660 F4800
+G1 X102.817 Y61.170 E0.00660 F4800
+G1 X102.972 Y61.186 E0.00660 F4800
+G1 X103.127 Y61.202 E0.00660 F4800
+G1 X103.282 Y61.219 E0.00660 F4800
+G1 X103.437 Y61.236 E0.00660 F4800
+G1 X103.591 Y61.254 E0.00660 F4800
+G1 X103.746 Y61.273 E0.00660 F4800
+G1 X103.900 Y61.292 E0.00660 F4800
+G1 X104.055 Y61.312 E0.00660 F4800
+G1 X104.209 Y61.332 E0.00660 F4800
+G1 X104.363 Y61.354 E0.00660 F4800
+G1 X104.517 Y61.375 E0.00660 F4800
+G1 X104.671 Y61.398 E0.00660 F4800
+G1 X104.825 Y61.421 E0.00660 F4800
+G1 X104.979 Y61.444 E0.00660 F4800
+G1 X105.133 Y61.468 E0.00660 F4800
+G1 X105.286 Y61.493 E0.00660 F4800
+G1 X105.440 Y61.519 E0.00660 F4800
+G1 X105.593 Y61.545 E0.00660 F4800
+G1 X105.746 Y61.571 E0.00660 F4800
+G1 X105.899 Y61.598 E0.00660 F4800
+G1 X106.052 Y61.626 E0.00660 F4800
+G1 X106.205 Y61.655 E0.00660 F4800
+G1 X106.358 Y61.684 E0.00660 F4800
+G1 X106.510 Y61.714 E0.00660 F4800
+G1 X106.663 Y61.744 E0.00660 F4800
+G1 X106.815 Y61.775 E0.00660 F4800
+G1 X106.967 Y61.806 E0.00660 F4800
+G1 X107.119 Y61.838 E0.00660 F4800
+G1 X107.271 Y61.871 E0.00660 F4800
+G1 X107.422 Y61.904 E0.00660 F4800
+G1 X107.574 Y61.938 E0.00660 F4800
+G1 X107.725 Y61.973 E0.00660 F4800
+G1 X107.877 Y62.008 E0.00660 F4800
+G1 X108.028 Y62.044 E0.00660 F4800
+G1 X108.179 Y62.080 E0.00660 F4800
+G1 X108.329 Y62.117 E0.00660 F4800
+G1 X108.480 Y62.154 E0.00660 F4800
+G1 X108.630 Y62.193 E0.00660 F4800
+G1 X108.781 Y62.231 E0.00660 F4800
+G1 X108.931 Y62.271 E0.00660 F4800
+G1 X109.081 Y62.310 E0.00660 F4800
+G1 X109.230 Y62.351 E0.00660 F4800
+G1 X109.380 Y62.392 E0.00660 F4800
+G1 X109.529 Y62.434 E0.00660 F4800
+G1 X109.678 Y62.476 E0.00660 F4800
+G1 X109.827 Y62.519 E0.00660 F4800
+G1 X109.976 Y62.562 E0.00660 F4800
+G1 X110.125 Y62.606 E0.00660 F4800
+G1 X110.273 Y62.651 E0.00660 F4800
+G1 X110.422 Y62.696 E0.00660 F4800
+G1 X110.570 Y62.742 E0.00660 F4800
+G1 X110.717 Y62.789 E0.00660 F4800
+G1 X110.865 Y62.836 E0.00660 F4800
+G1 X111.013 Y62.883 E0.00660 F4800
+G1 X111.160 Y62.931 E0.00660 F4800
+G1 X111.307 Y62.980 E0.00660 F4800
+G1 X111.454 Y63.030 E0.00660 F4800
+G1 X111.600 Y63.079 E0.00660 F4800
+G1 X111.747 Y63.130 E0.00660 F4800
+G1 X111.893 Y63.181 E0.00660 F4800
+G1 X112.039 Y63.233 E0.00660 F4800
+G1 X112.184 Y63.285 E0.00660 F4800
+G1 X112.330 Y63.338 E0.00660 F4800
+G1 X112.475 Y63.391 E0.00660 F4800
+G1 X112.620 Y63.445 E0.00660 F4800
+G1 X112.765 Y63.500 E0.00660 F4800
+G1 X112.909 Y63.555 E0.00660 F4800
+G1 X113.054 Y63.611 E0.00660 F4800
+G1 X113.198 Y63.667 E0.00660 F4800
+G1 X113.342 Y63.724 E0.00660 F4800
+G1 X113.485 Y63.781 E0.00660 F4800
+G1 X113.629 Y63.839 E0.00660 F4800
+G1 X113.772 Y63.898 E0.00660 F4800
+G1 X113.915 Y63.957 E0.00660 F4800
+G1 X114.057 Y64.016 E0.00660 F4800
+G1 X114.200 Y64.077 E0.00660 F4800
+G1 X114.342 Y64.137 E0.00660 F4800
+G1 X114.484 Y64.199 E0.00660 F4800
+G1 X114.625 Y64.261 E0.00660 F4800
+G1 X114.766 Y64.323 E0.00660 F4800
+G1 X114.907 Y64.386 E0.00660 F4800
+G1 X115.048 Y64.450 E0.00660 F4800
+G1 X115.189 Y64.514 E0.00660 F4800
+G1 X115.329 Y64.579 E0.00660 F4800
+G1 X115.469 Y64.644 E0.00660 F4800
+G1 X115.609 Y64.710 E0.00660 F4800
+G1 X115.748 Y64.776 E0.00660 F4800
+G1 X115.887 Y64.843 E0.00660 F4800
+G1 X116.026 Y64.910 E0.00660 F4800
+G1 X116.165 Y64.978 E0.00660 F4800
+G1 X116.303 Y65.047 E0.00660 F4800
+G1 X116.441 Y65.116 E0.00660 F4800
+G1 X116.578 Y65.186 E0.00660 F4800
+G1 X116.716 Y65.256 E0.00660 F4800
+G1 X116.853 Y65.327 E0.00660 F4800
+G1 X116.990 Y65.398 E0.00660 F4800
+G1 X117.126 Y65.470 E0.00660 F4800
+G1 X117.262 Y65.542 E0.00660 F4800
+G1 X117.398 Y65.615 E0.00660 F4800
+G1 X117.534 Y65.689 E0.00660 F4800
+G1 X117.669 Y65.762 E0.00660 F4800
+G1 X117.804 Y65.837 E0.00660 F4800
+G1 X117.939 Y65.912 E0.00660 F4800
+G1 X118.073 Y65.988 E0.00660 F4800
+G1 X118.207 Y66.064 E0.00660 F4800
+G1 X118.341 Y66.140 E0.00660 F4800
+G1 X118.474 Y66.217 E0.00660 F4800
+G1 X118.607 Y66.295 E0.00660 F4800
+G1 X118.740 Y66.373 E0.00660 F4800
+G1 X118.872 Y66.452 E0.00660 F4800
+G1 X119.004 Y66.531 E0.00660 F4800
+G1 X119.136 Y66.611 E0.00660 F4800
+G1 X119.268 Y66.691 E0.00660 F4800
+G1 X119.399 Y66.772 E0.00660 F4800
+G1 X119.529 Y66.853 E0.00660 F4800
+G1 X119.660 Y66.935 E0.00660 F4800
+G1 X119.790 Y67.018 E0.00660 F4800
+G1 X119.919 Y67.100 E0.00660 F4800
+G1 X120.049 Y67.184 E0.00660 F4800
+G1 X120.178 Y67.268 E0.00660 F4800
+G1 X120.306 Y67.352 E0.00660 F4800
+G1 X120.435 Y67.437 E0.00660 F4800
+G1 X120.563 Y67.522 E0.00660 F4800
+G1 X120.690 Y67.608 E0.00660 F4800
+G1 X120.818 Y67.694 E0.00660 F4800
+G1 X120.944 Y67.781 E0.00660 F4800
+G1 X121.071 Y67.869 E0.00660 F4800
+G1 X121.197 Y67.957 E0.00660 F4800
+G1 X121.323 Y68.045 E0.00660 F4800
+G1 X121.448 Y68.134 E0.00660 F4800
+G1 X121.573 Y68.223 E0.00660 F4800
+G1 X121.698 Y68.313 E0.00660 F4800
+G1 X121.822 Y68.403 E0.00660 F4800
+G1 X121.946 Y68.494 E0.00660 F4800
+G1 X122.070 Y68.586 E0.00660 F4800
+G1 X122.193 Y68.677 E0.00660 F4800
+G1 X122.316 Y68.770 E0.00660 F4800
+G1 X122.438 Y68.862 E0.00660 F4800
+G1 X122.560 Y68.956 E0.00660 F4800
+G1 X122.682 Y69.049 E0.00660 F4800
+G1 X122.803 Y69.143 E0.00660 F4800
+G1 X122.924 Y69.238 E0.00660 F4800
+G1 X123.044 Y69.333 E0.00660 F4800
+G1 X123.164 Y69.429 E0.00660 F4800
+G1 X123.284 Y69.525 E0.00660 F4800
+G1 X123.403 Y69.622 E0.00660 F4800
+G1 X123.522 Y69.719 E0.00660 F4800
+G1 X123.641 Y69.816 E0.00660 F4800
+G1 X123.759 Y69.914 E0.00660 F4800
+G1 X123.876 Y70.012 E0.00660 F4800
+G1 X123.994 Y70.111 E0.00660 F4800
+G1 X124.111 Y70.211 E0.00660 F4800
+G1 X124.227 Y70.310 E0.00660 F4800
+G1 X124.343 Y70.411 E0.00660 F4800
+G1 X124.459 Y70.511 E0.00660 F4800
+G1 X124.574 Y70.612 E0.00660 F4800
+G1 X124.689 Y70.714 E0.00660 F4800
+G1 X124.803 Y70.816 E0.00660 F4800
+G1 X124.917 Y70.919 E0.00660 F4800
+G1 X125.030 Y71.021 E0.00660 F4800
+G1 X125.143 Y71.125 E0.00660 F4800
+G1 X125.256 Y71.229 E0.00660 F4800
+G1 X125.368 Y71.333 E0.00660 F4800
+G1 X125.480 Y71.438 E0.00660 F4800
+G1 X125.592 Y71.543 E0.00660 F4800
+G1 X125.702 Y71.648 E0.00660 F4800
+G1 X125.813 Y71.754 E0.00660 F4800
+G1 X125.923 Y71.861 E0.00660 F4800
+G1 X126.033 Y71.967 E0.00660 F4800
+G1 X126.142 Y72.075 E0.00660 F4800
+G1 X126.251 Y72.182 E0.00660 F4800
+G1 X126.359 Y72.291 E0.00660 F4800
+G1 X126.467 Y72.399 E0.00660 F4800
+G1 X126.574 Y72.508 E0.00660 F4800
+G1 X126.681 Y72.617 E0.00660 F4800
+G1 X126.788 Y72.727 E0.00660 F4800
+G1 X126.894 Y72.837 E0.00660 F4800
+G1 X126.999 Y72.948 E0.00660 F4800
+G1 X127.104 Y73.059 E0.00660 F4800
+G1 X127.209 Y73.171 E0.00660 F4800
+G1 X127.313 Y73.282 E0.00660 F4800
+G1 X127.417 Y73.395 E0.00660 F4800
+G1 X127.521 Y73.507 E0.00660 F4800
+G1 X127.623 Y73.620 E0.00660 F4800
+G1 X127.726 Y73.734 E0.00660 F4800
+G1 X127.828 Y73.848 E0.00660 F4800
+G1 X127.929 Y73.962 E0.00660 F4800
+G1 X128.030 Y74.077 E0.00660 F4800
+G1 X128.131 Y74.192 E0.00660 F4800
+G1 X128.231 Y74.307 E0.00660 F4800
+G1 X128.330 Y74.423 E0.00660 F4800
+G1 X128.429 Y74.539 E0.00660 F4800
+G1 X128.528 Y74.656 E0.00660 F4800
+G1 X128.626 Y74.773 E0.00660 F4800
+G1 X128.724 Y74.890 E0.00660 F4800
+G1 X128.821 Y75.008 E0.00660 F4800
+G1 X128.918 Y75.126 E0.00660 F4800
+G1 X129.014 Y75.244 E0.00660 F4800
+G1 X129.110 Y75.363 E0.00660 F4800
+G1 X129.205 Y75.482 E0.00660 F4800
+G1 X129.300 Y75.602 E0.00660 F4800
+G1 X129.394 Y75.722 E0.00660 F4800
+G1 X129.488 Y75.842 E0.00660 F4800
+G1 X129.581 Y75.963 E0.00660 F4800
+G1 X129.674 Y76.084 E0.00660 F4800
+G1 X129.766 Y76.205 E0.00660 F4800
+G1 X129.858 Y76.327 E0.00660 F4800
+G1 X129.949 Y76.449 E0.00660 F4800
+G1 X130.040 Y76.571 E0.00660 F4800
+G1 X130.130 Y76.694 E0.00660 F4800
+G1 X130.220 Y76.817 E0.00660 F4800
+G1 X130.310 Y76.941 E0.00660 F4800
+G1 X130.398 Y77.065 E0.00660 F4800
+G1 X130.487 Y77.189 E0.00660 F4800
+G1 X130.574 Y77.313 E0.00660 F4800
+G1 X130.662 Y77.438 E0.00660 F4800
+G1 X130.748 Y77.563 E0.00660 F4800
+G1 X130.835 Y77.689 E0.00660 F4800
+G1 X130.920 Y77.815 E0.00660 F4800
+G1 X131.006 Y77.941 E0.00660 F4800
+G1 X131.090 Y78.067 E0.00660 F4800
+G1 X131.175 Y78.194 E0.00660 F4800
+G1 X131.258 Y78.321 E0.00660 F4800
+G1 X131.341 Y78.449 E0.00660 F4800
+G1 X131.424 Y78.577 E0.00660 F4800
+G1 X131.506 Y78.705 E0.00660 F4800
+G1 X131.588 Y78.833 E0.00660 F4800
+G1 X131.669 Y78.962 E0.00660 F4800
+G1 X131.749 Y79.091 E0.00660 F4800
+G1 X131.830 Y79.220 E0.00660 F4800
+G1 X131.909 Y79.350 E0.00660 F4800
+G1 X131.988 Y79.480 E0.00660 F4800
+G1 X132.066 Y79.610 E0.00660 F4800
+G1 X132.144 Y79.741 E0.00660 F4800
+G1 X132.222 Y79.872 E0.00660 F4800
+G1 X132.299 Y80.003 E0.00660 F4800
+G1 X132.375 Y80.134 E0.00660 F4800
+G1 X132.451 Y80.266 E0.00660 F4800
+G1 X132.526 Y80.398 E0.00660 F4800
+G1 X132.601 Y80.530 E0.00660 F4800
+G1 X132.675 Y80.663 E0.00660 F4800
+G1 X132.748 Y80.796 E0.00660 F4800
+G1 X132.822 Y80.929 E0.00660 F4800
+G1 X132.894 Y81.062 E0.00660 F4800
+G1 X132.966 Y81.196 E0.00660 F4800
+G1 X133.038 Y81.330 E0.00660 F4800
+G1 X133.109 Y81.464 E0.00660 F4800
+G1 X133.179 Y81.599 E0.00660 F4800
+G1 X133.249 Y81.734 E0.00660 F4800
+G1 X133.318 Y81.869 E0.00660 F4800
+G1 X133.387 Y82.004 E0.00660 F4800
+G1 X133.455 Y82.140 E0.00660 F4800
+G1 X133.523 Y82.275 E0.00660 F4800
+G1 X133.590 Y82.412 E0.00660 F4800
+G1 X133.656 Y82.548 E0.00660 F4800
+G1 X133.722 Y82.684 E0.00660 F4800
+G1 X133.788 Y82.821 E0.00660 F4800
+G1 X133.853 Y82.958 E0.00660 F4800
+G1 X133.917 Y83.096 E0.00660 F4800
+G1 X133.981 Y83.233 E0.00660 F4800
+G1 X134.044 Y83.371 E0.00660 F4800
+G1 X134.106 Y83.509 E0.00660 F4800
+G1 X134.169 Y83.647 E0.00660 F4800
+G1 X134.230 Y83.786 E0.00660 F4800
+G1 X134.291 Y83.925 E0.00660 F4800
+G1 X134.351 Y84.064 E0.00660 F4800
+G1 X134.411 Y84.203 E0.00660 F4800
+G1 X134.470 Y84.342 E0.00660 F4800
+G1 X134.529 Y84.482 E0.00660 F4800
+G1 X134.587 Y84.622 E0.00660 F4800
+G1 X134.645 Y84.762 E0.00660 F4800
+G1 X134.702 Y84.902 E0.00660 F4800
+G1 X134.758 Y85.043 E0.00660 F4800
+G1 X134.814 Y85.183 E0.00660 F4800
+G1 X134.870 Y85.324 E0.00660 F4800
+G1 X134.924 Y85.465 E0.00660 F4800
+G1 X134.978 Y85.607 E0.00660 F4800
+G1 X135.032 Y85.748 E0.00660 F4800
+G1 X135.085 Y85.890 E0.00660 F4800
+G1 X135.137 Y86.032 E0.00660 F4800
+G1 X135.189 Y86.174 E0.00660 F4800
+G1 X135.241 Y86.316 E0.00660 F4800
+G1 X135.291 Y86.459 E0.00660 F4800
+G1 X135.341 Y86.602 E0.00660 F4800
+G1 X135.391 Y86.745 E0.00660 F4800
+G1 X135.440 Y86.888 E0.00660 F4800
+G1 X135.488 Y87.031 E0.00660 F4800
+G1 X135.536 Y87.174 E0.00660 F4800
+G1 X135.584 Y87.318 E0.00660 F4800
+G1 X135.630 Y87.462 E0.00660 F4800
+G1 X135.676 Y87.605 E0.00660 F4800
+G1 X135.722 Y87.750 E0.00660 F4800
+G1 X135.767 Y87.894 E0.00660 F4800
+G1 X135.811 Y88.038 E0.00660 F4800
+G1 X135.855 Y88.183 E0.00660 F4800
+G1 X135.898 Y88.328 E0.00660 F4800
+G1 X135.941 Y88.473 E0.00660 F4800
+G1 X135.983 Y88.618 E0.00660 F4800
+G1 X136.024 Y88.763 E0.00660 F4800
+G1 X136.065 Y88.908 E0.00660 F4800
+G1 X136.105 Y89.054 E0.00660 F4800
+G1 X136.145 Y89.199 E0.00660 F4800
+G1 X136.184 Y89.345 E0.00660 F4800
+G1 X136.222 Y89.491 E0.00660 F4800
+G1 X136.260 Y89.637 E0.00660 F4800
+G1 X136.298 Y89.783 E0.00660 F4800
+G1 X136.334 Y89.930 E0.00660 F4800
+G1 X136.370 Y90.076 E0.00660 F4800
+G1 X136.406 Y90.223 E0.00660 F4800
+G1 X136.441 Y90.369 E0.00660 F4800
+G1 X136.475 Y90.516 E0.00660 F4800
+G1 X136.509 Y90.663 E0.00660 F4800
+G1 X136.542 Y90.810 E0.00660 F4800
+G1 X136.575 Y90.958 E0.00660 F4800
+G1 X136.607 Y91.105 E0.00660 F4800
+G1 X136.638 Y91.252 E0.00660 F4800
+G1 X136.669 Y91.400 E0.00660 F4800
+G1 X136.699 Y91.548 E0.00660 F4800
+G1 X136.729 Y91.695 E0.00660 F4800
+G1 X136.758 Y91.843 E0.00660 F4800
+G1 X136.786 Y91.991 E0.00660 F4800
+G1 X136.814 Y92.139 E0.00660 F4800
+G1 X136.841 Y92.287 E0.00660 F4800
+G1 X136.868 Y92.435 E0.00660 F4800
+G1 X136.894 Y92.584 E0.00660 F4800
+G1 X136.919 Y92.732 E0.00660 F4800
+G1 X136.944 Y92.881 E0.00660 F4800
+G1 X136.969 Y93.029 E0.00660 F4800
+G1 X136.992 Y93.178 E0.00660 F4800
+G1 X137.015 Y93.327 E0.00660 F4800
+G1 X137.038 Y93.475 E0.00660 F4800
+G1 X137.060 Y93.624 E0.00660 F4800
+G1 X137.081 Y93.773 E0.00660 F4800
+G1 X137.101 Y93.922 E0.00660 F4800
+G1 X137.122 Y94.071 E0.00660 F4800
+G1 X137.141 Y94.221 E0.00660 F4800
+G1 X137.160 Y94.370 E0.00660 F4800
+G1 X137.178 Y94.519 E0.00660 F4800
+G1 X137.196 Y94.668 E0.00660 F4800
+G1 X137.213 Y94.818 E0.00660 F4800
+G1 X137.229 Y94.967 E0.00660 F4800
+G1 X137.245 Y95.117 E0.00660 F4800
+G1 X137.260 Y95.266 E0.00660 F4800
+G1 X137.275 Y95.416 E0.00660 F4800
+G1 X137.289 Y95.565 E0.00660 F4800
+G1 X137.303 Y95.715 E0.00660 F4800
+G1 X137.316 Y95.865 E0.00660 F4800
+G1 X137.328 Y96.014 E0.00660 F4800
+G1 X137.339 Y96.164 E0.00660 F4800
+G1 X137.351 Y96.314 E0.00660 F4800
+G1 X137.361 Y96.464 E0.00660 F4800
+G1 X137.371 Y96.614 E0.00660 F4800
+G1 X137.380 Y96.763 E0.00660 F4800
+G1 X137.389 Y96.913 E0.00660 F4800
+G1 X137.397 Y97.063 E0.00660 F4800
+G1 X137.404 Y97.213 E0.00660 F4800
+G1 X137.411 Y97.363 E0.00660 F4800
+G1 X137.417 Y97.513 E0.00660 F4800
+G1 X137.423 Y97.663 E0.00660 F4800
+G1 X137.428 Y97.813 E0.00660 F4800
+G1 X137.433 Y97.963 E0.00660 F4800
+G1 X137.436 Y98.113 E0.00660 F4800
+G1 X137.440 Y98.263 E0.00660 F4800
+G1 X137.442 Y98.413 E0.00660 F4800
+G1 X137.444 Y98.563 E0.00660 F4800
+G1 X137.446 Y98.712 E0.00660 F4800
+G1 X137.447 Y98.862 E0.00660 F4800
+G1 X137.447 Y99.012 E0.00660 F4800
+G1 X137.447 Y99.162 E0.00660 F4800
+G1 X137.446 Y99.312 E0.00660 F4800
+G1 X137.444 Y99.462 E0.00660 F4800
+G1 X137.442 Y99.612 E0.00660 F4800
+G1 X137.439 Y99.761 E0.00660 F4800
+G1 X137.436 Y99.911 E0.00660 F4800
+G1 X137.432 Y100.061 E0.00660 F4800
+G1 X137.427 Y100.211 E0.00660 F4800
+G1 X137.422 Y100.360 E0.00660 F4800
+G1 X137.417 Y100.510 E0.00660 F4800
+G1 X137.410 Y100.660 E0.00660 F4800
+G1 X137.403 Y100.809 E0.00660 F4800
+G1 X137.396 Y100.959 E0.00660 F4800
+G1 X137.388 Y101.108 E0.00660 F4800
+G1 X137.379 Y101.258 E0.00660 F4800
+G1 X137.370 Y101.407 E0.00660 F4800
+G1 X137.360 Y101.556 E0.00660 F4800
+G1 X137.349 Y101.705 E0.00660 F4800
+G1 X137.338 Y101.855 E0.00660 F4800
+G1 X137.326 Y102.004 E0.00660 F4800
+G1 X137.314 Y102.153 E0.00660 F4800
+G1 X137.301 Y102.302 E0.00660 F4800
+G1 X137.288 Y102.451 E0.00660 F4800
+G1 X137.273 Y102.600 E0.00660 F4800
+G1 X137.259 Y102.748 E0.00660 F4800
+G1 X137.243 Y102.897 E0.00660 F4800
+G1 X137.228 Y103.046 E0.00660 F4800
+G1 X137.211 Y103.194 E0.00660 F4800
+G1 X137.194 Y103.343 E0.00660 F4800
+G1 X137.176 Y103.491 E0.00660 F4800
+G1 X137.158 Y103.639 E0.00660 F4800
+G1 X137.139 Y103.788 E0.00660 F4800
+G1 X137.120 Y103.936 E0.00660 F4800
+G1 X137.100 Y104.084 E0.00660 F4800
+G1 X137.079 Y104.232 E0.00660 F4800
+G1 X137.058 Y104.379 E0.00660 F4800
+G1 X137.036 Y104.527 E0.00660 F4800
+G1 X137.014 Y104.675 E0.00660 F4800
+G1 X136.991 Y104.822 E0.00660 F4800
+G1 X136.967 Y104.970 E0.00660 F4800
+G1 X136.943 Y105.117 E0.00660 F4800
+G1 X136.919 Y105.264 E0.00660 F4800
+G1 X136.893 Y105.411 E0.00660 F4800
+G1 X136.867 Y105.558 E0.00660 F4800
+G1 X136.841 Y105.705 E0.00660 F4800
+G1 X136.814 Y105.851 E0.00660 F4800
+G1 X136.786 Y105.998 E0.00660 F4800
+G1 X136.758 Y106.144 E0.00660 F4800
+G1 X136.729 Y106.291 E0.00660 F4800
+G1 X136.700 Y106.437 E0.00660 F4800
+G1 X136.670 Y106.583 E0.00660 F4800
+G1 X136.639 Y106.729 E0.00660 F4800
+G1 X136.608 Y106.875 E0.00660 F4800
+G1 X136.576 Y107.020 E0.00660 F4800
+G1 X136.544 Y107.166 E0.00660 F4800
+G1 X136.511 Y107.311 E0.00660 F4800
+G1 X136.478 Y107.456 E0.00660 F4800
+G1 X136.444 Y107.601 E0.00660 F4800
+G1 X136.409 Y107.746 E0.00660 F4800
+G1 X136.374 Y107.891 E0.00660 F4800
+G1 X136.338 Y108.036 E0.00660 F4800
+G1 X136.302 Y108.180 E0.00660 F4800
+G1 X136.265 Y108.324 E0.00660 F4800
+G1 X136.227 Y108.468 E0.00660 F4800
+G1 X136.189 Y108.612 E0.00660 F4800
+G1 X136.151 Y108.756 E0.00660 F4800
+G1 X136.112 Y108.899 E0.00660 F4800
+G1 X136.072 Y109.043 E0.00660 F4800
+G1 X136.031 Y109.186 E0.00660 F4800
+G1 X135.991 Y109.329 E0.00660 F4800
+G1 X135.949 Y109.472 E0.00660 F4800
+G1 X135.907 Y109.615 E0.00660 F4800
+G1 X135.864 Y109.757 E0.00660 F4800
+G1 X135.821 Y109.900 E0.00660 F4800
+G1 X135.778 Y110.042 E0.00660 F4800
+G1 X135.733 Y110.184 E0.00660 F4800
+G1 X135.688 Y110.325 E0.00660 F4800
+G1 X135.643 Y110.467 E0.00660 F4800
+G1 X135.597 Y110.608 E0.00660 F4800
+G1 X135.550 Y110.749 E0.00660 F4800
+G1 X135.503 Y110.890 E0.00660 F4800
+G1 X135.456 Y111.031 E0.00660 F4800
+G1 X135.407 Y111.172 E0.00660 F4800
+G1 X135.359 Y111.312 E0.00660 F4800
+G1 X135.309 Y111.452 E0.00660 F4800
+G1 X135.259 Y111.592 E0.00660 F4800
+G1 X135.209 Y111.732 E0.00660 F4800
+G1 X135.158 Y111.871 E0.00660 F4800
+G1 X135.106 Y112.010 E0.00660 F4800
+G1 X135.054 Y112.149 E0.00660 F4800
+G1 X135.002 Y112.288 E0.00660 F4800
+G1 X134.948 Y112.427 E0.00660 F4800
+G1 X134.895 Y112.565 E0.00660 F4800
+G1 X134.840 Y112.703 E0.00660 F4800
+G1 X134.786 Y112.841 E0.00660 F4800
+G1 X134.730 Y112.979 E0.00660 F4800
+G1 X134.674 Y113.116 E0.00660 F4800
+G1 X134.618 Y113.253 E0.00660 F4800
+G1 X134.561 Y113.390 E0.00660 F4800
+G1 X134.503 Y113.527 E0.00660 F4800
+G1 X134.445 Y113.663 E0.00660 F4800
+G1 X134.386 Y113.799 E0.00660 F4800
+G1 X134.327 Y113.935 E0.00660 F4800
+G1 X134.268 Y114.071 E0.00660 F4800
+G1 X134.207 Y114.206 E0.00660 F4800
+G1 X134.147 Y114.342 E0.00660 F4800
+G1 X134.085 Y114.476 E0.00660 F4800
+G1 X134.023 Y114.611 E0.00660 F4800
+G1 X133.961 Y114.746 E0.00660 F4800
+G1 X133.898 Y114.880 E0.00660 F4800
+G1 X133.835 Y115.013 E0.00660 F4800
+G1 X133.771 Y115.147 E0.00660 F4800
+G1 X133.706 Y115.280 E0.00660 F4800
+G1 X133.641 Y115.413 E0.00660 F4800
+G1 X133.576 Y115.546 E0.00660 F4800
+G1 X133.509 Y115.679 E0.00660 F4800
+G1 X133.443 Y115.811 E0.00660 F4800
+G1 X133.376 Y115.943 E0.00660 F4800
+G1 X133.308 Y116.074 E0.00660 F4800
+G1 X133.240 Y116.206 E0.00660 F4800
+G1 X133.171 Y116.337 E0.00660 F4800
+G1 X133.102 Y116.468 E0.00660 F4800
+G1 X133.032 Y116.598 E0.00660 F4800
+G1 X132.962 Y116.728 E0.00660 F4800
+G1 X132.891 Y116.858 E0.00660 F4800
+G1 X132.820 Y116.988 E0.00660 F4800
+G1 X132.748 Y117.117 E0.00660 F4800
+G1 X132.676 Y117.246 E0.00660 F4800
+G1 X132.603 Y117.375 E0.00660 F4800
+G1 X132.530 Y117.503 E0.00660 F4800
+G1 X132.456 Y117.631 E0.00660 F4800
+G1 X132.382 Y117.759 E0.00660 F4800
+G1 X132.307 Y117.886 E0.00660 F4800
+G1 X132.232 Y118.014 E0.00660 F4800
+G1 X132.156 Y118.140 E0.00660 F4800
+G1 X132.080 Y118.267 E0.00660 F4800
+G1 X132.003 Y118.393 E0.00660 F4800
+G1 X131.926 Y118.519 E0.00660 F4800
+G1 X131.848 Y118.644 E0.00660 F4800
+G1 X131.770 Y118.770 E0.00660 F4800
+G1 X131.691 Y118.894 E0.00660 F4800
+G1 X131.612 Y119.019 E0.00660 F4800
+G1 X131.532 Y119.143 E0.00660 F4800
+G1 X131.452 Y119.267 E0.00660 F4800
+G1 X131.371 Y119.391 E0.00660 F4800
+G1 X131.290 Y119.514 E0.00660 F4800
+G1 X131.208 Y119.637 E0.00660 F4800
+G1 X131.126 Y119.759 E0.00660 F4800
+G1 X131.043 Y119.881 E0.00660 F4800
+G1 X130.960 Y120.003 E0.00660 F4800
+G1 X130.876 Y120.125 E0.00660 F4800
+G1 X130.792 Y120.246 E0.00660 F4800
+G1 X130.708 Y120.367 E0.00660 F4800
+G1 X130.623 Y120.487 E0.00660 F4800
+G1 X130.537 Y120.607 E0.00660 F4800
+G1 X130.451 Y120.727 E0.00660 F4800
+G1 X130.365 Y120.846 E0.00660 F4800
+G1 X130.278 Y120.965 E0.00660 F4800
+G1 X130.191 Y121.084 E0.00660 F4800
+G1 X130.103 Y121.202 E0.00660 F4800
+G1 X130.014 Y121.320 E0.00660 F4800
+G1 X129.926 Y121.438 E0.00660 F4800
+G1 X129.836 Y121.555 E0.00660 F4800
+G1 X129.747 Y121.672 E0.00660 F4800
+G1 X129.657 Y121.788 E0.00660 F4800
+G1 X129.566 Y121.904 E0.00660 F4800
+G1 X129.475 Y122.020 E0.00660 F4800
+G1 X129.383 Y122.135 E0.00660 F4800
+G1 X129.291 Y122.250 E0.00660 F4800
+G1 X129.199 Y122.365 E0.00660 F4800
+G1 X129.106 Y122.479 E0.00660 F4800
+G1 X129.013 Y122.593 E0.00660 F4800
+G1 X128.919 Y122.706 E0.00660 F4800
+G1 X128.825 Y122.819 E0.00660 F4800
+G1 X128.730 Y122.932 E0.00660 F4800
+G1 X128.635 Y123.044 E0.00660 F4800
+G1 X128.540 Y123.156 E0.00660 F4800
+G1 X128.444 Y123.267 E0.00660 F4800
+G1 X128.347 Y123.378 E0.00660 F4800
+G1 X128.251 Y123.489 E0.00660 F4800
+G1 X128.153 Y123.599 E0.00660 F4800
+G1 X128.056 Y123.709 E0.00660 F4800
+G1 X127.957 Y123.819 E0.00660 F4800
+G1 X127.859 Y123.928 E0.00660 F4800
+G1 X127.760 Y124.036 E0.00660 F4800
+G1 X127.661 Y124.144 E0.00660 F4800
+G1 X127.561 Y124.252 E0.00660 F4800
+G1 X127.461 Y124.360 E0.00660 F4800
+G1 X127.360 Y124.467 E0.00660 F4800
+G1 X127.259 Y124.573 E0.00660 F4800
+G1 X127.157 Y124.679 E0.00660 F4800
+G1 X127.056 Y124.785 E0.00660 F4800
+G1 X126.953 Y124.890 E0.00660 F4800
+G1 X126.851 Y124.995 E0.00660 F4800
+G1 X126.747 Y125.100 E0.00660 F4800
+G1 X126.644 Y125.204 E0.00660 F4800
+G1 X126.540 Y125.307 E0.00660 F4800
+G1 X126.436 Y125.411 E0.00660 F4800
+G1 X126.331 Y125.513 E0.00660 F4800
+G1 X126.226 Y125.616 E0.00660 F4800
+G1 X126.120 Y125.718 E0.00660 F4800
+G1 X126.014 Y125.819 E0.00660 F4800
+G1 X125.908 Y125.920 E0.00660 F4800
+G1 X125.801 Y126.021 E0.00660 F4800
+G1 X125.694 Y126.121 E0.00660 F4800
+G1 X125.587 Y126.220 E0.00660 F4800
+G1 X125.479 Y126.320 E0.00660 F4800
+G1 X125.371 Y126.419 E0.00660 F4800
+G1 X125.262 Y126.517 E0.00660 F4800
+G1 X125.153 Y126.615 E0.00660 F4800
+G1 X125.044 Y126.712 E0.00660 F4800
+G1 X124.934 Y126.809 E0.00660 F4800
+G1 X124.824 Y126.906 E0.00660 F4800
+G1 X124.713 Y127.002 E0.00660 F4800
+G1 X124.602 Y127.098 E0.00660 F4800
+G1 X124.491 Y127.193 E0.00660 F4800
+G1 X124.379 Y127.288 E0.00660 F4800
+G1 X124.267 Y127.382 E0.00660 F4800
+G1 X124.155 Y127.476 E0.00660 F4800
+G1 X124.042 Y127.569 E0.00660 F4800
+G1 X123.929 Y127.662 E0.00660 F4800
+G1 X123.816 Y127.755 E0.00660 F4800
+G1 X123.702 Y127.847 E0.00660 F4800
+G1 X123.588 Y127.938 E0.00660 F4800
+G1 X123.473 Y128.029 E0.00660 F4800
+G1 X123.358 Y128.120 E0.00660 F4800
+G1 X123.243 Y128.210 E0.00660 F4800
+G1 X123.128 Y128.300 E0.00660 F4800
+G1 X123.012 Y128.389 E0.00660 F4800
+G1 X122.896 Y128.477 E0.00660 F4800
+G1 X122.779 Y128.566 E0.00660 F4800
+G1 X122.662 Y128.653 E0.00660 F4800
+G1 X122.545 Y128.741 E0.00660 F4800
+G1 X122.427 Y128.828 E0.00660 F4800
+G1 X122.309 Y128.914 E0.00660 F4800
+G1 X122.191 Y129.000 E0.00660 F4800
+G1 X122.072 Y129.085 E0.00660 F4800
+G1 X121.953 Y129.170 E0.00660 F4800
+G1 X121.834 Y129.254 E0.00660 F4800
+G1 X121.715 Y129.338 E0.00660 F4800
+G1 X121.595 Y129.422 E0.00660 F4800
+G1 X121.474 Y129.504 E0.00660 F4800
+G1 X121.354 Y129.587 E0.00660 F4800
+G1 X121.233 Y129.669 E0.00660 F4800
+G1 X121.112 Y129.750 E0.00660 F4800
+G1 X120.990 Y129.831 E0.00660 F4800
+G1 X120.869 Y129.912 E0.00660 F4800
+G1 X120.747 Y129.992 E0.00660 F4800
+G1 X120.624 Y130.071 E0.00660 F4800
+G1 X120.502 Y130.150 E0.00660 F4800
+G1 X120.379 Y130.228 E0.00660 F4800
+G1 X120.255 Y130.306 E0.00660 F4800
+G1 X120.132 Y130.384 E0.00660 F4800
+G1 X120.008 Y130.461 E0.00660 F4800
+G1 X119.884 Y130.537 E0.00660 F4800
+G1 X119.759 Y130.613 E0.00660 F4800
+G1 X119.634 Y130.689 E0.00660 F4800
+G1 X119.509 Y130.763 E0.00660 F4800
+G1 X119.384 Y130.838 E0.00660 F4800
+G1 X119.258 Y130.912 E0.00660 F4800
+G1 X119.132 Y130.985 E0.00660 F4800
+G1 X119.006 Y131.058 E0.00660 F4800
+G1 X118.880 Y131.130 E0.00660 F4800
+G1 X118.753 Y131.202 E0.00660 F4800
+G1 X118.626 Y131.273 E0.00660 F4800
+G1 X118.499 Y131.344 E0.00660 F4800
+G1 X118.371 Y131.415 E0.00660 F4800
+G1 X118.243 Y131.484 E0.00660 F4800
+G1 X118.115 Y131.554 E0.00660 F4800
+G1 X117.987 Y131.622 E0.00660 F4800
+G1 X117.858 Y131.691 E0.00660 F4800
+G1 X117.730 Y131.758 E0.00660 F4800
+G1 X117.600 Y131.825 E0.00660 F4800
+G1 X117.471 Y131.892 E0.00660 F4800
+G1 X117.341 Y131.958 E0.00660 F4800
+G1 X117.212 Y132.024 E0.00660 F4800
+G1 X117.081 Y132.089 E0.00660 F4800
+G1 X116.951 Y132.153 E0.00660 F4800
+G1 X116.821 Y132.217 E0.00660 F4800
+G1 X116.690 Y132.281 E0.00660 F4800
+G1 X116.559 Y132.344 E0.00660 F4800
+G1 X116.427 Y132.406 E0.00660 F4800
+G1 X116.296 Y132.468 E0.00660 F4800
+G1 X116.164 Y132.529 E0.00660 F4800
+G1 X116.032 Y132.590 E0.00660 F4800
+G1 X115.900 Y132.650 E0.00660 F4800
+G1 X115.767 Y132.710 E0.00660 F4800
+G1 X115.635 Y132.769 E0.00660 F4800
+G1 X115.502 Y132.828 E0.00660 F4800
+G1 X115.368 Y132.886 E0.00660 F4800
+G1 X115.235 Y132.944 E0.00660 F4800
+G1 X115.102 Y133.001 E0.00660 F4800
+G1 X114.968 Y133.057 E0.00660 F4800
+G1 X114.834 Y133.113 E0.00660 F4800
+G1 X114.700 Y133.169 E0.00660 F4800
+G1 X114.565 Y133.224 E0.00660 F4800
+G1 X114.431 Y133.278 E0.00660 F4800
+G1 X114.296 Y133.332 E0.00660 F4800
+G1 X114.161 Y133.385 E0.00660 F4800
+G1 X114.026 Y133.438 E0.00660 F4800
+G1 X113.890 Y133.490 E0.00660 F4800
+G1 X113.755 Y133.541 E0.00660 F4800
+G1 X113.619 Y133.592 E0.00660 F4800
+G1 X113.483 Y133.643 E0.00660 F4800
+G1 X113.347 Y133.693 E0.00660 F4800
+G1 X113.210 Y133.742 E0.00660 F4800
+G1 X113.074 Y133.791 E0.00660 F4800
+G1 X112.937 Y133.839 E0.00660 F4800
+G1 X112.800 Y133.887 E0.00660 F4800
+G1 X112.663 Y133.934 E0.00660 F4800
+G1 X112.526 Y133.981 E0.00660 F4800
+G1 X112.389 Y134.027 E0.00660 F4800
+G1 X112.251 Y134.072 E0.00660 F4800
+G1 X112.113 Y134.117 E0.00660 F4800
+G1 X111.975 Y134.162 E0.00660 F4800
+G1 X111.837 Y134.206 E0.00660 F4800
+G1 X111.699 Y134.249 E0.00660 F4800
+G1 X111.561 Y134.292 E0.00660 F4800
+G1 X111.422 Y134.334 E0.00660 F4800
+G1 X111.284 Y134.375 E0.00660 F4800
+G1 X111.145 Y134.416 E0.00660 F4800
+G1 X111.006 Y134.457 E0.00660 F4800
+G1 X110.867 Y134.497 E0.00660 F4800
+G1 X110.728 Y134.536 E0.00660 F4800
+G1 X110.588 Y134.575 E0.00660 F4800
+G1 X110.449 Y134.613 E0.00660 F4800
+G1 X110.309 Y134.651 E0.00660 F4800
+G1 X110.169 Y134.688 E0.00660 F4800
+G1 X110.029 Y134.725 E0.00660 F4800
+G1 X109.889 Y134.761 E0.00660 F4800
+G1 X109.749 Y134.796 E0.00660 F4800
+G1 X109.609 Y134.831 E0.00660 F4800
+G1 X109.468 Y134.865 E0.00660 F4800
+G1 X109.328 Y134.899 E0.00660 F4800
+G1 X109.187 Y134.932 E0.00660 F4800
+G1 X109.046 Y134.965 E0.00660 F4800
+G1 X108.905 Y134.997 E0.00660 F4800
+G1 X108.764 Y135.028 E0.00660 F4800
+G1 X108.623 Y135.059 E0.00660 F4800
+G1 X108.482 Y135.089 E0.00660 F4800
+G1 X108.340 Y135.119 E0.00660 F4800
+G1 X108.199 Y135.148 E0.00660 F4800
+G1 X108.057 Y135.177 E0.00660 F4800
+G1 X107.916 Y135.205 E0.00660 F4800
+G1 X107.774 Y135.233 E0.00660 F4800
+G1 X107.632 Y135.259 E0.00660 F4800
+G1 X107.490 Y135.286 E0.00660 F4800
+G1 X107.348 Y135.312 E0.00660 F4800
+G1 X107.206 Y135.337 E0.00660 F4800
+G1 X107.064 Y135.361 E0.00660 F4800
+G1 X106.922 Y135.385 E0.00660 F4800
+G1 X106.779 Y135.409 E0.00660 F4800
+G1 X106.637 Y135.432 E0.00660 F4800
+G1 X106.494 Y135.454 E0.00660 F4800
+G1 X106.352 Y135.476 E0.00660 F4800
+G1 X106.209 Y135.497 E0.00660 F4800
+G1 X106.066 Y135.518 E0.00660 F4800
+G1 X105.924 Y135.538 E0.00660 F4800
+G1 X105.781 Y135.557 E0.00660 F4800
+G1 X105.638 Y135.576 E0.00660 F4800
+G1 X105.495 Y135.594 E0.00660 F4800
+G1 X105.352 Y135.612 E0.00660 F4800
+G1 X105.209 Y135.629 E0.00660 F4800
+G1 X105.066 Y135.646 E0.00660 F4800
+G1 X104.923 Y135.662 E0.00660 F4800
+G1 X104.779 Y135.677 E0.00660 F4800
+G1 X104.636 Y135.692 E0.00660 F4800
+G1 X104.493 Y135.706 E0.00660 F4800
+G1 X104.349 Y135.720 E0.00660 F4800
+G1 X104.206 Y135.733 E0.00660 F4800
+G1 X104.063 Y135.746 E0.00660 F4800
+G1 X103.919 Y135.758 E0.00660 F4800
+G1 X103.776 Y135.769 E0.00660 F4800
+G1 X103.632 Y135.780 E0.00660 F4800
+G1 X103.489 Y135.790 E0.00660 F4800
+G1 X103.345 Y135.800 E0.00660 F4800
+G1 X103.201 Y135.809 E0.00660 F4800
+G1 X103.058 Y135.818 E0.00660 F4800
+G1 X102.914 Y135.826 E0.00660 F4800
+G1 X102.771 Y135.833 E0.00660 F4800
+G1 X102.627 Y135.840 E0.00660 F4800
+G1 X102.483 Y135.846 E0.00660 F4800
+G1 X102.340 Y135.852 E0.00660 F4800
+G1 X102.196 Y135.857 E0.00660 F4800
+G1 X102.052 Y135.861 E0.00660 F4800
+G1 X101.909 Y135.865 E0.00660 F4800
+G1 X101.765 Y135.869 E0.00660 F4800
+G1 X101.621 Y135.871 E0.00660 F4800
+G1 X101.478 Y135.874 E0.00660 F4800
+G1 X101.334 Y135.875 E0.00660 F4800
+G1 X101.190 Y135.876 E0.00660 F4800
+G1 X101.047 Y135.877 E0.00660 F4800
+G1 X100.903 Y135.877 E0.00660 F4800
+G1 X100.759 Y135.876 E0.00660 F4800
+G1 X100.616 Y135.875 E0.00660 F4800
+G1 X100.472 Y135.873 E0.00660 F4800
+G1 X100.329 Y135.870 E0.00660 F4800
+G1 X100.185 Y135.868 E0.00660 F4800
+G1 X100.042 Y135.864 E0.00660 F4800
+G1 X99.898 Y135.860 E0.00660 F4800
+G1 X99.755 Y135.855 E0.00660 F4800
+G1 X99.612 Y135.850 E0.00660 F4800
+G1 X99.468 Y135.844 E0.00660 F4800
+G1 X99.325 Y135.838 E0.00660 F4800
+G1 X99.182 Y135.831 E0.00660 F4800
+G1 X99.039 Y135.823 E0.00660 F4800
+G1 X98.895 Y135.815 E0.00660 F4800
+G1 X98.752 Y135.806 E0.00660 F4800
+G1 X98.609 Y135.797 E0.00660 F4800
+G1 X98.466 Y135.787 E0.00660 F4800
+G1 X98.323 Y135.777 E0.00660 F4800
+G1 X98.180 Y135.766 E0.00660 F4800
+G1 X98.038 Y135.754 E0.00660 F4800
+G1 X97.895 Y135.742 E0.00660 F4800
+G1 X97.752 Y135.729 E0.00660 F4800
+G1 X97.609 Y135.716 E0.00660 F4800
+G1 X97.467 Y135.702 E0.00660 F4800
+G1 X97.324 Y135.688 E0.00660 F4800
+G1 X97.182 Y135.673 E0.00660 F4800
+G1 X97.040 Y135.657 E0.00660 F4800
+G1 X96.897 Y135.641 E0.00660 F4800
+G1 X96.755 Y135.625 E0.00660 F4800
+G1 X96.613 Y135.607 E0.00660 F4800
+G1 X96.471 Y135.589 E0.00660 F4800
+G1 X96.329 Y135.571 E0.00660 F4800
+G1 X96.187 Y135.552 E0.00660 F4800
+G1 X96.046 Y135.533 E0.00660 F4800
+G1 X95.904 Y135.513 E0.00660 F4800
+G1 X95.762 Y135.492 E0.00660 F4800
+G1 X95.621 Y135.471 E0.00660 F4800
+G1 X95.480 Y135.449 E0.00660 F4800
+G1 X95.338 Y135.427 E0.00660 F4800
+G1 X95.197 Y135.404 E0.00660 F4800
+G1 X95.056 Y135.380 E0.00660 F4800
+G1 X94.915 Y135.356 E0.00660 F4800
+G1 X94.775 Y135.332 E0.00660 F4800
+G1 X94.634 Y135.307 E0.00660 F4800
+G1 X94.493 Y135.281 E0.00660 F4800
+G1 X94.353 Y135.255 E0.00660 F4800
+G1 X94.213 Y135.228 E0.00660 F4800
+G1 X94.072 Y135.200 E0.00660 F4800
+G1 X93.932 Y135.172 E0.00660 F4800
+G1 X93.792 Y135.144 E0.00660 F4800
+G1 X93.652 Y135.115 E0.00660 F4800
+G1 X93.513 Y135.085 E0.00660 F4800
+G1 X93.373 Y135.055 E0.00660 F4800
+G1 X93.234 Y135.024 E0.00660 F4800
+G1 X93.095 Y134.993 E0.00660 F4800
+G1 X92.955 Y134.961 E0.00660 F4800
+G1 X92.816 Y134.929 E0.00660 F4800
+G1 X92.678 Y134.896 E0.00660 F4800
+G1 X92.539 Y134.863 E0.00660 F4800
+G1 X92.400 Y134.829 E0.00660 F4800
+G1 X92.262 Y134.794 E0.00660 F4800
+G1 X92.124 Y134.759 E0.00660 F4800
+G1 X91.986 Y134.723 E0.00660 F4800
+G1 X91.848 Y134.687 E0.00660 F4800
+G1 X91.710 Y134.650 E0.00660 F4800
+G1 X91.572 Y134.613 E0.00660 F4800
+G1 X91.435 Y134.575 E0.00660 F4800
+G1 X91.298 Y134.537 E0.00660 F4800
+G1 X91.161 Y134.498 E0.00660 F4800
+G1 X91.024 Y134.458 E0.00660 F4800
+G1 X90.887 Y134.418 E0.00660 F4800
+G1 X90.751 Y134.377 E0.00660 F4800
+G1 X90.614 Y134.336 E0.00660 F4800
+G1 X90.478 Y134.295 E0.00660 F4800
+G1 X90.342 Y134.252 E0.00660 F4800
+G1 X90.206 Y134.210 E0.00660 F4800
+G1 X90.070 Y134.166 E0.00660 F4800
+G1 X89.935 Y134.123 E0.00660 F4800
+G1 X89.800 Y134.078 E0.00660 F4800
+G1 X89.665 Y134.033 E0.00660 F4800
+G1 X89.530 Y133.988 E0.00660 F4800
+G1 X89.395 Y133.942 E0.00660 F4800
+G1 X89.261 Y133.895 E0.00660 F4800
+G1 X89.126 Y133.848 E0.00660 F4800
+G1 X88.992 Y133.801 E0.00660 F4800
+G1 X88.858 Y133.753 E0.00660 F4800
+G1 X88.725 Y133.704 E0.00660 F4800
+G1 X88.591 Y133.655 E0.00660 F4800
+G1 X88.458 Y133.605 E0.00660 F4800
+G1 X88.325 Y133.555 E0.00660 F4800
+G1 X88.192 Y133.504 E0.00660 F4800
+G1 X88.060 Y133.453 E0.00660 F4800
+G1 X87.927 Y133.401 E0.00660 F4800
+G1 X87.795 Y133.349 E0.00660 F4800
+G1 X87.663 Y133.296 E0.00660 F4800
+G1 X87.532 Y133.243 E0.00660 F4800
+G1 X87.400 Y133.189 E0.00660 F4800
+G1 X87.269 Y133.134 E0.00660 F4800
+G1 X87.138 Y133.079 E0.00660 F4800
+G1 X87.007 Y133.024 E0.00660 F4800
+G1 X86.877 Y132.968 E0.00660 F4800
+G1 X86.746 Y132.912 E0.00660 F4800
+G1 X86.616 Y132.855 E0.00660 F4800
+G1 X86.487 Y132.797 E0.00660 F4800
+G1 X86.357 Y132.739 E0.00660 F4800
+G1 X86.228 Y132.681 E0.00660 F4800
+G1 X86.099 Y132.622 E0.00660 F4800
+G1 X85.970 Y132.562 E0.00660 F4800
+G1 X85.841 Y132.502 E0.00660 F4800
+G1 X85.713 Y132.441 E0.00660 F4800
+G1 X85.585 Y132.380 E0.00660 F4800
+G1 X85.457 Y132.319 E0.00660 F4800
+G1 X85.330 Y132.257 E0.00660 F4800
+G1 X85.203 Y132.194 E0.00660 F4800
+G1 X85.076 Y132.131 E0.00660 F4800
+G1 X84.949 Y132.068 E0.00660 F4800
+G1 X84.822 Y132.003 E0.00660 F4800
+G1 X84.696 Y131.939 E0.00660 F4800
+G1 X84.570 Y131.874 E0.00660 F4800
+G1 X84.445 Y131.808 E0.00660 F4800
+G1 X84.319 Y131.742 E0.00660 F4800
+G1 X84.194 Y131.676 E0.00660 F4800
+G1 X84.070 Y131.609 E0.00660 F4800
+G1 X83.945 Y131.541 E0.00660 F4800
+G1 X83.821 Y131.473 E0.00660 F4800
+G1 X83.697 Y131.404 E0.00660 F4800
+G1 X83.573 Y131.335 E0.00660 F4800
+G1 X83.450 Y131.266 E0.00660 F4800
+G1 X83.327 Y131.196 E0.00660 F4800
+G1 X83.204 Y131.126 E0.00660 F4800
+G1 X83.082 Y131.055 E0.00660 F4800
+G1 X82.960 Y130.983 E0.00660 F4800
+G1 X82.838 Y130.911 E0.00660 F4800
+G1 X82.716 Y130.839 E0.00660 F4800
+G1 X82.595 Y130.766 E0.00660 F4800
+G1 X82.474 Y130.693 E0.00660 F4800
+G1 X82.353 Y130.619 E0.00660 F4800
+G1 X82.233 Y130.545 E0.00660 F4800
+G1 X82.113 Y130.470 E0.00660 F4800
+G1 X81.993 Y130.395 E0.00660 F4800
+G1 X81.874 Y130.319 E0.00660 F4800
+G1 X81.755 Y130.243 E0.00660 F4800
+G1 X81.636 Y130.166 E0.00660 F4800
+G1 X81.518 Y130.089 E0.00660 F4800
+G1 X81.400 Y130.011 E0.00660 F4800
+G1 X81.282 Y129.933 E0.00660 F4800
+G1 X81.164 Y129.855 E0.00660 F4800
+G1 X81.047 Y129.776 E0.00660 F4800
+G1 X80.931 Y129.696 E0.00660 F4800
+G1 X80.814 Y129.617 E0.00660 F4800
+G1 X80.698 Y129.536 E0.00660 F4800
+G1 X80.582 Y129.456 E0.00660 F4800
+G1 X80.467 Y129.374 E0.00660 F4800
+G1 X80.352 Y129.293 E0.00660 F4800
+G1 X80.237 Y129.210 E0.00660 F4800
+G1 X80.122 Y129.128 E0.00660 F4800
+G1 X80.008 Y129.045 E0.00660 F4800
+G1 X79.895 Y128.961 E0.00660 F4800
+G1 X79.781 Y128.877 E0.00660 F4800
+G1 X79.668 Y128.793 E0.00660 F4800
+G1 X79.555 Y128.708 E0.00660 F4800
+G1 X79.443 Y128.623 E0.00660 F4800
+G1 X79.331 Y128.537 E0.00660 F4800
+G1 X79.220 Y128.451 E0.00660 F4800
+G1 X79.108 Y128.365 E0.00660 F4800
+G1 X78.997 Y128.278 E0.00660 F4800
+G1 X78.887 Y128.190 E0.00660 F4800
+G1 X78.777 Y128.102 E0.00660 F4800
+G1 X78.667 Y128.014 E0.00660 F4800
+G1 X78.557 Y127.925 E0.00660 F4800
+G1 X78.448 Y127.836 E0.00660 F4800
+G1 X78.340 Y127.746 E0.00660 F4800
+G1 X78.231 Y127.656 E0.00660 F4800
+G1 X78.123 Y127.566 E0.00660 F4800
+G1 X78.016 Y127.475 E0.00660 F4800
+G1 X77.908 Y127.384 E0.00660 F4800
+G1 X77.802 Y127.292 E0.00660 F4800
+G1 X77.695 Y127.200 E0.00660 F4800
+G1 X77.589 Y127.108 E0.00660 F4800
+G1 X77.483 Y127.015 E0.00660 F4800
+G1 X77.378 Y126.921 E0.00660 F4800
+G1 X77.273 Y126.828 E0.00660 F4800
+G1 X77.169 Y126.733 E0.00660 F4800
+G1 X77.065 Y126.639 E0.00660 F4800
+G1 X76.961 Y126.544 E0.00660 F4800
+G1 X76.857 Y126.448 E0.00660 F4800
+G1 X76.754 Y126.353 E0.00660 F4800
+G1 X76.652 Y126.257 E0.00660 F4800
+G1 X76.550 Y126.160 E0.00660 F4800
+G1 X76.448 Y126.063 E0.00660 F4800
+G1 X76.347 Y125.966 E0.00660 F4800
+G1 X76.246 Y125.868 E0.00660 F4800
+G1 X76.145 Y125.770 E0.00660 F4800
+G1 X76.045 Y125.671 E0.00660 F4800
+G1 X75.945 Y125.572 E0.00660 F4800
+G1 X75.846 Y125.473 E0.00660 F4800
+G1 X75.747 Y125.373 E0.00660 F4800
+G1 X75.648 Y125.273 E0.00660 F4800
+G1 X75.550 Y125.173 E0.00660 F4800
+G1 X75.453 Y125.072 E0.00660 F4800
+G1 X75.355 Y124.970 E0.00660 F4800
+G1 X75.258 Y124.869 E0.00660 F4800
+G1 X75.162 Y124.767 E0.00660 F4800
+G1 X75.066 Y124.664 E0.00660 F4800
+G1 X74.970 Y124.562 E0.00660 F4800
+G1 X74.875 Y124.459 E0.00660 F4800
+G1 X74.780 Y124.355 E0.00660 F4800
+G1 X74.686 Y124.251 E0.00660 F4800
+G1 X74.592 Y124.147 E0.00660 F4800
+G1 X74.499 Y124.043 E0.00660 F4800
+G1 X74.406 Y123.938 E0.00660 F4800
+G1 X74.313 Y123.832 E0.00660 F4800
+G1 X74.221 Y123.727 E0.00660 F4800
+G1 X74.129 Y123.621 E0.00660 F4800
+G1 X74.038 Y123.514 E0.00660 F4800
+G1 X73.947 Y123.408 E0.00660 F4800
+G1 X73.856 Y123.301 E0.00660 F4800
+G1 X73.766 Y123.193 E0.00660 F4800
+G1 X73.677 Y123.085 E0.00660 F4800
+G1 X73.588 Y122.977 E0.00660 F4800
+G1 X73.499 Y122.869 E0.00660 F4800
+G1 X73.411 Y122.760 E0.00660 F4800
+G1 X73.323 Y122.651 E0.00660 F4800
+G1 X73.236 Y122.541 E0.00660 F4800
+G1 X73.149 Y122.432 E0.00660 F4800
+G1 X73.063 Y122.322 E0.00660 F4800
+G1 X72.977 Y122.211 E0.00660 F4800
+G1 X72.891 Y122.100 E0.00660 F4800
+G1 X72.806 Y121.989 E0.00660 F4800
+G1 X72.721 Y121.878 E0.00660 F4800
+G1 X72.637 Y121.766 E0.00660 F4800
+G1 X72.553 Y121.654 E0.00660 F4800
+G1 X72.470 Y121.541 E0.00660 F4800
+G1 X72.387 Y121.429 E0.00660 F4800
+G1 X72.305 Y121.316 E0.00660 F4800
+G1 X72.223 Y121.202 E0.00660 F4800
+G1 X72.142 Y121.089 E0.00660 F4800
+G1 X72.061 Y120.975 E0.00660 F4800
+G1 X71.980 Y120.860 E0.00660 F4800
+G1 X71.900 Y120.746 E0.00660 F4800
+G1 X71.821 Y120.631 E0.00660 F4800
+G1 X71.742 Y120.515 E0.00660 F4800
+G1 X71.663 Y120.400 E0.00660 F4800
+G1 X71.585 Y120.284 E0.00660 F4800
+G1 X71.507 Y120.168 E0.00660 F4800
+G1 X71.430 Y120.051 E0.00660 F4800
+G1 X71.354 Y119.935 E0.00660 F4800
+G1 X71.277 Y119.818 E0.00660 F4800
+G1 X71.202 Y119.700 E0.00660 F4800
+G1 X71.126 Y119.583 E0.00660 F4800
+G1 X71.052 Y119.465 E0.00660 F4800
+G1 X70.977 Y119.347 E0.00660 F4800
+G1 X70.904 Y119.228 E0.00660 F4800
+G1 X70.830 Y119.110 E0.00660 F4800
+G1 X70.757 Y118.991 E0.00660 F4800
+G1 X70.685 Y118.871 E0.00660 F4800
+G1 X70.613 Y118.752 E0.00660 F4800
+G1 X70.542 Y118.632 E0.00660 F4800
+G1 X70.471 Y118.512 E0.00660 F4800
+G1 X70.400 Y118.391 E0.00660 F4800
+G1 X70.330 Y118.271 E0.00660 F4800
+G1 X70.261 Y118.150 E0.00660 F4800
+G1 X70.192 Y118.029 E0.00660 F4800
+G1 X70.124 Y117.907 E0.00660 F4800
+G1 X70.056 Y117.786 E0.00660 F4800
+G1 X69.988 Y117.664 E0.00660 F4800
+G1 X69.921 Y117.541 E0.00660 F4800
+G1 X69.855 Y117.419 E0.00660 F4800
+G1 X69.789 Y117.296 E0.00660 F4800
+G1 X69.723 Y117.173 E0.00660 F4800
+G1 X69.658 Y117.050 E0.00660 F4800
+G1 X69.594 Y116.927 E0.00660 F4800
+G1 X69.530 Y116.803 E0.00660 F4800
+G1 X69.467 Y116.679 E0.00660 F4800
+G1 X69.404 Y116.555 E0.00660 F4800
+G1 X69.341 Y116.430 E0.00660 F4800
+G1 X69.279 Y116.306 E0.00660 F4800
+G1 X69.218 Y116.181 E0.00660 F4800
+G1 X69.157 Y116.056 E0.00660 F4800
+G1 X69.096 Y115.931 E0.00660 F4800
+G1 X69.036 Y115.805 E0.00660 F4800
+G1 X68.977 Y115.679 E0.00660 F4800
+G1 X68.918 Y115.553 E0.00660 F4800
+G1 X68.860 Y115.427 E0.00660 F4800
+G1 X68.802 Y115.300 E0.00660 F4800
+G1 X68.745 Y115.174 E0.00660 F4800
+G1 X68.688 Y115.047 E0.00660 F4800
+G1 X68.631 Y114.920 E0.00660 F4800
+G1 X68.576 Y114.793 E0.00660 F4800
+G1 X68.520 Y114.665 E0.00660 F4800
+G1 X68.466 Y114.537 E0.00660 F4800
+G1 X68.411 Y114.409 E0.00660 F4800
+G1 X68.358 Y114.281 E0.00660 F4800
+G1 X68.304 Y114.153 E0.00660 F4800
+G1 X68.252 Y114.025 E0.00660 F4800
+G1 X68.199 Y113.896 E0.00660 F4800
+G1 X68.148 Y113.767 E0.00660 F4800
+G1 X68.097 Y113.638 E0.00660 F4800
+G1 X68.046 Y113.509 E0.00660 F4800
+G1 X67.996 Y113.379 E0.00660 F4800
+G1 X67.946 Y113.249 E0.00660 F4800
+G1 X67.897 Y113.120 E0.00660 F4800
+G1 X67.849 Y112.990 E0.00660 F4800
+G1 X67.801 Y112.859 E0.00660 F4800
+G1 X67.753 Y112.729 E0.00660 F4800
+G1 X67.706 Y112.598 E0.00660 F4800
+G1 X67.660 Y112.468 E0.00660 F4800
+G1 X67.614 Y112.337 E0.00660 F4800
+G1 X67.569 Y112.206 E0.00660 F4800
+G1 X67.524 Y112.075 E0.00660 F4800
+G1 X67.480 Y111.943 E0.00660 F4800
+G1 X67.436 Y111.812 E0.00660 F4800
+G1 X67.393 Y111.680 E0.00660 F4800
+G1 X67.350 Y111.548 E0.00660 F4800
+G1 X67.308 Y111.416 E0.00660 F4800
+G1 X67.266 Y111.284 E0.00660 F4800
+G1 X67.225 Y111.152 E0.00660 F4800
+G1 X67.185 Y111.019 E0.00660 F4800
+G1 X67.145 Y110.887 E0.00660 F4800
+G1 X67.105 Y110.754 E0.00660 F4800
+G1 X67.066 Y110.621 E0.00660 F4800
+G1 X67.028 Y110.488 E0.00660 F4800
+G1 X66.990 Y110.355 E0.00660 F4800
+G1 X66.953 Y110.221 E0.00660 F4800
+G1 X66.916 Y110.088 E0.00660 F4800
+G1 X66.880 Y109.954 E0.00660 F4800
+G1 X66.844 Y109.821 E0.00660 F4800
+G1 X66.809 Y109.687 E0.00660 F4800
+G1 X66.774 Y109.553 E0.00660 F4800
+G1 X66.740 Y109.419 E0.00660 F4800
+G1 X66.706 Y109.285 E0.00660 F4800
+G1 X66.673 Y109.150 E0.00660 F4800
+G1 X66.641 Y109.016 E0.00660 F4800
+G1 X66.609 Y108.881 E0.00660 F4800
+G1 X66.578 Y108.747 E0.00660 F4800
+G1 X66.547 Y108.612 E0.00660 F4800
+G1 X66.516 Y108.477 E0.00660 F4800
+G1 X66.487 Y108.342 E0.00660 F4800
+G1 X66.457 Y108.207 E0.00660 F4800
+G1 X66.429 Y108.072 E0.00660 F4800
+G1 X66.401 Y107.937 E0.00660 F4800
+G1 X66.373 Y107.801 E0.00660 F4800
+G1 X66.346 Y107.666 E0.00660 F4800
+G1 X66.320 Y107.530 E0.00660 F4800
+G1 X66.294 Y107.395 E0.00660 F4800
+G1 X66.268 Y107.259 E0.00660 F4800
+G1 X66.243 Y107.123 E0.00660 F4800
+G1 X66.219 Y106.987 E0.00660 F4800
+G1 X66.195 Y106.851 E0.00660 F4800
+G1 X66.172 Y106.715 E0.00660 F4800
+G1 X66.149 Y106.579 E0.00660 F4800
+G1 X66.127 Y106.443 E0.00660 F4800
+G1 X66.106 Y106.307 E0.00660 F4800
+G1 X66.085 Y106.170 E0.00660 F4800
+G1 X66.064 Y106.034 E0.00660 F4800
+G1 X66.044 Y105.897 E0.00660 F4800
+G1 X66.025 Y105.761 E0.00660 F4800
+G1 X66.006 Y105.624 E0.00660 F4800
+G1 X65.988 Y105.488 E0.00660 F4800
+G1 X65.970 Y105.351 E0.00660 F4800
+G1 X65.953 Y105.214 E0.00660 F4800
+G1 X65.936 Y105.077 E0.00660 F4800
+G1 X65.920 Y104.940 E0.00660 F4800
+G1 X65.905 Y104.803 E0.00660 F4800
+G1 X65.890 Y104.667 E0.00660 F4800
+G1 X65.875 Y104.530 E0.00660 F4800
+G1 X65.861 Y104.392 E0.00660 F4800
+G1 X65.848 Y104.255 E0.00660 F4800
+G1 X65.835 Y104.118 E0.00660 F4800
+G1 X65.823 Y103.981 E0.00660 F4800
+G1 X65.811 Y103.844 E0.00660 F4800
+G1 X65.800 Y103.707 E0.00660 F4800
+G1 X65.790 Y103.569 E0.00660 F4800
+G1 X65.780 Y103.432 E0.00660 F4800
+G1 X65.770 Y103.295 E0.00660 F4800
+G1 X65.761 Y103.158 E0.00660 F4800
+G1 X65.753 Y103.020 E0.00660 F4800
+G1 X65.745 Y102.883 E0.00660 F4800
+G1 X65.738 Y102.746 E0.00660 F4800
+G1 X65.731 Y102.608 E0.00660 F4800
+G1 X65.725 Y102.471 E0.00660 F4800
+G1 X65.719 Y102.333 E0.00660 F4800
+G1 X65.714 Y102.196 E0.00660 F4800
+G1 X65.710 Y102.059 E0.00660 F4800
+G1 X65.706 Y101.921 E0.00660 F4800
+G1 X65.702 Y101.784 E0.00660 F4800
+G1 X65.699 Y101.646 E0.00660 F4800
+G1 X65.697 Y101.509 E0.00660 F4800
+G1 X65.695 Y101.372 E0.00660 F4800
+G1 X65.694 Y101.234 E0.00660 F4800
+G1 X65.694 Y101.097 E0.00660 F4800
+G1 X65.693 Y100.960 E0.00660 F4800
+G1 X65.694 Y100.822 E0.00660 F4800
+G1 X65.695 Y100.685 E0.00660 F4800
+G1 X65.696 Y100.548 E0.00660 F4800
+G1 X65.698 Y100.410 E0.00660 F4800
+G1 X65.701 Y100.273 E0.00660 F4800
+G1 X65.704 Y100.136 E0.00660 F4800
+G1 X65.708 Y99.999 E0.00660 F4800
+G1 X65.712 Y99.862 E0.00660 F4800
+G1 X65.717 Y99.724 E0.00660 F4800
+G1 X65.722 Y99.587 E0.00660 F4800
+G1 X65.728 Y99.450 E0.00660 F4800
+G1 X65.735 Y99.313 E0.00660 F4800
+G1 X65.742 Y99.176 E0.00660 F4800
+G1 X65.749 Y99.039 E0.00660 F4800
+G1 X65.758 Y98.903 E0.00660 F4800
+G1 X65.766 Y98.766 E0.00660 F4800
+G1 X65.775 Y98.629 E0.00660 F4800
+G1 X65.785 Y98.492 E0.00660 F4800
+G1 X65.796 Y98.356 E0.00660 F4800
+G1 X65.806 Y98.219 E0.00660 F4800
+G1 X65.818 Y98.083 E0.00660 F4800
+G1 X65.830 Y97.946 E0.00660 F4800
+G1 X65.842 Y97.810 E0.00660 F4800
+G1 X65.855 Y97.673 E0.00660 F4800
+G1 X65.869 Y97.537 E0.00660 F4800
+G1 X65.883 Y97.401 E0.00660 F4800
+G1 X65.898 Y97.265 E0.00660 F4800
+G1 X65.913 Y97.129 E0.00660 F4800
+G1 X65.928 Y96.993 E0.00660 F4800
+G1 X65.945 Y96.857 E0.00660 F4800
+G1 X65.962 Y96.721 E0.00660 F4800
+G1 X65.979 Y96.585 E0.00660 F4800
+G1 X65.997 Y96.450 E0.00660 F4800
+G1 X66.015 Y96.314 E0.00660 F4800
+G1 X66.034 Y96.179 E0.00660 F4800
+G1 X66.054 Y96.043 E0.00660 F4800
+G1 X66.074 Y95.908 E0.00660 F4800
+G1 X66.095 Y95.773 E0.00660 F4800
+G1 X66.116 Y95.638 E0.00660 F4800
+G1 X66.137 Y95.503 E0.00660 F4800
+G1 X66.160 Y95.368 E0.00660 F4800
+G1 X66.182 Y95.233 E0.00660 F4800
+G1 X66.206 Y95.098 E0.00660 F4800
+G1 X66.229 Y94.964 E0.00660 F4800
+G1 X66.254 Y94.829 E0.00660 F4800
+G1 X66.279 Y94.695 E0.00660 F4800
+G1 X66.304 Y94.561 E0.00660 F4800
+G1 X66.330 Y94.427 E0.00660 F4800
+G1 X66.357 Y94.293 E0.00660 F4800
+G1 X66.384 Y94.159 E0.00660 F4800
+G1 X66.411 Y94.025 E0.00660 F4800
+G1 X66.439 Y93.892 E0.00660 F4800
+G1 X66.468 Y93.758 E0.00660 F4800
+G1 X66.497 Y93.625 E0.00660 F4800
+G1 X66.527 Y93.492 E0.00660 F4800
+G1 X66.557 Y93.359 E0.00660 F4800
+G1 X66.588 Y93.226 E0.00660 F4800
+G1 X66.619 Y93.093 E0.00660 F4800
+G1 X66.651 Y92.960 E0.00660 F4800
+G1 X66.683 Y92.828 E0.00660 F4800
+G1 X66.716 Y92.695 E0.00660 F4800
+G1 X66.749 Y92.563 E0.00660 F4800
+G1 X66.783 Y92.431 E0.00660 F4800
+G1 X66.818 Y92.299 E0.00660 F4800
+G1 X66.853 Y92.168 E0.00660 F4800
+G1 X66.888 Y92.036 E0.00660 F4800
+G1 X66.924 Y91.905 E0.00660 F4800
+G1 X66.961 Y91.773 E0.00660 F4800
+G1 X66.998 Y91.642 E0.00660 F4800
+G1 X67.035 Y91.511 E0.00660 F4800
+G1 X67.074 Y91.380 E0.00660 F4800
+G1 X67.112 Y91.250 E0.00660 F4800
+G1 X67.151 Y91.119 E0.00660 F4800
+G1 X67.191 Y90.989 E0.00660 F4800
+G1 X67.231 Y90.859 E0.00660 F4800
+G1 X67.272 Y90.729 E0.00660 F4800
+G1 X67.313 Y90.599 E0.00660 F4800
+G1 X67.355 Y90.470 E0.00660 F4800
+G1 X67.397 Y90.340 E0.00660 F4800
+G1 X67.440 Y90.211 E0.00660 F4800
+G1 X67.483 Y90.082 E0.00660 F4800
+G1 X67.527 Y89.953 E0.00660 F4800
+G1 X67.571 Y89.825 E0.00660 F4800
+G1 X67.616 Y89.696 E0.00660 F4800
+G1 X67.661 Y89.568 E0.00660 F4800
+G1 X67.707 Y89.440 E0.00660 F4800
+G1 X67.753 Y89.312 E0.00660 F4800
+G1 X67.800 Y89.185 E0.00660 F4800
+G1 X67.847 Y89.057 E0.00660 F4800
+G1 X67.895 Y88.930 E0.00660 F4800
+G1 X67.943 Y88.803 E0.00660 F4800
+G1 X67.992 Y88.676 E0.00660 F4800
+G1 X68.041 Y88.550 E0.00660 F4800
+G1 X68.091 Y88.423 E0.00660 F4800
+G1 X68.141 Y88.297 E0.00660 F4800
+G1 X68.192 Y88.171 E0.00660 F4800
+G1 X68.244 Y88.045 E0.00660 F4800
+G1 X68.295 Y87.920 E0.00660 F4800
+G1 X68.348 Y87.795 E0.00660 F4800
+G1 X68.401 Y87.670 E0.00660 F4800
+G1 X68.454 Y87.545 E0.00660 F4800
+G1 X68.508 Y87.420 E0.00660 F4800
+G1 X68.562 Y87.296 E0.00660 F4800
+G1 X68.617 Y87.172 E0.00660 F4800
+G1 X68.672 Y87.048 E0.00660 F4800
+G1 X68.728 Y86.924 E0.00660 F4800
+G1 X68.784 Y86.801 E0.00660 F4800
+G1 X68.841 Y86.678 E0.00660 F4800
+G1 X68.898 Y86.555 E0.00660 F4800
+G1 X68.956 Y86.432 E0.00660 F4800
+G1 X69.014 Y86.309 E0.00660 F4800
+G1 X69.072 Y86.187 E0.00660 F4800
+G1 X69.132 Y86.065 E0.00660 F4800
+G1 X69.191 Y85.944 E0.00660 F4800
+G1 X69.251 Y85.822 E0.00660 F4800
+G1 X69.312 Y85.701 E0.00660 F4800
+G1 X69.373 Y85.580 E0.00660 F4800
+G1 X69.434 Y85.459 E0.00660 F4800
+G1 X69.496 Y85.339 E0.00660 F4800
+G1 X69.559 Y85.219 E0.00660 F4800
+G1 X69.622 Y85.099 E0.00660 F4800
+G1 X69.685 Y84.979 E0.00660 F4800
+G1 X69.749 Y84.860 E0.00660 F4800
+G1 X69.814 Y84.741 E0.00660 F4800
+G1 X69.878 Y84.622 E0.00660 F4800
+G1 X69.944 Y84.503 E0.00660 F4800
+G1 X70.010 Y84.385 E0.00660 F4800
+G1 X70.076 Y84.267 E0.00660 F4800
+G1 X70.142 Y84.150 E0.00660 F4800
+G1 X70.210 Y84.032 E0.00660 F4800
+G1 X70.277 Y83.915 E0.00660 F4800
+G1 X70.345 Y83.798 E0.00660 F4800
+G1 X70.414 Y83.682 E0.00660 F4800
+G1 X70.483 Y83.565 E0.00660 F4800
+G1 X70.552 Y83.449 E0.00660 F4800
+G1 X70.622 Y83.334 E0.00660 F4800
+G1 X70.693 Y83.218 E0.00660 F4800
+G1 X70.763 Y83.103 E0.00660 F4800
+G1 X70.835 Y82.988 E0.00660 F4800
+G1 X70.906 Y82.874 E0.00660 F4800
+G1 X70.979 Y82.760 E0.00660 F4800
+G1 X71.051 Y82.646 E0.00660 F4800
+G1 X71.124 Y82.532 E0.00660 F4800
+G1 X71.198 Y82.419 E0.00660 F4800
+G1 X71.272 Y82.306 E0.00660 F4800
+G1 X71.346 Y82.193 E0.00660 F4800
+G1 X71.421 Y82.081 E0.00660 F4800
+G1 X71.496 Y81.969 E0.00660 F4800
+G1 X71.572 Y81.857 E0.00660 F4800
+G1 X71.648 Y81.746 E0.00660 F4800
+G1 X71.725 Y81.635 E0.00660 F4800
+G1 X71.802 Y81.524 E0.00660 F4800
+G1 X71.879 Y81.414 E0.00660 F4800
+G1 X71.957 Y81.303 E0.00660 F4800
+G1 X72.036 Y81.194 E0.00660 F4800
+G1 X72.114 Y81.084 E0.00660 F4800
+G1 X72.193 Y80.975 E0.00660 F4800
+G1 X72.273 Y80.866 E0.00660 F4800
+G1 X72.353 Y80.758 E0.00660 F4800
+G1 X72.434 Y80.650 E0.00660 F4800
+G1 X72.514 Y80.542 E0.00660 F4800
+G1 X72.596 Y80.434 E0.00660 F4800
+G1 X72.678 Y80.327 E0.00660 F4800
+G1 X72.760 Y80.220 E0.00660 F4800
+G1 X72.842 Y80.114 E0.00660 F4800
+G1 X72.925 Y80.008 E0.00660 F4800
+G1 X73.009 Y79.902 E0.00660 F4800
+G1 X73.092 Y79.797 E0.00660 F4800
+G1 X73.177 Y79.692 E0.00660 F4800
+G1 X73.261 Y79.587 E0.00660 F4800
+G1 X73.346 Y79.483 E0.00660 F4800
+G1 X73.432 Y79.379 E0.00660 F4800
+G1 X73.518 Y79.275 E0.00660 F4800
+G1 X73.604 Y79.172 E0.00660 F4800
+G1 X73.690 Y79.069 E0.00660 F4800
+G1 X73.778 Y78.966 E0.00660 F4800
+G1 X73.865 Y78.864 E0.00660 F4800
+G1 X73.953 Y78.762 E0.00660 F4800
+G1 X74.041 Y78.661 E0.00660 F4800
+G1 X74.130 Y78.560 E0.00660 F4800
+G1 X74.219 Y78.459 E0.00660 F4800
+G1 X74.308 Y78.358 E0.00660 F4800
+G1 X74.398 Y78.258 E0.00660 F4800
+G1 X74.488 Y78.159 E0.00660 F4800
+G1 X74.579 Y78.060 E0.00660 F4800
+G1 X74.670 Y77.961 E0.00660 F4800
+G1 X74.761 Y77.862 E0.00660 F4800
+G1 X74.853 Y77.764 E0.00660 F4800
+G1 X74.945 Y77.666 E0.00660 F4800
+G1 X75.038 Y77.569 E0.00660 F4800
+G1 X75.130 Y77.472 E0.00660 F4800
+G1 X75.224 Y77.375 E0.00660 F4800
+G1 X75.317 Y77.279 E0.00660 F4800
+G1 X75.411 Y77.183 E0.00660 F4800
+G1 X75.506 Y77.088 E0.00660 F4800
+G1 X75.601 Y76.993 E0.00660 F4800
+G1 X75.696 Y76.898 E0.00660 F4800
+G1 X75.791 Y76.804 E0.00660 F4800
+G1 X75.887 Y76.710 E0.00660 F4800
+G1 X75.983 Y76.617 E0.00660 F4800
+G1 X76.080 Y76.524 E0.00660 F4800
+G1 X76.177 Y76.431 E0.00660 F4800
+G1 X76.274 Y76.339 E0.00660 F4800
+G1 X76.372 Y76.247 E0.00660 F4800
+G1 X76.470 Y76.155 E0.00660 F4800
+G1 X76.568 Y76.064 E0.00660 F4800
+G1 X76.667 Y75.973 E0.00660 F4800
+G1 X76.766 Y75.883 E0.00660 F4800
+G1 X76.865 Y75.793 E0.00660 F4800
+G1 X76.965 Y75.704 E0.00660 F4800
+G1 X77.065 Y75.615 E0.00660 F4800
+G1 X77.166 Y75.526 E0.00660 F4800
+G1 X77.266 Y75.438 E0.00660 F4800
+G1 X77.368 Y75.350 E0.00660 F4800
+G1 X77.469 Y75.263 E0.00660 F4800
+G1 X77.571 Y75.176 E0.00660 F4800
+G1 X77.673 Y75.089 E0.00660 F4800
+G1 X77.775 Y75.003 E0.00660 F4800
+G1 X77.878 Y74.918 E0.00660 F4800
+G1 X77.981 Y74.832 E0.00660 F4800
+G1 X78.085 Y74.747 E0.00660 F4800
+G1 X78.189 Y74.663 E0.00660 F4800
+G1 X78.293 Y74.579 E0.00660 F4800
+G1 X78.397 Y74.495 E0.00660 F4800
+G1 X78.502 Y74.412 E0.00660 F4800
+G1 X78.607 Y74.330 E0.00660 F4800
+G1 X78.712 Y74.247 E0.00660 F4800
+G1 X78.818 Y74.165 E0.00660 F4800
+G1 X78.924 Y74.084 E0.00660 F4800
+G1 X79.031 Y74.003 E0.00660 F4800
+G1 X79.137 Y73.922 E0.00660 F4800
+G1 X79.244 Y73.842 E0.00660 F4800
+G1 X79.351 Y73.763 E0.00660 F4800
+G1 X79.459 Y73.683 E0.00660 F4800
+G1 X79.567 Y73.605 E0.00660 F4800
+G1 X79.675 Y73.526 E0.00660 F4800
+G1 X79.784 Y73.448 E0.00660 F4800
+G1 X79.892 Y73.371 E0.00660 F4800
+G1 X80.001 Y73.294 E0.00660 F4800
+G1 X80.111 Y73.217 E0.00660 F4800
+G1 X80.220 Y73.141 E0.00660 F4800
+G1 X80.330 Y73.066 E0.00660 F4800
+G1 X80.441 Y72.990 E0.00660 F4800
+G1 X80.551 Y72.916 E0.00660 F4800
+G1 X80.662 Y72.841 E0.00660 F4800
+G1 X80.773 Y72.767 E0.00660 F4800
+G1 X80.884 Y72.694 E0.00660 F4800
+G1 X80.996 Y72.621 E0.00660 F4800
+G1 X81.108 Y72.549 E0.00660 F4800
+G1 X81.220 Y72.477 E0.00660 F4800
+G1 X81.333 Y72.405 E0.00660 F4800
+G1 X81.445 Y72.334 E0.00660 F4800
+G1 X81.559 Y72.263 E0.00660 F4800
+G1 X81.672 Y72.193 E0.00660 F4800
+G1 X81.785 Y72.123 E0.00660 F4800
+G1 X81.899 Y72.054 E0.00660 F4800
+G1 X82.013 Y71.985 E0.00660 F4800
+G1 X82.128 Y71.917 E0.00660 F4800
+G1 X82.242 Y71.849 E0.00660 F4800
+G1 X82.357 Y71.781 E0.00660 F4800
+G1 X82.472 Y71.714 E0.00660 F4800
+G1 X82.588 Y71.648 E0.00660 F4800
+G1 X82.703 Y71.582 E0.00660 F4800
+G1 X82.819 Y71.516 E0.00660 F4800
+G1 X82.935 Y71.451 E0.00660 F4800
+G1 X83.052 Y71.387 E0.00660 F4800
+G1 X83.168 Y71.323 E0.00660 F4800
+G1 X83.285 Y71.259 E0.00660 F4800
+G1 X83.402 Y71.196 E0.00660 F4800
+G1 X83.519 Y71.133 E0.00660 F4800
+G1 X83.637 Y71.071 E0.00660 F4800
+G1 X83.755 Y71.009 E0.00660 F4800
+G1 X83.873 Y70.948 E0.00660 F4800
+G1 X83.991 Y70.887 E0.00660 F4800
+G1 X84.110 Y70.827 E0.00660 F4800
+G1 X84.228 Y70.767 E0.00660 F4800
+G1 X84.347 Y70.708 E0.00660 F4800
+G1 X84.466 Y70.649 E0.00660 F4800
+G1 X84.586 Y70.591 E0.00660 F4800
+G1 X84.705 Y70.533 E0.00660 F4800
+G1 X84.825 Y70.475 E0.00660 F4800
+G1 X84.945 Y70.418 E0.00660 F4800
+G1 X85.066 Y70.362 E0.00660 F4800
+G1 X85.186 Y70.306 E0.00660 F4800
+G1 X85.307 Y70.251 E0.00660 F4800
+G1 X85.428 Y70.196 E0.00660 F4800
+G1 X85.549 Y70.141 E0.00660 F4800
+G1 X85.670 Y70.087 E0.00660 F4800
+G1 X85.791 Y70.034 E0.00660 F4800
+G1 X85.913 Y69.981 E0.00660 F4800
+G1 X86.035 Y69.928 E0.00660 F4800
+G1 X86.157 Y69.876 E0.00660 F4800
+G1 X86.279 Y69.825 E0.00660 F4800
+G1 X86.402 Y69.774 E0.00660 F4800
+G1 X86.524 Y69.723 E0.00660 F4800
+G1 X86.647 Y69.673 E0.00660 F4800
+G1 X86.770 Y69.624 E0.00660 F4800
+G1 X86.893 Y69.575 E0.00660 F4800
+G1 X87.017 Y69.526 E0.00660 F4800
+G1 X87.140 Y69.478 E0.00660 F4800
+G1 X87.264 Y69.431 E0.00660 F4800
+G1 X87.388 Y69.384 E0.00660 F4800
+G1 X87.512 Y69.337 E0.00660 F4800
+G1 X87.636 Y69.291 E0.00660 F4800
+G1 X87.761 Y69.246 E0.00660 F4800
+G1 X87.885 Y69.201 E0.00660 F4800
+G1 X88.010 Y69.157 E0.00660 F4800
+G1 X88.135 Y69.113 E0.00660 F4800
+G1 X88.260 Y69.069 E0.00660 F4800
+G1 X88.385 Y69.026 E0.00660 F4800
+G1 X88.511 Y68.984 E0.00660 F4800
+G1 X88.636 Y68.942 E0.00660 F4800
+G1 X88.762 Y68.900 E0.00660 F4800
+G1 X88.888 Y68.859 E0.00660 F4800
+G1 X89.014 Y68.819 E0.00660 F4800
+G1 X89.140 Y68.779 E0.00660 F4800
+G1 X89.266 Y68.740 E0.00660 F4800
+G1 X89.392 Y68.701 E0.00660 F4800
+G1 X89.519 Y68.662 E0.00660 F4800
+G1 X89.646 Y68.624 E0.00660 F4800
+G1 X89.772 Y68.587 E0.00660 F4800
+G1 X89.899 Y68.550 E0.00660 F4800
+G1 X90.026 Y68.514 E0.00660 F4800
+G1 X90.154 Y68.478 E0.00660 F4800
+G1 X90.281 Y68.443 E0.00660 F4800
+G1 X90.409 Y68.408 E0.00660 F4800
+G1 X90.536 Y68.374 E0.00660 F4800
+G1 X90.664 Y68.340 E0.00660 F4800
+G1 X90.792 Y68.307 E0.00660 F4800
+G1 X90.920 Y68.274 E0.00660 F4800
+G1 X91.048 Y68.242 E0.00660 F4800
+G1 X91.176 Y68.210 E0.00660 F4800
+G1 X91.304 Y68.179 E0.00660 F4800
+G1 X91.433 Y68.148 E0.00660 F4800
+G1 X91.561 Y68.118 E0.00660 F4800
+G1 X91.690 Y68.088 E0.00660 F4800
+G1 X91.818 Y68.059 E0.00660 F4800
+G1 X91.947 Y68.031 E0.00660 F4800
+G1 X92.076 Y68.003 E0.00660 F4800
+G1 X92.205 Y67.975 E0.00660 F4800
+G1 X92.334 Y67.948 E0.00660 F4800
+G1 X92.463 Y67.921 E0.00660 F4800
+G1 X92.593 Y67.895 E0.00660 F4800
+G1 X92.722 Y67.870 E0.00660 F4800
+G1 X92.851 Y67.845 E0.00660 F4800
+G1 X92.981 Y67.821 E0.00660 F4800
+G1 X93.111 Y67.797 E0.00660 F4800
+G1 X93.240 Y67.773 E0.00660 F4800
+G1 X93.370 Y67.750 E0.00660 F4800
+G1 X93.500 Y67.728 E0.00660 F4800
+G1 X93.630 Y67.706 E0.00660 F4800
+G1 X93.760 Y67.685 E0.00660 F4800
+G1 X93.890 Y67.664 E0.00660 F4800
+G1 X94.020 Y67.644 E0.00660 F4800
+G1 X94.150 Y67.624 E0.00660 F4800
+G1 X94.280 Y67.605 E0.00660 F4800
+G1 X94.411 Y67.586 E0.00660 F4800
+G1 X94.541 Y67.568 E0.00660 F4800
+G1 X94.671 Y67.551 E0.00660 F4800
+G1 X94.802 Y67.533 E0.00660 F4800
+G1 X94.932 Y67.517 E0.00660 F4800
+G1 X95.063 Y67.501 E0.00660 F4800
+G1 X95.194 Y67.485 E0.00660 F4800
+G1 X95.324 Y67.470 E0.00660 F4800
+G1 X95.455 Y67.456 E0.00660 F4800
+G1 X95.586 Y67.442 E0.00660 F4800
+G1 X95.717 Y67.428 E0.00660 F4800
+G1 X95.847 Y67.416 E0.00660 F4800
+G1 X95.978 Y67.403 E0.00660 F4800
+G1 X96.109 Y67.391 E0.00660 F4800
+G1 X96.240 Y67.380 E0.00660 F4800
+G1 X96.371 Y67.369 E0.00660 F4800
+G1 X96.502 Y67.359 E0.00660 F4800
+G1 X96.633 Y67.349 E0.00660 F4800
+G1 X96.764 Y67.340 E0.00660 F4800
+G1 X96.895 Y67.331 E0.00660 F4800
+G1 X97.026 Y67.323 E0.00660 F4800
+G1 X97.157 Y67.315 E0.00660 F4800
+G1 X97.288 Y67.308 E0.00660 F4800
+G1 X97.419 Y67.302 E0.00660 F4800
+G1 X97.550 Y67.296 E0.00660 F4800
+G1 X97.682 Y67.290 E0.00660 F4800
+G1 X97.813 Y67.285 E0.00660 F4800
+G1 X97.944 Y67.281 E0.00660 F4800
+G1 X98.075 Y67.277 E0.00660 F4800
+G1 X98.206 Y67.273 E0.00660 F4800
+G1 X98.337 Y67.270 E0.00660 F4800
+G1 X98.468 Y67.268 E0.00660 F4800
+G1 X98.599 Y67.266 E0.00660 F4800
+G1 X98.731 Y67.265 E0.00660 F4800
+G1 X98.862 Y67.264 E0.00660 F4800
+G1 X98.993 Y67.263 E0.00660 F4800
+G1 X99.124 Y67.264 E0.00660 F4800
+G1 X99.255 Y67.264 E0.00660 F4800
+G1 X99.386 Y67.266 E0.00660 F4800
+G1 X99.517 Y67.268 E0.00660 F4800
+G1 X99.648 Y67.270 E0.00660 F4800
+G1 X99.779 Y67.273 E0.00660 F4800
+G1 X99.910 Y67.276 E0.00660 F4800
+G1 X100.041 Y67.280 E0.00660 F4800
+G1 X100.171 Y67.284 E0.00660 F4800
+G1 X100.302 Y67.289 E0.00660 F4800
+G1 X100.433 Y67.295 E0.00660 F4800
+G1 X100.564 Y67.301 E0.00660 F4800
+G1 X100.695 Y67.307 E0.00660 F4800
+G1 X100.825 Y67.314 E0.00660 F4800
+G1 X100.956 Y67.322 E0.00660 F4800
+G1 X101.086 Y67.330 E0.00660 F4800
+G1 X101.217 Y67.339 E0.00660 F4800
+G1 X101.347 Y67.348 E0.00660 F4800
+G1 X101.478 Y67.357 E0.00660 F4800
+G1 X101.608 Y67.368 E0.00660 F4800
+G1 X101.738 Y67.378 E0.00660 F4800
+G1 X101.869 Y67.389 E0.00660 F4800
+G1 X101.999 Y67.401 E0.00660 F4800
+G1 X102.129 Y67.413 E0.00660 F4800
+G1 X102.259 Y67.426 E0.00660 F4800
+G1 X102.389 Y67.440 E0.00660 F4800
+G1 X102.519 Y67.453 E0.00660 F4800
+G1 X102.649 Y67.468 E0.00660 F4800
+G1 X102.779 Y67.482 E0.00660 F4800
+G1 X102.908 Y67.498 E0.00660 F4800
+G1 X103.038 Y67.514 E0.00660 F4800
+G1 X103.167 Y67.530 E0.00660 F4800
+G1 X103.297 Y67.547 E0.00660 F4800
+G1 X103.426 Y67.564 E0.00660 F4800
+G1 X103.555 Y67.582 E0.00660 F4800
+G1 X103.685 Y67.601 E0.00660 F4800
+G1 X103.814 Y67.620 E0.00660 F4800
+G1 X103.943 Y67.639 E0.00660 F4800
+G1 X104.072 Y67.659 E0.00660 F4800
+G1 X104.200 Y67.680 E0.00660 F4800
+G1 X104.329 Y67.701 E0.00660 F4800
+G1 X104.458 Y67.722 E0.00660 F4800
+G1 X104.586 Y67.744 E0.00660 F4800
+G1 X104.715 Y67.767 E0.00660 F4800
+G1 X104.843 Y67.790 E0.00660 F4800
+G1 X104.971 Y67.814 E0.00660 F4800
+G1 X105.099 Y67.838 E0.00660 F4800
+G1 X105.227 Y67.862 E0.00660 F4800
+G1 X105.355 Y67.887 E0.00660 F4800
+G1 X105.483 Y67.913 E0.00660 F4800
+G1 X105.610 Y67.939 E0.00660 F4800
+G1 X105.738 Y67.966 E0.00660 F4800
+G1 X105.865 Y67.993 E0.00660 F4800
+G1 X105.993 Y68.021 E0.00660 F4800
+G1 X106.120 Y68.049 E0.00660 F4800
+G1 X106.247 Y68.077 E0.00660 F4800
+G1 X106.374 Y68.107 E0.00660 F4800
+G1 X106.500 Y68.136 E0.00660 F4800
+G1 X106.627 Y68.166 E0.00660 F4800
+G1 X106.753 Y68.197 E0.00660 F4800
+G1 X106.880 Y68.228 E0.00660 F4800
+G1 X107.006 Y68.260 E0.00660 F4800
+G1 X107.132 Y68.292 E0.00660 F4800
+G1 X107.258 Y68.325 E0.00660 F4800
+G1 X107.383 Y68.358 E0.00660 F4800
+G1 X107.509 Y68.392 E0.00660 F4800
+G1 X107.634 Y68.426 E0.00660 F4800
+G1 X107.760 Y68.461 E0.00660 F4800
+G1 X107.885 Y68.496 E0.00660 F4800
+G1 X108.010 Y68.531 E0.00660 F4800
+G1 X108.135 Y68.568 E0.00660 F4800
+G1 X108.259 Y68.604 E0.00660 F4800
+G1 X108.384 Y68.641 E0.00660 F4800
+G1 X108.508 Y68.679 E0.00660 F4800
+G1 X108.632 Y68.717 E0.00660 F4800
+G1 X108.756 Y68.756 E0.00660 F4800
+G1 X108.880 Y68.795 E0.00660 F4800
+G1 X109.004 Y68.835 E0.00660 F4800
+G1 X109.127 Y68.875 E0.00660 F4800
+G1 X109.250 Y68.915 E0.00660 F4800
+G1 X109.374 Y68.956 E0.00660 F4800
+G1 X109.496 Y68.998 E0.00660 F4800
+G1 X109.619 Y69.040 E0.00660 F4800
+G1 X109.742 Y69.082 E0.00660 F4800
+G1 X109.864 Y69.125 E0.00660 F4800
+G1 X109.986 Y69.169 E0.00660 F4800
+G1 X110.108 Y69.213 E0.00660 F4800
+G1 X110.230 Y69.257 E0.00660 F4800
+G1 X110.352 Y69.302 E0.00660 F4800
+G1 X110.473 Y69.348 E0.00660 F4800
+G1 X110.594 Y69.394 E0.00660 F4800
+G1 X110.715 Y69.440 E0.00660 F4800
+G1 X110.836 Y69.487 E0.00660 F4800
+G1 X110.957 Y69.534 E0.00660 F4800
+G1 X111.077 Y69.582 E0.00660 F4800
+G1 X111.197 Y69.631 E0.00660 F4800
+G1 X111.317 Y69.679 E0.00660 F4800
+G1 X111.437 Y69.729 E0.00660 F4800
+G1 X111.557 Y69.778 E0.00660 F4800
+G1 X111.676 Y69.828 E0.00660 F4800
+G1 X111.795 Y69.879 E0.00660 F4800
+G1 X111.914 Y69.930 E0.00660 F4800
+G1 X112.033 Y69.982 E0.00660 F4800
+G1 X112.151 Y70.034 E0.00660 F4800
+G1 X112.270 Y70.087 E0.00660 F4800
+G1 X112.388 Y70.140 E0.00660 F4800
+G1 X112.505 Y70.193 E0.00660 F4800
+G1 X112.623 Y70.247 E0.00660 F4800
+G1 X112.740 Y70.301 E0.00660 F4800
+G1 X112.857 Y70.356 E0.00660 F4800
+G1 X112.974 Y70.412 E0.00660 F4800
+G1 X113.091 Y70.467 E0.00660 F4800
+G1 X113.207 Y70.524 E0.00660 F4800
+G1 X113.323 Y70.580 E0.00660 F4800
+G1 X113.439 Y70.637 E0.00660 F4800
+G1 X113.555 Y70.695 E0.00660 F4800
+G1 X113.670 Y70.753 E0.00660 F4800
+G1 X113.786 Y70.812 E0.00660 F4800
+G1 X113.900 Y70.871 E0.00660 F4800
+G1 X114.015 Y70.930 E0.00660 F4800
+G1 X114.130 Y70.990 E0.00660 F4800
+G1 X114.244 Y71.050 E0.00660 F4800
+G1 X114.358 Y71.111 E0.00660 F4800
+G1 X114.471 Y71.172 E0.00660 F4800
+G1 X114.585 Y71.234 E0.00660 F4800
+G1 X114.698 Y71.296 E0.00660 F4800
+G1 X114.811 Y71.359 E0.00660 F4800
+G1 X114.923 Y71.422 E0.00660 F4800
+G1 X115.036 Y71.485 E0.00660 F4800
+G1 X115.148 Y71.549 E0.00660 F4800
+G1 X115.259 Y71.613 E0.00660 F4800
+G1 X115.371 Y71.678 E0.00660 F4800
+G1 X115.482 Y71.743 E0.00660 F4800
+G1 X115.593 Y71.809 E0.00660 F4800
+G1 X115.704 Y71.875 E0.00660 F4800
+G1 X115.814 Y71.942 E0.00660 F4800
+G1 X115.924 Y72.009 E0.00660 F4800
+G1 X116.034 Y72.076 E0.00660 F4800
+G1 X116.144 Y72.144 E0.00660 F4800
+G1 X116.253 Y72.212 E0.00660 F4800
+G1 X116.362 Y72.281 E0.00660 F4800
+G1 X116.471 Y72.350 E0.00660 F4800
+G1 X116.579 Y72.419 E0.00660 F4800
+G1 X116.687 Y72.489 E0.00660 F4800
+G1 X116.795 Y72.560 E0.00660 F4800
+G1 X116.903 Y72.631 E0.00660 F4800
+G1 X117.010 Y72.702 E0.00660 F4800
+G1 X117.117 Y72.773 E0.00660 F4800
+G1 X117.223 Y72.846 E0.00660 F4800
+G1 X117.330 Y72.918 E0.00660 F4800
+G1 X117.436 Y72.991 E0.00660 F4800
+G1 X117.541 Y73.064 E0.00660 F4800
+G1 X117.647 Y73.138 E0.00660 F4800
+G1 X117.752 Y73.212 E0.00660 F4800
+G1 X117.857 Y73.287 E0.00660 F4800
+G1 X117.961 Y73.362 E0.00660 F4800
+G1 X118.065 Y73.437 E0.00660 F4800
+G1 X118.169 Y73.513 E0.00660 F4800
+G1 X118.273 Y73.589 E0.00660 F4800
+G1 X118.376 Y73.665 E0.00660 F4800
+G1 X118.479 Y73.742 E0.00660 F4800
+G1 X118.581 Y73.820 E0.00660 F4800
+G1 X118.684 Y73.898 E0.00660 F4800
+G1 X118.786 Y73.976 E0.00660 F4800
+G1 X118.887 Y74.054 E0.00660 F4800
+G1 X118.988 Y74.133 E0.00660 F4800
+G1 X119.089 Y74.213 E0.00660 F4800
+G1 X119.190 Y74.293 E0.00660 F4800
+G1 X119.290 Y74.373 E0.00660 F4800
+G1 X119.390 Y74.453 E0.00660 F4800
+G1 X119.490 Y74.534 E0.00660 F4800
+G1 X119.589 Y74.616 E0.00660 F4800
+G1 X119.688 Y74.697 E0.00660 F4800
+G1 X119.787 Y74.779 E0.00660 F4800
+G1 X119.885 Y74.862 E0.00660 F4800
+G1 X119.983 Y74.945 E0.00660 F4800
+G1 X120.080 Y75.028 E0.00660 F4800
+G1 X120.177 Y75.112 E0.00660 F4800
+G1 X120.274 Y75.196 E0.00660 F4800
+G1 X120.371 Y75.280 E0.00660 F4800
+G1 X120.467 Y75.365 E0.00660 F4800
+G1 X120.563 Y75.450 E0.00660 F4800
+G1 X120.658 Y75.535 E0.00660 F4800
+G1 X120.753 Y75.621 E0.00660 F4800
+G1 X120.848 Y75.707 E0.00660 F4800
+G1 X120.942 Y75.794 E0.00660 F4800
+G1 X121.036 Y75.881 E0.00660 F4800
+G1 X121.130 Y75.968 E0.00660 F4800
+G1 X121.223 Y76.056 E0.00660 F4800
+G1 X121.316 Y76.144 E0.00660 F4800
+G1 X121.409 Y76.233 E0.00660 F4800
+G1 X121.501 Y76.321 E0.00660 F4800
+G1 X121.593 Y76.411 E0.00660 F4800
+G1 X121.684 Y76.500 E0.00660 F4800
+G1 X121.776 Y76.590 E0.00660 F4800
+G1 X121.866 Y76.680 E0.00660 F4800
+G1 X121.957 Y76.771 E0.00660 F4800
+G1 X122.047 Y76.862 E0.00660 F4800
+G1 X122.136 Y76.953 E0.00660 F4800
+G1 X122.225 Y77.044 E0.00660 F4800
+G1 X122.314 Y77.136 E0.00660 F4800
+G1 X122.403 Y77.229 E0.00660 F4800
+G1 X122.491 Y77.321 E0.00660 F4800
+G1 X122.579 Y77.414 E0.00660 F4800
+G1 X122.666 Y77.508 E0.00660 F4800
+G1 X122.753 Y77.601 E0.00660 F4800
+G1 X122.839 Y77.695 E0.00660 F4800
+G1 X122.926 Y77.790 E0.00660 F4800
+G1 X123.011 Y77.884 E0.00660 F4800
+G1 X123.097 Y77.979 E0.00660 F4800
+G1 X123.182 Y78.074 E0.00660 F4800
+G1 X123.266 Y78.170 E0.00660 F4800
+G1 X123.351 Y78.266 E0.00660 F4800
+G1 X123.434 Y78.362 E0.00660 F4800
+G1 X123.518 Y78.459 E0.00660 F4800
+G1 X123.601 Y78.556 E0.00660 F4800
+G1 X123.683 Y78.653 E0.00660 F4800
+G1 X123.766 Y78.751 E0.00660 F4800
+G1 X123.847 Y78.849 E0.00660 F4800
+G1 X123.929 Y78.947 E0.00660 F4800
+G1 X124.010 Y79.045 E0.00660 F4800
+G1 X124.090 Y79.144 E0.00660 F4800
+G1 X124.171 Y79.243 E0.00660 F4800
+G1 X124.250 Y79.343 E0.00660 F4800
+G1 X124.330 Y79.442 E0.00660 F4800
+G1 X124.409 Y79.543 E0.00660 F4800
+G1 X124.487 Y79.643 E0.00660 F4800
+G1 X124.565 Y79.744 E0.00660 F4800
+G1 X124.643 Y79.845 E0.00660 F4800
+G1 X124.721 Y79.946 E0.00660 F4800
+G1 X124.797 Y80.047 E0.00660 F4800
+G1 X124.874 Y80.149 E0.00660 F4800
+G1 X124.950 Y80.251 E0.00660 F4800
+G1 X125.026 Y80.354 E0.00660 F4800
+G1 X125.101 Y80.456 E0.00660 F4800
+G1 X125.176 Y80.559 E0.00660 F4800
+G1 X125.250 Y80.663 E0.00660 F4800
+G1 X125.324 Y80.766 E0.00660 F4800
+G1 X125.398 Y80.870 E0.00660 F4800
+G1 X125.471 Y80.974 E0.00660 F4800
+G1 X125.543 Y81.079 E0.00660 F4800
+G1 X125.616 Y81.183 E0.00660 F4800
+G1 X125.687 Y81.288 E0.00660 F4800
+G1 X125.759 Y81.394 E0.00660 F4800
+G1 X125.830 Y81.499 E0.00660 F4800
+G1 X125.900 Y81.605 E0.00660 F4800
+G1 X125.970 Y81.711 E0.00660 F4800
+G1 X126.040 Y81.817 E0.00660 F4800
+G1 X126.109 Y81.924 E0.00660 F4800
+G1 X126.178 Y82.031 E0.00660 F4800
+G1 X126.246 Y82.138 E0.00660 F4800
+G1 X126.314 Y82.245 E0.00660 F4800
+G1 X126.382 Y82.353 E0.00660 F4800
+G1 X126.449 Y82.461 E0.00660 F4800
+G1 X126.516 Y82.569 E0.00660 F4800
+G1 X126.582 Y82.677 E0.00660 F4800
+G1 X126.647 Y82.786 E0.00660 F4800
+G1 X126.713 Y82.895 E0.00660 F4800
+G1 X126.778 Y83.004 E0.00660 F4800
+G1 X126.842 Y83.113 E0.00660 F4800
+G1 X126.906 Y83.223 E0.00660 F4800
+G1 X126.969 Y83.333 E0.00660 F4800
+G1 X127.032 Y83.443 E0.00660 F4800
+G1 X127.095 Y83.553 E0.00660 F4800
+G1 X127.157 Y83.664 E0.00660 F4800
+G1 X127.219 Y83.775 E0.00660 F4800
+G1 X127.280 Y83.886 E0.00660 F4800
+G1 X127.341 Y83.997 E0.00660 F4800
+G1 X127.401 Y84.108 E0.00660 F4800
+G1 X127.461 Y84.220 E0.00660 F4800
+G1 X127.520 Y84.332 E0.00660 F4800
+G1 X127.579 Y84.444 E0.00660 F4800
+G1 X127.638 Y84.557 E0.00660 F4800
+G1 X127.696 Y84.669 E0.00660 F4800
+G1 X127.754 Y84.782 E0.00660 F4800
+G1 X127.811 Y84.895 E0.00660 F4800
+G1 X127.867 Y85.008 E0.00660 F4800
+G1 X127.924 Y85.122 E0.00660 F4800
+G1 X127.979 Y85.235 E0.00660 F4800
+G1 X128.035 Y85.349 E0.00660 F4800
+G1 X128.089 Y85.463 E0.00660 F4800
+G1 X128.144 Y85.578 E0.00660 F4800
+G1 X128.198 Y85.692 E0.00660 F4800
+G1 X128.251 Y85.807 E0.00660 F4800
+G1 X128.304 Y85.922 E0.00660 F4800
+G1 X128.357 Y86.037 E0.00660 F4800
+G1 X128.409 Y86.152 E0.00660 F4800
+G1 X128.460 Y86.268 E0.00660 F4800
+G1 X128.511 Y86.383 E0.00660 F4800
+G1 X128.562 Y86.499 E0.00660 F4800
+G1 X128.612 Y86.615 E0.00660 F4800
+G1 X128.662 Y86.732 E0.00660 F4800
+G1 X128.711 Y86.848 E0.00660 F4800
+G1 X128.760 Y86.965 E0.00660 F4800
+G1 X128.808 Y87.081 E0.00660 F4800
+G1 X128.856 Y87.198 E0.00660 F4800
+G1 X128.903 Y87.315 E0.00660 F4800
+G1 X128.950 Y87.433 E0.00660 F4800
+G1 X128.996 Y87.550 E0.00660 F4800
+G1 X129.042 Y87.668 E0.00660 F4800
+G1 X129.088 Y87.786 E0.00660 F4800
+G1 X129.133 Y87.904 E0.00660 F4800
+G1 X129.177 Y88.022 E0.00660 F4800
+G1 X129.221 Y88.140 E0.00660 F4800
+G1 X129.264 Y88.259 E0.00660 F4800
+G1 X129.307 Y88.377 E0.00660 F4800
+G1 X129.350 Y88.496 E0.00660 F4800
+G1 X129.392 Y88.615 E0.00660 F4800
+G1 X129.434 Y88.734 E0.00660 F4800
+G1 X129.475 Y88.853 E0.00660 F4800
+G1 X129.515 Y88.973 E0.00660 F4800
+G1 X129.555 Y89.092 E0.00660 F4800
+G1 X129.595 Y89.212 E0.00660 F4800
+G1 X129.634 Y89.332 E0.00660 F4800
+G1 X129.673 Y89.452 E0.00660 F4800
+G1 X129.711 Y89.572 E0.00660 F4800
+G1 X129.749 Y89.692 E0.00660 F4800
+G1 X129.786 Y89.812 E0.00660 F4800
+G1 X129.823 Y89.933 E0.00660 F4800
+G1 X129.859 Y90.053 E0.00660 F4800
+G1 X129.895 Y90.174 E0.00660 F4800
+G1 X129.930 Y90.295 E0.00660 F4800
+G1 X129.965 Y90.416 E0.00660 F4800
+G1 X129.999 Y90.537 E0.00660 F4800
+G1 X130.033 Y90.659 E0.00660 F4800
+G1 X130.066 Y90.780 E0.00660 F4800
+G1 X130.099 Y90.901 E0.00660 F4800
+G1 X130.131 Y91.023 E0.00660 F4800
+G1 X130.163 Y91.145 E0.00660 F4800
+G1 X130.194 Y91.267 E0.00660 F4800
+G1 X130.225 Y91.389 E0.00660 F4800
+G1 X130.256 Y91.511 E0.00660 F4800
+G1 X130.285 Y91.633 E0.00660 F4800
+G1 X130.315 Y91.755 E0.00660 F4800
+G1 X130.344 Y91.877 E0.00660 F4800
+G1 X130.372 Y92.000 E0.00660 F4800
+G1 X130.400 Y92.122 E0.00660 F4800
+G1 X130.427 Y92.245 E0.00660 F4800
+G1 X130.454 Y92.368 E0.00660 F4800
+G1 X130.481 Y92.491 E0.00660 F4800
+G1 X130.507 Y92.614 E0.00660 F4800
+G1 X130.532 Y92.737 E0.00660 F4800
+G1 X130.557 Y92.860 E0.00660 F4800
+G1 X130.581 Y92.983 E0.00660 F4800
+G1 X130.605 Y93.106 E0.00660 F4800
+G1 X130.629 Y93.229 E0.00660 F4800
+G1 X130.652 Y93.353 E0.00660 F4800
+G1 X130.674 Y93.476 E0.00660 F4800
+G1 X130.696 Y93.600 E0.00660 F4800
+G1 X130.717 Y93.724 E0.00660 F4800
+G1 X130.738 Y93.847 E0.00660 F4800
+G1 X130.759 Y93.971 E0.00660 F4800
+G1 X130.779 Y94.095 E0.00660 F4800
+G1 X130.798 Y94.219 E0.00660 F4800
+G1 X130.817 Y94.343 E0.00660 F4800
+G1 X130.835 Y94.467 E0.00660 F4800
+G1 X130.853 Y94.591 E0.00660 F4800
+G1 X130.871 Y94.715 E0.00660 F4800
+G1 X130.888 Y94.839 E0.00660 F4800
+G1 X130.904 Y94.963 E0.00660 F4800
+G1 X130.920 Y95.088 E0.00660 F4800
+G1 X130.936 Y95.212 E0.00660 F4800
+G1 X130.951 Y95.336 E0.00660 F4800
+G1 X130.965 Y95.461 E0.00660 F4800
+G1 X130.979 Y95.585 E0.00660 F4800
+G1 X130.992 Y95.710 E0.00660 F4800
+G1 X131.005 Y95.834 E0.00660 F4800
+G1 X131.018 Y95.959 E0.00660 F4800
+G1 X131.030 Y96.083 E0.00660 F4800
+G1 X131.041 Y96.208 E0.00660 F4800
+G1 X131.052 Y96.333 E0.00660 F4800
+G1 X131.063 Y96.457 E0.00660 F4800
+G1 X131.073 Y96.582 E0.00660 F4800
+G1 X131.082 Y96.707 E0.00660 F4800
+G1 X131.091 Y96.832 E0.00660 F4800
+G1 X131.099 Y96.956 E0.00660 F4800
+G1 X131.107 Y97.081 E0.00660 F4800
+G1 X131.115 Y97.206 E0.00660 F4800
+G1 X131.122 Y97.331 E0.00660 F4800
+G1 X131.128 Y97.456 E0.00660 F4800
+G1 X131.134 Y97.581 E0.00660 F4800
+G1 X131.140 Y97.705 E0.00660 F4800
+G1 X131.145 Y97.830 E0.00660 F4800
+G1 X131.149 Y97.955 E0.00660 F4800
+G1 X131.153 Y98.080 E0.00660 F4800
+G1 X131.156 Y98.205 E0.00660 F4800
+G1 X131.159 Y98.330 E0.00660 F4800
+G1 X131.162 Y98.454 E0.00660 F4800
+G1 X131.164 Y98.579 E0.00660 F4800
+G1 X131.165 Y98.704 E0.00660 F4800
+G1 X131.166 Y98.829 E0.00660 F4800
+G1 X131.166 Y98.954 E0.00660 F4800
+G1 X131.166 Y99.079 E0.00660 F4800
+G1 X131.166 Y99.203 E0.00660 F4800
+G1 X131.165 Y99.328 E0.00660 F4800
+G1 X131.163 Y99.453 E0.00660 F4800
+G1 X131.161 Y99.578 E0.00660 F4800
+G1 X131.159 Y99.702 E0.00660 F4800
+G1 X131.156 Y99.827 E0.00660 F4800
+G1 X131.152 Y99.952 E0.00660 F4800
+G1 X131.148 Y100.076 E0.00660 F4800
+G1 X131.143 Y100.201 E0.00660 F4800
+G1 X131.138 Y100.325 E0.00660 F4800
+G1 X131.133 Y100.450 E0.00660 F4800
+G1 X131.127 Y100.574 E0.00660 F4800
+G1 X131.120 Y100.699 E0.00660 F4800
+G1 X131.113 Y100.823 E0.00660 F4800
+G1 X131.106 Y100.947 E0.00660 F4800
+G1 X131.098 Y101.072 E0.00660 F4800
+G1 X131.089 Y101.196 E0.00660 F4800
+G1 X131.080 Y101.320 E0.00660 F4800
+G1 X131.070 Y101.444 E0.00660 F4800
+G1 X131.060 Y101.568 E0.00660 F4800
+G1 X131.050 Y101.692 E0.00660 F4800
+G1 X131.039 Y101.816 E0.00660 F4800
+G1 X131.027 Y101.940 E0.00660 F4800
+G1 X131.015 Y102.064 E0.00660 F4800
+G1 X131.003 Y102.188 E0.00660 F4800
+G1 X130.990 Y102.311 E0.00660 F4800
+G1 X130.976 Y102.435 E0.00660 F4800
+G1 X130.962 Y102.558 E0.00660 F4800
+G1 X130.948 Y102.682 E0.00660 F4800
+G1 X130.933 Y102.805 E0.00660 F4800
+G1 X130.918 Y102.929 E0.00660 F4800
+G1 X130.902 Y103.052 E0.00660 F4800
+G1 X130.885 Y103.175 E0.00660 F4800
+G1 X130.868 Y103.298 E0.00660 F4800
+G1 X130.851 Y103.421 E0.00660 F4800
+G1 X130.833 Y103.544 E0.00660 F4800
+G1 X130.815 Y103.667 E0.00660 F4800
+G1 X130.796 Y103.790 E0.00660 F4800
+G1 X130.776 Y103.912 E0.00660 F4800
+G1 X130.756 Y104.035 E0.00660 F4800
+G1 X130.736 Y104.157 E0.00660 F4800
+G1 X130.715 Y104.280 E0.00660 F4800
+G1 X130.694 Y104.402 E0.00660 F4800
+G1 X130.672 Y104.524 E0.00660 F4800
+G1 X130.650 Y104.646 E0.00660 F4800
+G1 X130.627 Y104.768 E0.00660 F4800
+G1 X130.604 Y104.890 E0.00660 F4800
+G1 X130.580 Y105.012 E0.00660 F4800
+G1 X130.556 Y105.133 E0.00660 F4800
+G1 X130.531 Y105.255 E0.00660 F4800
+G1 X130.506 Y105.376 E0.00660 F4800
+G1 X130.480 Y105.497 E0.00660 F4800
+G1 X130.454 Y105.619 E0.00660 F4800
+G1 X130.427 Y105.740 E0.00660 F4800
+G1 X130.400 Y105.861 E0.00660 F4800
+G1 X130.373 Y105.981 E0.00660 F4800
+G1 X130.345 Y106.102 E0.00660 F4800
+G1 X130.316 Y106.223 E0.00660 F4800
+G1 X130.287 Y106.343 E0.00660 F4800
+G1 X130.257 Y106.463 E0.00660 F4800
+G1 X130.227 Y106.583 E0.00660 F4800
+G1 X130.197 Y106.703 E0.00660 F4800
+G1 X130.166 Y106.823 E0.00660 F4800
+G1 X130.135 Y106.943 E0.00660 F4800
+G1 X130.103 Y107.062 E0.00660 F4800
+G1 X130.070 Y107.182 E0.00660 F4800
+G1 X130.037 Y107.301 E0.00660 F4800
+G1 X130.004 Y107.420 E0.00660 F4800
+G1 X129.970 Y107.539 E0.00660 F4800
+G1 X129.936 Y107.658 E0.00660 F4800
+G1 X129.901 Y107.777 E0.00660 F4800
+G1 X129.866 Y107.895 E0.00660 F4800
+G1 X129.830 Y108.014 E0.00660 F4800
+G1 X129.794 Y108.132 E0.00660 F4800
+G1 X129.758 Y108.250 E0.00660 F4800
+G1 X129.720 Y108.368 E0.00660 F4800
+G1 X129.683 Y108.485 E0.00660 F4800
+G1 X129.645 Y108.603 E0.00660 F4800
+G1 X129.606 Y108.720 E0.00660 F4800
+G1 X129.567 Y108.838 E0.00660 F4800
+G1 X129.528 Y108.955 E0.00660 F4800
+G1 X129.488 Y109.072 E0.00660 F4800
+G1 X129.448 Y109.188 E0.00660 F4800
+G1 X129.407 Y109.305 E0.00660 F4800
+G1 X129.366 Y109.421 E0.00660 F4800
+G1 X129.324 Y109.537 E0.00660 F4800
+G1 X129.282 Y109.653 E0.00660 F4800
+G1 X129.239 Y109.769 E0.00660 F4800
+G1 X129.196 Y109.885 E0.00660 F4800
+G1 X129.153 Y110.000 E0.00660 F4800
+G1 X129.109 Y110.115 E0.00660 F4800
+G1 X129.064 Y110.230 E0.00660 F4800
+G1 X129.019 Y110.345 E0.00660 F4800
+G1 X128.974 Y110.460 E0.00660 F4800
+G1 X128.928 Y110.574 E0.00660 F4800
+G1 X128.882 Y110.688 E0.00660 F4800
+G1 X128.835 Y110.802 E0.00660 F4800
+G1 X128.788 Y110.916 E0.00660 F4800
+G1 X128.740 Y111.030 E0.00660 F4800
+G1 X128.692 Y111.143 E0.00660 F4800
+G1 X128.644 Y111.256 E0.00660 F4800
+G1 X128.595 Y111.369 E0.00660 F4800
+G1 X128.545 Y111.482 E0.00660 F4800
+G1 X128.495 Y111.595 E0.00660 F4800
+G1 X128.445 Y111.707 E0.00660 F4800
+G1 X128.394 Y111.819 E0.00660 F4800
+G1 X128.343 Y111.931 E0.00660 F4800
+G1 X128.291 Y112.043 E0.00660 F4800
+G1 X128.239 Y112.155 E0.00660 F4800
+G1 X128.187 Y112.266 E0.00660 F4800
+G1 X128.134 Y112.377 E0.00660 F4800
+G1 X128.081 Y112.488 E0.00660 F4800
+G1 X128.027 Y112.598 E0.00660 F4800
+G1 X127.972 Y112.709 E0.00660 F4800
+G1 X127.918 Y112.819 E0.00660 F4800
+G1 X127.863 Y112.929 E0.00660 F4800
+G1 X127.807 Y113.038 E0.00660 F4800
+G1 X127.751 Y113.148 E0.00660 F4800
+G1 X127.695 Y113.257 E0.00660 F4800
+G1 X127.638 Y113.366 E0.00660 F4800
+G1 X127.581 Y113.474 E0.00660 F4800
+G1 X127.523 Y113.583 E0.00660 F4800
+G1 X127.465 Y113.691 E0.00660 F4800
+G1 X127.406 Y113.799 E0.00660 F4800
+G1 X127.347 Y113.907 E0.00660 F4800
+G1 X127.288 Y114.014 E0.00660 F4800
+G1 X127.228 Y114.121 E0.00660 F4800
+G1 X127.168 Y114.228 E0.00660 F4800
+G1 X127.107 Y114.335 E0.00660 F4800
+G1 X127.046 Y114.441 E0.00660 F4800
+G1 X126.984 Y114.548 E0.00660 F4800
+G1 X126.922 Y114.653 E0.00660 F4800
+G1 X126.860 Y114.759 E0.00660 F4800
+G1 X126.797 Y114.865 E0.00660 F4800
+G1 X126.734 Y114.970 E0.00660 F4800
+G1 X126.671 Y115.074 E0.00660 F4800
+G1 X126.607 Y115.179 E0.00660 F4800
+G1 X126.542 Y115.283 E0.00660 F4800
+G1 X126.477 Y115.387 E0.00660 F4800
+G1 X126.412 Y115.491 E0.00660 F4800
+G1 X126.347 Y115.595 E0.00660 F4800
+G1 X126.281 Y115.698 E0.00660 F4800
+G1 X126.214 Y115.801 E0.00660 F4800
+G1 X126.147 Y115.903 E0.00660 F4800
+G1 X126.080 Y116.006 E0.00660 F4800
+G1 X126.013 Y116.108 E0.00660 F4800
+G1 X125.944 Y116.210 E0.00660 F4800
+G1 X125.876 Y116.311 E0.00660 F4800
+G1 X125.807 Y116.412 E0.00660 F4800
+G1 X125.738 Y116.513 E0.00660 F4800
+G1 X125.668 Y116.614 E0.00660 F4800
+G1 X125.598 Y116.714 E0.00660 F4800
+G1 X125.528 Y116.814 E0.00660 F4800
+G1 X125.457 Y116.914 E0.00660 F4800
+G1 X125.386 Y117.014 E0.00660 F4800
+G1 X125.314 Y117.113 E0.00660 F4800
+G1 X125.242 Y117.212 E0.00660 F4800
+G1 X125.170 Y117.310 E0.00660 F4800
+G1 X125.097 Y117.409 E0.00660 F4800
+G1 X125.024 Y117.506 E0.00660 F4800
+G1 X124.951 Y117.604 E0.00660 F4800
+G1 X124.877 Y117.701 E0.00660 F4800
+G1 X124.803 Y117.799 E0.00660 F4800
+G1 X124.728 Y117.895 E0.00660 F4800
+G1 X124.653 Y117.992 E0.00660 F4800
+G1 X124.578 Y118.088 E0.00660 F4800
+G1 X124.502 Y118.184 E0.00660 F4800
+G1 X124.426 Y118.279 E0.00660 F4800
+G1 X124.349 Y118.374 E0.00660 F4800
+G1 X124.272 Y118.469 E0.00660 F4800
+G1 X124.195 Y118.563 E0.00660 F4800
+G1 X124.118 Y118.658 E0.00660 F4800
+G1 X124.040 Y118.752 E0.00660 F4800
+G1 X123.961 Y118.845 E0.00660 F4800
+G1 X123.882 Y118.938 E0.00660 F4800
+G1 X123.803 Y119.031 E0.00660 F4800
+G1 X123.724 Y119.124 E0.00660 F4800
+G1 X123.644 Y119.216 E0.00660 F4800
+G1 X123.564 Y119.308 E0.00660 F4800
+G1 X123.484 Y119.399 E0.00660 F4800
+G1 X123.403 Y119.491 E0.00660 F4800
+G1 X123.321 Y119.581 E0.00660 F4800
+G1 X123.240 Y119.672 E0.00660 F4800
+G1 X123.158 Y119.762 E0.00660 F4800
+G1 X123.076 Y119.852 E0.00660 F4800
+G1 X122.993 Y119.942 E0.00660 F4800
+G1 X122.910 Y120.031 E0.00660 F4800
+G1 X122.827 Y120.120 E0.00660 F4800
+G1 X122.743 Y120.208 E0.00660 F4800
+G1 X122.659 Y120.296 E0.00660 F4800
+G1 X122.575 Y120.384 E0.00660 F4800
+G1 X122.490 Y120.471 E0.00660 F4800
+G1 X122.405 Y120.559 E0.00660 F4800
+G1 X122.320 Y120.645 E0.00660 F4800
+G1 X122.234 Y120.732 E0.00660 F4800
+G1 X122.148 Y120.818 E0.00660 F4800
+G1 X122.062 Y120.903 E0.00660 F4800
+G1 X121.975 Y120.989 E0.00660 F4800
+G1 X121.888 Y121.074 E0.00660 F4800
+G1 X121.801 Y121.158 E0.00660 F4800
+G1 X121.713 Y121.243 E0.00660 F4800
+G1 X121.625 Y121.326 E0.00660 F4800
+G1 X121.537 Y121.410 E0.00660 F4800
+G1 X121.448 Y121.493 E0.00660 F4800
+G1 X121.359 Y121.576 E0.00660 F4800
+G1 X121.270 Y121.658 E0.00660 F4800
+G1 X121.180 Y121.740 E0.00660 F4800
+G1 X121.090 Y121.822 E0.00660 F4800
+G1 X121.000 Y121.903 E0.00660 F4800
+G1 X120.910 Y121.984 E0.00660 F4800
+G1 X120.819 Y122.065 E0.00660 F4800
+G1 X120.728 Y122.145 E0.00660 F4800
+G1 X120.636 Y122.225 E0.00660 F4800
+G1 X120.544 Y122.304 E0.00660 F4800
+G1 X120.452 Y122.383 E0.00660 F4800
+G1 X120.360 Y122.462 E0.00660 F4800
+G1 X120.267 Y122.540 E0.00660 F4800
+G1 X120.174 Y122.618 E0.00660 F4800
+G1 X120.081 Y122.696 E0.00660 F4800
+G1 X119.987 Y122.773 E0.00660 F4800
+G1 X119.894 Y122.849 E0.00660 F4800
+G1 X119.799 Y122.926 E0.00660 F4800
+G1 X119.705 Y123.002 E0.00660 F4800
+G1 X119.610 Y123.077 E0.00660 F4800
+G1 X119.515 Y123.153 E0.00660 F4800
+G1 X119.420 Y123.227 E0.00660 F4800
+G1 X119.324 Y123.302 E0.00660 F4800
+G1 X119.228 Y123.376 E0.00660 F4800
+G1 X119.132 Y123.449 E0.00660 F4800
+G1 X119.036 Y123.523 E0.00660 F4800
+G1 X118.939 Y123.595 E0.00660 F4800
+G1 X118.842 Y123.668 E0.00660 F4800
+G1 X118.744 Y123.740 E0.00660 F4800
+G1 X118.647 Y123.812 E0.00660 F4800
+G1 X118.549 Y123.883 E0.00660 F4800
+G1 X118.451 Y123.954 E0.00660 F4800
+G1 X118.353 Y124.024 E0.00660 F4800
+G1 X118.254 Y124.094 E0.00660 F4800
+G1 X118.155 Y124.164 E0.00660 F4800
+G1 X118.056 Y124.233 E0.00660 F4800
+G1 X117.956 Y124.302 E0.00660 F4800
+G1 X117.857 Y124.370 E0.00660 F4800
+G1 X117.757 Y124.438 E0.00660 F4800
+G1 X117.656 Y124.506 E0.00660 F4800
+G1 X117.556 Y124.573 E0.00660 F4800
+G1 X117.455 Y124.640 E0.00660 F4800
+G1 X117.354 Y124.706 E0.00660 F4800
+G1 X117.253 Y124.772 E0.00660 F4800
+G1 X117.151 Y124.838 E0.00660 F4800
+G1 X117.050 Y124.903 E0.00660 F4800
+G1 X116.948 Y124.967 E0.00660 F4800
+G1 X116.845 Y125.032 E0.00660 F4800
+G1 X116.743 Y125.095 E0.00660 F4800
+G1 X116.640 Y125.159 E0.00660 F4800
+G1 X116.537 Y125.222 E0.00660 F4800
+G1 X116.434 Y125.284 E0.00660 F4800
+G1 X116.331 Y125.347 E0.00660 F4800
+G1 X116.227 Y125.408 E0.00660 F4800
+G1 X116.123 Y125.470 E0.00660 F4800
+G1 X116.019 Y125.531 E0.00660 F4800
+G1 X115.915 Y125.591 E0.00660 F4800
+G1 X115.810 Y125.651 E0.00660 F4800
+G1 X115.705 Y125.711 E0.00660 F4800
+G1 X115.600 Y125.770 E0.00660 F4800
+G1 X115.495 Y125.829 E0.00660 F4800
+G1 X115.389 Y125.887 E0.00660 F4800
+G1 X115.284 Y125.945 E0.00660 F4800
+G1 X115.178 Y126.002 E0.00660 F4800
+G1 X115.072 Y126.059 E0.00660 F4800
+G1 X114.965 Y126.116 E0.00660 F4800
+G1 X114.859 Y126.172 E0.00660 F4800
+G1 X114.752 Y126.228 E0.00660 F4800
+G1 X114.645 Y126.283 E0.00660 F4800
+G1 X114.538 Y126.338 E0.00660 F4800
+G1 X114.430 Y126.393 E0.00660 F4800
+G1 X114.323 Y126.447 E0.00660 F4800
+G1 X114.215 Y126.500 E0.00660 F4800
+G1 X114.107 Y126.553 E0.00660 F4800
+G1 X113.999 Y126.606 E0.00660 F4800
+G1 X113.890 Y126.658 E0.00660 F4800
+G1 X113.782 Y126.710 E0.00660 F4800
+G1 X113.673 Y126.761 E0.00660 F4800
+G1 X113.564 Y126.812 E0.00660 F4800
+G1 X113.455 Y126.863 E0.00660 F4800
+G1 X113.346 Y126.913 E0.00660 F4800
+G1 X113.236 Y126.962 E0.00660 F4800
+G1 X113.126 Y127.011 E0.00660 F4800
+G1 X113.017 Y127.060 E0.00660 F4800
+G1 X112.907 Y127.108 E0.00660 F4800
+G1 X112.796 Y127.156 E0.00660 F4800
+G1 X112.686 Y127.203 E0.00660 F4800
+G1 X112.575 Y127.250 E0.00660 F4800
+G1 X112.464 Y127.297 E0.00660 F4800
+G1 X112.354 Y127.343 E0.00660 F4800
+M400
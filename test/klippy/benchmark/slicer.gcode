@@ -0,0 +1,3359 @@
+;FLAVOR:Marlin
+;TIME:1234
+;Filament used: 1.234m
+;Layer height: 0.2
+;Generated with benchmark
+G28
+G90
+M83
+M107
+;LAYER:0
+G0 F9000 X60 Y60 Z0.2
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 1
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 2
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 3
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 4
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 5
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 6
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 7
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 8
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 9
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 10
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 11
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 12
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 13
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 14
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 15
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 16
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 17
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 18
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 19
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 20
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 21
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 22
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 23
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 24
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 25
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 26
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 27
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 28
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 29
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 30
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 31
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 32
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 33
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 34
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 35
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 36
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 37
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 38
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 39
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 40
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 41
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 42
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 43
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 44
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 45
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 46
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 47
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 48
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 49
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 50
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 51
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 52
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 53
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 54
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 55
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 56
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 57
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 58
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 59
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 60
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 61
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 62
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 63
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 64
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 65
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 66
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 67
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 68
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 69
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 70
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 71
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 72
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 73
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 74
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 75
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 76
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 77
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 78
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 79
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 80
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 81
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 82
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 83
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 84
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 85
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 86
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 87
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 88
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 89
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 90
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 91
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 92
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 93
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 94
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 95
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 96
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 97
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 98
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 99
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 100
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 101
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 102
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 103
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 104
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 105
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 106
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 107
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 108
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 109
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 110
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 111
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 112
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 113
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 114
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 115
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 116
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 117
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 118
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 119
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 120
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 121
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 122
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 123
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 124
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 125
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 126
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 127
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 128
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 129
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 130
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 131
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 132
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 133
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 134
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 135
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 136
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 137
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 138
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 139
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 140
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 141
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 142
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 143
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 144
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 145
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 146
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 147
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 148
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 149
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 150
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 151
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 152
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 153
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 154
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 155
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 156
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 157
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 158
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 159
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 160
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 161
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 162
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 163
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 164
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 165
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 166
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 167
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 168
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 169
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 170
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 171
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 172
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 173
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 174
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 175
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 176
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 177
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 178
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 179
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 180
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 181
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 182
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 183
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 184
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 185
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 186
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 187
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 188
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 189
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 190
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 191
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 192
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 193
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 194
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 195
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 196
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 197
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 198
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 199
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 200
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 201
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 202
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 203
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 204
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 205
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 206
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 207
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 208
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 209
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 210
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 211
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 212
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 213
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 214
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 215
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 216
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 217
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 218
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 219
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 220
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 221
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 222
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 223
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 224
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 225
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 226
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 227
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 228
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 229
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 230
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 231
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 232
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 233
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 234
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 235
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 236
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 237
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 238
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 239
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 240
+;TIME_ELAPSED:102.800000
+;LAYER:1
+G0 F9000 X60 Y60 Z0.4
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 241
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 242
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 243
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 244
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 245
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 246
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 247
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 248
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 249
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 250
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 251
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 252
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 253
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 254
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 255
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 256
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 257
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 258
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 259
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 260
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 261
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 262
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 263
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 264
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 265
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 266
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 267
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 268
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 269
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 270
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 271
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 272
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 273
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 274
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 275
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 276
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 277
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 278
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 279
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 280
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 281
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 282
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 283
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 284
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 285
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 286
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 287
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 288
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 289
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 290
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 291
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 292
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 293
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 294
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 295
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 296
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 297
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 298
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 299
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 300
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 301
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 302
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 303
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 304
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 305
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 306
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 307
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 308
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 309
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 310
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 311
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 312
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 313
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 314
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 315
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 316
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 317
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 318
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 319
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 320
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 321
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 322
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 323
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 324
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 325
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 326
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 327
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 328
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 329
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 330
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 331
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 332
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 333
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 334
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 335
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 336
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 337
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 338
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 339
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 340
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 341
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 342
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 343
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 344
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 345
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 346
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 347
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 348
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 349
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 350
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 351
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 352
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 353
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 354
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 355
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 356
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 357
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 358
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 359
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 360
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 361
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 362
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 363
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 364
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 365
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 366
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 367
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 368
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 369
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 370
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 371
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 372
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 373
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 374
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 375
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 376
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 377
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 378
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 379
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 380
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 381
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 382
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 383
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 384
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 385
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 386
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 387
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 388
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 389
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 390
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 391
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 392
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 393
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 394
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 395
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 396
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 397
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 398
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 399
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 400
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 401
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 402
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 403
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 404
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 405
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 406
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 407
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 408
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 409
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 410
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 411
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 412
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 413
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 414
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 415
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 416
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 417
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 418
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 419
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 420
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 421
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 422
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 423
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 424
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 425
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 426
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 427
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 428
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 429
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 430
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 431
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 432
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 433
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 434
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 435
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 436
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 437
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 438
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 439
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 440
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 441
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 442
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 443
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 444
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 445
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 446
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 447
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 448
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 449
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 450
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 451
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 452
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 453
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 454
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 455
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 456
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 457
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 458
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 459
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 460
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 461
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 462
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 463
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 464
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 465
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 466
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 467
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 468
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 469
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 470
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 471
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 472
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 473
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 474
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 475
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 476
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 477
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 478
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 479
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 480
+;TIME_ELAPSED:205.600000
+;LAYER:2
+G0 F9000 X60 Y60 Z0.6
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 481
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 482
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 483
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 484
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 485
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 486
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 487
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 488
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 489
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 490
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 491
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 492
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 493
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 494
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 495
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 496
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 497
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 498
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 499
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 500
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 501
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 502
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 503
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 504
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 505
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 506
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 507
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 508
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 509
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 510
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 511
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 512
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 513
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 514
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 515
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 516
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 517
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 518
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 519
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 520
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 521
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 522
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 523
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 524
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 525
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 526
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 527
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 528
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 529
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 530
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 531
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 532
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 533
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 534
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 535
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 536
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 537
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 538
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 539
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 540
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 541
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 542
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 543
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 544
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 545
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 546
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 547
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 548
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 549
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 550
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 551
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 552
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 553
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 554
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 555
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 556
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 557
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 558
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 559
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 560
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 561
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 562
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 563
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 564
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 565
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 566
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 567
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 568
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 569
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 570
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 571
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 572
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 573
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 574
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 575
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 576
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 577
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 578
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 579
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 580
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 581
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 582
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 583
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 584
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 585
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 586
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 587
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 588
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 589
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 590
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 591
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 592
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 593
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 594
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 595
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 596
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 597
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 598
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 599
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 600
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 601
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 602
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 603
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 604
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 605
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 606
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 607
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 608
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 609
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 610
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 611
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 612
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 613
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 614
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 615
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 616
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 617
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 618
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 619
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 620
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 621
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 622
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 623
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 624
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 625
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 626
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 627
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 628
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 629
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 630
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 631
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 632
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 633
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 634
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 635
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 636
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 637
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 638
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 639
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 640
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 641
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 642
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 643
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 644
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 645
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 646
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 647
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 648
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 649
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 650
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 651
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 652
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 653
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 654
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 655
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 656
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 657
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 658
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 659
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 660
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 661
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 662
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 663
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 664
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 665
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 666
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 667
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 668
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 669
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 670
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 671
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 672
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 673
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 674
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 675
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 676
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 677
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 678
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 679
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 680
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 681
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 682
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 683
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 684
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 685
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 686
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 687
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 688
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 689
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 690
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 691
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 692
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 693
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 694
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 695
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 696
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 697
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 698
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 699
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 700
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 701
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 702
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 703
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 704
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 705
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 706
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 707
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 708
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 709
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 710
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 711
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 712
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 713
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 714
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 715
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 716
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 717
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 718
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 719
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 720
+;TIME_ELAPSED:308.400000
+;LAYER:3
+G0 F9000 X60 Y60 Z0.8
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 721
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 722
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 723
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 724
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 725
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 726
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 727
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 728
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 729
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 730
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 731
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 732
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 733
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 734
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 735
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 736
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 737
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 738
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 739
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 740
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 741
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 742
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 743
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 744
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 745
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 746
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 747
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 748
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 749
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 750
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 751
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 752
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 753
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 754
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 755
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 756
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 757
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 758
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 759
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 760
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 761
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 762
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 763
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 764
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 765
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 766
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 767
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 768
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 769
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 770
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 771
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 772
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 773
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 774
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 775
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 776
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 777
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 778
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 779
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 780
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 781
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 782
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 783
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 784
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 785
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 786
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 787
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 788
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 789
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 790
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 791
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 792
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 793
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 794
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 795
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 796
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 797
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 798
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 799
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 800
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 801
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 802
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 803
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 804
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 805
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 806
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 807
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 808
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 809
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 810
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 811
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 812
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 813
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 814
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 815
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 816
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 817
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 818
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 819
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 820
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 821
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 822
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 823
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 824
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 825
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 826
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 827
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 828
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 829
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 830
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 831
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 832
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 833
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 834
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 835
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 836
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 837
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 838
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 839
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 840
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 841
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 842
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 843
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 844
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 845
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 846
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 847
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 848
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 849
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 850
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 851
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 852
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 853
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 854
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 855
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 856
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 857
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 858
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 859
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 860
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 861
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 862
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 863
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 864
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 865
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 866
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 867
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 868
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 869
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 870
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 871
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 872
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 873
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 874
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 875
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 876
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 877
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 878
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 879
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 880
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 881
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 882
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 883
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 884
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 885
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 886
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 887
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 888
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 889
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 890
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 891
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 892
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 893
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 894
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 895
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 896
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 897
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 898
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 899
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 900
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 901
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 902
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 903
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 904
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 905
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 906
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 907
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 908
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 909
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 910
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 911
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 912
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 913
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 914
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 915
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 916
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 917
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 918
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 919
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 920
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 921
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 922
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 923
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 924
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 925
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 926
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 927
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 928
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 929
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 930
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 931
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 932
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 933
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 934
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 935
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 936
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 937
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 938
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 939
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 940
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 941
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 942
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 943
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 944
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 945
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 946
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 947
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 948
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 949
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 950
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 951
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 952
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 953
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 954
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 955
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 956
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 957
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 958
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 959
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 960
+;TIME_ELAPSED:411.200000
+;LAYER:4
+G0 F9000 X60 Y60 Z1.0
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 961
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 962
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 963
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 964
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 965
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 966
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 967
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 968
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 969
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 970
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 971
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 972
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 973
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 974
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 975
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 976
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 977
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 978
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 979
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 980
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 981
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 982
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 983
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 984
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 985
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 986
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 987
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 988
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 989
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 990
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 991
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 992
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 993
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 994
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 995
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 996
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 997
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 998
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 999
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 1000
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 1001
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 1002
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 1003
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 1004
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 1005
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 1006
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 1007
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 1008
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 1009
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 1010
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 1011
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 1012
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 1013
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 1014
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 1015
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 1016
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 1017
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 1018
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 1019
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 1020
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 1021
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 1022
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 1023
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 1024
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 1025
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 1026
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 1027
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 1028
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 1029
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 1030
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 1031
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 1032
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 1033
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 1034
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 1035
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 1036
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 1037
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 1038
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 1039
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 1040
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 1041
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 1042
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 1043
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 1044
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 1045
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 1046
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 1047
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 1048
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 1049
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 1050
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 1051
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 1052
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 1053
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 1054
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 1055
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 1056
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 1057
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 1058
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 1059
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 1060
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 1061
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 1062
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 1063
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 1064
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 1065
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 1066
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 1067
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 1068
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 1069
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 1070
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 1071
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 1072
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 1073
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 1074
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 1075
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 1076
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 1077
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 1078
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 1079
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 1080
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 1081
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 1082
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 1083
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 1084
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 1085
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 1086
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 1087
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 1088
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 1089
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 1090
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 1091
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 1092
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 1093
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 1094
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 1095
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 1096
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 1097
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 1098
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 1099
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 1100
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 1101
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 1102
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 1103
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 1104
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 1105
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 1106
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 1107
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 1108
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 1109
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 1110
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 1111
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 1112
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 1113
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 1114
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 1115
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 1116
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 1117
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 1118
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 1119
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 1120
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 1121
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 1122
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 1123
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 1124
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 1125
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 1126
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 1127
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 1128
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 1129
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 1130
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 1131
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 1132
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 1133
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 1134
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 1135
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 1136
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 1137
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 1138
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 1139
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 1140
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 1141
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 1142
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 1143
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 1144
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 1145
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 1146
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 1147
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 1148
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 1149
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 1150
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 1151
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 1152
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 1153
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 1154
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 1155
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 1156
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 1157
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 1158
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 1159
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 1160
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 1161
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 1162
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 1163
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 1164
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 1165
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 1166
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 1167
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 1168
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 1169
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 1170
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 1171
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 1172
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 1173
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 1174
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 1175
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 1176
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 1177
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 1178
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 1179
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 1180
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 1181
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 1182
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 1183
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 1184
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 1185
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 1186
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 1187
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 1188
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 1189
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 1190
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 1191
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 1192
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 1193
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 1194
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 1195
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 1196
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 1197
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 1198
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 1199
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 1200
+;TIME_ELAPSED:514.000000
+;LAYER:5
+G0 F9000 X60 Y60 Z1.2
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 1201
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 1202
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 1203
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 1204
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 1205
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 1206
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 1207
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 1208
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 1209
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 1210
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 1211
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 1212
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 1213
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 1214
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 1215
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 1216
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 1217
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 1218
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 1219
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 1220
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 1221
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 1222
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 1223
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 1224
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 1225
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 1226
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 1227
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 1228
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 1229
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 1230
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 1231
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 1232
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 1233
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 1234
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 1235
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 1236
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 1237
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 1238
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 1239
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 1240
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 1241
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 1242
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 1243
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 1244
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 1245
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 1246
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 1247
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 1248
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 1249
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 1250
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 1251
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 1252
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 1253
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 1254
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 1255
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 1256
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 1257
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 1258
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 1259
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 1260
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 1261
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 1262
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 1263
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 1264
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 1265
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 1266
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 1267
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 1268
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 1269
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 1270
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 1271
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 1272
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 1273
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 1274
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 1275
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 1276
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 1277
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 1278
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 1279
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 1280
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 1281
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 1282
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 1283
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 1284
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 1285
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 1286
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 1287
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 1288
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 1289
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 1290
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 1291
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 1292
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 1293
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 1294
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 1295
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 1296
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 1297
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 1298
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 1299
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 1300
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 1301
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 1302
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 1303
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 1304
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 1305
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 1306
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 1307
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 1308
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 1309
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 1310
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 1311
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 1312
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 1313
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 1314
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 1315
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 1316
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 1317
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 1318
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 1319
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 1320
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 1321
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 1322
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 1323
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 1324
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 1325
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 1326
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 1327
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 1328
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 1329
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 1330
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 1331
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 1332
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 1333
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 1334
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 1335
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 1336
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 1337
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 1338
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 1339
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 1340
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 1341
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 1342
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 1343
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 1344
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 1345
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 1346
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 1347
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 1348
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 1349
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 1350
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 1351
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 1352
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 1353
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 1354
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 1355
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 1356
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 1357
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 1358
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 1359
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 1360
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 1361
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 1362
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 1363
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 1364
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 1365
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 1366
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 1367
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 1368
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 1369
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 1370
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 1371
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 1372
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 1373
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 1374
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 1375
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 1376
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 1377
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 1378
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 1379
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 1380
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 1381
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 1382
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 1383
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 1384
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 1385
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 1386
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 1387
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 1388
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 1389
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 1390
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 1391
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 1392
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 1393
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 1394
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 1395
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 1396
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 1397
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 1398
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 1399
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 1400
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 1401
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 1402
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 1403
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 1404
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 1405
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 1406
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 1407
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 1408
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 1409
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 1410
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 1411
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 1412
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 1413
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 1414
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 1415
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 1416
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 1417
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 1418
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 1419
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 1420
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 1421
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 1422
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 1423
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 1424
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 1425
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 1426
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 1427
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 1428
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 1429
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 1430
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 1431
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 1432
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 1433
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 1434
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 1435
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 1436
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 1437
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 1438
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 1439
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 1440
+;TIME_ELAPSED:616.800000
+;LAYER:6
+G0 F9000 X60 Y60 Z1.4
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 1441
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 1442
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 1443
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 1444
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 1445
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 1446
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 1447
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 1448
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 1449
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 1450
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 1451
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 1452
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 1453
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 1454
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 1455
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 1456
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 1457
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 1458
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 1459
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 1460
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 1461
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 1462
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 1463
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 1464
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 1465
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 1466
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 1467
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 1468
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 1469
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 1470
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 1471
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 1472
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 1473
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 1474
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 1475
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 1476
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 1477
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 1478
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 1479
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 1480
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 1481
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 1482
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 1483
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 1484
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 1485
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 1486
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 1487
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 1488
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 1489
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 1490
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 1491
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 1492
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 1493
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 1494
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 1495
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 1496
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 1497
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 1498
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 1499
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 1500
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 1501
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 1502
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 1503
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 1504
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 1505
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 1506
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 1507
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 1508
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 1509
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 1510
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 1511
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 1512
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 1513
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 1514
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 1515
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 1516
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 1517
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 1518
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 1519
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 1520
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 1521
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 1522
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 1523
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 1524
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 1525
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 1526
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 1527
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 1528
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 1529
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 1530
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 1531
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 1532
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 1533
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 1534
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 1535
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 1536
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 1537
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 1538
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 1539
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 1540
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 1541
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 1542
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 1543
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 1544
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 1545
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 1546
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 1547
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 1548
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 1549
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 1550
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 1551
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 1552
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 1553
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 1554
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 1555
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 1556
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 1557
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 1558
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 1559
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 1560
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 1561
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 1562
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 1563
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 1564
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 1565
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 1566
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 1567
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 1568
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 1569
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 1570
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 1571
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 1572
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 1573
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 1574
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 1575
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 1576
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 1577
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 1578
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 1579
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 1580
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 1581
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 1582
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 1583
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 1584
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 1585
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 1586
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 1587
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 1588
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 1589
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 1590
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 1591
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 1592
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 1593
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 1594
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 1595
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 1596
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 1597
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 1598
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 1599
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 1600
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 1601
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 1602
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 1603
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 1604
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 1605
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 1606
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 1607
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 1608
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 1609
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 1610
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 1611
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 1612
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 1613
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 1614
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 1615
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 1616
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 1617
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 1618
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 1619
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 1620
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 1621
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 1622
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 1623
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 1624
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 1625
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 1626
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 1627
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 1628
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 1629
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 1630
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 1631
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 1632
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 1633
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 1634
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 1635
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 1636
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 1637
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 1638
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 1639
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 1640
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 1641
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 1642
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 1643
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 1644
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 1645
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 1646
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 1647
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 1648
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 1649
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 1650
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 1651
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 1652
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 1653
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 1654
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 1655
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 1656
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 1657
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 1658
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 1659
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 1660
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 1661
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 1662
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 1663
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 1664
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 1665
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 1666
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 1667
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 1668
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 1669
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 1670
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 1671
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 1672
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 1673
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 1674
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 1675
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 1676
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 1677
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 1678
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 1679
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 1680
+;TIME_ELAPSED:719.600000
+;LAYER:7
+G0 F9000 X60 Y60 Z1.6
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 1681
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 1682
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 1683
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 1684
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 1685
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 1686
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 1687
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 1688
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 1689
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 1690
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 1691
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 1692
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 1693
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 1694
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 1695
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 1696
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 1697
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 1698
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 1699
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 1700
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 1701
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 1702
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 1703
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 1704
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 1705
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 1706
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 1707
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 1708
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 1709
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 1710
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 1711
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 1712
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 1713
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 1714
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 1715
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 1716
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 1717
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 1718
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 1719
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 1720
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 1721
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 1722
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 1723
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 1724
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 1725
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 1726
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 1727
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 1728
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 1729
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 1730
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 1731
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 1732
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 1733
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 1734
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 1735
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 1736
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 1737
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 1738
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 1739
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 1740
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 1741
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 1742
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 1743
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 1744
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 1745
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 1746
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 1747
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 1748
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 1749
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 1750
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 1751
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 1752
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 1753
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 1754
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 1755
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 1756
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 1757
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 1758
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 1759
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 1760
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 1761
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 1762
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 1763
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 1764
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 1765
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 1766
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 1767
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 1768
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 1769
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 1770
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 1771
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 1772
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 1773
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 1774
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 1775
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 1776
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 1777
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 1778
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 1779
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 1780
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 1781
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 1782
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 1783
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 1784
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 1785
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 1786
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 1787
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 1788
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 1789
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 1790
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 1791
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 1792
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 1793
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 1794
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 1795
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 1796
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 1797
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 1798
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 1799
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 1800
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 1801
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 1802
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 1803
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 1804
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 1805
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 1806
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 1807
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 1808
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 1809
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 1810
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 1811
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 1812
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 1813
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 1814
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 1815
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 1816
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 1817
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 1818
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 1819
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 1820
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 1821
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 1822
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 1823
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 1824
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 1825
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 1826
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 1827
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 1828
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 1829
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 1830
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 1831
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 1832
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 1833
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 1834
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 1835
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 1836
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 1837
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 1838
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 1839
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 1840
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 1841
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 1842
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 1843
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 1844
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 1845
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 1846
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 1847
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 1848
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 1849
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 1850
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 1851
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 1852
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 1853
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 1854
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 1855
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 1856
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 1857
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 1858
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 1859
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 1860
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 1861
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 1862
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 1863
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 1864
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 1865
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 1866
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 1867
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 1868
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 1869
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 1870
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 1871
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 1872
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 1873
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 1874
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 1875
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 1876
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 1877
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 1878
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 1879
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 1880
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 1881
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 1882
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 1883
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 1884
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 1885
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 1886
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 1887
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 1888
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 1889
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 1890
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 1891
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 1892
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 1893
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 1894
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 1895
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 1896
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 1897
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 1898
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 1899
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 1900
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 1901
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 1902
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 1903
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 1904
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 1905
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 1906
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 1907
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 1908
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 1909
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 1910
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 1911
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 1912
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 1913
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 1914
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 1915
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 1916
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 1917
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 1918
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 1919
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 1920
+;TIME_ELAPSED:822.400000
+;LAYER:8
+G0 F9000 X60 Y60 Z1.8
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 1921
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 1922
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 1923
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 1924
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 1925
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 1926
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 1927
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 1928
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 1929
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 1930
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 1931
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 1932
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 1933
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 1934
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 1935
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 1936
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 1937
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 1938
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 1939
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 1940
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 1941
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 1942
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 1943
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 1944
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 1945
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 1946
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 1947
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 1948
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 1949
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 1950
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 1951
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 1952
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 1953
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 1954
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 1955
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 1956
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 1957
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 1958
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 1959
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 1960
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 1961
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 1962
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 1963
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 1964
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 1965
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 1966
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 1967
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 1968
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 1969
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 1970
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 1971
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 1972
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 1973
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 1974
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 1975
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 1976
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 1977
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 1978
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 1979
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 1980
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 1981
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 1982
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 1983
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 1984
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 1985
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 1986
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 1987
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 1988
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 1989
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 1990
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 1991
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 1992
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 1993
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 1994
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 1995
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 1996
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 1997
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 1998
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 1999
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 2000
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 2001
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 2002
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 2003
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 2004
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 2005
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 2006
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 2007
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 2008
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 2009
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 2010
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 2011
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 2012
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 2013
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 2014
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 2015
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 2016
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 2017
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 2018
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 2019
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 2020
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 2021
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 2022
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 2023
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 2024
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 2025
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 2026
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 2027
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 2028
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 2029
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 2030
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 2031
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 2032
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 2033
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 2034
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 2035
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 2036
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 2037
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 2038
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 2039
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 2040
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 2041
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 2042
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 2043
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 2044
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 2045
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 2046
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 2047
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 2048
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 2049
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 2050
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 2051
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 2052
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 2053
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 2054
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 2055
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 2056
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 2057
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 2058
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 2059
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 2060
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 2061
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 2062
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 2063
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 2064
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 2065
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 2066
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 2067
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 2068
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 2069
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 2070
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 2071
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 2072
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 2073
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 2074
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 2075
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 2076
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 2077
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 2078
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 2079
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 2080
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 2081
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 2082
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 2083
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 2084
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 2085
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 2086
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 2087
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 2088
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 2089
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 2090
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 2091
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 2092
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 2093
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 2094
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 2095
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 2096
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 2097
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 2098
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 2099
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 2100
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 2101
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 2102
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 2103
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 2104
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 2105
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 2106
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 2107
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 2108
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 2109
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 2110
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 2111
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 2112
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 2113
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 2114
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 2115
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 2116
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 2117
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 2118
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 2119
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 2120
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 2121
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 2122
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 2123
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 2124
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 2125
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 2126
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 2127
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 2128
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 2129
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 2130
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 2131
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 2132
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 2133
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 2134
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 2135
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 2136
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 2137
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 2138
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 2139
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 2140
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 2141
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 2142
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 2143
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 2144
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 2145
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 2146
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 2147
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 2148
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 2149
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 2150
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 2151
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 2152
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 2153
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 2154
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 2155
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 2156
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 2157
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 2158
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 2159
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 2160
+;TIME_ELAPSED:925.200000
+;LAYER:9
+G0 F9000 X60 Y60 Z2.0
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 2161
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 2162
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 2163
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 2164
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 2165
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 2166
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 2167
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 2168
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 2169
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 2170
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 2171
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 2172
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 2173
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 2174
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 2175
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 2176
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 2177
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 2178
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 2179
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 2180
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 2181
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 2182
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 2183
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 2184
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 2185
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 2186
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 2187
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 2188
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 2189
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 2190
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 2191
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 2192
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 2193
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 2194
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 2195
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 2196
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 2197
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 2198
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 2199
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 2200
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 2201
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 2202
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 2203
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 2204
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 2205
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 2206
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 2207
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 2208
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 2209
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 2210
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 2211
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 2212
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 2213
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 2214
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 2215
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 2216
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 2217
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 2218
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 2219
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 2220
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 2221
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 2222
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 2223
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 2224
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 2225
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 2226
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 2227
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 2228
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 2229
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 2230
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 2231
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 2232
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 2233
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 2234
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 2235
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 2236
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 2237
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 2238
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 2239
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 2240
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 2241
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 2242
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 2243
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 2244
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 2245
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 2246
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 2247
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 2248
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 2249
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 2250
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 2251
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 2252
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 2253
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 2254
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 2255
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 2256
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 2257
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 2258
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 2259
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 2260
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 2261
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 2262
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 2263
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 2264
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 2265
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 2266
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 2267
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 2268
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 2269
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 2270
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 2271
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 2272
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 2273
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 2274
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 2275
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 2276
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 2277
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 2278
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 2279
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 2280
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 2281
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 2282
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 2283
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 2284
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 2285
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 2286
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 2287
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 2288
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 2289
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 2290
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 2291
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 2292
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 2293
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 2294
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 2295
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 2296
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 2297
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 2298
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 2299
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 2300
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 2301
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 2302
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 2303
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 2304
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 2305
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 2306
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 2307
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 2308
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 2309
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 2310
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 2311
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 2312
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 2313
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 2314
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 2315
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 2316
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 2317
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 2318
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 2319
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 2320
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 2321
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 2322
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 2323
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 2324
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 2325
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 2326
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 2327
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 2328
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 2329
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 2330
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 2331
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 2332
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 2333
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 2334
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 2335
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 2336
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 2337
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 2338
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 2339
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 2340
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 2341
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 2342
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 2343
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 2344
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 2345
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 2346
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 2347
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 2348
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 2349
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 2350
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 2351
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 2352
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 2353
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 2354
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 2355
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 2356
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 2357
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 2358
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 2359
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 2360
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 2361
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 2362
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 2363
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 2364
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 2365
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 2366
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 2367
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 2368
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 2369
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 2370
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 2371
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 2372
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 2373
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 2374
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 2375
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 2376
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 2377
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 2378
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 2379
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 2380
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 2381
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 2382
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 2383
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 2384
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 2385
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 2386
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 2387
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 2388
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 2389
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 2390
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 2391
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 2392
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 2393
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 2394
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 2395
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 2396
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 2397
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 2398
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 2399
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 2400
+;TIME_ELAPSED:1028.000000
+;LAYER:10
+G0 F9000 X60 Y60 Z2.2
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 2401
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 2402
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 2403
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 2404
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 2405
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 2406
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 2407
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 2408
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 2409
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 2410
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 2411
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 2412
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 2413
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 2414
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 2415
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 2416
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 2417
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 2418
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 2419
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 2420
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 2421
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 2422
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 2423
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 2424
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 2425
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 2426
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 2427
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 2428
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 2429
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 2430
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 2431
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 2432
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 2433
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 2434
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 2435
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 2436
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 2437
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 2438
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 2439
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 2440
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 2441
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 2442
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 2443
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 2444
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 2445
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 2446
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 2447
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 2448
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 2449
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 2450
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 2451
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 2452
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 2453
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 2454
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 2455
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 2456
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 2457
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 2458
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 2459
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 2460
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 2461
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 2462
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 2463
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 2464
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 2465
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 2466
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 2467
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 2468
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 2469
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 2470
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 2471
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 2472
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 2473
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 2474
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 2475
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 2476
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 2477
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 2478
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 2479
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 2480
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 2481
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 2482
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 2483
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 2484
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 2485
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 2486
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 2487
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 2488
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 2489
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 2490
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 2491
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 2492
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 2493
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 2494
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 2495
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 2496
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 2497
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 2498
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 2499
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 2500
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 2501
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 2502
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 2503
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 2504
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 2505
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 2506
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 2507
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 2508
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 2509
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 2510
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 2511
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 2512
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 2513
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 2514
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 2515
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 2516
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 2517
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 2518
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 2519
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 2520
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 2521
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 2522
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 2523
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 2524
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 2525
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 2526
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 2527
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 2528
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 2529
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 2530
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 2531
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 2532
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 2533
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 2534
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 2535
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 2536
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 2537
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 2538
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 2539
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 2540
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 2541
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 2542
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 2543
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 2544
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 2545
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 2546
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 2547
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 2548
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 2549
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 2550
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 2551
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 2552
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 2553
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 2554
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 2555
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 2556
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 2557
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 2558
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 2559
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 2560
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 2561
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 2562
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 2563
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 2564
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 2565
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 2566
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 2567
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 2568
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 2569
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 2570
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 2571
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 2572
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 2573
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 2574
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 2575
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 2576
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 2577
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 2578
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 2579
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 2580
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 2581
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 2582
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 2583
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 2584
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 2585
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 2586
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 2587
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 2588
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 2589
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 2590
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 2591
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 2592
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 2593
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 2594
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 2595
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 2596
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 2597
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 2598
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 2599
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 2600
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 2601
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 2602
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 2603
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 2604
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 2605
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 2606
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 2607
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 2608
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 2609
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 2610
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 2611
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 2612
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 2613
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 2614
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 2615
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 2616
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 2617
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 2618
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 2619
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 2620
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 2621
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 2622
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 2623
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 2624
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 2625
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 2626
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 2627
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 2628
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 2629
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 2630
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 2631
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 2632
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 2633
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 2634
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 2635
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 2636
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 2637
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 2638
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 2639
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 2640
+;TIME_ELAPSED:1130.800000
+;LAYER:11
+G0 F9000 X60 Y60 Z2.4
+;TYPE:WALL-OUTER
+;MESH:benchmark.stl
+M204 S1000
+G1 F1800 X60.000 Y60.000 E2.66000 ; segment 2641
+;WIDTH:0.40
+G1 F1800 X140.000 Y61.333 E2.66000 ; segment 2642
+G1 F1800 X60.000 Y62.667 E2.66000 ; segment 2643
+G1 F1800 X140.000 Y64.000 E2.66000 ; segment 2644
+G1 F1800 X60.000 Y65.333 E2.66000 ; segment 2645
+G1 F1800 X140.000 Y66.667 E2.66000 ; segment 2646
+G1 F1800 X60.000 Y68.000 E2.66000 ; segment 2647
+G1 F1800 X140.000 Y69.333 E2.66000 ; segment 2648
+G1 F1800 X60.000 Y70.667 E2.66000 ; segment 2649
+G1 F1800 X140.000 Y72.000 E2.66000 ; segment 2650
+G1 F1800 X60.000 Y73.333 E2.66000 ; segment 2651
+;WIDTH:0.45
+G1 F1800 X140.000 Y74.667 E2.66000 ; segment 2652
+G1 F1800 X60.000 Y76.000 E2.66000 ; segment 2653
+G1 F1800 X140.000 Y77.333 E2.66000 ; segment 2654
+G1 F1800 X60.000 Y78.667 E2.66000 ; segment 2655
+G1 F1800 X140.000 Y80.000 E2.66000 ; segment 2656
+G1 F1800 X60.000 Y81.333 E2.66000 ; segment 2657
+G1 F1800 X140.000 Y82.667 E2.66000 ; segment 2658
+G1 F1800 X60.000 Y84.000 E2.66000 ; segment 2659
+G1 F1800 X140.000 Y85.333 E2.66000 ; segment 2660
+G1 F1800 X60.000 Y86.667 E2.66000 ; segment 2661
+;WIDTH:0.50
+G1 F1800 X140.000 Y88.000 E2.66000 ; segment 2662
+G1 F1800 X60.000 Y89.333 E2.66000 ; segment 2663
+G1 F1800 X140.000 Y90.667 E2.66000 ; segment 2664
+G1 F1800 X60.000 Y92.000 E2.66000 ; segment 2665
+G1 F1800 X140.000 Y93.333 E2.66000 ; segment 2666
+G1 F1800 X60.000 Y94.667 E2.66000 ; segment 2667
+G1 F1800 X140.000 Y96.000 E2.66000 ; segment 2668
+G1 F1800 X60.000 Y97.333 E2.66000 ; segment 2669
+G1 F1800 X140.000 Y98.667 E2.66000 ; segment 2670
+G1 F1800 X60.000 Y100.000 E2.66000 ; segment 2671
+;WIDTH:0.40
+G1 F1800 X140.000 Y101.333 E2.66000 ; segment 2672
+G1 F1800 X60.000 Y102.667 E2.66000 ; segment 2673
+G1 F1800 X140.000 Y104.000 E2.66000 ; segment 2674
+G1 F1800 X60.000 Y105.333 E2.66000 ; segment 2675
+G1 F1800 X140.000 Y106.667 E2.66000 ; segment 2676
+G1 F1800 X60.000 Y108.000 E2.66000 ; segment 2677
+G1 F1800 X140.000 Y109.333 E2.66000 ; segment 2678
+G1 F1800 X60.000 Y110.667 E2.66000 ; segment 2679
+G1 F1800 X140.000 Y112.000 E2.66000 ; segment 2680
+G1 F1800 X60.000 Y113.333 E2.66000 ; segment 2681
+;WIDTH:0.45
+G1 F1800 X140.000 Y114.667 E2.66000 ; segment 2682
+G1 F1800 X60.000 Y116.000 E2.66000 ; segment 2683
+G1 F1800 X140.000 Y117.333 E2.66000 ; segment 2684
+G1 F1800 X60.000 Y118.667 E2.66000 ; segment 2685
+G1 F1800 X140.000 Y120.000 E2.66000 ; segment 2686
+G1 F1800 X60.000 Y121.333 E2.66000 ; segment 2687
+G1 F1800 X140.000 Y122.667 E2.66000 ; segment 2688
+G1 F1800 X60.000 Y124.000 E2.66000 ; segment 2689
+G1 F1800 X140.000 Y125.333 E2.66000 ; segment 2690
+G1 F1800 X60.000 Y126.667 E2.66000 ; segment 2691
+;WIDTH:0.50
+G1 F1800 X140.000 Y128.000 E2.66000 ; segment 2692
+G1 F1800 X60.000 Y129.333 E2.66000 ; segment 2693
+G1 F1800 X140.000 Y130.667 E2.66000 ; segment 2694
+G1 F1800 X60.000 Y132.000 E2.66000 ; segment 2695
+G1 F1800 X140.000 Y133.333 E2.66000 ; segment 2696
+G1 F1800 X60.000 Y134.667 E2.66000 ; segment 2697
+G1 F1800 X140.000 Y136.000 E2.66000 ; segment 2698
+G1 F1800 X60.000 Y137.333 E2.66000 ; segment 2699
+G1 F1800 X140.000 Y138.667 E2.66000 ; segment 2700
+;TYPE:WALL-INNER
+;MESH:benchmark.stl
+M204 S1500
+G1 F2400 X60.000 Y60.000 E2.66000 ; segment 2701
+;WIDTH:0.40
+G1 F2400 X140.000 Y61.333 E2.66000 ; segment 2702
+G1 F2400 X60.000 Y62.667 E2.66000 ; segment 2703
+G1 F2400 X140.000 Y64.000 E2.66000 ; segment 2704
+G1 F2400 X60.000 Y65.333 E2.66000 ; segment 2705
+G1 F2400 X140.000 Y66.667 E2.66000 ; segment 2706
+G1 F2400 X60.000 Y68.000 E2.66000 ; segment 2707
+G1 F2400 X140.000 Y69.333 E2.66000 ; segment 2708
+G1 F2400 X60.000 Y70.667 E2.66000 ; segment 2709
+G1 F2400 X140.000 Y72.000 E2.66000 ; segment 2710
+G1 F2400 X60.000 Y73.333 E2.66000 ; segment 2711
+;WIDTH:0.45
+G1 F2400 X140.000 Y74.667 E2.66000 ; segment 2712
+G1 F2400 X60.000 Y76.000 E2.66000 ; segment 2713
+G1 F2400 X140.000 Y77.333 E2.66000 ; segment 2714
+G1 F2400 X60.000 Y78.667 E2.66000 ; segment 2715
+G1 F2400 X140.000 Y80.000 E2.66000 ; segment 2716
+G1 F2400 X60.000 Y81.333 E2.66000 ; segment 2717
+G1 F2400 X140.000 Y82.667 E2.66000 ; segment 2718
+G1 F2400 X60.000 Y84.000 E2.66000 ; segment 2719
+G1 F2400 X140.000 Y85.333 E2.66000 ; segment 2720
+G1 F2400 X60.000 Y86.667 E2.66000 ; segment 2721
+;WIDTH:0.50
+G1 F2400 X140.000 Y88.000 E2.66000 ; segment 2722
+G1 F2400 X60.000 Y89.333 E2.66000 ; segment 2723
+G1 F2400 X140.000 Y90.667 E2.66000 ; segment 2724
+G1 F2400 X60.000 Y92.000 E2.66000 ; segment 2725
+G1 F2400 X140.000 Y93.333 E2.66000 ; segment 2726
+G1 F2400 X60.000 Y94.667 E2.66000 ; segment 2727
+G1 F2400 X140.000 Y96.000 E2.66000 ; segment 2728
+G1 F2400 X60.000 Y97.333 E2.66000 ; segment 2729
+G1 F2400 X140.000 Y98.667 E2.66000 ; segment 2730
+G1 F2400 X60.000 Y100.000 E2.66000 ; segment 2731
+;WIDTH:0.40
+G1 F2400 X140.000 Y101.333 E2.66000 ; segment 2732
+G1 F2400 X60.000 Y102.667 E2.66000 ; segment 2733
+G1 F2400 X140.000 Y104.000 E2.66000 ; segment 2734
+G1 F2400 X60.000 Y105.333 E2.66000 ; segment 2735
+G1 F2400 X140.000 Y106.667 E2.66000 ; segment 2736
+G1 F2400 X60.000 Y108.000 E2.66000 ; segment 2737
+G1 F2400 X140.000 Y109.333 E2.66000 ; segment 2738
+G1 F2400 X60.000 Y110.667 E2.66000 ; segment 2739
+G1 F2400 X140.000 Y112.000 E2.66000 ; segment 2740
+G1 F2400 X60.000 Y113.333 E2.66000 ; segment 2741
+;WIDTH:0.45
+G1 F2400 X140.000 Y114.667 E2.66000 ; segment 2742
+G1 F2400 X60.000 Y116.000 E2.66000 ; segment 2743
+G1 F2400 X140.000 Y117.333 E2.66000 ; segment 2744
+G1 F2400 X60.000 Y118.667 E2.66000 ; segment 2745
+G1 F2400 X140.000 Y120.000 E2.66000 ; segment 2746
+G1 F2400 X60.000 Y121.333 E2.66000 ; segment 2747
+G1 F2400 X140.000 Y122.667 E2.66000 ; segment 2748
+G1 F2400 X60.000 Y124.000 E2.66000 ; segment 2749
+G1 F2400 X140.000 Y125.333 E2.66000 ; segment 2750
+G1 F2400 X60.000 Y126.667 E2.66000 ; segment 2751
+;WIDTH:0.50
+G1 F2400 X140.000 Y128.000 E2.66000 ; segment 2752
+G1 F2400 X60.000 Y129.333 E2.66000 ; segment 2753
+G1 F2400 X140.000 Y130.667 E2.66000 ; segment 2754
+G1 F2400 X60.000 Y132.000 E2.66000 ; segment 2755
+G1 F2400 X140.000 Y133.333 E2.66000 ; segment 2756
+G1 F2400 X60.000 Y134.667 E2.66000 ; segment 2757
+G1 F2400 X140.000 Y136.000 E2.66000 ; segment 2758
+G1 F2400 X60.000 Y137.333 E2.66000 ; segment 2759
+G1 F2400 X140.000 Y138.667 E2.66000 ; segment 2760
+;TYPE:SKIN
+;MESH:benchmark.stl
+M204 S2000
+G1 F3000 X60.000 Y60.000 E2.66000 ; segment 2761
+;WIDTH:0.40
+G1 F3000 X140.000 Y61.333 E2.66000 ; segment 2762
+G1 F3000 X60.000 Y62.667 E2.66000 ; segment 2763
+G1 F3000 X140.000 Y64.000 E2.66000 ; segment 2764
+G1 F3000 X60.000 Y65.333 E2.66000 ; segment 2765
+G1 F3000 X140.000 Y66.667 E2.66000 ; segment 2766
+G1 F3000 X60.000 Y68.000 E2.66000 ; segment 2767
+G1 F3000 X140.000 Y69.333 E2.66000 ; segment 2768
+G1 F3000 X60.000 Y70.667 E2.66000 ; segment 2769
+G1 F3000 X140.000 Y72.000 E2.66000 ; segment 2770
+G1 F3000 X60.000 Y73.333 E2.66000 ; segment 2771
+;WIDTH:0.45
+G1 F3000 X140.000 Y74.667 E2.66000 ; segment 2772
+G1 F3000 X60.000 Y76.000 E2.66000 ; segment 2773
+G1 F3000 X140.000 Y77.333 E2.66000 ; segment 2774
+G1 F3000 X60.000 Y78.667 E2.66000 ; segment 2775
+G1 F3000 X140.000 Y80.000 E2.66000 ; segment 2776
+G1 F3000 X60.000 Y81.333 E2.66000 ; segment 2777
+G1 F3000 X140.000 Y82.667 E2.66000 ; segment 2778
+G1 F3000 X60.000 Y84.000 E2.66000 ; segment 2779
+G1 F3000 X140.000 Y85.333 E2.66000 ; segment 2780
+G1 F3000 X60.000 Y86.667 E2.66000 ; segment 2781
+;WIDTH:0.50
+G1 F3000 X140.000 Y88.000 E2.66000 ; segment 2782
+G1 F3000 X60.000 Y89.333 E2.66000 ; segment 2783
+G1 F3000 X140.000 Y90.667 E2.66000 ; segment 2784
+G1 F3000 X60.000 Y92.000 E2.66000 ; segment 2785
+G1 F3000 X140.000 Y93.333 E2.66000 ; segment 2786
+G1 F3000 X60.000 Y94.667 E2.66000 ; segment 2787
+G1 F3000 X140.000 Y96.000 E2.66000 ; segment 2788
+G1 F3000 X60.000 Y97.333 E2.66000 ; segment 2789
+G1 F3000 X140.000 Y98.667 E2.66000 ; segment 2790
+G1 F3000 X60.000 Y100.000 E2.66000 ; segment 2791
+;WIDTH:0.40
+G1 F3000 X140.000 Y101.333 E2.66000 ; segment 2792
+G1 F3000 X60.000 Y102.667 E2.66000 ; segment 2793
+G1 F3000 X140.000 Y104.000 E2.66000 ; segment 2794
+G1 F3000 X60.000 Y105.333 E2.66000 ; segment 2795
+G1 F3000 X140.000 Y106.667 E2.66000 ; segment 2796
+G1 F3000 X60.000 Y108.000 E2.66000 ; segment 2797
+G1 F3000 X140.000 Y109.333 E2.66000 ; segment 2798
+G1 F3000 X60.000 Y110.667 E2.66000 ; segment 2799
+G1 F3000 X140.000 Y112.000 E2.66000 ; segment 2800
+G1 F3000 X60.000 Y113.333 E2.66000 ; segment 2801
+;WIDTH:0.45
+G1 F3000 X140.000 Y114.667 E2.66000 ; segment 2802
+G1 F3000 X60.000 Y116.000 E2.66000 ; segment 2803
+G1 F3000 X140.000 Y117.333 E2.66000 ; segment 2804
+G1 F3000 X60.000 Y118.667 E2.66000 ; segment 2805
+G1 F3000 X140.000 Y120.000 E2.66000 ; segment 2806
+G1 F3000 X60.000 Y121.333 E2.66000 ; segment 2807
+G1 F3000 X140.000 Y122.667 E2.66000 ; segment 2808
+G1 F3000 X60.000 Y124.000 E2.66000 ; segment 2809
+G1 F3000 X140.000 Y125.333 E2.66000 ; segment 2810
+G1 F3000 X60.000 Y126.667 E2.66000 ; segment 2811
+;WIDTH:0.50
+G1 F3000 X140.000 Y128.000 E2.66000 ; segment 2812
+G1 F3000 X60.000 Y129.333 E2.66000 ; segment 2813
+G1 F3000 X140.000 Y130.667 E2.66000 ; segment 2814
+G1 F3000 X60.000 Y132.000 E2.66000 ; segment 2815
+G1 F3000 X140.000 Y133.333 E2.66000 ; segment 2816
+G1 F3000 X60.000 Y134.667 E2.66000 ; segment 2817
+G1 F3000 X140.000 Y136.000 E2.66000 ; segment 2818
+G1 F3000 X60.000 Y137.333 E2.66000 ; segment 2819
+G1 F3000 X140.000 Y138.667 E2.66000 ; segment 2820
+;TYPE:FILL
+;MESH:benchmark.stl
+M204 S2500
+G1 F3600 X60.000 Y60.000 E2.66000 ; segment 2821
+;WIDTH:0.40
+G1 F3600 X140.000 Y61.333 E2.66000 ; segment 2822
+G1 F3600 X60.000 Y62.667 E2.66000 ; segment 2823
+G1 F3600 X140.000 Y64.000 E2.66000 ; segment 2824
+G1 F3600 X60.000 Y65.333 E2.66000 ; segment 2825
+G1 F3600 X140.000 Y66.667 E2.66000 ; segment 2826
+G1 F3600 X60.000 Y68.000 E2.66000 ; segment 2827
+G1 F3600 X140.000 Y69.333 E2.66000 ; segment 2828
+G1 F3600 X60.000 Y70.667 E2.66000 ; segment 2829
+G1 F3600 X140.000 Y72.000 E2.66000 ; segment 2830
+G1 F3600 X60.000 Y73.333 E2.66000 ; segment 2831
+;WIDTH:0.45
+G1 F3600 X140.000 Y74.667 E2.66000 ; segment 2832
+G1 F3600 X60.000 Y76.000 E2.66000 ; segment 2833
+G1 F3600 X140.000 Y77.333 E2.66000 ; segment 2834
+G1 F3600 X60.000 Y78.667 E2.66000 ; segment 2835
+G1 F3600 X140.000 Y80.000 E2.66000 ; segment 2836
+G1 F3600 X60.000 Y81.333 E2.66000 ; segment 2837
+G1 F3600 X140.000 Y82.667 E2.66000 ; segment 2838
+G1 F3600 X60.000 Y84.000 E2.66000 ; segment 2839
+G1 F3600 X140.000 Y85.333 E2.66000 ; segment 2840
+G1 F3600 X60.000 Y86.667 E2.66000 ; segment 2841
+;WIDTH:0.50
+G1 F3600 X140.000 Y88.000 E2.66000 ; segment 2842
+G1 F3600 X60.000 Y89.333 E2.66000 ; segment 2843
+G1 F3600 X140.000 Y90.667 E2.66000 ; segment 2844
+G1 F3600 X60.000 Y92.000 E2.66000 ; segment 2845
+G1 F3600 X140.000 Y93.333 E2.66000 ; segment 2846
+G1 F3600 X60.000 Y94.667 E2.66000 ; segment 2847
+G1 F3600 X140.000 Y96.000 E2.66000 ; segment 2848
+G1 F3600 X60.000 Y97.333 E2.66000 ; segment 2849
+G1 F3600 X140.000 Y98.667 E2.66000 ; segment 2850
+G1 F3600 X60.000 Y100.000 E2.66000 ; segment 2851
+;WIDTH:0.40
+G1 F3600 X140.000 Y101.333 E2.66000 ; segment 2852
+G1 F3600 X60.000 Y102.667 E2.66000 ; segment 2853
+G1 F3600 X140.000 Y104.000 E2.66000 ; segment 2854
+G1 F3600 X60.000 Y105.333 E2.66000 ; segment 2855
+G1 F3600 X140.000 Y106.667 E2.66000 ; segment 2856
+G1 F3600 X60.000 Y108.000 E2.66000 ; segment 2857
+G1 F3600 X140.000 Y109.333 E2.66000 ; segment 2858
+G1 F3600 X60.000 Y110.667 E2.66000 ; segment 2859
+G1 F3600 X140.000 Y112.000 E2.66000 ; segment 2860
+G1 F3600 X60.000 Y113.333 E2.66000 ; segment 2861
+;WIDTH:0.45
+G1 F3600 X140.000 Y114.667 E2.66000 ; segment 2862
+G1 F3600 X60.000 Y116.000 E2.66000 ; segment 2863
+G1 F3600 X140.000 Y117.333 E2.66000 ; segment 2864
+G1 F3600 X60.000 Y118.667 E2.66000 ; segment 2865
+G1 F3600 X140.000 Y120.000 E2.66000 ; segment 2866
+G1 F3600 X60.000 Y121.333 E2.66000 ; segment 2867
+G1 F3600 X140.000 Y122.667 E2.66000 ; segment 2868
+G1 F3600 X60.000 Y124.000 E2.66000 ; segment 2869
+G1 F3600 X140.000 Y125.333 E2.66000 ; segment 2870
+G1 F3600 X60.000 Y126.667 E2.66000 ; segment 2871
+;WIDTH:0.50
+G1 F3600 X140.000 Y128.000 E2.66000 ; segment 2872
+G1 F3600 X60.000 Y129.333 E2.66000 ; segment 2873
+G1 F3600 X140.000 Y130.667 E2.66000 ; segment 2874
+G1 F3600 X60.000 Y132.000 E2.66000 ; segment 2875
+G1 F3600 X140.000 Y133.333 E2.66000 ; segment 2876
+G1 F3600 X60.000 Y134.667 E2.66000 ; segment 2877
+G1 F3600 X140.000 Y136.000 E2.66000 ; segment 2878
+G1 F3600 X60.000 Y137.333 E2.66000 ; segment 2879
+G1 F3600 X140.000 Y138.667 E2.66000 ; segment 2880
+;TIME_ELAPSED:1233.600000
+M400
+;End of Gcode